@@ -0,0 +1,104 @@
+import csv
+import hashlib
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from backend.agents.common.snapshot import ReloadingSnapshot
+from backend.shared.dependencies.config import get_settings
+
+# Shortest master code a line item's code may resolve to (an HSN heading).
+MIN_PREFIX = 4
+_SEPARATORS = str.maketrans("", "", " .-")
+
+class HsnMasterError(Exception):
+    """An HSN/SAC master dataset that cannot be loaded."""
+
+def normalize_hsn(code) -> Optional[str]:
+    """The digits of an HSN/SAC code as written on an invoice ("8471.30 10", 8471), or None."""
+    if code is None:
+        return None
+    if type(code) is not str:
+        code = str(code)
+    if not code.isdigit():
+        code = code.translate(_SEPARATORS)
+        if not code.isdigit():
+            return None
+    return code
+
+def _rate_set(rates: str) -> FrozenSet[float]:
+    return frozenset(round(float(rate), 2) for rate in rates.split("|") if rate.strip())
+
+class HsnIndex:
+    """HSN/SAC codes of a master dataset with their GST rates.
+
+    Every master code (chapter, heading, subheading or tariff item) is a key of one
+    dict, and a line item's code resolves to the longest master code that prefixes it,
+    trying only the code lengths the master has. That is a few dict probes per code,
+    well under a microsecond, where a trie or a bisect over a sorted array would walk
+    Python objects per digit. Codes sharing a rate share one frozenset.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, FrozenSet[float]]], version: str = ""):
+        self.version = version
+        shared: Dict[FrozenSet[float], FrozenSet[float]] = {}
+        self._rates: Dict[str, FrozenSet[float]] = {}
+        for code, rates in entries:
+            self._rates[code] = shared.setdefault(rates, rates)
+        self._lengths = sorted({len(code) for code in self._rates if len(code) >= MIN_PREFIX}, reverse=True)
+
+    def __len__(self) -> int:
+        return len(self._rates)
+
+    def resolve(self, code) -> Optional[str]:
+        """The master code `code` falls under, or None if it is unknown or malformed."""
+        code = normalize_hsn(code)
+        if code is None:
+            return None
+        rates = self._rates
+        if code in rates:
+            return code
+        for length in self._lengths:
+            if length < len(code) and code[:length] in rates:
+                return code[:length]
+        return None
+
+    def rates(self, code) -> Optional[FrozenSet[float]]:
+        """The GST rates (percent) of the master code `code` falls under; empty when the
+        master lists none, None when the code is unknown."""
+        resolved = self.resolve(code)
+        return None if resolved is None else self._rates[resolved]
+
+def load_hsn_master(path: str) -> HsnIndex:
+    """Loads a master dataset CSV with code and rates columns ("5|12" for a code taxed
+    at either rate; blank when not known). The version is a hash of the file."""
+    with open(path, "rb") as f:
+        version = hashlib.sha256(f.read()).hexdigest()[:12]
+    entries = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            code = normalize_hsn(row.get("code"))
+            if not code:
+                raise HsnMasterError(f"{path}:{line}: bad code {row.get('code')!r}")
+            try:
+                entries.append((code, _rate_set(row.get("rates") or "")))
+            except ValueError as e:
+                raise HsnMasterError(f"{path}:{line}: bad rates {row.get('rates')!r}") from e
+    return HsnIndex(entries, version)
+
+class HsnMaster(ReloadingSnapshot[HsnIndex]):
+    """The HSN/SAC master dataset at a path, reloaded in full and swapped in when a new
+    version of the file is put in place."""
+
+    def __init__(self, path: str, reload_interval_s: float = 5.0):
+        super().__init__(path, load_hsn_master, reload_interval_s)
+
+    def index(self) -> HsnIndex:
+        return self.current()
+
+@lru_cache()
+def get_hsn_master() -> Optional[HsnMaster]:
+    """The HSN/SAC master configured by VALIDATION_HSN_MASTER, or None when unset."""
+    settings = get_settings()
+    if not settings.VALIDATION_HSN_MASTER:
+        return None
+    return HsnMaster(settings.VALIDATION_HSN_MASTER, settings.VALIDATION_RULES_RELOAD_INTERVAL_S)
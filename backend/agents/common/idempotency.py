@@ -0,0 +1,41 @@
+import functools
+import logging
+
+import grpc
+
+from backend.shared.clients.agents import IDEMPOTENCY_KEY_HEADER
+
+def idempotent(agent: str, response_cls):
+    """Makes a unary servicer method replay its first successful response for a repeated
+    idempotency key instead of redoing the work.
+
+    Responses are recorded through the servicer's `mcp_client`, so a retry is answered
+    the same way even by another replica or after a restart. Calls without a key, and
+    failed calls, are not recorded. If the record store is unreachable the call runs
+    normally.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(self, request, context):
+            key = dict(context.invocation_metadata()).get(IDEMPOTENCY_KEY_HEADER)
+            if not key:
+                return handler(self, request, context)
+
+            try:
+                recorded = self.mcp_client.get_idempotency_record(key)
+            except grpc.RpcError as e:
+                logging.warning(f"Could not look up idempotency key {key}: {e}")
+                recorded = None
+            if recorded is not None:
+                logging.info(f"{agent} replaying the recorded response for idempotency key {key}")
+                return response_cls.FromString(recorded)
+
+            response = handler(self, request, context)
+            if context.code() in (None, grpc.StatusCode.OK):
+                try:
+                    self.mcp_client.save_idempotency_record(key, agent, response.SerializeToString())
+                except grpc.RpcError as e:
+                    logging.warning(f"Could not record idempotency key {key}: {e}")
+            return response
+        return wrapper
+    return decorator
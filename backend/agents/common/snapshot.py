@@ -0,0 +1,50 @@
+import logging
+import os
+import threading
+import time
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+class ReloadingSnapshot(Generic[T]):
+    """Data loaded from a file, reloaded when the file is replaced.
+
+    At most every `reload_interval_s`, `current()` checks whether the file changed and
+    loads the new version in full before swapping it in, so callers see either the old
+    data or the new, never a mix. Data already handed out stays usable. If the new
+    file cannot be loaded, the error is logged and the previous data stays in use. A
+    reload interval of 0 disables reloading.
+    """
+
+    def __init__(self, path: str, load: Callable[[str], T], reload_interval_s: float = 5.0):
+        self.path = path
+        self.load = load
+        self.reload_interval_s = reload_interval_s
+        self._lock = threading.Lock()
+        self._signature = self._stat()
+        self._data = load(path)
+        self._checked_at = time.monotonic()
+
+    def _stat(self) -> tuple:
+        stat = os.stat(self.path)
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def current(self) -> T:
+        if self.reload_interval_s > 0 and time.monotonic() - self._checked_at >= self.reload_interval_s:
+            self._maybe_reload()
+        return self._data
+
+    def _maybe_reload(self):
+        with self._lock:
+            if time.monotonic() - self._checked_at < self.reload_interval_s:
+                return
+            self._checked_at = time.monotonic()
+            try:
+                signature = self._stat()
+                if signature == self._signature:
+                    return
+                self._data = self.load(self.path)
+                self._signature = signature
+                logging.info(f"Reloaded {self.path}")
+            except Exception as e:
+                logging.error(f"Could not reload {self.path}: {e}")
@@ -0,0 +1,69 @@
+import re
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+
+GSTIN_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_GSTIN_VALUES = {char: value for value, char in enumerate(GSTIN_CHARS)}
+
+# GST state and union territory codes, the first two digits of a GSTIN.
+GST_STATE_CODES = {
+    "01": "Jammu and Kashmir", "02": "Himachal Pradesh", "03": "Punjab", "04": "Chandigarh",
+    "05": "Uttarakhand", "06": "Haryana", "07": "Delhi", "08": "Rajasthan", "09": "Uttar Pradesh",
+    "10": "Bihar", "11": "Sikkim", "12": "Arunachal Pradesh", "13": "Nagaland", "14": "Manipur",
+    "15": "Mizoram", "16": "Tripura", "17": "Meghalaya", "18": "Assam", "19": "West Bengal",
+    "20": "Jharkhand", "21": "Odisha", "22": "Chhattisgarh", "23": "Madhya Pradesh", "24": "Gujarat",
+    "25": "Daman and Diu", "26": "Dadra and Nagar Haveli and Daman and Diu", "27": "Maharashtra",
+    "28": "Andhra Pradesh (before 2014)", "29": "Karnataka", "30": "Goa", "31": "Lakshadweep",
+    "32": "Kerala", "33": "Tamil Nadu", "34": "Puducherry", "35": "Andaman and Nicobar Islands",
+    "36": "Telangana", "37": "Andhra Pradesh", "38": "Ladakh", "97": "Other Territory",
+    "99": "Centre Jurisdiction",
+}
+
+def validate_gstin(gstin: str) -> bool:
+    if not gstin:
+        return False
+    return re.match(r"^\d{2}[A-Z]{5}\d{4}[A-Z]{1}[A-Z\d]{1}Z[A-Z\d]{1}$", gstin) is not None
+
+def gstin_check_digit(gstin: str) -> str:
+    """The mod-36 check digit of the first 14 characters of a GSTIN."""
+    total = 0
+    for position, char in enumerate(gstin[:14]):
+        product = _GSTIN_VALUES[char] * (2 if position % 2 else 1)
+        total += product // 36 + product % 36
+    return GSTIN_CHARS[-total % 36]
+
+def gstin_problem(gstin: str) -> Optional[str]:
+    """What is wrong with a GSTIN: "format", "state_code" or "check_digit"; None if it is valid."""
+    if not validate_gstin(gstin):
+        return "format"
+    if gstin[:2] not in GST_STATE_CODES:
+        return "state_code"
+    if gstin[14] != gstin_check_digit(gstin):
+        return "check_digit"
+    return None
+
+def validate_date(date_str: str) -> bool:
+    if not date_str:
+        return False
+    try:
+        invoice_date = datetime.fromisoformat(date_str).astimezone(timezone.utc)
+        return invoice_date <= datetime.now(timezone.utc)
+    except ValueError:
+        return False
+
+# Extraction schema fields checked as soon as they are extracted (see check_header_field).
+HEADER_FIELDS = ("invoiceDate", "vendor")
+
+def check_header_field(name: str, value: Any) -> List[str]:
+    """Header checks on one field of the extraction schema (EXTRACTION_SCHEMA_PROMPT);
+    returns the problems found. Lets the extraction agent flag an invoice while the
+    rest of it is still being extracted."""
+    if name == "invoiceDate" and not validate_date(value):
+        return ["Invoice date is in the future or invalid."]
+    if name == "vendor":
+        problem = gstin_problem((value or {}).get("gstin"))
+        if problem == "format":
+            return ["Invalid GSTIN format."]
+        if problem:
+            return ["GSTIN has an invalid state code or check digit."]
+    return []
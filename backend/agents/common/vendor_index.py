@@ -0,0 +1,222 @@
+import argparse
+import csv
+import difflib
+import logging
+import mmap
+import os
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional
+
+from backend.agents.common.snapshot import ReloadingSnapshot
+from backend.shared.dependencies.config import get_settings
+
+MAGIC = b"GSTVIDX1"
+# magic, vendors, GSTIN slots, name slots, offset of the records
+_HEADER = struct.Struct("<8sIIIQ")
+# GSTIN, record offset + 1 (0 marks an empty slot)
+_GSTIN_SLOT = struct.Struct("<15sxI")
+# crc32 of the normalized name, record offset + 1
+_NAME_SLOT = struct.Struct("<II")
+
+# Words that differ between how a vendor's name is written on an invoice and how it
+# is registered.
+_NAME_NOISE = frozenset({
+    "the", "and", "pvt", "private", "ltd", "limited", "llp", "co", "company", "corp", "corporation", "inc",
+})
+
+class VendorIndexError(Exception):
+    """A file that is not a vendor index snapshot."""
+
+def normalize_vendor_name(name: Optional[str]) -> str:
+    name = re.sub(r"^\s*m/s\.?\s*", "", (name or "").casefold()).replace("&", " and ")
+    return " ".join(token for token in re.findall(r"[a-z0-9]+", name) if token not in _NAME_NOISE)
+
+def name_similarity(a: Optional[str], b: Optional[str]) -> float:
+    """Similarity in [0, 1] of two vendor names after normalization, ignoring word order."""
+    a, b = normalize_vendor_name(a), normalize_vendor_name(b)
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    in_order = difflib.SequenceMatcher(None, a, b).ratio()
+    sorted_words = difflib.SequenceMatcher(None, " ".join(sorted(a.split())), " ".join(sorted(b.split()))).ratio()
+    return max(in_order, sorted_words)
+
+@dataclass
+class VendorRecord:
+    gstin: str
+    legal_name: str
+    trade_name: str = ""
+    status: str = "Active"
+
+    @property
+    def state_code(self) -> str:
+        return self.gstin[:2]
+
+    def name_score(self, name: Optional[str]) -> float:
+        """How closely `name` matches the vendor's legal or trade name."""
+        return max(name_similarity(name, self.legal_name), name_similarity(name, self.trade_name))
+
+def _slot_count(entries: int) -> int:
+    # A power of two at least twice the entries, so probe sequences stay short.
+    slots = 8
+    while slots < 2 * entries:
+        slots *= 2
+    return slots
+
+def _free_slot(table: bytearray, slot_struct: struct.Struct, slots: int, start: int) -> int:
+    slot = start & (slots - 1)
+    while slot_struct.unpack_from(table, slot * slot_struct.size)[-1]:
+        slot = (slot + 1) & (slots - 1)
+    return slot
+
+def build_vendor_index(records: Iterable[VendorRecord], path: str) -> int:
+    """Writes a vendor index snapshot of `records` to `path` and returns the number of
+    vendors. A later record replaces an earlier one with the same GSTIN. The file is
+    replaced atomically, so processes with the old snapshot open keep reading it."""
+    vendors = {}
+    for record in records:
+        gstin = (record.gstin or "").strip().upper()
+        if len(gstin) != 15 or not gstin.isascii():
+            logging.warning(f"Skipping vendor {record.legal_name!r}: malformed GSTIN {record.gstin!r}")
+            continue
+        vendors[gstin] = record
+
+    gstin_slots, name_slots = _slot_count(len(vendors)), _slot_count(2 * len(vendors))
+    gstin_table = bytearray(gstin_slots * _GSTIN_SLOT.size)
+    name_table = bytearray(name_slots * _NAME_SLOT.size)
+    data = bytearray()
+    for gstin, record in vendors.items():
+        offset = len(data)
+        fields = (gstin, record.legal_name, record.trade_name, record.status)
+        data += "\t".join(" ".join(str(field or "").split()) for field in fields).encode("utf-8") + b"\n"
+
+        key = gstin.encode("ascii")
+        slot = _free_slot(gstin_table, _GSTIN_SLOT, gstin_slots, zlib.crc32(key))
+        _GSTIN_SLOT.pack_into(gstin_table, slot * _GSTIN_SLOT.size, key, offset + 1)
+        for name in {normalize_vendor_name(record.legal_name), normalize_vendor_name(record.trade_name)} - {""}:
+            name_hash = zlib.crc32(name.encode("utf-8"))
+            slot = _free_slot(name_table, _NAME_SLOT, name_slots, name_hash)
+            _NAME_SLOT.pack_into(name_table, slot * _NAME_SLOT.size, name_hash, offset + 1)
+
+    records_offset = _HEADER.size + len(gstin_table) + len(name_table)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(vendors), gstin_slots, name_slots, records_offset))
+        f.write(gstin_table)
+        f.write(name_table)
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(vendors)
+
+class VendorIndex:
+    """A vendor master snapshot, memory-mapped read-only.
+
+    GSTINs and normalized vendor names are open-addressing hash tables in the file, so
+    `get` and `find_by_name` read a few slots and one record however many vendors there
+    are. Opening a snapshot parses nothing: the OS pages the file in as lookups touch
+    it, and processes mapping the same snapshot share those pages.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self._count, self._gstin_slots, self._name_slots, self._records_offset = _HEADER.unpack_from(self._mm, 0)
+        except struct.error:
+            magic = None
+        if magic != MAGIC:
+            self._mm.close()
+            raise VendorIndexError(f"{path} is not a vendor index snapshot")
+        self._names_offset = _HEADER.size + self._gstin_slots * _GSTIN_SLOT.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, offset: int) -> VendorRecord:
+        start = self._records_offset + offset
+        return VendorRecord(*self._mm[start:self._mm.find(b"\n", start)].decode("utf-8").split("\t"))
+
+    def get(self, gstin: Optional[str]) -> Optional[VendorRecord]:
+        """The vendor registered under `gstin`, if any."""
+        if not isinstance(gstin, str) or len(gstin) != 15 or not gstin.isascii():
+            return None
+        key = gstin.encode("ascii")
+        mask = self._gstin_slots - 1
+        slot = zlib.crc32(key) & mask
+        while True:
+            stored, offset = _GSTIN_SLOT.unpack_from(self._mm, _HEADER.size + slot * _GSTIN_SLOT.size)
+            if not offset:
+                return None
+            if stored == key:
+                return self._record(offset - 1)
+            slot = (slot + 1) & mask
+
+    def find_by_name(self, name: Optional[str]) -> List[VendorRecord]:
+        """Vendors whose legal or trade name normalizes to the same as `name`."""
+        normalized = normalize_vendor_name(name)
+        if not normalized:
+            return []
+        name_hash = zlib.crc32(normalized.encode("utf-8"))
+        mask = self._name_slots - 1
+        slot = name_hash & mask
+        found = []
+        while True:
+            stored, offset = _NAME_SLOT.unpack_from(self._mm, self._names_offset + slot * _NAME_SLOT.size)
+            if not offset:
+                return found
+            if stored == name_hash:
+                record = self._record(offset - 1)
+                if normalized in (normalize_vendor_name(record.legal_name), normalize_vendor_name(record.trade_name)):
+                    found.append(record)
+            slot = (slot + 1) & mask
+
+    def close(self):
+        self._mm.close()
+
+class VendorMaster(ReloadingSnapshot[VendorIndex]):
+    """The vendor index snapshot at a path, remapped when the file is replaced."""
+
+    def __init__(self, path: str, reload_interval_s: float = 5.0):
+        super().__init__(path, VendorIndex, reload_interval_s)
+
+    def index(self) -> VendorIndex:
+        return self.current()
+
+@lru_cache()
+def get_vendor_master() -> Optional[VendorMaster]:
+    """The vendor master configured by VALIDATION_VENDOR_INDEX, or None when unset."""
+    settings = get_settings()
+    if not settings.VALIDATION_VENDOR_INDEX:
+        return None
+    return VendorMaster(settings.VALIDATION_VENDOR_INDEX, settings.VALIDATION_RULES_RELOAD_INTERVAL_S)
+
+def read_vendor_csv(path: str) -> Iterator[VendorRecord]:
+    """Reads a vendor master export with gstin and legal_name columns, and optionally
+    trade_name and status."""
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield VendorRecord(
+                gstin=row["gstin"],
+                legal_name=row["legal_name"],
+                trade_name=row.get("trade_name") or "",
+                status=row.get("status") or "Active",
+            )
+
+def main():
+    parser = argparse.ArgumentParser(description="Builds a vendor index snapshot from a vendor master CSV export.")
+    parser.add_argument("csv_path")
+    parser.add_argument("index_path")
+    args = parser.parse_args()
+    count = build_vendor_index(read_vendor_csv(args.csv_path), args.index_path)
+    print(f"Wrote {count} vendors to {args.index_path}")
+
+if __name__ == "__main__":
+    main()
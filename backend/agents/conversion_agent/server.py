@@ -5,8 +5,10 @@ import uuid
 import json
 
 from backend.shared.grpc import agent_comm_pb2, agent_comm_pb2_grpc
-from backend.shared.clients.mcp import MCPClient
+from backend.shared.clients.mcp import MCPClient, TelemetrySender
+from backend.agents.common.idempotency import idempotent
 from backend.agents.common.logging_config import configure_logging
+from backend.shared.clients.registry import server_options
 
 def to_tally_xml(schema: dict) -> str:
     invoice_number = schema.get("invoice_number", "")
@@ -23,18 +25,21 @@ def to_zoho_json(schema: dict) -> dict:
 class ConversionServicer(agent_comm_pb2_grpc.AgentCommServicer):
     def __init__(self):
         self.mcp_client = MCPClient()
+        self.telemetry = TelemetrySender(self.mcp_client)
 
+    @idempotent("conversion_agent", agent_comm_pb2.ConvertResponse)
     def Convert(self, request, context):
         validation_id = request.validation_id
         logging.info(f"Convert called for validation_id: {validation_id}, target: {request.target}")
 
         try:
-            # In a real system, you would fetch the mapped schema from the validation_id
-            # This is not yet implemented in the MCP, so we'll stub it for now.
-            mapped_schema = {
-                "invoice_number": "INV-123", "invoice_date": "2025-11-25",
-                "grand_total": 100.00, "items": []
-            }
+            validation_logs = self.mcp_client.get_validation_logs(validation_id)
+            if not validation_logs:
+                raise Exception("Validation logs not found.")
+            mapped = self.mcp_client.get_mapped_schema(validation_logs["schema_id"])
+            if not mapped:
+                raise Exception("Mapped schema not found.")
+            mapped_schema = mapped["mapped_data"] or {}
 
             output = ""
             if request.target == "tally":
@@ -45,22 +50,27 @@ class ConversionServicer(agent_comm_pb2_grpc.AgentCommServicer):
                 raise ValueError("Invalid conversion target.")
 
             conversion_id = f"CONV-{request.target.upper()}-{uuid.uuid4()}"
+            artifact_url = f"s3://dummy/{conversion_id}"
 
-            # Save to conversion_logs via MCP
-            self.mcp_client.write_audit(
+            self.mcp_client.save_conversion_log(
+                conversion_id=conversion_id,
+                validation_id=validation_id,
+                target=request.target,
+                output=output,
+                status="CONVERTED",
+                artifact_url=artifact_url,
+            )
+            self.telemetry.write_audit(
                 agent="conversion_agent",
                 action="save_conversion_log",
                 reference_id=validation_id,
-                payload_json={
-                    "conversion_id": conversion_id, "target": request.target,
-                    "output_snippet": output[:100],
-                }
+                payload={"conversion_id": conversion_id, "target": request.target},
             )
 
             return agent_comm_pb2.ConvertResponse(
                 conversion_id=conversion_id,
                 status="CONVERTED",
-                artifact_url=f"s3://dummy/{conversion_id}"
+                artifact_url=artifact_url
             )
 
         except Exception as e:
@@ -71,7 +81,7 @@ class ConversionServicer(agent_comm_pb2_grpc.AgentCommServicer):
 
 def serve():
     configure_logging("conversion_agent")
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=server_options())
     agent_comm_pb2_grpc.add_AgentCommServicer_to_server(ConversionServicer(), server)
     server.add_insecure_port("[::]:6005")
     server.start()
@@ -3,84 +3,169 @@ import grpc
 from concurrent import futures
 import uuid
 import time
-import io
+import os
+import tempfile
 
 from backend.shared.grpc import agent_comm_pb2, agent_comm_pb2_grpc
-from backend.shared.clients.mcp import MCPClient
+from backend.shared.clients.mcp import MCPClient, TelemetrySender
+from backend.agents.common.idempotency import idempotent
 from backend.agents.common.logging_config import configure_logging
+from backend.agents.common.validation_utils import HEADER_FIELDS, check_header_field
 from backend.shared.services.ocr import get_ocr_service
 from backend.shared.services.extractor import get_extractor_service
+from backend.shared.services.job_queue import get_ocr_job_queue
+from backend.shared.dependencies.config import get_settings
+from backend.agents.extraction_agent.worker import OcrWorkerPool
+from backend.shared.clients.registry import server_options
 
 class ExtractionServicer(agent_comm_pb2_grpc.AgentCommServicer):
     def __init__(self):
         self.mcp_client = MCPClient()
-        self.ocr_service = get_ocr_service(self.mcp_client)
+        self.telemetry = TelemetrySender(self.mcp_client)
+        self.ocr_service = get_ocr_service(self.mcp_client, self.telemetry)
         self.extractor_service = get_extractor_service(self.mcp_client)
 
+    @idempotent("extraction_agent", agent_comm_pb2.OCRResponse)
     def StartOCR(self, request, context):
         ingestion_id = request.ingestion.ingestion_id
         logging.info(f"StartOCR called for ingestion_id: {ingestion_id}")
-        start_time = time.time()
 
         try:
-            doc = self.mcp_client.get_document(ingestion_id)
-            if not doc or not doc.file_bytes:
-                raise Exception("Document not found or file_bytes is missing.")
+            ocr_id = self.run_ocr(ingestion_id)
+            return agent_comm_pb2.OCRResponse(
+                ocr_id=ocr_id,
+                status="EXTRACTED",
+                message="OCR and schema extraction completed successfully."
+            )
+        except Exception as e:
+            context.set_details(f"Extraction failed: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return agent_comm_pb2.OCRResponse(status="FAILED", message=str(e))
 
-            file_bytes = doc.file_bytes
-            file_name = doc.file_name
+    def run_ocr(self, ingestion_id: str) -> str:
+        """Runs OCR and schema extraction for an ingestion and returns the ocr_id.
 
-            raw_text = self.ocr_service.perform_ocr(file_bytes, file_name)
-            detected_fields = self.extractor_service.extract_schema(raw_text)
+        Shared by the StartOCR RPC and the queue workers. Raises on failure.
+        """
+        start_time = time.time()
+
+        try:
+            # Spool the streamed document to disk so memory stays bounded for large scans.
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                doc, file_path = self._download_document(ingestion_id, tmp_dir)
+                ocr = self.ocr_service.perform_ocr(file_path, doc.file_name, ingestion_id)
+            raw_text = ocr.text
+
+            detected_fields, header_issues, first_decision_ms = self._extract_fields(ingestion_id, raw_text)
 
             ocr_id = f"OCR-{uuid.uuid4()}"
 
-            self.mcp_client.write_audit(
+            # Saved synchronously: the mapping agent reads it back by ocr_id.
+            self.mcp_client.save_ocr_output(
+                ocr_id=ocr_id,
+                ingestion_id=ingestion_id,
+                raw_text=raw_text,
+                detected_fields=detected_fields,
+                confidence=0.85, # This would come from the extractor service
+                status="EXTRACTED",
+            )
+            self.telemetry.write_audit(
                 agent="extraction_agent",
                 action="save_ocr_output",
                 reference_id=ingestion_id,
-                payload_json={
-                    "ocr_id": ocr_id,
-                    "status": "EXTRACTED",
-                    "confidence": 0.85, # This would come from the extractor service
-                    "detected_fields": detected_fields,
-                }
+                payload={"ocr_id": ocr_id, "header_issues": header_issues},
             )
 
             ocr_time_ms = int((time.time() - start_time) * 1000)
-            self.mcp_client.write_metric(
-                agent="OCR-AG",
-                ingestion_id=ingestion_id,
-                metrics={"ocr_time_ms": ocr_time_ms, "text_length": len(raw_text), "success": True},
-            )
-
-            return agent_comm_pb2.OCRResponse(
-                ocr_id=ocr_id,
-                status="EXTRACTED",
-                message="OCR and schema extraction completed successfully."
-            )
+            metrics = {
+                "ocr_time_ms": ocr_time_ms,
+                "text_length": len(raw_text),
+                "ocr_engine": ocr.engine,
+                "ocr_confidence": round(ocr.confidence, 4),
+                "success": True,
+            }
+            if first_decision_ms is not None:
+                metrics["header_checked_ms"] = first_decision_ms
+            self.telemetry.write_metric(agent="OCR-AG", ingestion_id=ingestion_id, metrics=metrics)
+            return ocr_id
 
         except Exception as e:
             logging.error(f"Error during extraction for ingestion_id {ingestion_id}: {e}", exc_info=True)
             ocr_time_ms = int((time.time() - start_time) * 1000)
-            self.mcp_client.write_metric(
+            self.telemetry.write_metric(
                 agent="OCR-AG",
                 ingestion_id=ingestion_id,
                 metrics={"ocr_time_ms": ocr_time_ms, "success": False},
             )
-            context.set_details(f"Extraction failed: {e}")
-            context.set_code(grpc.StatusCode.INTERNAL)
-            return agent_comm_pb2.OCRResponse(status="FAILED", message=str(e))
+            raise
+
+    def _extract_fields(self, ingestion_id: str, raw_text: str):
+        """Extracts the invoice schema from the OCR text.
+
+        With EXTRACTION_LLM_STREAMING the header fields are checked as soon as the LLM
+        has produced them, while the line items are still streaming. Returns the fields,
+        the header problems found and the ms from the start of extraction until the
+        header was checked (None when not streaming).
+        """
+        if not get_settings().EXTRACTION_LLM_STREAMING:
+            return self.extractor_service.extract_schema(raw_text, ingestion_id), [], None
+
+        started = time.time()
+        pending = set(HEADER_FIELDS)
+        issues = []
+        checked_ms = None
+
+        def on_field(name, value):
+            nonlocal checked_ms
+            if name not in pending:
+                return
+            pending.discard(name)
+            issues.extend(check_header_field(name, value))
+            if not pending:
+                checked_ms = int((time.time() - started) * 1000)
+                if issues:
+                    logging.warning(f"Header checks failed for {ingestion_id}: {issues}")
+
+        fields = self.extractor_service.extract_schema_stream(raw_text, ingestion_id, on_field)
+        return fields, issues, checked_ms
+
+    def _download_document(self, ingestion_id: str, tmp_dir: str):
+        file_path = os.path.join(tmp_dir, "document")
+        with open(file_path, "wb") as f:
+            doc = self.mcp_client.download_document_to(ingestion_id, f)
+        if not doc or os.path.getsize(file_path) == 0:
+            raise Exception("Document not found or file content is missing.")
+        return doc, file_path
 
 
 def serve():
     configure_logging("extraction_agent")
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    agent_comm_pb2_grpc.add_AgentCommServicer_to_server(ExtractionServicer(), server)
+    settings = get_settings()
+    servicer = ExtractionServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=server_options())
+    agent_comm_pb2_grpc.add_AgentCommServicer_to_server(servicer, server)
     server.add_insecure_port("[::]:6001")
     server.start()
     logging.info("Extraction agent gRPC server started on port 6001")
-    server.wait_for_termination()
+
+    # Queue workers drain OCR jobs enqueued by the gateway, independently of the RPC threads.
+    workers = None
+    if settings.OCR_WORKERS > 0:
+        workers = OcrWorkerPool(
+            queue=get_ocr_job_queue(servicer.mcp_client),
+            process_fn=servicer.run_ocr,
+            num_workers=settings.OCR_WORKERS,
+            poll_interval_s=settings.OCR_WORKER_POLL_INTERVAL_S,
+            retry_delay_s=settings.OCR_JOB_RETRY_DELAY_S,
+        )
+        workers.start()
+
+    try:
+        server.wait_for_termination()
+    finally:
+        if workers:
+            workers.stop()
+        servicer.ocr_service.close()
 
 if __name__ == "__main__":
     serve()
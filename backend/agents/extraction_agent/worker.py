@@ -0,0 +1,83 @@
+import logging
+import socket
+import threading
+from typing import Callable, List, Optional
+
+import grpc
+
+from backend.shared.services.job_queue import OcrJobQueue
+
+class OcrWorkerPool:
+    """Drains the OCR job queue on a pool of threads.
+
+    Each worker claims one job at a time, so lanes are honoured per claim: a freshly
+    queued high priority job is picked up by the next idle worker.
+    """
+
+    def __init__(
+        self,
+        queue: OcrJobQueue,
+        process_fn: Callable[[str], str],
+        num_workers: int = 4,
+        poll_interval_s: float = 1.0,
+        retry_delay_s: int = 30,
+        priorities: Optional[List[str]] = None,
+    ):
+        self.queue = queue
+        self.process_fn = process_fn
+        self.num_workers = num_workers
+        self.poll_interval_s = poll_interval_s
+        self.retry_delay_s = retry_delay_s
+        self.priorities = priorities
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        prefix = f"{socket.gethostname()}-ocr"
+        for i in range(self.num_workers):
+            thread = threading.Thread(target=self._run, args=(f"{prefix}-{i}",), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logging.info(f"Started {self.num_workers} OCR worker(s)")
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stops claiming new jobs and waits for in-flight jobs to finish."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _run(self, worker_id: str):
+        while not self._stop.is_set():
+            try:
+                jobs = self.queue.claim(worker_id, 1, self.priorities)
+            except grpc.RpcError as e:
+                logging.error(f"Worker {worker_id} failed to claim OCR jobs: {e.details()}")
+                jobs = []
+
+            if not jobs:
+                self._stop.wait(self.poll_interval_s)
+                continue
+
+            for job in jobs:
+                self._process(worker_id, job)
+
+    def _process(self, worker_id: str, job):
+        logging.info(f"Worker {worker_id} processing {job.job_id} ({job.priority}) for {job.ingestion_id}")
+        try:
+            ocr_id = self.process_fn(job.ingestion_id)
+        except Exception as e:
+            logging.error(f"OCR job {job.job_id} failed on attempt {job.attempts}: {e}")
+            self._report(worker_id, job, self.queue.fail, str(e), self.retry_delay_s)
+            return
+        self._report(worker_id, job, self.queue.complete, ocr_id)
+
+    def _report(self, worker_id: str, job, update: Callable, *args):
+        try:
+            held = update(job.job_id, worker_id, *args)
+        except grpc.RpcError as e:
+            logging.error(f"Worker {worker_id} failed to report OCR job {job.job_id}: {e.details()}")
+            return
+        if not held:
+            # Reclaimed after the visibility timeout: the job's new worker reports it.
+            logging.warning(f"Worker {worker_id} lost its lease on OCR job {job.job_id}; result discarded")
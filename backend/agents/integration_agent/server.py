@@ -4,11 +4,13 @@ from concurrent import futures
 import uuid
 import os
 import httpx
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from backend.shared.grpc import agent_comm_pb2, agent_comm_pb2_grpc
-from backend.shared.clients.mcp import MCPClient
+from backend.shared.clients.mcp import MCPClient, TelemetrySender
+from backend.agents.common.idempotency import idempotent
 from backend.agents.common.logging_config import configure_logging
+from backend.shared.clients.registry import server_options
 
 TALLY_URL = os.getenv("TALLY_URL", "http://localhost:9000")
 ZOHO_BASE_URL = os.getenv("ZOHO_BASE_URL", "https://books.zoho.com/api/v3")
@@ -16,18 +18,24 @@ ZOHO_BASE_URL = os.getenv("ZOHO_BASE_URL", "https://books.zoho.com/api/v3")
 class IntegrationServicer(agent_comm_pb2_grpc.AgentCommServicer):
     def __init__(self):
         self.mcp_client = MCPClient()
+        self.telemetry = TelemetrySender(self.mcp_client)
 
+    @idempotent("integration_agent", agent_comm_pb2.IntegrationResponse)
     def PushIntegration(self, request, context):
         conversion_id = request.conversion_id
         logging.info(f"PushIntegration called for conversion_id: {conversion_id}, target: {request.target}")
 
         try:
-            # In a real system, you would fetch the conversion output from the MCP
-            output = "<ENVELOPE>...</ENVELOPE>" if request.target == "tally" else "{}"
+            conversion_log = self.mcp_client.get_conversion_log(conversion_id)
+            if not conversion_log:
+                raise Exception("Conversion log not found.")
+            output = conversion_log["output"]
 
             status = "PENDING"
             retry = 0
             next_retry_at = None
+            response = None
+            last_attempt_at = datetime.now(timezone.utc)
 
             try:
                 if request.target == "tally":
@@ -43,20 +51,27 @@ class IntegrationServicer(agent_comm_pb2_grpc.AgentCommServicer):
             except httpx.HTTPStatusError as e:
                 status = "FAILED"
                 retry = 1
-                next_retry_at = datetime.utcnow() + timedelta(minutes=5)
+                next_retry_at = last_attempt_at + timedelta(minutes=5)
                 logging.error(f"HTTP error during integration for {conversion_id}: {e}")
 
             integration_id = f"INT-{request.target.upper()}-{uuid.uuid4()}"
 
-            # Save to integration_logs via MCP
-            self.mcp_client.write_audit(
+            self.mcp_client.save_integration_log(
+                integration_id=integration_id,
+                conversion_id=conversion_id,
+                target=request.target,
+                status=status,
+                retry=retry,
+                platform_response=response.text if response is not None else None,
+                platform_status_code=response.status_code if response is not None else None,
+                last_attempt_at=int(last_attempt_at.timestamp()),
+                next_retry_at=int(next_retry_at.timestamp()) if next_retry_at else None,
+            )
+            self.telemetry.write_audit(
                 agent="integration_agent",
                 action="save_integration_log",
                 reference_id=conversion_id,
-                payload_json={
-                    "integration_id": integration_id, "target": request.target,
-                    "status": status, "retry": retry
-                }
+                payload={"integration_id": integration_id, "status": status},
             )
 
             return agent_comm_pb2.IntegrationResponse(
@@ -72,7 +87,7 @@ class IntegrationServicer(agent_comm_pb2_grpc.AgentCommServicer):
 
 def serve():
     configure_logging("integration_agent")
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=server_options())
     agent_comm_pb2_grpc.add_AgentCommServicer_to_server(IntegrationServicer(), server)
     server.add_insecure_port("[::]:6006")
     server.start()
@@ -6,13 +6,17 @@ import json
 import time
 
 from backend.shared.grpc import agent_comm_pb2, agent_comm_pb2_grpc
-from backend.shared.clients.mcp import MCPClient
+from backend.shared.clients.mcp import MCPClient, TelemetrySender
+from backend.agents.common.idempotency import idempotent
 from backend.agents.common.logging_config import configure_logging
+from backend.shared.clients.registry import server_options
 
 class MappingServicer(agent_comm_pb2_grpc.AgentCommServicer):
     def __init__(self):
         self.mcp_client = MCPClient()
+        self.telemetry = TelemetrySender(self.mcp_client)
 
+    @idempotent("mapping_agent", agent_comm_pb2.MapResponse)
     def MapSchema(self, request, context):
         ocr_id = request.ocr_id
         logging.info(f"MapSchema called for ocr_id: {ocr_id}")
@@ -37,21 +41,18 @@ class MappingServicer(agent_comm_pb2_grpc.AgentCommServicer):
 
             schema_id = f"MAP-{uuid.uuid4()}"
 
-            # Save to mapped_schema via MCP
-            self.mcp_client.write_audit(
+            self.mcp_client.save_mapped_schema(schema_id=schema_id, ocr_id=ocr_id, mapped_data=mapped_schema)
+            self.telemetry.write_audit(
                 agent="mapping_agent",
                 action="save_mapped_schema",
                 reference_id=ocr_id,
-                payload_json={
-                    "schema_id": schema_id,
-                    "mapped_schema": mapped_schema,
-                }
+                payload={"schema_id": schema_id},
             )
 
             mapping_time_ms = int((time.time() - start_time) * 1000)
-            self.mcp_client.write_metric(
+            self.telemetry.write_metric(
                 agent="mapping_agent",
-                ingestion_id=None, # In a real system, you would get this from the ocr_output
+                ingestion_id=ocr_output.get("ingestion_id"),
                 metrics={"mapping_time_ms": mapping_time_ms, "fields_extracted": len(mapped_schema)},
             )
 
@@ -69,7 +70,7 @@ class MappingServicer(agent_comm_pb2_grpc.AgentCommServicer):
 
 def serve():
     configure_logging("mapping_agent")
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=server_options())
     agent_comm_pb2_grpc.add_AgentCommServicer_to_server(MappingServicer(), server)
     server.add_insecure_port("[::]:6002")
     server.start()
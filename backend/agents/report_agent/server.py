@@ -5,13 +5,17 @@ import uuid
 import json
 
 from backend.shared.grpc import agent_comm_pb2, agent_comm_pb2_grpc
-from backend.shared.clients.mcp import MCPClient
+from backend.shared.clients.mcp import MCPClient, TelemetrySender
+from backend.agents.common.idempotency import idempotent
 from backend.agents.common.logging_config import configure_logging
+from backend.shared.clients.registry import server_options
 
 class ReportServicer(agent_comm_pb2_grpc.AgentCommServicer):
     def __init__(self):
         self.mcp_client = MCPClient()
+        self.telemetry = TelemetrySender(self.mcp_client)
 
+    @idempotent("report_agent", agent_comm_pb2.ReportResponse)
     def GenerateReport(self, request, context):
         validation_id = request.validation_id
         logging.info(f"GenerateReport called for validation_id: {validation_id}")
@@ -30,16 +34,19 @@ class ReportServicer(agent_comm_pb2_grpc.AgentCommServicer):
 
             report_id = f"RPT-{uuid.uuid4()}"
 
-            # Save to reports table via MCP
-            self.mcp_client.write_audit(
+            self.mcp_client.save_report(
+                report_id=report_id,
+                validation_id=validation_id,
+                status="READY",
+                summary=summary,
+                schema_id=request.schema_id or validation_logs["schema_id"],
+                user_id=request.user_id,
+            )
+            self.telemetry.write_audit(
                 agent="report_agent",
                 action="save_report",
                 reference_id=validation_id,
-                payload_json={
-                    "report_id": report_id,
-                    "status": "READY",
-                    "summary": summary
-                }
+                payload={"report_id": report_id},
             )
 
             return agent_comm_pb2.ReportResponse(
@@ -56,7 +63,7 @@ class ReportServicer(agent_comm_pb2_grpc.AgentCommServicer):
 
 def serve():
     configure_logging("report_agent")
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=server_options())
     agent_comm_pb2_grpc.add_AgentCommServicer_to_server(ReportServicer(), server)
     server.add_insecure_port("[::]:6004")
     server.start()
@@ -0,0 +1,89 @@
+import json
+import logging
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from backend.agents.validation_agent.rules import CompiledRuleset, Finding, RulesetSource
+from backend.shared.services.process_pool import BoundedProcessPool
+
+@dataclass
+class SchemaOutcome:
+    """Validation outcome of one mapped schema; `error` is set when it could not be validated."""
+    schema_id: str
+    findings: List[Finding] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def errors(self) -> List[str]:
+        return [f.message for f in self.findings if f.severity == "error"]
+
+    @property
+    def warnings(self) -> List[Finding]:
+        return [f for f in self.findings if f.severity == "warning"]
+
+def validate_chunk(ruleset: CompiledRuleset, documents: List[Tuple[str, bytes]]) -> List[SchemaOutcome]:
+    """Decodes (schema_id, mapped_data JSON) pairs and validates them in one validate_many
+    pass. If the pass fails on a malformed schema, the chunk is validated one schema at
+    a time, and only the schemas that fail get an error."""
+    outcomes, invoices, valid = [], [], []
+    for schema_id, mapped_json in documents:
+        outcome = SchemaOutcome(schema_id)
+        outcomes.append(outcome)
+        try:
+            invoice = json.loads(mapped_json) if mapped_json else {}
+        except ValueError as e:
+            outcome.error = f"Invalid mapped data: {e}"
+            continue
+        if not isinstance(invoice, dict):
+            invoice = {}
+        invoices.append(invoice)
+        valid.append(outcome)
+    try:
+        results = ruleset.validate_many(invoices)
+    except Exception:
+        results = []
+        for outcome, invoice in zip(valid, invoices):
+            try:
+                results.append(ruleset.validate(invoice))
+            except Exception as e:
+                logging.error(f"Validating schema {outcome.schema_id} failed: {e}")
+                outcome.error = f"Validation failed: {e}"
+                results.append(None)
+    for outcome, findings in zip(valid, results):
+        if findings is not None:
+            outcome.findings = findings
+    return outcomes
+
+# Rulesets compiled in this (worker) process, by (name, fingerprint); only the latest is kept.
+_compiled: Dict[tuple, CompiledRuleset] = {}
+
+def compiled_ruleset(source: RulesetSource) -> CompiledRuleset:
+    key = (source.name, source.fingerprint)
+    ruleset = _compiled.get(key)
+    if ruleset is None:
+        _compiled.clear()
+        ruleset = _compiled[key] = source.compile()
+    return ruleset
+
+def _validate_chunk_from_source(source: RulesetSource, documents: List[Tuple[str, bytes]]) -> List[SchemaOutcome]:
+    return validate_chunk(compiled_ruleset(source), documents)
+
+class BatchValidator(BoundedProcessPool):
+    """Validates a stream of mapped schemas in chunks on a process pool.
+
+    Schemas arrive as undecoded JSON, so both decoding and validation happen in the
+    workers and only the findings come back. Each chunk of `chunk_size` schemas goes to
+    a worker along with the ruleset's source, which workers compile once per ruleset
+    version. Outcomes are yielded in input order. A pool of one worker validates in
+    this process.
+    """
+
+    def __init__(self, workers: int = 0, chunk_size: int = 200):
+        super().__init__(workers)
+        self.chunk_size = chunk_size
+
+    def validate(self, source: RulesetSource, documents: Iterable[Tuple[str, bytes]]) -> Iterator[List[SchemaOutcome]]:
+        """Yields the outcomes of each chunk of `documents`, in order."""
+        chunks = ((source, list(chunk)) for chunk in batched(documents, self.chunk_size))
+        return self.imap(_validate_chunk_from_source, chunks)
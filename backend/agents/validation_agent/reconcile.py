@@ -0,0 +1,295 @@
+import decimal
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from decimal import Decimal
+from functools import partial
+from itertools import accumulate, compress, count, repeat
+from operator import add, mul, ne
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+CENT = Decimal("0.01")
+# Nothing on an invoice reaches this; larger amounts are misreads.
+LIMIT = 10**15
+# Digits the arithmetic keeps: enough for quantity × rate × tax rate of amounts below
+# LIMIT, rounded to paise, and their sums, so no product loses digits or fails to
+# quantize.
+PRECISION = 64
+ROUNDING_MODES = frozenset(name for name in dir(decimal) if name.startswith("ROUND_"))
+
+# Fields reconciled by default: the mapped schema's. A ruleset's `reconcile.fields`
+# can rename any of them, e.g. for camelCase extractions.
+DEFAULT_FIELDS = {
+    "items": "items",
+    "description": "description",
+    "quantity": "quantity",
+    "rate": "rate",
+    "tax_rate": "tax_rate",
+    "tax_amount": "tax_amount",
+    "amount": "total",
+    "subtotal": "total_amount",
+    "tax_total": "tax_total",
+    "cgst": "cgst",
+    "sgst": "sgst",
+    "igst": "igst",
+    "round_off": "round_off",
+    "grand_total": "grand_total",
+}
+
+def to_decimal(value) -> Optional[Decimal]:
+    """The amount `value` as written (a float by its shortest repr, so 0.1 is 0.1, and
+    a string without thousands separators), or None when blank or not an amount."""
+    kind = type(value)
+    if kind is float:
+        value = repr(value)
+    elif kind is str:
+        value = value.replace(",", "").strip()
+    elif kind is not int and kind is not Decimal:
+        return None
+    try:
+        amount = Decimal(value)
+    except decimal.InvalidOperation:
+        return None
+    return amount if amount.is_finite() and -LIMIT < amount < LIMIT else None
+
+class Column(NamedTuple):
+    """Amounts of one field; None where missing."""
+    values: List[Optional[Decimal]]
+    complete: bool  # no amount missing
+    empty: bool  # every amount missing
+
+    @classmethod
+    def of(cls, values: List[Optional[Decimal]], distinct: Optional[Iterable] = None) -> "Column":
+        present = [value is not None for value in (values if distinct is None else distinct)]
+        return cls(values, all(present), not any(present))
+
+def decimal_column(column: Sequence[Any]) -> Column:
+    """`column` as Decimals (see to_decimal). Columns mostly repeat few distinct values
+    (quantities, tax rates), which are converted once each."""
+    try:
+        distinct = set(column)
+    except TypeError:  # unhashable values
+        distinct = None
+    # to_decimal, inlined for floats (NaN fails the comparison and goes to to_decimal).
+    if distinct is None or 2 * len(distinct) > len(column):
+        return Column.of([
+            Decimal(repr(value)) if type(value) is float and -LIMIT < value < LIMIT else to_decimal(value)
+            for value in column
+        ])
+    converted = {
+        value: Decimal(repr(value)) if type(value) is float and -LIMIT < value < LIMIT else to_decimal(value)
+        for value in distinct
+    }
+    return Column.of(list(map(converted.__getitem__, column)), converted.values())
+
+def combine(fn: Callable[..., Iterable[Decimal]], *columns: Column) -> Column:
+    """The columns combined row by row, None in rows where one of them is. `fn` takes
+    the columns' values as lists and returns the combined values in order, so it can
+    map C-level Decimal operations over whole columns."""
+    size = len(columns[0].values)
+    if any(column.empty for column in columns):
+        return Column([None] * size, False, True)
+    if all(column.complete for column in columns):
+        return Column(list(fn(*(column.values for column in columns))), True, False)
+    rows = [i for i, args in enumerate(zip(*(column.values for column in columns))) if None not in args]
+    values: List[Optional[Decimal]] = [None] * size
+    for i, value in zip(rows, fn(*([column.values[i] for i in rows] for column in columns))):
+        values[i] = value
+    return Column.of(values)
+
+def differing(found: Column, expected: Column, tolerance: Decimal) -> List[int]:
+    """Positions where `found` and `expected` both have an amount and they differ by
+    more than `tolerance`."""
+    if found.empty or expected.empty:
+        return []
+    if found.complete and expected.complete:
+        # Most amounts are exactly right; only those that differ are measured.
+        unequal = compress(count(), map(ne, found.values, expected.values))
+        return [i for i in unequal if abs(found.values[i] - expected.values[i]) > tolerance]
+    return [
+        i for i, (a, b) in enumerate(zip(found.values, expected.values))
+        if a is not None and b is not None and abs(a - b) > tolerance
+    ]
+
+def _sum(amounts: Sequence[Optional[Decimal]]) -> Optional[Decimal]:
+    return None if not amounts or any(amount is None for amount in amounts) else sum(amounts, Decimal(0))
+
+@dataclass
+class Mismatch:
+    """An amount that does not reconcile. `field` locates it (`items[2].total` for the
+    third line item); `expected` is what the other amounts add up to."""
+    check: str
+    field: str
+    message: str
+    expected: str
+    found: str
+
+@dataclass
+class ReconcileConfig:
+    # Largest difference between an amount and what it should add up to.
+    tolerance: Decimal = CENT
+    # Largest round off; without a round off field, the grand total may differ from
+    # subtotal + GST by this much.
+    max_round_off: Decimal = Decimal("0.50")
+    # How line amounts (quantity × rate, and their tax) are rounded to paise.
+    rounding: str = decimal.ROUND_HALF_UP
+    # Whether a line item's amount includes its tax.
+    amount_includes_tax: bool = True
+    # Severity of the findings.
+    severity: str = "error"
+    fields: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_FIELDS))
+
+    @classmethod
+    def from_definition(cls, definition: dict) -> "ReconcileConfig":
+        """The config of a ruleset's `reconcile` mapping; raises ValueError if invalid."""
+        unknown = set(definition) - {"tolerance", "max_round_off", "rounding", "amount_includes_tax", "fields", "severity"}
+        if unknown:
+            raise ValueError(f"unknown reconcile settings {sorted(unknown)}")
+        fields = dict(definition.get("fields") or {})
+        if set(fields) - set(DEFAULT_FIELDS):
+            raise ValueError(f"unknown reconcile fields {sorted(set(fields) - set(DEFAULT_FIELDS))}")
+        if definition.get("severity", cls.severity) not in ("error", "warning"):
+            raise ValueError("reconcile severity must be error or warning")
+        if definition.get("rounding", cls.rounding) not in ROUNDING_MODES:
+            raise ValueError(f"reconcile rounding must be one of {sorted(ROUNDING_MODES)}")
+        amounts = {}
+        for key in ("tolerance", "max_round_off"):
+            amounts[key] = to_decimal(definition.get(key, getattr(cls, key)))
+            if amounts[key] is None or amounts[key] < 0:
+                raise ValueError(f"reconcile {key} must be a non-negative amount")
+        return cls(
+            rounding=definition.get("rounding", cls.rounding),
+            amount_includes_tax=bool(definition.get("amount_includes_tax", True)),
+            severity=definition.get("severity", cls.severity),
+            fields={**DEFAULT_FIELDS, **fields},
+            **amounts,
+        )
+
+class Reconciler:
+    """Checks that an invoice's amounts add up, in Decimal arithmetic.
+
+    Per line item, quantity × rate (rounded to paise) is the taxable value, the tax
+    amount is that at the tax rate, and the amount is the taxable value plus the tax
+    (or without it, see `amount_includes_tax`). Per invoice, the line items' taxable
+    values add up to the subtotal and their taxes to the GST amount, CGST + SGST +
+    IGST make the GST amount with CGST equal to SGST, and subtotal + GST + round off
+    make the grand total. A check is skipped when an amount it needs is missing or
+    unreadable; required and range rules report those.
+
+    Like the rules, `reconcile_many` works on columns: each line item field of all the
+    invoices becomes one column of Decimals, converting every distinct value once, and
+    the line items' amounts are computed column by column.
+    """
+
+    def __init__(self, config: ReconcileConfig):
+        self.config = config
+
+    def reconcile_many(self, invoices: Sequence[dict]) -> List[List[Mismatch]]:
+        with decimal.localcontext(prec=PRECISION):
+            return self._reconcile_many(invoices)
+
+    def _reconcile_many(self, invoices: Sequence[dict]) -> List[List[Mismatch]]:
+        f, tolerance = self.config.fields, self.config.tolerance
+        mismatches: List[List[Mismatch]] = [[] for _ in invoices]
+        item_lists = [invoice.get(f["items"]) or () for invoice in invoices]
+        offsets = list(accumulate(map(len, item_lists), initial=0))
+        items = [item for items in item_lists for item in items]
+
+        def item_column(name) -> Column:
+            return decimal_column([item.get(f[name]) for item in items])
+
+        def invoice_column(name) -> List[Optional[Decimal]]:
+            return decimal_column([invoice.get(f[name]) for invoice in invoices]).values
+
+        quantities, rates, tax_rates = item_column("quantity"), item_column("rate"), item_column("tax_rate")
+        stated_taxes, amounts = item_column("tax_amount"), item_column("amount")
+        quantize, rounding = Decimal.quantize, self.config.rounding
+
+        def rounded(values: Iterable[Decimal]) -> Iterator[Decimal]:
+            return map(quantize, values, repeat(CENT), repeat(rounding))
+
+        taxable = combine(lambda quantities, rates: rounded(map(mul, quantities, rates)), quantities, rates)
+        computed_taxes = combine(
+            lambda values, tax_rates: rounded(map(Decimal.scaleb, map(mul, values, tax_rates), repeat(-2))),
+            taxable, tax_rates,
+        )
+        if stated_taxes.complete or computed_taxes.empty:
+            taxes = stated_taxes
+        elif stated_taxes.empty:
+            taxes = computed_taxes
+        else:
+            values = [
+                computed if stated is None else stated for stated, computed in zip(stated_taxes.values, computed_taxes.values)
+            ]
+            taxes = Column.of(values)
+        expected_amounts = combine(partial(map, add), taxable, taxes) if self.config.amount_includes_tax else taxable
+
+        item_mismatches = [
+            (i, "item_tax_amount", f["tax_amount"], "Tax amount", stated_taxes, computed_taxes)
+            for i in differing(stated_taxes, computed_taxes, tolerance)
+        ] + [
+            (i, "item_amount", f["amount"], "Amount", amounts, expected_amounts)
+            for i in differing(amounts, expected_amounts, tolerance)
+        ]
+        for i, check, name, label, found, expected in sorted(item_mismatches):
+            owner = bisect_right(offsets, i) - 1
+            line, description = i - offsets[owner], items[i].get(f["description"])
+            mismatches[owner].append(Mismatch(
+                check, f"{f['items']}[{line}].{name}",
+                f"{label} {found.values[i]} should be {expected.values[i]} for line {line + 1}: {description}",
+                str(expected.values[i]), str(found.values[i]),
+            ))
+
+        columns = zip(
+            invoice_column("subtotal"), invoice_column("tax_total"), invoice_column("cgst"),
+            invoice_column("sgst"), invoice_column("igst"), invoice_column("round_off"), invoice_column("grand_total"),
+        )
+        taxable, taxes = taxable.values, taxes.values
+        for k, (subtotal, tax_total, cgst, sgst, igst, round_off, grand_total) in enumerate(columns):
+            found = mismatches[k]
+            items_subtotal = _sum(taxable[offsets[k]:offsets[k + 1]])
+            items_tax = _sum(taxes[offsets[k]:offsets[k + 1]])
+
+            if subtotal is not None and items_subtotal is not None and abs(subtotal - items_subtotal) > tolerance:
+                found.append(Mismatch(
+                    "subtotal", f["subtotal"],
+                    f"Subtotal {subtotal} does not match the line items' total {items_subtotal}.",
+                    str(items_subtotal), str(subtotal),
+                ))
+            if tax_total is not None and items_tax is not None and abs(tax_total - items_tax) > tolerance:
+                found.append(Mismatch(
+                    "tax_total", f["tax_total"],
+                    f"GST amount {tax_total} does not match the line items' tax {items_tax}.",
+                    str(items_tax), str(tax_total),
+                ))
+
+            gst = items_tax if tax_total is None else tax_total
+            components = [amount for amount in (cgst, sgst, igst) if amount is not None]
+            if components and gst is not None and abs(sum(components) - gst) > tolerance:
+                found.append(Mismatch(
+                    "gst_split", f["tax_total"],
+                    f"CGST + SGST + IGST {sum(components)} does not match the GST amount {gst}.",
+                    str(gst), str(sum(components)),
+                ))
+            if cgst is not None and sgst is not None and abs(cgst - sgst) > tolerance:
+                found.append(Mismatch(
+                    "cgst_sgst", f["sgst"], f"SGST {sgst} differs from CGST {cgst}.", str(cgst), str(sgst),
+                ))
+
+            if round_off is not None and abs(round_off) > self.config.max_round_off:
+                found.append(Mismatch(
+                    "round_off", f["round_off"],
+                    f"Round off {round_off} exceeds {self.config.max_round_off}.",
+                    str(self.config.max_round_off), str(round_off),
+                ))
+            base = items_subtotal if subtotal is None else subtotal
+            if grand_total is None or base is None or gst is None:
+                continue
+            expected = base + gst + (round_off or 0)
+            allowed = tolerance if round_off is not None else max(tolerance, self.config.max_round_off)
+            if abs(grand_total - expected) > allowed:
+                found.append(Mismatch(
+                    "grand_total", f["grand_total"],
+                    f"Grand total {grand_total} should be {expected} (subtotal + GST + round off).",
+                    str(expected), str(grand_total),
+                ))
+        return mismatches
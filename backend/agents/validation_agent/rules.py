@@ -0,0 +1,428 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from itertools import accumulate, compress
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import yaml
+
+from backend.agents.common.hsn_index import MIN_PREFIX, get_hsn_master, normalize_hsn
+from backend.agents.common.validation_utils import gstin_problem
+from backend.agents.common.vendor_index import get_vendor_master
+from backend.agents.validation_agent.reconcile import ReconcileConfig, Reconciler
+from backend.shared.dependencies.config import get_settings
+
+BUNDLED_RULESETS_DIR = os.path.join(os.path.dirname(__file__), "rulesets")
+RULESET_SUFFIXES = (".yaml", ".yml", ".json")
+SEVERITIES = ("error", "warning")
+SCOPES = ("invoice", "items")
+
+class RulesetError(Exception):
+    """A ruleset definition that cannot be compiled."""
+
+class UnknownRuleset(KeyError):
+    pass
+
+@dataclass
+class Finding:
+    rule_id: str
+    field: str
+    severity: str
+    message: str
+    # For reconciliation findings, the amount the others add up to and the one found.
+    expected: Optional[str] = None
+    found: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        """The finding as stored in validation logs, without unset amounts."""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+    @property
+    def suggested_fix(self) -> Optional[dict]:
+        return None if self.expected is None else {"expected": self.expected, "found": self.found}
+
+class _Row(dict):
+    # Message templates name fields of the invoice or line item; missing ones read None.
+    def __missing__(self, key):
+        return None
+
+def _blank(value) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+def _parse_date(value) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(str(value)).astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+# A check compiles a rule into a predicate on one value. Blank values fail every
+# check but `required` only when the rule is not `optional`.
+Predicate = Callable[[Any], bool]
+
+def _blank_aware(rule: dict, ok: Predicate) -> Predicate:
+    blank_ok = rule.get("optional", False)
+    return lambda value: blank_ok if _blank(value) else ok(value)
+
+def _required_check(rule: dict) -> Predicate:
+    return lambda value: not _blank(value)
+
+def _regex_check(rule: dict) -> Predicate:
+    try:
+        fullmatch = re.compile(rule["pattern"]).fullmatch
+    except re.error as e:
+        raise RulesetError(f"rule {rule['id']}: bad pattern: {e}") from e
+    return _blank_aware(rule, lambda value: fullmatch(str(value)) is not None)
+
+def _length_check(rule: dict) -> Predicate:
+    allowed = frozenset(rule.get("allowed") or ())
+    low, high = rule.get("min", 0), rule.get("max", float("inf"))
+
+    def ok(value):
+        length = len(str(value))
+        return (not allowed or length in allowed) and low <= length <= high
+    return _blank_aware(rule, ok)
+
+def _range_check(rule: dict) -> Predicate:
+    low, high = rule.get("min", float("-inf")), rule.get("max", float("inf"))
+
+    def ok(value):
+        try:
+            return low <= float(value) <= high
+        except (TypeError, ValueError):
+            return False
+    return _blank_aware(rule, ok)
+
+def _one_of_check(rule: dict) -> Predicate:
+    values = frozenset(rule["values"])
+    return _blank_aware(rule, lambda value: value in values)
+
+def _date_check(rule: dict) -> Predicate:
+    not_future = rule.get("not_future", False)
+
+    def ok(value):
+        parsed = _parse_date(value)
+        return parsed is not None and not (not_future and parsed > datetime.now(timezone.utc))
+    return _blank_aware(rule, ok)
+
+def _gstin_check(rule: dict) -> Predicate:
+    # State code and check digit; malformed GSTINs are left to a regex rule, so each
+    # problem is reported once.
+    return _blank_aware(rule, lambda value: gstin_problem(str(value)) in (None, "format"))
+
+def _require_one_with_field(rule: dict, what: str):
+    if len(rule.get("with") or ()) != 1:
+        raise RulesetError(f"rule {rule['id']}: {rule['check']} needs `with: [<{what} field>]`")
+
+def _vendor_known_check(rule: dict) -> Predicate:
+    master = get_vendor_master()
+    if master is None:
+        return lambda value: True
+    statuses = frozenset(status.casefold() for status in rule.get("statuses", ["Active"]))
+
+    def ok(value):
+        vendor = master.index().get(str(value))
+        return vendor is not None and (not statuses or vendor.status.casefold() in statuses)
+    return _blank_aware(rule, ok)
+
+def _vendor_name_check(rule: dict) -> Predicate:
+    # Values are (name, GSTIN) pairs: the rule's field `with` the GSTIN field. Vendors
+    # missing from the master pass; vendor_known reports them.
+    _require_one_with_field(rule, "GSTIN")
+    master = get_vendor_master()
+    if master is None:
+        return lambda pair: True
+    min_score = rule.get("min_score", 0.85)
+    blank_ok = rule.get("optional", False)
+
+    def ok(pair):
+        name, gstin = pair
+        if _blank(name):
+            return blank_ok
+        vendor = master.index().get(gstin)
+        return vendor is None or vendor.name_score(name) >= min_score
+    return ok
+
+def _hsn_known_check(rule: dict) -> Predicate:
+    # Malformed or too short codes are left to a length rule.
+    master = get_hsn_master()
+    if master is None:
+        return lambda value: True
+
+    def ok(value):
+        code = normalize_hsn(value)
+        return code is None or len(code) < MIN_PREFIX or master.index().resolve(code) is not None
+    return _blank_aware(rule, ok)
+
+def _hsn_tax_rate_check(rule: dict) -> Predicate:
+    # Values are (tax rate, code) pairs: the rule's field `with` the HSN field. Unknown
+    # codes, which hsn_known reports, and codes the master has no rate for pass.
+    _require_one_with_field(rule, "HSN")
+    master = get_hsn_master()
+    if master is None:
+        return lambda pair: True
+    blank_ok = rule.get("optional", False)
+
+    def ok(pair):
+        rate, code = pair
+        if _blank(rate):
+            return blank_ok
+        rates = master.index().rates(code)
+        if not rates:
+            return True
+        try:
+            return round(float(rate), 2) in rates
+        except (TypeError, ValueError):
+            return False
+    return ok
+
+CHECKS: Dict[str, Callable[[dict], Predicate]] = {
+    "required": _required_check,
+    "regex": _regex_check,
+    "length": _length_check,
+    "range": _range_check,
+    "one_of": _one_of_check,
+    "date": _date_check,
+    "gstin": _gstin_check,
+    "vendor_known": _vendor_known_check,
+    "vendor_name": _vendor_name_check,
+    "hsn_known": _hsn_known_check,
+    "hsn_tax_rate": _hsn_tax_rate_check,
+}
+
+def failing_positions(ok: Predicate, column: Sequence[Any]) -> List[int]:
+    """Positions of the values of `column` that fail `ok`.
+
+    Columns repeat few distinct values (HSN codes, dates, tax rates), so `ok` runs
+    once per distinct value. The failing values, if any, are then located without a
+    Python-level loop over the column.
+    """
+    try:
+        failing = {value for value in set(column) if not ok(value)}
+    except TypeError:  # unhashable values
+        return [i for i, value in enumerate(column) if not ok(value)]
+    if not failing:
+        return []
+    return list(compress(range(len(column)), map(failing.__contains__, column)))
+
+@dataclass
+class CompiledRule:
+    id: str
+    scope: str
+    field: str
+    severity: str
+    message: str
+    check: Predicate
+    # Further fields read with `field`; the check then gets a tuple of their values.
+    with_fields: tuple = ()
+
+def compile_rule(rule: dict) -> CompiledRule:
+    for key in ("id", "field", "check", "message"):
+        if key not in rule:
+            raise RulesetError(f"rule {rule.get('id', '?')}: missing {key!r}")
+    if rule["check"] not in CHECKS:
+        raise RulesetError(f"rule {rule['id']}: unknown check {rule['check']!r}")
+    scope, severity = rule.get("scope", "invoice"), rule.get("severity", "error")
+    if scope not in SCOPES:
+        raise RulesetError(f"rule {rule['id']}: scope must be one of {SCOPES}")
+    if severity not in SEVERITIES:
+        raise RulesetError(f"rule {rule['id']}: severity must be one of {SEVERITIES}")
+    return CompiledRule(
+        rule["id"], scope, rule["field"], severity, rule["message"], CHECKS[rule["check"]](rule), tuple(rule.get("with") or ()),
+    )
+
+class CompiledRuleset:
+    """A ruleset compiled into column checks.
+
+    `validate_many` gathers each field the rules use into one column, across all the
+    invoices (header fields) or all their line items (item fields), and runs every
+    rule once over its column (see failing_positions). Messages are only formatted
+    for failing values. The ruleset's reconciler, if any, then checks the amounts add
+    up; its findings have ids prefixed `reconcile_`.
+    """
+
+    def __init__(self, name: str, rules: List[CompiledRule], reconciler: Optional[Reconciler] = None):
+        self.name = name
+        self.rules = rules
+        self.reconciler = reconciler
+
+    def validate(self, invoice: dict) -> List[Finding]:
+        return self.validate_many([invoice])[0]
+
+    def validate_many(self, invoices: Sequence[dict]) -> List[List[Finding]]:
+        findings: List[List[Finding]] = [[] for _ in invoices]
+        item_lists = [invoice.get("items") or () for invoice in invoices]
+        offsets = list(accumulate(map(len, item_lists), initial=0))  # first item of each invoice
+        columns: Dict[tuple, list] = {}
+        for rule in self.rules:
+            key = (rule.scope, rule.field, rule.with_fields)
+            if key not in columns:
+                if rule.with_fields:
+                    fields = (rule.field,) + rule.with_fields
+                    rows = invoices if rule.scope == "invoice" else (item for items in item_lists for item in items)
+                    columns[key] = [tuple(row.get(field) for field in fields) for row in rows]
+                elif rule.scope == "invoice":
+                    columns[key] = [invoice.get(rule.field) for invoice in invoices]
+                else:
+                    columns[key] = [item.get(rule.field) for items in item_lists for item in items]
+            for i in failing_positions(rule.check, columns[key]):
+                if rule.scope == "invoice":
+                    owner, row = i, invoices[i]
+                else:
+                    owner = bisect_right(offsets, i) - 1
+                    row = item_lists[owner][i - offsets[owner]]
+                findings[owner].append(Finding(rule.id, rule.field, rule.severity, rule.message.format_map(_Row(row))))
+        if self.reconciler:
+            severity = self.reconciler.config.severity
+            for found, mismatches in zip(findings, self.reconciler.reconcile_many(invoices)):
+                found.extend(
+                    Finding(f"reconcile_{m.check}", m.field, severity, m.message, m.expected, m.found) for m in mismatches
+                )
+        return findings
+
+@dataclass
+class RulesetSource:
+    """The definitions a ruleset compiles from. Unlike a CompiledRuleset it pickles, so
+    worker processes can be handed one and compile it themselves; the fingerprint
+    identifies the definitions for caching."""
+    name: str
+    fingerprint: str
+    definitions: Dict[str, dict]
+
+    def compile(self) -> CompiledRuleset:
+        return compile_rulesets(self.definitions)[self.name]
+
+def load_definition(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        definition = json.load(f) if path.endswith(".json") else yaml.safe_load(f)
+    if not isinstance(definition, dict) or not isinstance(definition.get("rules", []), list):
+        raise RulesetError(f"{path}: expected a mapping with a 'rules' list")
+    return definition
+
+def compile_rulesets(definitions: Dict[str, dict]) -> Dict[str, CompiledRuleset]:
+    """Compiles ruleset definitions by name. A ruleset may `extends` another: it gets
+    the base's rules first, with rules of the same id replaced by its own, and the
+    base's `reconcile` settings updated with its own (`reconcile: false` turns
+    reconciliation off)."""
+    compiled: Dict[str, CompiledRuleset] = {}
+
+    def resolve(name: str, chain: tuple) -> List[dict]:
+        if name in chain:
+            raise RulesetError(f"ruleset {name}: circular extends {' -> '.join(chain + (name,))}")
+        if name not in definitions:
+            raise RulesetError(f"ruleset {chain[-1]} extends unknown ruleset {name}")
+        definition = definitions[name]
+        rules = resolve(definition["extends"], chain + (name,)) if definition.get("extends") else []
+        own = {rule.get("id"): rule for rule in definition.get("rules", [])}
+        merged = [own.pop(rule["id"], rule) for rule in rules]
+        return merged + list(own.values())
+
+    def reconcile_settings(name: str) -> Optional[dict]:
+        definition = definitions[name]
+        settings = reconcile_settings(definition["extends"]) if definition.get("extends") else None
+        own = definition.get("reconcile")
+        if own is None:
+            return settings
+        if own is False:
+            return None
+        if not isinstance(own, dict):
+            raise RulesetError(f"ruleset {name}: reconcile must be a mapping or false")
+        settings = settings or {}
+        fields = {**(settings.get("fields") or {}), **(own.get("fields") or {})}
+        return {**settings, **own, "fields": fields}
+
+    for name in definitions:
+        rules = [compile_rule(rule) for rule in resolve(name, ())]
+        settings = reconcile_settings(name)
+        try:
+            reconciler = Reconciler(ReconcileConfig.from_definition(settings)) if settings is not None else None
+        except ValueError as e:
+            raise RulesetError(f"ruleset {name}: {e}") from e
+        compiled[name] = CompiledRuleset(name, rules, reconciler)
+    return compiled
+
+class RulesetRegistry:
+    """Rulesets compiled from the YAML/JSON files of a directory, one ruleset per file
+    named after it.
+
+    The files are compiled when the registry is created; a bad ruleset then raises. At
+    most every `reload_interval_s`, a lookup checks the files' modification times and
+    recompiles all of them if any changed, so edits apply without a restart. If the
+    new files do not compile, the error is logged and the previous rulesets stay in
+    use. A reload interval of 0 disables reloading.
+    """
+
+    def __init__(self, directory: str, reload_interval_s: float = 5.0):
+        self.directory = directory
+        self.reload_interval_s = reload_interval_s
+        self._lock = threading.Lock()
+        self._signature = self._scan()
+        self._definitions, self._rulesets = self._compile(self._signature)
+        self._checked_at = time.monotonic()
+
+    def _scan(self) -> Dict[str, tuple]:
+        signature = {}
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(RULESET_SUFFIXES):
+                stat = entry.stat()
+                signature[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    def _compile(self, signature: Dict[str, tuple]):
+        definitions = {}
+        for path in sorted(signature):
+            name = os.path.splitext(os.path.basename(path))[0]
+            if name in definitions:
+                raise RulesetError(f"ruleset {name} is defined by more than one file")
+            definitions[name] = load_definition(path)
+        compiled = compile_rulesets(definitions)
+        fingerprint = hashlib.sha256(json.dumps(definitions, sort_keys=True, default=str).encode()).hexdigest()
+        return (fingerprint, definitions), compiled
+
+    def get(self, name: str) -> CompiledRuleset:
+        self._maybe_reload()
+        try:
+            return self._rulesets[name]
+        except KeyError:
+            raise UnknownRuleset(f"Unknown ruleset: {name}") from None
+
+    def source(self, name: str) -> RulesetSource:
+        """The definitions the current `get(name)` ruleset was compiled from."""
+        self._maybe_reload()
+        fingerprint, definitions = self._definitions
+        if name not in definitions:
+            raise UnknownRuleset(f"Unknown ruleset: {name}")
+        return RulesetSource(name, fingerprint, definitions)
+
+    def names(self) -> List[str]:
+        return sorted(self._rulesets)
+
+    def _maybe_reload(self):
+        if self.reload_interval_s <= 0 or time.monotonic() - self._checked_at < self.reload_interval_s:
+            return
+        with self._lock:
+            if time.monotonic() - self._checked_at < self.reload_interval_s:
+                return
+            self._checked_at = time.monotonic()
+            try:
+                signature = self._scan()
+                if signature == self._signature:
+                    return
+                self._definitions, self._rulesets = self._compile(signature)
+                self._signature = signature
+                logging.info(f"Reloaded validation rulesets: {self.names()}")
+            except Exception as e:
+                logging.error(f"Could not reload validation rulesets from {self.directory}: {e}")
+
+def get_ruleset_registry() -> RulesetRegistry:
+    settings = get_settings()
+    return RulesetRegistry(
+        settings.VALIDATION_RULESETS_DIR or BUNDLED_RULESETS_DIR,
+        settings.VALIDATION_RULES_RELOAD_INTERVAL_S,
+    )
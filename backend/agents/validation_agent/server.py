@@ -3,71 +3,92 @@ import grpc
 from concurrent import futures
 import uuid
 import json
-import re
-from datetime import datetime, timezone
 
-from backend.shared.grpc import agent_comm_pb2, agent_comm_pb2_grpc
-from backend.shared.clients.mcp import MCPClient
+from backend.shared.grpc import agent_comm_pb2, agent_comm_pb2_grpc, mcp_pb2
+from backend.shared.clients.mcp import MCPClient, TelemetrySender
+from backend.agents.common.idempotency import idempotent
 from backend.agents.common.logging_config import configure_logging
+from backend.agents.common.validation_utils import validate_date, validate_gstin
+from backend.agents.validation_agent.batch import BatchValidator
+from backend.agents.validation_agent.rules import UnknownRuleset, get_ruleset_registry
+from backend.shared.clients.registry import server_options
+from backend.shared.dependencies.config import get_settings
 
-def validate_gstin(gstin: str) -> bool:
-    if not gstin:
-        return False
-    return re.match(r"^\d{2}[A-Z]{5}\d{4}[A-Z]{1}[A-Z\d]{1}Z[A-Z\d]{1}$", gstin) is not None
-
-def validate_date(date_str: str) -> bool:
-    if not date_str:
-        return False
-    try:
-        invoice_date = datetime.fromisoformat(date_str).astimezone(timezone.utc)
-        return invoice_date <= datetime.now(timezone.utc)
-    except ValueError:
-        return False
+def _finding_message(finding) -> agent_comm_pb2.ValidationFinding:
+    return agent_comm_pb2.ValidationFinding(
+        rule_id=finding.rule_id,
+        field=finding.field,
+        severity=finding.severity,
+        message=finding.message,
+        expected=finding.expected,
+        found=finding.found,
+    )
 
 class ValidationServicer(agent_comm_pb2_grpc.AgentCommServicer):
     def __init__(self):
         self.mcp_client = MCPClient()
+        self.telemetry = TelemetrySender(self.mcp_client)
+        self.rulesets = get_ruleset_registry()
+        settings = get_settings()
+        self.batch_validator = BatchValidator(settings.VALIDATION_BATCH_WORKERS, settings.VALIDATION_BATCH_CHUNK_SIZE)
 
+    @idempotent("validation_agent", agent_comm_pb2.ValidateResponse)
     def ValidateSchema(self, request, context):
         schema_id = request.schema_id
-        logging.info(f"ValidateSchema called for schema_id: {schema_id}")
+        ruleset_name = request.ruleset or "default"
+        logging.info(f"ValidateSchema called for schema_id: {schema_id} (ruleset {ruleset_name})")
 
         try:
-            mapped_schema = self.mcp_client.get_mapped_schema(schema_id)
-            if not mapped_schema:
-                raise Exception("Mapped schema not found.")
-
-            errors = []
-            warnings = []
+            ruleset = self.rulesets.get(ruleset_name)
+        except UnknownRuleset as e:
+            context.set_details(str(e))
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            return agent_comm_pb2.ValidateResponse()
 
-            if not validate_gstin(mapped_schema.get("supplier_gstin")):
-                errors.append("Invalid GSTIN format.")
-            if not validate_date(mapped_schema.get("invoice_date")):
-                errors.append("Invoice date is in the future or invalid.")
+        try:
+            mapped = self.mcp_client.get_mapped_schema(schema_id)
+            if not mapped:
+                raise Exception("Mapped schema not found.")
+            mapped_schema = mapped["mapped_data"] or {}
 
-            for item in mapped_schema.get("items", []):
-                if not item.get("hsn") or len(str(item.get("hsn"))) not in [4, 6, 8]:
-                    warnings.append(f"Invalid HSN for item: {item.get('description')}")
+            findings = ruleset.validate(mapped_schema)
+            error_findings = [f for f in findings if f.severity == "error"]
+            warning_findings = [f for f in findings if f.severity == "warning"]
 
+            errors = [f.message for f in error_findings]
+            warnings = [f.message for f in warning_findings]
             valid = not errors
             validation_id = f"VAL-{uuid.uuid4()}"
 
-            # Save to validation_logs via MCP
-            self.mcp_client.write_audit(
+            self.mcp_client.save_validation_logs(
+                validation_id=validation_id,
+                schema_id=schema_id,
+                status="VALID" if valid else "INVALID",
+                errors=[f.as_dict() for f in error_findings],
+                warnings=[f.as_dict() for f in warning_findings],
+            )
+            for finding in warning_findings:
+                self.mcp_client.save_warning(
+                    warning_id=f"WARN-{uuid.uuid4()}",
+                    validation_id=validation_id,
+                    field_name=finding.field,
+                    severity="WARNING",
+                    message=finding.message,
+                    suggested_fix=finding.suggested_fix,
+                )
+            self.telemetry.write_audit(
                 agent="validation_agent",
                 action="save_validation_log",
                 reference_id=schema_id,
-                payload_json={
-                    "validation_id": validation_id, "valid": valid,
-                    "errors": errors, "warnings": warnings
-                }
+                payload={"validation_id": validation_id, "valid": valid, "ruleset": ruleset_name},
             )
 
             return agent_comm_pb2.ValidateResponse(
                 validation_id=validation_id,
                 valid=valid,
                 errors=errors,
-                warnings=warnings
+                warnings=warnings,
+                findings=[_finding_message(f) for f in findings],
             )
 
         except Exception as e:
@@ -76,14 +97,121 @@ class ValidationServicer(agent_comm_pb2_grpc.AgentCommServicer):
             context.set_code(grpc.StatusCode.INTERNAL)
             return agent_comm_pb2.ValidateResponse()
 
+    def ValidateSchemas(self, request, context):
+        """Validates many mapped schemas and streams one result per schema.
+
+        Schemas are streamed from the MCP and validated chunk by chunk on the batch
+        validator's worker processes. Each chunk's logs and warnings are saved with one
+        SaveValidationResults bulk write before its results are sent, and the whole call
+        records a single audit event.
+        """
+        ruleset_name = request.ruleset or "default"
+        requested = set(request.schema_ids)
+        logging.info(
+            f"ValidateSchemas called for {len(requested) or 'all'} schemas created in "
+            f"[{request.created_from}, {request.created_to}) (ruleset {ruleset_name})"
+        )
+        try:
+            source = self.rulesets.source(ruleset_name)
+        except UnknownRuleset as e:
+            context.set_details(str(e))
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            return
+
+        counts = {"valid": 0, "invalid": 0, "failed": 0}
+        seen = set()
+        schemas = self.mcp_client.stream_mapped_schemas(list(request.schema_ids), request.created_from, request.created_to)
+        documents = ((schema.schema_id, schema.mapped_data) for schema in schemas)
+        try:
+            for outcomes in self.batch_validator.validate(source, documents):
+                for result in self._save_batch_results(outcomes):
+                    seen.add(result.schema_id)
+                    counts["failed" if result.error else "valid" if result.valid else "invalid"] += 1
+                    yield result
+            for schema_id in sorted(requested - seen):
+                counts["failed"] += 1
+                yield agent_comm_pb2.ValidateBatchResult(schema_id=schema_id, error="Mapped schema not found.")
+        except Exception as e:
+            logging.error(f"Batch validation failed after {len(seen)} schemas: {e}", exc_info=True)
+            context.set_details(f"Batch validation failed: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+        finally:
+            logging.info(f"ValidateSchemas with ruleset {ruleset_name}: {counts}")
+            self.telemetry.write_audit(
+                agent="validation_agent",
+                action="validate_batch",
+                reference_id=f"BATCH-{uuid.uuid4()}",
+                payload={"ruleset": ruleset_name, **counts},
+            )
+
+    def _save_batch_results(self, outcomes) -> list:
+        """Saves the validated outcomes of a chunk in one bulk write and returns a result
+        for every outcome. Results the MCP did not store carry the error instead."""
+        results, saved, saved_results = [], [], []
+        for outcome in outcomes:
+            if outcome.error:
+                results.append(agent_comm_pb2.ValidateBatchResult(schema_id=outcome.schema_id, error=outcome.error))
+                continue
+            warnings = outcome.warnings
+            result = agent_comm_pb2.ValidateBatchResult(
+                schema_id=outcome.schema_id,
+                validation_id=f"VAL-{uuid.uuid4()}",
+                valid=not outcome.errors,
+                errors=outcome.errors,
+                warnings=[f.message for f in warnings],
+                findings=[_finding_message(f) for f in outcome.findings],
+            )
+            results.append(result)
+            saved_results.append(result)
+            saved.append(mcp_pb2.ValidationResult(
+                log=mcp_pb2.ValidationLogs(
+                    validation_id=result.validation_id,
+                    schema_id=outcome.schema_id,
+                    status="VALID" if result.valid else "INVALID",
+                    errors=json.dumps([f.as_dict() for f in outcome.findings if f.severity == "error"]).encode('utf-8'),
+                    warnings=json.dumps([f.as_dict() for f in warnings]).encode('utf-8'),
+                ),
+                warnings=[
+                    mcp_pb2.WarningLog(
+                        warning_id=f"WARN-{uuid.uuid4()}",
+                        validation_id=result.validation_id,
+                        field_name=finding.field,
+                        severity="WARNING",
+                        message=finding.message,
+                        suggested_fix=json.dumps(finding.suggested_fix).encode('utf-8') if finding.suggested_fix else b"",
+                    )
+                    for finding in warnings
+                ],
+            ))
+        if not saved:
+            return results
+
+        try:
+            ack = self.mcp_client.save_validation_results(saved)
+            failed, failure = [saved_results[i] for i in ack.rejected_indexes], "Result rejected by the MCP"
+        except grpc.RpcError as e:
+            failed, failure = saved_results, f"Saving validation results failed: {e}"
+        if failed:
+            logging.error(f"{len(failed)} of {len(saved)} validation results not saved: {failure}")
+        for result in failed:
+            # Keep the schema id and error only: the result was not stored.
+            schema_id = result.schema_id
+            result.Clear()
+            result.schema_id, result.error = schema_id, failure
+        return results
+
 def serve():
     configure_logging("validation_agent")
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    agent_comm_pb2_grpc.add_AgentCommServicer_to_server(ValidationServicer(), server)
+    servicer = ValidationServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=server_options())
+    agent_comm_pb2_grpc.add_AgentCommServicer_to_server(servicer, server)
     server.add_insecure_port("[::]:6003")
     server.start()
     logging.info("Validation agent gRPC server started on port 6003")
-    server.wait_for_termination()
+    try:
+        server.wait_for_termination()
+    finally:
+        servicer.batch_validator.close()
 
 if __name__ == "__main__":
     serve()
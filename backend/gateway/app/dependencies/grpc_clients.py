@@ -1,14 +1,41 @@
 from functools import lru_cache
-from fastapi import Depends
+from typing import Optional
 
-from backend.shared.clients.mcp import MCPClient
-from backend.shared.clients.agents import AgentsClient
-from backend.shared.dependencies.config import Settings, get_settings
+from backend.shared.clients.mcp import MCPClient, AsyncMCPClient
+from backend.shared.clients.agents import AgentsClient, AsyncAgentsClient
 
 @lru_cache()
-def get_mcp_client(settings: Settings = Depends(get_settings)) -> MCPClient:
+def get_mcp_client() -> MCPClient:
     return MCPClient()
 
 @lru_cache()
-def get_agents_client(settings: Settings = Depends(get_settings)) -> AgentsClient:
+def get_agents_client() -> AgentsClient:
     return AgentsClient()
+
+# grpc.aio channels are bound to the event loop that creates them, so the async clients
+# are created lazily from `async def` dependencies (which FastAPI runs on the loop, not in
+# its threadpool) and shared by every request handled by this worker.
+_async_mcp_client: Optional[AsyncMCPClient] = None
+_async_agents_client: Optional[AsyncAgentsClient] = None
+
+async def get_async_mcp_client() -> AsyncMCPClient:
+    global _async_mcp_client
+    if _async_mcp_client is None:
+        _async_mcp_client = AsyncMCPClient()
+    return _async_mcp_client
+
+async def get_async_agents_client() -> AsyncAgentsClient:
+    global _async_agents_client
+    if _async_agents_client is None:
+        _async_agents_client = AsyncAgentsClient()
+    return _async_agents_client
+
+async def close_async_clients():
+    """Closes the async gRPC channels, if they were ever opened."""
+    global _async_mcp_client, _async_agents_client
+    if _async_mcp_client is not None:
+        await _async_mcp_client.close()
+        _async_mcp_client = None
+    if _async_agents_client is not None:
+        await _async_agents_client.close()
+        _async_agents_client = None
@@ -1,11 +1,20 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.gateway.app.routers import ingestion, metrics, reports, convert, integration, warnings
+from backend.gateway.app.dependencies.grpc_clients import close_async_clients
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the shared grpc.aio channels on the loop that opened them.
+    await close_async_clients()
 
 app = FastAPI(
     title="Invoice Orchestrator Gateway",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware to allow all origins
@@ -1,25 +1,38 @@
 from fastapi import APIRouter, UploadFile, Form, File, HTTPException
 import json
 import uuid
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from backend.gateway.app.schemas.ingestion import IngestionUploadResponse
-from backend.gateway.app.services.mcp_client import MCPClient
-from backend.gateway.app.services.agents_client import AgentsClient
-from backend.gateway.app.dependencies.grpc_clients import get_mcp_client, get_agents_client
+from backend.gateway.app.schemas.ingestion import IngestionUploadResponse, IngestionStatusResponse
+from backend.shared.clients.mcp import AsyncMCPClient
+from backend.gateway.app.dependencies.grpc_clients import get_async_mcp_client
+from backend.shared.dependencies.config import get_settings
+from backend.shared.services.job_queue import get_async_ocr_job_queue
 from fastapi import Depends
 
 router = APIRouter()
 
-@router.post("/upload", response_model=IngestionUploadResponse)
+OCR_PRIORITIES = ("high", "normal", "low")
+
+async def _iter_upload_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    chunk_size = get_settings().DOCUMENT_CHUNK_SIZE
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+@router.post("/upload", response_model=IngestionUploadResponse, status_code=202)
 async def upload_ingestion(
     payload: Optional[str] = Form(None),
     file: Optional[UploadFile] = File(None),
-    mcp_client: MCPClient = Depends(get_mcp_client),
-    agents_client: AgentsClient = Depends(get_agents_client),
+    priority: str = Form("normal"),
+    mcp_client: AsyncMCPClient = Depends(get_async_mcp_client),
 ):
     if not file and not payload:
         raise HTTPException(status_code=400, detail="Either a file or a payload with a file_url must be provided.")
+    if priority not in OCR_PRIORITIES:
+        raise HTTPException(status_code=400, detail=f"priority must be one of {', '.join(OCR_PRIORITIES)}.")
 
     ingestion_id = f"ING-{uuid.uuid4()}"
     metadata = json.loads(payload) if payload else {}
@@ -32,24 +45,53 @@ async def upload_ingestion(
     if not file_url:
         raise HTTPException(status_code=400, detail="file_url must be provided in the payload if no file is uploaded.")
 
-    file_bytes = await file.read() if file else None
+    if file:
+        # Stream the upload through in fixed-size chunks instead of buffering the whole scan.
+        await mcp_client.upload_document(
+            ingestion_id=ingestion_id,
+            file_name=file.filename,
+            file_url=file_url,
+            metadata=metadata,
+            chunks=_iter_upload_chunks(file),
+        )
+    else:
+        await mcp_client.save_document(
+            ingestion_id=ingestion_id,
+            file_name=file_url.split("/")[-1],
+            file_url=file_url,
+            metadata=metadata,
+        )
 
-    mcp_client.save_document(
+    # OCR runs on the extraction agent's queue workers; the request returns as soon as the job is durable.
+    job = await get_async_ocr_job_queue(mcp_client).enqueue(
         ingestion_id=ingestion_id,
-        file_name=file.filename if file else file_url.split("/")[-1],
         file_url=file_url,
         metadata=metadata,
-        file_bytes=file_bytes,
+        priority=priority,
     )
 
-    agents_client.start_ocr(
+    return IngestionUploadResponse(
         ingestion_id=ingestion_id,
-        file_url=file_url,
-        metadata=metadata
+        status="QUEUED",
+        job_id=job.job_id,
+        message="Ingestion accepted, OCR queued"
     )
 
-    return IngestionUploadResponse(
-        ingestion_id=ingestion_id,
-        status="ACCEPTED",
-        message="Ingestion accepted, OCR started"
+@router.get("/{ingestion_id}/status", response_model=IngestionStatusResponse)
+async def get_ingestion_status(
+    ingestion_id: str,
+    mcp_client: AsyncMCPClient = Depends(get_async_mcp_client),
+):
+    job = await get_async_ocr_job_queue(mcp_client).get(ingestion_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="No OCR job found for this ingestion")
+
+    return IngestionStatusResponse(
+        ingestion_id=job.ingestion_id,
+        job_id=job.job_id,
+        status=job.status,
+        priority=job.priority,
+        attempts=job.attempts,
+        ocr_id=job.ocr_id or None,
+        error=job.error or None,
     )
@@ -2,16 +2,16 @@ from fastapi import APIRouter
 from datetime import datetime
 
 from backend.gateway.app.schemas.metrics import MetricIngestRequest, DashboardMetricsResponse
-from backend.gateway.app.services.mcp_client import MCPClient
-from backend.gateway.app.dependencies.grpc_clients import get_mcp_client
+from backend.shared.clients.mcp import AsyncMCPClient
+from backend.gateway.app.dependencies.grpc_clients import get_async_mcp_client
 from fastapi import Depends
 
 router = APIRouter()
 
 @router.post("")
-async def ingest_metric(request: MetricIngestRequest, mcp_client: MCPClient = Depends(get_mcp_client)):
+async def ingest_metric(request: MetricIngestRequest, mcp_client: AsyncMCPClient = Depends(get_async_mcp_client)):
     metric_ts = int(request.metric_ts.timestamp()) if request.metric_ts else None
-    mcp_client.write_metric(
+    await mcp_client.write_metric(
         agent=request.agent,
         ingestion_id=request.ingestion_id,
         metrics=request.metrics,
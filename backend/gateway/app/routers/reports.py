@@ -1,15 +1,15 @@
 from fastapi import APIRouter
 
 from backend.gateway.app.schemas.reports import GenerateReportRequest, ReportStatusResponse
-from backend.gateway.app.services.agents_client import AgentsClient
-from backend.gateway.app.dependencies.grpc_clients import get_agents_client
+from backend.shared.clients.agents import AsyncAgentsClient
+from backend.gateway.app.dependencies.grpc_clients import get_async_agents_client
 from fastapi import Depends
 
 router = APIRouter()
 
 @router.post("/generate", response_model=ReportStatusResponse)
-async def generate_report(request: GenerateReportRequest, agents_client: AgentsClient = Depends(get_agents_client)):
-    response = agents_client.generate_report(
+async def generate_report(request: GenerateReportRequest, agents_client: AsyncAgentsClient = Depends(get_async_agents_client)):
+    response = await agents_client.generate_report(
         validation_id=request.validation_id,
         schema_id=request.schema_id,
         user_id=request.user_id,
@@ -4,4 +4,14 @@ from typing import Optional
 class IngestionUploadResponse(BaseModel):
     ingestion_id: str
     status: str
+    job_id: Optional[str] = None
     message: Optional[str] = None
+
+class IngestionStatusResponse(BaseModel):
+    ingestion_id: str
+    job_id: str
+    status: str
+    priority: str
+    attempts: int
+    ocr_id: Optional[str] = None
+    error: Optional[str] = None
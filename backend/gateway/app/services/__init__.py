@@ -1 +0,0 @@
-# This file makes the 'services' directory a Python package.
@@ -0,0 +1,361 @@
+import asyncio
+import json
+import logging
+import signal
+from concurrent import futures
+
+import grpc
+
+from backend.shared.grpc import mcp_pb2, mcp_pb2_grpc
+from backend.mcp.db import async_repository, repository
+from backend.mcp.db.async_engine import dispose_async_engine, init_async_engine
+from backend.mcp.db.models import (
+    ConversionLogs,
+    IntegrationLogs,
+    MappedSchema,
+    OcrOutput,
+    Reports,
+    ValidationLogs,
+    WarningsLogs,
+)
+from backend.mcp.db.writer import BatchWriter
+from backend.mcp import server as mcp_server
+from backend.mcp.server import (
+    MCPServicer,
+    _conversion_log_message,
+    _conversion_log_row,
+    _document_message,
+    _idempotency_record_message,
+    _integration_log_message,
+    _integration_log_row,
+    _list_documents_message,
+    _mapped_schema_message,
+    _mapped_schema_row,
+    _ocr_job_message,
+    _set_ocr_job_update_status,
+    _ocr_output_message,
+    _ocr_output_row,
+    _orchestration_checkpoints_message,
+    _orchestration_message,
+    _orchestration_snapshot_row,
+    _orchestration_step_row,
+    _report_message,
+    _report_row,
+    _validation_logs_message,
+    _valid_lease_request,
+    _validation_logs_row,
+    _warning_row,
+)
+
+class AsyncMCPServicer(MCPServicer):
+    """MCP service for the grpc.aio server.
+
+    The database bound unary RPCs are coroutines on async_repository (asyncpg), so
+    concurrency is limited by the connection pool rather than a thread count. RPCs that
+    are not ported (document streaming, batch telemetry, bulk validation reads and
+    writes, QueryLLM and QueryLLMStream) are inherited from MCPServicer and run on the server's migration thread pool.
+    """
+
+    async def SaveDocument(self, request, context):
+        logging.info(f"SaveDocument called for ingestion_id: {request.ingestion_id}")
+        content_hash, size_bytes = None, None
+        if request.file_bytes:
+            content_hash, size_bytes = await asyncio.to_thread(self.blob_store.put, request.file_bytes)
+
+        doc = await async_repository.save_document(
+            ingestion_id=request.ingestion_id,
+            file_name=request.file_name,
+            file_url=request.file_url,
+            metadata=dict(request.metadata),
+            content_hash=content_hash,
+            size_bytes=size_bytes,
+        )
+        if doc:
+            return mcp_pb2.SaveDocResp(ok=True, doc_ref=doc.ingestion_id, message="Document saved successfully.")
+        context.set_details(f"Failed to save document {request.ingestion_id}")
+        context.set_code(grpc.StatusCode.INTERNAL)
+        return mcp_pb2.SaveDocResp(ok=False, message="Database operation failed.")
+
+    async def GetDocument(self, request, context):
+        logging.info(f"GetDocument called for ingestion_id: {request.ingestion_id}")
+        doc = await async_repository.get_document(request.ingestion_id)
+        if not doc:
+            context.set_details(f"Document with ingestion_id '{request.ingestion_id}' not found.")
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            return mcp_pb2.GetDocResp()
+        return _document_message(doc, await asyncio.to_thread(self._read_blob, doc))
+
+    async def ListDocuments(self, request, context):
+        limit = min(request.limit or mcp_server.LIST_DOCUMENTS_MAX_LIMIT, mcp_server.LIST_DOCUMENTS_MAX_LIMIT)
+        ids = await async_repository.list_document_ids(request.status or None, limit, request.after or None)
+        return _list_documents_message(ids, limit, context)
+
+    async def WriteMetric(self, request, context):
+        logging.info(f"WriteMetric called for agent: {request.agent}")
+        args = (request.agent, request.ingestion_id, request.metric_json, request.metric_ts)
+        if self.metric_writer:
+            success = await self._submit_async(self.metric_writer, repository.metric_row, *args)
+        else:
+            success = await async_repository.write_metric(*args)
+        if not success:
+            context.set_details("Failed to write metric to database.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+        return mcp_pb2.WriteAck(ok=success)
+
+    async def WriteAudit(self, request, context):
+        logging.info(f"WriteAudit called for agent: {request.agent}, action: {request.action}")
+        args = (request.agent, request.action, request.reference_id, request.payload_json, request.ts)
+        if self.audit_writer:
+            success = await self._submit_async(self.audit_writer, repository.audit_row, *args)
+        else:
+            success = await async_repository.write_audit(*args)
+        if not success:
+            context.set_details("Failed to write audit event to database.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+        return mcp_pb2.WriteAck(ok=success)
+
+    async def _submit_async(self, writer: BatchWriter, build_row, *args) -> bool:
+        try:
+            row = build_row(*args)
+        except (ValueError, OverflowError, OSError) as e:
+            logging.error(f"Rejected {writer.name} row from {args[0]}: {e}")
+            return False
+        # Only block a worker thread (never the event loop) when the buffer is full.
+        return writer.try_submit(row) or await asyncio.to_thread(writer.submit, row)
+
+    async def SaveOrchestration(self, request, context):
+        logging.info(f"SaveOrchestration called for ingestion_id: {request.ingestion_id}")
+        success = await async_repository.save_orchestration(request.ingestion_id, json.loads(request.state_bytes))
+        if not success:
+            context.set_details("Failed to save orchestration state.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+        return mcp_pb2.WriteAck(ok=success)
+
+    async def GetOrchestration(self, request, context):
+        logging.info(f"GetOrchestration called for ingestion_id: {request.ingestion_id}")
+        checkpoints = await async_repository.get_orchestration_checkpoints(request.ingestion_id)
+        if checkpoints and (checkpoints[0] or checkpoints[1]):
+            return _orchestration_message(request.ingestion_id, *checkpoints)
+        context.set_details(f"Orchestration with ingestion_id '{request.ingestion_id}' not found.")
+        context.set_code(grpc.StatusCode.NOT_FOUND)
+        return mcp_pb2.OrchestrationState()
+
+    async def AppendOrchestrationStep(self, request, context):
+        row = self._artifact_row("orchestration step", request.ingestion_id, _orchestration_step_row, request, context)
+        if row is None:
+            return mcp_pb2.WriteAck(ok=False)
+        success = await async_repository.append_orchestration_step(**row)
+        return self._orchestration_written("step", request.ingestion_id, success, context)
+
+    async def CompactOrchestration(self, request, context):
+        row = self._artifact_row("orchestration snapshot", request.ingestion_id, _orchestration_snapshot_row, request, context)
+        if row is None:
+            return mcp_pb2.WriteAck(ok=False)
+        success = await async_repository.compact_orchestration(**row)
+        return self._orchestration_written("snapshot", request.ingestion_id, success, context)
+
+    async def GetOrchestrationCheckpoints(self, request, context):
+        checkpoints = await async_repository.get_orchestration_checkpoints(request.ingestion_id)
+        if checkpoints is None:
+            context.set_details(f"Failed to load checkpoints for '{request.ingestion_id}'.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.OrchestrationCheckpoints()
+        return _orchestration_checkpoints_message(*checkpoints)
+
+    async def DeleteOrchestrationCheckpoints(self, request, context):
+        success = await async_repository.delete_orchestration_checkpoints(request.ingestion_id)
+        return self._orchestration_written("checkpoints", request.ingestion_id, success, context)
+
+    async def AcquireOrchestrationLease(self, request, context):
+        if not _valid_lease_request(request, context):
+            return mcp_pb2.OrchestrationLease()
+        acquired = await async_repository.acquire_orchestration_lease(request.ingestion_id, request.owner, request.ttl_s)
+        if acquired is None:
+            context.set_details(f"Failed to acquire the lease of {request.ingestion_id}.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.OrchestrationLease()
+        return mcp_pb2.OrchestrationLease(acquired=acquired)
+
+    async def RenewOrchestrationLeases(self, request, context):
+        if not _valid_lease_request(request, context):
+            return mcp_pb2.WriteBatchAck()
+        ids = list(request.ingestion_ids)
+        renewed = await async_repository.renew_orchestration_leases(request.owner, ids, request.ttl_s) if ids else 0
+        if renewed is None:
+            context.set_details("Failed to renew orchestration leases.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.WriteBatchAck()
+        return mcp_pb2.WriteBatchAck(accepted=renewed, rejected=len(ids) - renewed)
+
+    async def ReleaseOrchestrationLease(self, request, context):
+        success = await async_repository.release_orchestration_lease(request.ingestion_id, request.owner)
+        return self._orchestration_written("lease", request.ingestion_id, success, context)
+
+    async def ClaimStaleOrchestrations(self, request, context):
+        if not _valid_lease_request(request, context):
+            return mcp_pb2.ClaimStaleOrchestrationsResp()
+        claimed = await async_repository.claim_stale_orchestrations(
+            request.owner, request.ttl_s, request.limit or 10, request.max_recoveries or 3,
+        )
+        if claimed is None:
+            context.set_details("Failed to claim stale orchestrations.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.ClaimStaleOrchestrationsResp()
+        if claimed:
+            logging.info(f"{request.owner} claimed {len(claimed)} stale orchestrations")
+        return mcp_pb2.ClaimStaleOrchestrationsResp(ingestion_ids=claimed)
+
+    async def GetIdempotencyRecord(self, request, context):
+        record = await async_repository.get_idempotency_record(request.id) if request.id else None
+        return _idempotency_record_message(record)
+
+    async def SaveIdempotencyRecord(self, request, context):
+        if not request.key or not request.agent:
+            context.set_details("Idempotency key and agent are required.")
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            return mcp_pb2.WriteAck(ok=False)
+        success = await async_repository.save_idempotency_record(request.key, request.agent, request.response)
+        if not success:
+            context.set_details(f"Failed to save idempotency record {request.key}.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+        return mcp_pb2.WriteAck(ok=success)
+
+    async def _cached_artifact_async(self, kind: str, key: str, load, to_message):
+        message = self.artifact_cache.get(kind, key)
+        if message is None:
+            row = await load(key)
+            if row is None:
+                return None
+            message = to_message(row)
+            self.artifact_cache.put(kind, key, message)
+        return message
+
+    async def _get_artifact_async(self, kind: str, request, load, to_message, empty, context):
+        message = await self._cached_artifact_async(kind, request.id, load, to_message)
+        if message:
+            return message
+        context.set_details(f"{kind} with id '{request.id}' not found.")
+        context.set_code(grpc.StatusCode.NOT_FOUND)
+        return empty
+
+    async def _save_artifact_async(self, kind: str, key: str, model, build_row, request, context):
+        row = self._artifact_row(kind, key, build_row, request, context)
+        if row is None:
+            return mcp_pb2.WriteAck(ok=False)
+        return self._saved_artifact(kind, key, await async_repository.save_artifact(model, row), context)
+
+    async def SaveOcrOutput(self, request, context):
+        return await self._save_artifact_async("ocr_output", request.ocr_id, OcrOutput, _ocr_output_row, request, context)
+
+    async def GetOcrOutput(self, request, context):
+        return await self._get_artifact_async("ocr_output", request, async_repository.get_ocr_output, _ocr_output_message, mcp_pb2.OcrOutput(), context)
+
+    async def SaveMappedSchema(self, request, context):
+        return await self._save_artifact_async("mapped_schema", request.schema_id, MappedSchema, _mapped_schema_row, request, context)
+
+    async def GetMappedSchema(self, request, context):
+        return await self._get_artifact_async("mapped_schema", request, async_repository.get_mapped_schema, _mapped_schema_message, mcp_pb2.MappedSchema(), context)
+
+    async def SaveValidationLogs(self, request, context):
+        return await self._save_artifact_async("validation_logs", request.validation_id, ValidationLogs, _validation_logs_row, request, context)
+
+    async def GetValidationLogs(self, request, context):
+        return await self._get_artifact_async("validation_logs", request, async_repository.get_validation_logs, _validation_logs_message, mcp_pb2.ValidationLogs(), context)
+
+    async def SaveConversionLog(self, request, context):
+        return await self._save_artifact_async("conversion_log", request.conversion_id, ConversionLogs, _conversion_log_row, request, context)
+
+    async def GetConversionLog(self, request, context):
+        return await self._get_artifact_async("conversion_log", request, async_repository.get_conversion_log, _conversion_log_message, mcp_pb2.ConversionLog(), context)
+
+    async def SaveIntegrationLog(self, request, context):
+        return await self._save_artifact_async("integration_log", request.integration_id, IntegrationLogs, _integration_log_row, request, context)
+
+    async def GetIntegrationLog(self, request, context):
+        return await self._get_artifact_async("integration_log", request, async_repository.get_integration_log, _integration_log_message, mcp_pb2.IntegrationLog(), context)
+
+    async def SaveReport(self, request, context):
+        return await self._save_artifact_async("report", request.report_id, Reports, _report_row, request, context)
+
+    async def GetReport(self, request, context):
+        return await self._get_artifact_async("report", request, async_repository.get_report, _report_message, mcp_pb2.Report(), context)
+
+    async def SaveWarning(self, request, context):
+        return await self._save_artifact_async("warning", request.warning_id, WarningsLogs, _warning_row, request, context)
+
+    async def EnqueueOcrJob(self, request, context):
+        logging.info(f"EnqueueOcrJob called for ingestion_id: {request.ingestion_id}, priority: {request.priority}")
+        job = await async_repository.enqueue_ocr_job(
+            ingestion_id=request.ingestion_id,
+            file_url=request.file_url,
+            metadata=dict(request.metadata),
+            priority=request.priority or "normal",
+        )
+        if not job:
+            context.set_details(f"Failed to enqueue OCR job for {request.ingestion_id}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.OcrJob()
+        return _ocr_job_message(job)
+
+    async def ClaimOcrJobs(self, request, context):
+        jobs = await async_repository.claim_ocr_jobs(
+            worker_id=request.worker_id,
+            max_jobs=request.max_jobs or 1,
+            priorities=list(request.priorities),
+        )
+        if jobs:
+            logging.info(f"Worker {request.worker_id} claimed {len(jobs)} OCR job(s)")
+        return mcp_pb2.ClaimOcrJobsResp(jobs=[_ocr_job_message(job) for job in jobs])
+
+    async def CompleteOcrJob(self, request, context):
+        success = await async_repository.complete_ocr_job(request.job_id, request.worker_id, request.ocr_id)
+        _set_ocr_job_update_status(context, success, request, "complete")
+        return mcp_pb2.WriteAck(ok=bool(success))
+
+    async def FailOcrJob(self, request, context):
+        success = await async_repository.fail_ocr_job(
+            request.job_id, request.worker_id, request.error, request.retry_delay_s
+        )
+        _set_ocr_job_update_status(context, success, request, "update")
+        return mcp_pb2.WriteAck(ok=bool(success))
+
+    async def GetOcrJob(self, request, context):
+        job = await async_repository.get_ocr_job(request.ingestion_id)
+        if not job:
+            context.set_details(f"No OCR job found for ingestion_id '{request.ingestion_id}'.")
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            return mcp_pb2.OcrJob()
+        return _ocr_job_message(job)
+
+
+def create_server(servicer: AsyncMCPServicer, address: str = '[::]:50051'):
+    """Builds the grpc.aio server; sync handlers run on a MCP_GRPC_WORKERS thread pool."""
+    server = grpc.aio.server(
+        migration_thread_pool=futures.ThreadPoolExecutor(max_workers=mcp_server.MCP_GRPC_WORKERS),
+        options=mcp_server.GRPC_SERVER_OPTIONS,
+    )
+    mcp_pb2_grpc.add_MCPServicer_to_server(servicer, server)
+    port = server.add_insecure_port(address)
+    return server, port
+
+async def serve_async():
+    init_async_engine()
+    servicer = AsyncMCPServicer()
+    server, _ = create_server(servicer)
+    await server.start()
+    logging.info("MCP grpc.aio server started on port 50051")
+
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, lambda: asyncio.ensure_future(server.stop(mcp_server.SHUTDOWN_GRACE_S)))
+
+    mcp_server.start_http_server(servicer)
+
+    try:
+        await server.wait_for_termination()
+    finally:
+        servicer.close()
+        await dispose_async_engine()
+
+def serve():
+    """Starts the grpc.aio server and waits for termination."""
+    asyncio.run(serve_async())
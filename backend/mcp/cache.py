@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+class ArtifactCache:
+    """Thread-safe LRU cache with a TTL and a total size bound.
+
+    Meant for write-once pipeline artifacts (OCR output, mapped schemas, validation
+    logs), keyed by (kind, id). Values are usually protobuf messages and are sized with
+    `ByteSize()`; pass `size_fn` for anything else. Callers must not mutate cached values.
+    A cache with `max_bytes=0` stores nothing.
+    """
+
+    def __init__(self, max_bytes: int, ttl_s: float, size_fn: Optional[Callable[[Any], int]] = None):
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.size_fn = size_fn or (lambda value: value.ByteSize())
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # key -> (value, size, expires_at)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, kind: str, key: Hashable):
+        cache_key = (kind, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(cache_key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return value
+
+    def put(self, kind: str, key: Hashable, value: Any):
+        size = self.size_fn(value)
+        if size > self.max_bytes:
+            return
+        cache_key = (kind, key)
+        with self._lock:
+            if cache_key in self._entries:
+                self._remove(cache_key)
+            self._entries[cache_key] = (value, size, time.monotonic() + self.ttl_s)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, kind: str, key: Hashable):
+        with self._lock:
+            if (kind, key) in self._entries:
+                self._remove((kind, key))
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, cache_key):
+        _, size, _ = self._entries.pop(cache_key)
+        self._bytes -= size
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,65 @@
+import os
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.mcp.db.engine import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_STATEMENT_TIMEOUT_MS,
+)
+
+# asyncpg URL for the aio server; defaults to DATABASE_URL with the driver swapped.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", DATABASE_URL.replace("+psycopg2", "+asyncpg"))
+
+def create_db_async_engine(database_url: str = ASYNC_DATABASE_URL, **overrides):
+    """Creates an asyncpg engine with the same pool settings as the sync engine."""
+    kwargs = dict(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+    kwargs.update(overrides)
+    if DB_STATEMENT_TIMEOUT_MS:
+        kwargs["connect_args"] = {"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}}
+    return create_async_engine(database_url, **kwargs)
+
+# Created lazily so that importing this module does not require asyncpg.
+async_engine = None
+AsyncSessionLocal = None
+
+def init_async_engine(**overrides):
+    """Creates the shared async engine and session factory (idempotent)."""
+    global async_engine, AsyncSessionLocal
+    if async_engine is None:
+        async_engine = create_db_async_engine(**overrides)
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+    return async_engine
+
+async def dispose_async_engine():
+    global async_engine, AsyncSessionLocal
+    if async_engine is not None:
+        await async_engine.dispose()
+        async_engine, AsyncSessionLocal = None, None
+
+def get_async_pool_stats():
+    """Size and idle count of the asyncpg connection pool, or None while no async engine
+    is in use (threaded mode)."""
+    if async_engine is None:
+        return None
+    pool = async_engine.pool
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+    }
+
+def async_session():
+    """Returns a new AsyncSession, creating the engine on first use."""
+    init_async_engine()
+    return AsyncSessionLocal()
@@ -0,0 +1,327 @@
+"""Async (asyncpg) counterparts of the repository functions on the MCP hot path.
+
+Used by the grpc.aio server. Statement construction is shared with the sync
+repository so both modes read and write rows identically.
+"""
+import logging
+import sqlalchemy as sa
+
+from backend.mcp.db import repository
+from backend.mcp.db.async_engine import async_session
+from backend.mcp.db.models import (
+    AgentAudit,
+    ConversionLogs,
+    DocumentsIngested,
+    IdempotencyKeys,
+    IntegrationLogs,
+    MappedSchema,
+    Metrics,
+    OcrJobs,
+    OcrOutput,
+    Orchestrations,
+    Reports,
+    ValidationLogs,
+)
+
+async def save_document(ingestion_id: str, file_name: str, file_url: str, metadata: dict,
+                        content_hash: str | None = None, size_bytes: int | None = None):
+    """Saves a document record, incrementing its blob's reference count."""
+    try:
+        async with async_session() as session:
+            if content_hash:
+                await session.execute(repository.blob_ref_upsert(content_hash, size_bytes))
+            db_document = DocumentsIngested(
+                ingestion_id=ingestion_id,
+                file_name=file_name,
+                file_url=file_url,
+                content_hash=content_hash,
+                metadata=metadata,
+                source="grpc",
+                status="received"
+            )
+            session.add(db_document)
+            await session.commit()
+            logging.info(f"Successfully saved document {ingestion_id}")
+            return db_document
+    except Exception as e:
+        logging.error(f"Error saving document metadata for {ingestion_id}: {e}")
+        return None
+
+async def _get_by(model, column, value, description: str):
+    try:
+        async with async_session() as session:
+            return (await session.execute(sa.select(model).where(column == value))).scalars().first()
+    except Exception as e:
+        logging.error(f"Error getting {description} for {value}: {e}")
+        return None
+
+async def get_document(ingestion_id: str):
+    return await _get_by(DocumentsIngested, DocumentsIngested.ingestion_id, ingestion_id, "document")
+
+async def get_orchestration(ingestion_id: str):
+    return await _get_by(Orchestrations, Orchestrations.ingestion_id, ingestion_id, "orchestration state")
+
+async def save_artifact(model, values: dict):
+    """Saves or replaces an artifact row (see repository.artifact_upsert)."""
+    pk = model.__table__.primary_key.columns.values()[0].name
+    try:
+        async with async_session() as session:
+            await session.execute(repository.artifact_upsert(model, values))
+            await session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error saving {model.__tablename__} {values.get(pk)}: {e}")
+        return False
+
+async def get_artifact(model, artifact_id: str):
+    """Primary-key lookup of an artifact row."""
+    try:
+        async with async_session() as session:
+            return await session.get(model, artifact_id)
+    except Exception as e:
+        logging.error(f"Error getting {model.__tablename__} {artifact_id}: {e}")
+        return None
+
+async def get_ocr_output(ocr_id: str):
+    return await get_artifact(OcrOutput, ocr_id)
+
+async def get_mapped_schema(schema_id: str):
+    return await get_artifact(MappedSchema, schema_id)
+
+async def get_validation_logs(validation_id: str):
+    return await get_artifact(ValidationLogs, validation_id)
+
+async def get_conversion_log(conversion_id: str):
+    return await get_artifact(ConversionLogs, conversion_id)
+
+async def get_integration_log(integration_id: str):
+    return await get_artifact(IntegrationLogs, integration_id)
+
+async def get_report(report_id: str):
+    return await get_artifact(Reports, report_id)
+
+async def list_document_ids(status: str | None = None, limit: int = 1000, after: str | None = None):
+    """Lists ingestion ids after `after`, at most `limit` of them."""
+    try:
+        async with async_session() as session:
+            return list(await session.scalars(repository.list_document_ids_stmt(status, limit, after)))
+    except Exception as e:
+        logging.error(f"Error listing documents (status={status}, after={after}): {e}")
+        return None
+
+async def save_orchestration(ingestion_id: str, state: dict):
+    """Saves or updates an orchestration state."""
+    try:
+        async with async_session() as session:
+            await session.execute(repository.orchestration_upsert(ingestion_id, state))
+            await session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error saving orchestration state for {ingestion_id}: {e}")
+        return False
+
+async def append_orchestration_step(**values):
+    """Records one orchestration step delta."""
+    try:
+        async with async_session() as session:
+            await session.execute(repository.orchestration_step_insert(values))
+            await session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error saving orchestration step {values.get('version')} for {values.get('ingestion_id')}: {e}")
+        return False
+
+async def compact_orchestration(**values):
+    """Saves a full orchestration snapshot and drops the steps it covers, atomically."""
+    try:
+        async with async_session() as session:
+            for stmt in repository.orchestration_compact_stmts(values):
+                await session.execute(stmt)
+            await session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error compacting orchestration {values.get('ingestion_id')}: {e}")
+        return False
+
+async def get_orchestration_checkpoints(ingestion_id: str):
+    """Returns (orchestration row or None, steps after it in version order), or None on error."""
+    try:
+        async with async_session() as session:
+            orchestration = await session.get(Orchestrations, ingestion_id)
+            steps = list(await session.scalars(repository.orchestration_steps_stmt(ingestion_id)))
+            return orchestration, steps
+    except Exception as e:
+        logging.error(f"Error getting orchestration checkpoints for {ingestion_id}: {e}")
+        return None
+
+async def delete_orchestration_checkpoints(ingestion_id: str):
+    """Forgets an orchestration's checkpoint history so the next run starts fresh."""
+    try:
+        async with async_session() as session:
+            for stmt in repository.orchestration_reset_stmts(ingestion_id):
+                await session.execute(stmt)
+            await session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error deleting orchestration checkpoints for {ingestion_id}: {e}")
+        return False
+
+async def acquire_orchestration_lease(ingestion_id: str, owner: str, ttl_s: int):
+    """Returns True if `owner` now holds the lease, False if another owner does, None on error."""
+    try:
+        async with async_session() as session:
+            result = await session.execute(repository.acquire_orchestration_lease_stmt(ingestion_id, owner, ttl_s))
+            acquired = result.first()
+            await session.commit()
+            return acquired is not None
+    except Exception as e:
+        logging.error(f"Error acquiring orchestration lease for {ingestion_id}: {e}")
+        return None
+
+async def renew_orchestration_leases(owner: str, ingestion_ids: list[str], ttl_s: int):
+    """Extends the leases `owner` still holds; returns how many were renewed, or None on error."""
+    try:
+        async with async_session() as session:
+            result = await session.execute(repository.renew_orchestration_leases_stmt(owner, ingestion_ids, ttl_s))
+            await session.commit()
+            return result.rowcount
+    except Exception as e:
+        logging.error(f"Error renewing {len(ingestion_ids)} orchestration leases for {owner}: {e}")
+        return None
+
+async def release_orchestration_lease(ingestion_id: str, owner: str):
+    try:
+        async with async_session() as session:
+            await session.execute(repository.release_orchestration_lease_stmt(ingestion_id, owner))
+            await session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error releasing orchestration lease for {ingestion_id}: {e}")
+        return False
+
+async def claim_stale_orchestrations(owner: str, ttl_s: int, limit: int, max_recoveries: int):
+    """Claims up to `limit` orchestrations whose lease lapsed; returns their ids, or None on error."""
+    try:
+        async with async_session() as session:
+            claimed = list(await session.scalars(
+                repository.claim_stale_orchestrations_stmt(owner, ttl_s, limit, max_recoveries)
+            ))
+            await session.commit()
+            return claimed
+    except Exception as e:
+        logging.error(f"Error claiming stale orchestrations for {owner}: {e}")
+        return None
+
+async def save_idempotency_record(key: str, agent: str, response: bytes):
+    try:
+        async with async_session() as session:
+            await session.execute(repository.idempotency_record_insert(key, agent, response))
+            await session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error saving idempotency record {key}: {e}")
+        return False
+
+async def get_idempotency_record(key: str):
+    return await get_artifact(IdempotencyKeys, key)
+
+async def write_metric(agent: str, ingestion_id: str, metric_json: str, metric_ts: int):
+    """Writes a metric event."""
+    try:
+        await bulk_write_metrics([repository.metric_row(agent, ingestion_id, metric_json, metric_ts)])
+        return True
+    except Exception as e:
+        logging.error(f"Error writing metric for agent {agent}: {e}")
+        return False
+
+async def write_audit(agent: str, action: str, reference_id: str, payload_json: str, ts: int):
+    """Writes an audit event."""
+    try:
+        await bulk_write_audits([repository.audit_row(agent, action, reference_id, payload_json, ts)])
+        return True
+    except Exception as e:
+        logging.error(f"Error writing audit event for agent {agent}: {e}")
+        return False
+
+async def bulk_write_metrics(rows: list[dict]):
+    """Writes a batch of metric rows in one multi-row INSERT."""
+    async with async_session() as session:
+        await session.execute(sa.insert(Metrics), rows)
+        await session.commit()
+
+async def bulk_write_audits(rows: list[dict]):
+    """Writes a batch of audit rows in one multi-row INSERT."""
+    async with async_session() as session:
+        await session.execute(sa.insert(AgentAudit), rows)
+        await session.commit()
+
+async def enqueue_ocr_job(ingestion_id: str, file_url: str, metadata: dict, priority: str = "normal"):
+    """Adds an OCR job to the queue."""
+    try:
+        async with async_session() as session:
+            job = repository.new_ocr_job(ingestion_id, file_url, metadata, priority)
+            session.add(job)
+            await session.commit()
+            await session.refresh(job)
+            logging.info(f"Enqueued OCR job {job.job_id} for {ingestion_id} ({job.priority})")
+            return job
+    except Exception as e:
+        logging.error(f"Error enqueueing OCR job for {ingestion_id}: {e}")
+        return None
+
+async def claim_ocr_jobs(worker_id: str, max_jobs: int = 1, priorities: list | None = None):
+    """Atomically claims up to `max_jobs` jobs for a worker."""
+    try:
+        async with async_session() as session:
+            await session.execute(repository.fail_abandoned_ocr_jobs_stmt())
+            result = await session.scalars(repository.claim_ocr_jobs_stmt(worker_id, max_jobs, priorities))
+            jobs = result.all()
+            await session.commit()
+            return jobs
+    except Exception as e:
+        logging.error(f"Error claiming OCR jobs for worker {worker_id}: {e}")
+        return []
+
+async def complete_ocr_job(job_id: str, worker_id: str, ocr_id: str):
+    """Marks a claimed job as done. Returns False if the worker lost its lease on the job,
+    None on error."""
+    try:
+        async with async_session() as session:
+            result = await session.execute(repository.complete_ocr_job_stmt(job_id, worker_id, ocr_id))
+            await session.commit()
+            return result.rowcount == 1
+    except Exception as e:
+        logging.error(f"Error completing OCR job {job_id}: {e}")
+        return None
+
+async def fail_ocr_job(job_id: str, worker_id: str, error: str, retry_delay_s: int = 30):
+    """Records a failed attempt; the job is re-queued until it runs out of attempts.
+    Returns False if the worker lost its lease on the job, None on error."""
+    try:
+        async with async_session() as session:
+            job = (await session.execute(
+                sa.select(OcrJobs).where(repository.leased_ocr_job(job_id, worker_id)).with_for_update()
+            )).scalars().first()
+            if not job:
+                return False
+            repository.apply_ocr_job_failure(job, error, retry_delay_s)
+            await session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error failing OCR job {job_id}: {e}")
+        return None
+
+async def get_ocr_job(ingestion_id: str):
+    """Retrieves the most recent OCR job for an ingestion."""
+    try:
+        async with async_session() as session:
+            result = await session.execute(
+                sa.select(OcrJobs)
+                .where(OcrJobs.ingestion_id == ingestion_id)
+                .order_by(OcrJobs.created_at.desc())
+                .limit(1)
+            )
+            return result.scalars().first()
+    except Exception as e:
+        logging.error(f"Error getting OCR job for {ingestion_id}: {e}")
+        return None
@@ -2,17 +2,51 @@ import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import JSONB
 from backend.mcp.db.engine import Base
 
+class DocumentBlobs(Base):
+    __tablename__ = 'document_blobs'
+    content_hash = sa.Column(sa.String(64), primary_key=True)
+    size_bytes = sa.Column(sa.BigInteger, nullable=False)
+    ref_count = sa.Column(sa.Integer, nullable=False, default=0)
+    created_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now())
+    updated_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now())
+
 class DocumentsIngested(Base):
     __tablename__ = 'documents_ingested'
+    __table_args__ = (
+        sa.Index('idx_documents_ingested_status', 'status', 'ingestion_id'),
+    )
     ingestion_id = sa.Column(sa.String, primary_key=True)
     file_name = sa.Column(sa.String, nullable=False)
     file_url = sa.Column(sa.Text, nullable=True)
+    content_hash = sa.Column(sa.String(64), sa.ForeignKey('document_blobs.content_hash'), nullable=True)
     source = sa.Column(sa.String)
     metadata = sa.Column(JSONB)
     status = sa.Column(sa.String)
     created_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now())
     updated_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now())
 
+class OcrJobs(Base):
+    __tablename__ = 'ocr_jobs'
+    __table_args__ = (
+        sa.Index('idx_ocr_jobs_claim', 'status', 'priority_rank', 'available_at', 'created_at'),
+    )
+    job_id = sa.Column(sa.String, primary_key=True)
+    ingestion_id = sa.Column(sa.String, sa.ForeignKey('documents_ingested.ingestion_id', ondelete='CASCADE'), nullable=False, index=True)
+    file_url = sa.Column(sa.Text)
+    metadata_ = sa.Column('metadata', JSONB)
+    priority = sa.Column(sa.String, nullable=False, default='normal')
+    priority_rank = sa.Column(sa.Integer, nullable=False, default=1)
+    status = sa.Column(sa.String, nullable=False, default='QUEUED')
+    attempts = sa.Column(sa.Integer, nullable=False, default=0)
+    max_attempts = sa.Column(sa.Integer, nullable=False, default=3)
+    locked_by = sa.Column(sa.String)
+    locked_at = sa.Column(sa.TIMESTAMP(timezone=True))
+    available_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now())
+    ocr_id = sa.Column(sa.String)
+    error = sa.Column(sa.Text)
+    created_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now())
+    updated_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now())
+
 class OcrOutput(Base):
     __tablename__ = 'ocr_output'
     ocr_id = sa.Column(sa.String, primary_key=True)
@@ -107,8 +141,50 @@ class AgentAudit(Base):
 
 class Orchestrations(Base):
     __tablename__ = 'orchestrations'
+    __table_args__ = (
+        sa.Index('idx_orchestrations_lease', 'lease_expires_at', postgresql_where=sa.text('lease_owner IS NOT NULL')),
+    )
     ingestion_id = sa.Column(sa.String, primary_key=True)
     state = sa.Column(JSONB)
     status = sa.Column(sa.String)
+    # Last compacted checkpoint; orchestration_steps holds the deltas recorded after it.
+    version = sa.Column(sa.BigInteger, nullable=False, default=0, server_default='0')
+    checkpoint_type = sa.Column(sa.String)
+    checkpoint = sa.Column(sa.LargeBinary)
+    # Held by the orchestrator process running the flow; NULL once the run ends.
+    lease_owner = sa.Column(sa.String)
+    lease_expires_at = sa.Column(sa.TIMESTAMP(timezone=True))
+    recoveries = sa.Column(sa.Integer, nullable=False, default=0, server_default='0')
     created_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now())
     updated_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now())
+
+class OrchestrationSteps(Base):
+    __tablename__ = 'orchestration_steps'
+    ingestion_id = sa.Column(sa.String, primary_key=True)
+    version = sa.Column(sa.BigInteger, primary_key=True)
+    state_delta = sa.Column(JSONB)
+    status = sa.Column(sa.String)
+    checkpoint_type = sa.Column(sa.String)
+    checkpoint = sa.Column(sa.LargeBinary)
+    created_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now())
+
+class IdempotencyKeys(Base):
+    __tablename__ = 'idempotency_keys'
+    key = sa.Column(sa.String, primary_key=True)
+    agent = sa.Column(sa.String, nullable=False)
+    response = sa.Column(sa.LargeBinary)
+    created_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now())
+
+class LLMCache(Base):
+    __tablename__ = 'llm_cache'
+    __table_args__ = (
+        sa.Index('idx_llm_cache_last_used_at', 'last_used_at'),
+    )
+    key = sa.Column(sa.String, primary_key=True)
+    model = sa.Column(sa.String, nullable=False)
+    text = sa.Column(sa.Text)
+    confidence = sa.Column(sa.Float)
+    raw_response = sa.Column(sa.Text)
+    hits = sa.Column(sa.Integer, nullable=False, default=0, server_default='0')
+    created_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now())
+    last_used_at = sa.Column(sa.TIMESTAMP(timezone=True), server_default=sa.func.now())
@@ -1,22 +1,75 @@
+import csv
+import io
 import json
 import logging
-from datetime import datetime, timezone
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+import sqlalchemy as sa
 from sqlalchemy.orm import Session
 
-from backend.mcp.db.engine import SessionLocal
-from backend.mcp.db.models import DocumentsIngested, Metrics, AgentAudit, Orchestrations
-from sqlalchemy.dialects.postgresql import insert
+from backend.mcp.db.engine import SessionLocal, engine
+from backend.mcp.db.models import (
+    AgentAudit,
+    ConversionLogs,
+    DocumentBlobs,
+    DocumentsIngested,
+    IdempotencyKeys,
+    IntegrationLogs,
+    LLMCache,
+    MappedSchema,
+    Metrics,
+    OcrJobs,
+    OcrOutput,
+    Orchestrations,
+    OrchestrationSteps,
+    Reports,
+    ValidationLogs,
+    WarningsLogs,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert
 
 logging.basicConfig(level=logging.INFO)
 
-def save_document(ingestion_id: str, file_name: str, file_url: str, metadata: dict):
-    """Saves a document record to the database."""
+# OCR job queue lanes, claimed in this order.
+OCR_JOB_PRIORITY_RANKS = {"high": 0, "normal": 1, "low": 2}
+# RUNNING jobs whose lock is older than this are assumed abandoned and become claimable again.
+OCR_JOB_VISIBILITY_TIMEOUT_S = int(os.getenv("OCR_JOB_VISIBILITY_TIMEOUT_S", "600"))
+# Waiting jobs move up one lane per this many seconds so low priority work cannot starve.
+OCR_JOB_PRIORITY_AGING_S = int(os.getenv("OCR_JOB_PRIORITY_AGING_S", "300"))
+
+def blob_ref_upsert(content_hash: str, size_bytes: int | None):
+    """INSERT ... ON CONFLICT that creates a document_blobs row or bumps its ref_count.
+
+    Nothing decrements ref_count: documents are never deleted, so blobs are never
+    released or collected.
+    """
+    return insert(DocumentBlobs).values(
+        content_hash=content_hash,
+        size_bytes=size_bytes or 0,
+        ref_count=1,
+    ).on_conflict_do_update(
+        index_elements=['content_hash'],
+        set_=dict(ref_count=DocumentBlobs.ref_count + 1),
+    )
+
+def save_document(ingestion_id: str, file_name: str, file_url: str, metadata: dict,
+                  content_hash: str | None = None, size_bytes: int | None = None):
+    """Saves a document record to the database.
+
+    When the document carries content, the matching document_blobs row is created or
+    has its reference count incremented in the same transaction.
+    """
     try:
         with SessionLocal() as session:
+            if content_hash:
+                session.execute(blob_ref_upsert(content_hash, size_bytes))
+
             db_document = DocumentsIngested(
                 ingestion_id=ingestion_id,
                 file_name=file_name,
                 file_url=file_url,
+                content_hash=content_hash,
                 metadata=metadata,
                 source="grpc",  # Defaulting source
                 status="received"  # Defaulting status
@@ -44,6 +97,24 @@ def get_document(ingestion_id: str):
         logging.error(f"Error getting document {ingestion_id}: {e}")
         return None
 
+def list_document_ids_stmt(status: str | None = None, limit: int = 1000, after: str | None = None):
+    """Keyset page of ingestion ids ordered by ingestion_id, optionally filtered by status."""
+    stmt = sa.select(DocumentsIngested.ingestion_id).order_by(DocumentsIngested.ingestion_id).limit(limit)
+    if status:
+        stmt = stmt.where(DocumentsIngested.status == status)
+    if after:
+        stmt = stmt.where(DocumentsIngested.ingestion_id > after)
+    return stmt
+
+def list_document_ids(status: str | None = None, limit: int = 1000, after: str | None = None):
+    """Lists ingestion ids after `after`, at most `limit` of them."""
+    try:
+        with SessionLocal() as session:
+            return list(session.scalars(list_document_ids_stmt(status, limit, after)))
+    except Exception as e:
+        logging.error(f"Error listing documents (status={status}, after={after}): {e}")
+        return None
+
 def write_metric(agent: str, ingestion_id: str, metric_json: str, metric_ts: int):
     """Writes a metric event to the database."""
     try:
@@ -88,20 +159,103 @@ def write_audit(agent: str, action: str, reference_id: str, payload_json: str, t
         logging.error(f"Error writing audit event for agent {agent}: {e}")
         return False
 
+def metric_row(agent: str, ingestion_id: str, metric_json: str, metric_ts: int) -> dict:
+    """Builds a metrics row for bulk_write_metrics. Raises ValueError on invalid JSON."""
+    return dict(
+        agent=agent,
+        ingestion_id=ingestion_id,
+        metric_ts=datetime.fromtimestamp(metric_ts, tz=timezone.utc),
+        metrics=json.loads(metric_json),
+        tags={},
+    )
+
+def audit_row(agent: str, action: str, reference_id: str, payload_json: str, ts: int) -> dict:
+    """Builds an agent_audit row for bulk_write_audits. Raises ValueError on invalid JSON."""
+    return dict(
+        agent=agent,
+        action=action,
+        reference_id=reference_id,
+        payload=json.loads(payload_json),
+        created_at=datetime.fromtimestamp(ts, tz=timezone.utc),
+    )
+
+def _copy_rows(cursor, model, rows: list[dict]):
+    """Bulk loads rows with COPY ... FROM STDIN (CSV) on a raw psycopg2 cursor."""
+    table = model.__table__
+    columns = list(rows[0].keys())
+    buf = io.StringIO()
+    # QUOTE_NOTNULL writes None as an unquoted empty field (NULL) and '' as "" (empty string).
+    writer = csv.writer(buf, quoting=csv.QUOTE_NOTNULL)
+    for row in rows:
+        values = []
+        for column in columns:
+            value = row[column]
+            if isinstance(table.c[column].type, JSONB):
+                value = json.dumps(value)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            values.append(value)
+        writer.writerow(values)
+    buf.seek(0)
+    cursor.copy_expert(
+        f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+        buf,
+    )
+
+def _bulk_insert_tables(batches: list[tuple], use_copy: bool | None = None):
+    """Writes (model, rows) batches, in order, in one transaction, using COPY on psycopg2
+    and multi-row INSERTs otherwise."""
+    batches = [(model, rows) for model, rows in batches if rows]
+    if not batches:
+        return
+    if use_copy is None:
+        use_copy = engine.dialect.driver == "psycopg2"
+    if use_copy:
+        raw = engine.raw_connection()
+        try:
+            with raw.cursor() as cursor:
+                for model, rows in batches:
+                    _copy_rows(cursor, model, rows)
+            raw.commit()
+        finally:
+            raw.close()
+        return
+    with SessionLocal() as session:
+        for model, rows in batches:
+            session.execute(sa.insert(model), rows)
+        session.commit()
+
+def _bulk_insert(model, rows: list[dict], use_copy: bool | None = None):
+    """Writes rows in one transaction, using COPY on psycopg2 and a multi-row INSERT otherwise."""
+    _bulk_insert_tables([(model, rows)], use_copy)
+
+def bulk_write_metrics(rows: list[dict], use_copy: bool | None = None):
+    """Writes a batch of metric rows built with metric_row."""
+    _bulk_insert(Metrics, rows, use_copy)
+    logging.info(f"Wrote {len(rows)} metric rows")
+
+def bulk_write_audits(rows: list[dict], use_copy: bool | None = None):
+    """Writes a batch of audit rows built with audit_row."""
+    _bulk_insert(AgentAudit, rows, use_copy)
+    logging.info(f"Wrote {len(rows)} audit rows")
+
+def orchestration_upsert(ingestion_id: str, state: dict):
+    """INSERT ... ON CONFLICT that saves or replaces an orchestration state."""
+    insert_stmt = insert(Orchestrations).values(
+        ingestion_id=ingestion_id,
+        state=state,
+        status=state.get("status", "UNKNOWN")
+    )
+    return insert_stmt.on_conflict_do_update(
+        index_elements=['ingestion_id'],
+        set_=dict(state=state, status=state.get("status", "UNKNOWN"))
+    )
+
 def save_orchestration(ingestion_id: str, state: dict):
     """Saves or updates an orchestration state."""
     try:
         with SessionLocal() as session:
-            insert_stmt = insert(Orchestrations).values(
-                ingestion_id=ingestion_id,
-                state=state,
-                status=state.get("status", "UNKNOWN")
-            )
-            on_conflict_stmt = insert_stmt.on_conflict_do_update(
-                index_elements=['ingestion_id'],
-                set_=dict(state=state, status=state.get("status", "UNKNOWN"))
-            )
-            session.execute(on_conflict_stmt)
+            session.execute(orchestration_upsert(ingestion_id, state))
             session.commit()
             return True
     except Exception as e:
@@ -117,29 +271,622 @@ def get_orchestration(ingestion_id: str):
         logging.error(f"Error getting orchestration state for {ingestion_id}: {e}")
         return None
 
-def get_ocr_output(ocr_id: str):
-    """Retrieves OCR output."""
+def orchestration_step_insert(values: dict):
+    """INSERT of one orchestration step; replaying an already recorded version is a no-op."""
+    return insert(OrchestrationSteps).values(**values).on_conflict_do_nothing(
+        index_elements=['ingestion_id', 'version']
+    )
+
+def orchestration_compact_stmts(values: dict):
+    """Statements that fold an orchestration's steps into its row as of values['version'].
+
+    The upsert never moves the row back to an older version, so a late compaction
+    cannot overwrite a newer one.
+    """
+    insert_stmt = insert(Orchestrations).values(**values)
+    upsert = insert_stmt.on_conflict_do_update(
+        index_elements=['ingestion_id'],
+        set_={column: insert_stmt.excluded[column] for column in values if column != 'ingestion_id'},
+        where=Orchestrations.version <= insert_stmt.excluded.version,
+    )
+    delete = sa.delete(OrchestrationSteps).where(
+        OrchestrationSteps.ingestion_id == values['ingestion_id'],
+        OrchestrationSteps.version <= values['version'],
+    )
+    return upsert, delete
+
+def orchestration_steps_stmt(ingestion_id: str):
+    return (
+        sa.select(OrchestrationSteps)
+        .where(OrchestrationSteps.ingestion_id == ingestion_id)
+        .order_by(OrchestrationSteps.version)
+    )
+
+def orchestration_reset_stmts(ingestion_id: str):
+    """Statements that drop an orchestration's steps and compacted state, keeping the row."""
+    delete = sa.delete(OrchestrationSteps).where(OrchestrationSteps.ingestion_id == ingestion_id)
+    reset = (
+        sa.update(Orchestrations)
+        .where(Orchestrations.ingestion_id == ingestion_id)
+        .values(state=None, status=None, version=0, checkpoint_type=None, checkpoint=None)
+    )
+    return delete, reset
+
+def _lease_expiry(ttl_s: int):
+    return sa.func.now() + sa.func.make_interval(0, 0, 0, 0, 0, 0, ttl_s)
+
+def acquire_orchestration_lease_stmt(ingestion_id: str, owner: str, ttl_s: int):
+    """Takes the lease of an orchestration (creating its row) unless another owner holds
+    an unexpired one; RETURNING yields a row only when the lease was acquired."""
+    insert_stmt = insert(Orchestrations).values(
+        ingestion_id=ingestion_id, lease_owner=owner, lease_expires_at=_lease_expiry(ttl_s), recoveries=0,
+    )
+    return insert_stmt.on_conflict_do_update(
+        index_elements=['ingestion_id'],
+        set_=dict(lease_owner=owner, lease_expires_at=_lease_expiry(ttl_s), recoveries=0),
+        where=sa.or_(
+            Orchestrations.lease_owner.is_(None),
+            Orchestrations.lease_owner == owner,
+            Orchestrations.lease_expires_at < sa.func.now(),
+        ),
+    ).returning(Orchestrations.ingestion_id)
+
+def renew_orchestration_leases_stmt(owner: str, ingestion_ids: list[str], ttl_s: int):
+    return (
+        sa.update(Orchestrations)
+        .where(Orchestrations.ingestion_id.in_(ingestion_ids), Orchestrations.lease_owner == owner)
+        .values(lease_expires_at=_lease_expiry(ttl_s))
+    )
+
+def release_orchestration_lease_stmt(ingestion_id: str, owner: str):
+    return (
+        sa.update(Orchestrations)
+        .where(Orchestrations.ingestion_id == ingestion_id, Orchestrations.lease_owner == owner)
+        .values(lease_owner=None, lease_expires_at=None)
+    )
+
+def claim_stale_orchestrations_stmt(owner: str, ttl_s: int, limit: int, max_recoveries: int):
+    """UPDATE ... RETURNING that hands lapsed leases to `owner`, oldest first. SKIP LOCKED
+    lets several orchestrator processes sweep at once without claiming the same flow."""
+    stale = (
+        sa.select(Orchestrations.ingestion_id)
+        .where(
+            Orchestrations.lease_owner.is_not(None),
+            Orchestrations.lease_expires_at < sa.func.now(),
+            Orchestrations.recoveries < max_recoveries,
+        )
+        .order_by(Orchestrations.lease_expires_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    return (
+        sa.update(Orchestrations)
+        .where(Orchestrations.ingestion_id.in_(stale))
+        .values(
+            lease_owner=owner,
+            lease_expires_at=_lease_expiry(ttl_s),
+            recoveries=Orchestrations.recoveries + 1,
+        )
+        .returning(Orchestrations.ingestion_id)
+    )
+
+def acquire_orchestration_lease(ingestion_id: str, owner: str, ttl_s: int):
+    """Returns True if `owner` now holds the lease, False if another owner does, None on error."""
     try:
         with SessionLocal() as session:
-            return session.query(OcrOutput).filter(OcrOutput.ocr_id == ocr_id).first()
+            acquired = session.execute(acquire_orchestration_lease_stmt(ingestion_id, owner, ttl_s)).first()
+            session.commit()
+            return acquired is not None
     except Exception as e:
-        logging.error(f"Error getting ocr output for {ocr_id}: {e}")
+        logging.error(f"Error acquiring orchestration lease for {ingestion_id}: {e}")
         return None
 
-def get_mapped_schema(schema_id: str):
-    """Retrieves a mapped schema."""
+def renew_orchestration_leases(owner: str, ingestion_ids: list[str], ttl_s: int):
+    """Extends the leases `owner` still holds; returns how many were renewed, or None on error."""
+    try:
+        with SessionLocal() as session:
+            renewed = session.execute(renew_orchestration_leases_stmt(owner, ingestion_ids, ttl_s)).rowcount
+            session.commit()
+            return renewed
+    except Exception as e:
+        logging.error(f"Error renewing {len(ingestion_ids)} orchestration leases for {owner}: {e}")
+        return None
+
+def release_orchestration_lease(ingestion_id: str, owner: str):
+    try:
+        with SessionLocal() as session:
+            session.execute(release_orchestration_lease_stmt(ingestion_id, owner))
+            session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error releasing orchestration lease for {ingestion_id}: {e}")
+        return False
+
+def claim_stale_orchestrations(owner: str, ttl_s: int, limit: int, max_recoveries: int):
+    """Claims up to `limit` orchestrations whose lease lapsed; returns their ids, or None on error."""
+    try:
+        with SessionLocal() as session:
+            claimed = list(session.scalars(claim_stale_orchestrations_stmt(owner, ttl_s, limit, max_recoveries)))
+            session.commit()
+            return claimed
+    except Exception as e:
+        logging.error(f"Error claiming stale orchestrations for {owner}: {e}")
+        return None
+
+def idempotency_record_insert(key: str, agent: str, response: bytes):
+    """INSERT of an agent response; the first response recorded for a key wins."""
+    return insert(IdempotencyKeys).values(key=key, agent=agent, response=response).on_conflict_do_nothing(
+        index_elements=['key']
+    )
+
+def save_idempotency_record(key: str, agent: str, response: bytes):
+    try:
+        with SessionLocal() as session:
+            session.execute(idempotency_record_insert(key, agent, response))
+            session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error saving idempotency record {key}: {e}")
+        return False
+
+def get_idempotency_record(key: str):
+    return _get_artifact(IdempotencyKeys, key)
+
+def llm_cache_hit_stmt(key: str, ttl_s: int):
+    """UPDATE ... RETURNING that reads an unexpired cache entry and marks it used."""
+    return (
+        sa.update(LLMCache)
+        .where(LLMCache.key == key, LLMCache.created_at > sa.func.now() - sa.func.make_interval(0, 0, 0, 0, 0, 0, ttl_s))
+        .values(hits=LLMCache.hits + 1, last_used_at=sa.func.now())
+        .returning(LLMCache.text, LLMCache.confidence, LLMCache.raw_response)
+    )
+
+def llm_cache_insert(values: dict):
+    """Upsert of a cache entry; an expired entry under the same key is replaced."""
+    stmt = insert(LLMCache).values(**values, hits=0)
+    return stmt.on_conflict_do_update(
+        index_elements=['key'],
+        set_={column: stmt.excluded[column] for column in (*values, 'hits')} | {
+            'created_at': sa.func.now(), 'last_used_at': sa.func.now(),
+        },
+    )
+
+def llm_cache_prune_stmts(ttl_s: int, max_entries: int):
+    """Deletes expired entries, then the least recently used ones beyond max_entries."""
+    expired = sa.delete(LLMCache).where(
+        LLMCache.created_at <= sa.func.now() - sa.func.make_interval(0, 0, 0, 0, 0, 0, ttl_s)
+    )
+    overflow = sa.delete(LLMCache).where(LLMCache.key.in_(
+        sa.select(LLMCache.key).order_by(LLMCache.last_used_at.desc()).offset(max_entries).scalar_subquery()
+    ))
+    return expired, overflow
+
+def get_llm_cache_entry(key: str, ttl_s: int):
+    """Returns the cached (text, confidence, raw_response) for `key`, or None."""
+    try:
+        with SessionLocal() as session:
+            row = session.execute(llm_cache_hit_stmt(key, ttl_s)).first()
+            session.commit()
+            return row
+    except Exception as e:
+        logging.error(f"Error reading LLM cache entry {key}: {e}")
+        return None
+
+def save_llm_cache_entry(**values):
+    try:
+        with SessionLocal() as session:
+            session.execute(llm_cache_insert(values))
+            session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error saving LLM cache entry {values.get('key')}: {e}")
+        return False
+
+def prune_llm_cache(ttl_s: int, max_entries: int):
+    """Returns how many entries were evicted, or None on error."""
+    try:
+        with SessionLocal() as session:
+            deleted = sum(session.execute(stmt).rowcount for stmt in llm_cache_prune_stmts(ttl_s, max_entries))
+            session.commit()
+            return deleted
+    except Exception as e:
+        logging.error(f"Error pruning the LLM cache: {e}")
+        return None
+
+def append_orchestration_step(**values):
+    """Records one orchestration step delta."""
+    try:
+        with SessionLocal() as session:
+            session.execute(orchestration_step_insert(values))
+            session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error saving orchestration step {values.get('version')} for {values.get('ingestion_id')}: {e}")
+        return False
+
+def compact_orchestration(**values):
+    """Saves a full orchestration snapshot and drops the steps it covers, atomically."""
+    try:
+        with SessionLocal() as session:
+            for stmt in orchestration_compact_stmts(values):
+                session.execute(stmt)
+            session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error compacting orchestration {values.get('ingestion_id')}: {e}")
+        return False
+
+def get_orchestration_checkpoints(ingestion_id: str):
+    """Returns (orchestration row or None, steps after it in version order), or None on error."""
     try:
         with SessionLocal() as session:
-            return session.query(MappedSchema).filter(MappedSchema.schema_id == schema_id).first()
+            orchestration = session.get(Orchestrations, ingestion_id)
+            steps = list(session.scalars(orchestration_steps_stmt(ingestion_id)))
+            return orchestration, steps
     except Exception as e:
-        logging.error(f"Error getting mapped schema for {schema_id}: {e}")
+        logging.error(f"Error getting orchestration checkpoints for {ingestion_id}: {e}")
         return None
 
+def delete_orchestration_checkpoints(ingestion_id: str):
+    """Forgets an orchestration's checkpoint history so the next run starts fresh."""
+    try:
+        with SessionLocal() as session:
+            for stmt in orchestration_reset_stmts(ingestion_id):
+                session.execute(stmt)
+            session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error deleting orchestration checkpoints for {ingestion_id}: {e}")
+        return False
+
+def artifact_upsert(model, values: dict):
+    """INSERT ... ON CONFLICT on the primary key that saves or replaces an artifact row."""
+    pk = model.__table__.primary_key.columns.values()[0].name
+    insert_stmt = insert(model).values(**values)
+    return insert_stmt.on_conflict_do_update(
+        index_elements=[pk],
+        set_={column: insert_stmt.excluded[column] for column in values if column != pk},
+    )
+
+def _save_artifact(model, values: dict):
+    pk = model.__table__.primary_key.columns.values()[0].name
+    try:
+        with SessionLocal() as session:
+            session.execute(artifact_upsert(model, values))
+            session.commit()
+            logging.info(f"Saved {model.__tablename__} {values[pk]}")
+            return True
+    except Exception as e:
+        logging.error(f"Error saving {model.__tablename__} {values.get(pk)}: {e}")
+        return False
+
+def _get_artifact(model, artifact_id: str):
+    try:
+        with SessionLocal() as session:
+            return session.get(model, artifact_id)
+    except Exception as e:
+        logging.error(f"Error getting {model.__tablename__} {artifact_id}: {e}")
+        return None
+
+def save_ocr_output(ocr_id: str, ingestion_id: str, raw_text: str, detected_fields: dict,
+                    confidence: float, status: str):
+    """Saves or replaces an OCR output."""
+    return _save_artifact(OcrOutput, dict(
+        ocr_id=ocr_id,
+        ingestion_id=ingestion_id,
+        raw_text=raw_text,
+        detected_fields=detected_fields,
+        confidence=confidence,
+        status=status,
+    ))
+
+def get_ocr_output(ocr_id: str):
+    """Retrieves OCR output."""
+    return _get_artifact(OcrOutput, ocr_id)
+
+def save_mapped_schema(schema_id: str, ocr_id: str, mapped_data: dict, mapping_confidence: float):
+    """Saves or replaces a mapped schema."""
+    return _save_artifact(MappedSchema, dict(
+        schema_id=schema_id,
+        ocr_id=ocr_id,
+        mapped_data=mapped_data,
+        mapping_confidence=mapping_confidence,
+    ))
+
+def get_mapped_schema(schema_id: str):
+    """Retrieves a mapped schema."""
+    return _get_artifact(MappedSchema, schema_id)
+
+def save_validation_logs(validation_id: str, schema_id: str, status: str, errors: list, warnings: list):
+    """Saves or replaces a validation result."""
+    return _save_artifact(ValidationLogs, dict(
+        validation_id=validation_id,
+        schema_id=schema_id,
+        status=status,
+        errors=errors,
+        warnings=warnings,
+    ))
+
 def get_validation_logs(validation_id: str):
     """Retrieves validation logs."""
+    return _get_artifact(ValidationLogs, validation_id)
+
+def mapped_schemas_page_stmt(schema_ids: list[str] | None = None, created_from: datetime | None = None,
+                             created_to: datetime | None = None, limit: int = 1000, after: str | None = None):
+    """Keyset page of mapped schemas ordered by schema_id: those in `schema_ids`, or all of
+    them, created in [created_from, created_to). mapped_data is selected as JSON text."""
+    stmt = (
+        sa.select(
+            MappedSchema.schema_id,
+            MappedSchema.ocr_id,
+            sa.cast(MappedSchema.mapped_data, sa.Text).label("mapped_json"),
+            MappedSchema.mapping_confidence,
+        )
+        .order_by(MappedSchema.schema_id)
+        .limit(limit)
+    )
+    if schema_ids:
+        stmt = stmt.where(MappedSchema.schema_id.in_(schema_ids))
+    if created_from:
+        stmt = stmt.where(MappedSchema.created_at >= created_from)
+    if created_to:
+        stmt = stmt.where(MappedSchema.created_at < created_to)
+    if after:
+        stmt = stmt.where(MappedSchema.schema_id > after)
+    return stmt
+
+def iter_mapped_schemas(schema_ids: list[str] | None = None, created_from: datetime | None = None,
+                        created_to: datetime | None = None, page_size: int = 1000):
+    """Yields mapped schema rows (see mapped_schemas_page_stmt), one page per query.
+
+    With `schema_ids`, the ids are looked up `page_size` at a time. Raises on database
+    errors, which may come after some rows were yielded.
+    """
+    if schema_ids:
+        ids = sorted(set(schema_ids))
+        pages = (ids[start:start + page_size] for start in range(0, len(ids), page_size))
+        for page in pages:
+            with SessionLocal() as session:
+                yield from session.execute(mapped_schemas_page_stmt(page, created_from, created_to, page_size)).all()
+        return
+    after = None
+    while True:
+        with SessionLocal() as session:
+            rows = session.execute(mapped_schemas_page_stmt(None, created_from, created_to, page_size, after)).all()
+        yield from rows
+        if len(rows) < page_size:
+            return
+        after = rows[-1].schema_id
+
+def bulk_save_validation_results(log_rows: list[dict], warning_rows: list[dict], use_copy: bool | None = None):
+    """Writes validation_logs rows and the warnings_logs rows referencing them in one
+    transaction. The validation ids must be new."""
+    _bulk_insert_tables([(ValidationLogs, log_rows), (WarningsLogs, warning_rows)], use_copy)
+    logging.info(f"Wrote {len(log_rows)} validation logs with {len(warning_rows)} warnings")
+
+def save_conversion_log(conversion_id: str, validation_id: str, target: str, output: str,
+                        artifact_url: str | None, status: str):
+    """Saves or replaces a conversion result."""
+    return _save_artifact(ConversionLogs, dict(
+        conversion_id=conversion_id,
+        validation_id=validation_id,
+        target=target,
+        output=output,
+        artifact_url=artifact_url,
+        status=status,
+    ))
+
+def get_conversion_log(conversion_id: str):
+    """Retrieves a conversion log."""
+    return _get_artifact(ConversionLogs, conversion_id)
+
+def save_integration_log(integration_id: str, conversion_id: str, target: str, platform_response: str | None,
+                         status: str, retry: int = 0, platform_status_code: int | None = None,
+                         last_attempt_at: datetime | None = None, next_retry_at: datetime | None = None):
+    """Saves or replaces an integration attempt."""
+    return _save_artifact(IntegrationLogs, dict(
+        integration_id=integration_id,
+        conversion_id=conversion_id,
+        target=target,
+        platform_response=platform_response,
+        status=status,
+        retry=retry,
+        platform_status_code=platform_status_code,
+        last_attempt_at=last_attempt_at,
+        next_retry_at=next_retry_at,
+    ))
+
+def get_integration_log(integration_id: str):
+    """Retrieves an integration log."""
+    return _get_artifact(IntegrationLogs, integration_id)
+
+def save_report(report_id: str, validation_id: str, schema_id: str | None, user_id: str | None,
+                status: str, summary: dict, report_url: str | None = None):
+    """Saves or replaces a report."""
+    return _save_artifact(Reports, dict(
+        report_id=report_id,
+        validation_id=validation_id,
+        schema_id=schema_id,
+        user_id=user_id,
+        status=status,
+        summary=summary,
+        report_url=report_url,
+    ))
+
+def get_report(report_id: str):
+    """Retrieves a report."""
+    return _get_artifact(Reports, report_id)
+
+def save_warning(warning_id: str, ingestion_id: str | None, validation_id: str | None, field_name: str,
+                 severity: str, message: str, suggested_fix: dict | None = None):
+    """Saves or replaces a warning raised against a document or validation."""
+    return _save_artifact(WarningsLogs, dict(
+        warning_id=warning_id,
+        ingestion_id=ingestion_id,
+        validation_id=validation_id,
+        field_name=field_name,
+        severity=severity,
+        message=message,
+        suggested_fix=suggested_fix,
+    ))
+
+def new_ocr_job(ingestion_id: str, file_url: str, metadata: dict, priority: str = "normal") -> OcrJobs:
+    """Builds a QUEUED OcrJobs row; unknown priorities fall back to normal."""
+    if priority not in OCR_JOB_PRIORITY_RANKS:
+        priority = "normal"
+    return OcrJobs(
+        job_id=f"JOB-{uuid.uuid4()}",
+        ingestion_id=ingestion_id,
+        file_url=file_url,
+        metadata_=metadata,
+        priority=priority,
+        priority_rank=OCR_JOB_PRIORITY_RANKS[priority],
+        status="QUEUED",
+        attempts=0,
+    )
+
+def enqueue_ocr_job(ingestion_id: str, file_url: str, metadata: dict, priority: str = "normal"):
+    """Adds an OCR job to the queue."""
+    try:
+        with SessionLocal() as session:
+            job = new_ocr_job(ingestion_id, file_url, metadata, priority)
+            session.add(job)
+            session.commit()
+            session.refresh(job)
+            logging.info(f"Enqueued OCR job {job.job_id} for {ingestion_id} ({job.priority})")
+            return job
+    except Exception as e:
+        logging.error(f"Error enqueueing OCR job for {ingestion_id}: {e}")
+        return None
+
+def _abandoned_ocr_jobs(now: datetime):
+    return sa.and_(
+        OcrJobs.status == "RUNNING",
+        OcrJobs.locked_at < now - timedelta(seconds=OCR_JOB_VISIBILITY_TIMEOUT_S),
+    )
+
+def fail_abandoned_ocr_jobs_stmt():
+    """Marks FAILED the abandoned RUNNING jobs that have no attempts left to reclaim them with."""
+    now = datetime.now(timezone.utc)
+    return (
+        sa.update(OcrJobs)
+        .where(_abandoned_ocr_jobs(now), OcrJobs.attempts >= OcrJobs.max_attempts)
+        .values(
+            status="FAILED",
+            locked_by=None,
+            error=f"No result within {OCR_JOB_VISIBILITY_TIMEOUT_S}s on the last attempt",
+        )
+    )
+
+def ocr_job_claim_order(now: datetime) -> tuple:
+    """ORDER BY of claims: the lane, moved up one per OCR_JOB_PRIORITY_AGING_S waited,
+    then the oldest job first."""
+    waited_s = sa.extract("epoch", sa.literal(now, sa.DateTime(timezone=True)) - OcrJobs.created_at)
+    effective_rank = sa.func.greatest(OcrJobs.priority_rank - sa.func.floor(waited_s / OCR_JOB_PRIORITY_AGING_S), 0)
+    return effective_rank, OcrJobs.created_at
+
+def claim_ocr_jobs_stmt(worker_id: str, max_jobs: int = 1, priorities: list | None = None):
+    """UPDATE ... RETURNING that claims up to `max_jobs` visible jobs for a worker.
+
+    Candidates are selected FOR UPDATE SKIP LOCKED so concurrent workers never block on
+    or double-claim a row. Abandoned RUNNING jobs are reclaimed only while they have
+    attempts left; fail_abandoned_ocr_jobs_stmt fails the others.
+    """
+    now = datetime.now(timezone.utc)
+    visible = sa.or_(
+        sa.and_(OcrJobs.status == "QUEUED", OcrJobs.available_at <= now),
+        sa.and_(_abandoned_ocr_jobs(now), OcrJobs.attempts < OcrJobs.max_attempts),
+    )
+    candidates = (
+        sa.select(OcrJobs.job_id)
+        .where(visible)
+        .order_by(*ocr_job_claim_order(now))
+        .limit(max_jobs)
+        .with_for_update(skip_locked=True)
+    )
+    if priorities:
+        candidates = candidates.where(OcrJobs.priority.in_(priorities))
+
+    return (
+        sa.update(OcrJobs)
+        .where(OcrJobs.job_id.in_(candidates.scalar_subquery()))
+        .values(status="RUNNING", locked_by=worker_id, locked_at=now, attempts=OcrJobs.attempts + 1)
+        .returning(OcrJobs)
+    )
+
+def claim_ocr_jobs(worker_id: str, max_jobs: int = 1, priorities: list | None = None):
+    """Atomically claims up to `max_jobs` jobs for a worker."""
     try:
         with SessionLocal() as session:
-            return session.query(ValidationLogs).filter(ValidationLogs.validation_id == validation_id).first()
+            session.execute(fail_abandoned_ocr_jobs_stmt())
+            jobs = session.scalars(claim_ocr_jobs_stmt(worker_id, max_jobs, priorities)).all()
+            # Detach before commit so the returned rows are not expired.
+            session.expunge_all()
+            session.commit()
+            return jobs
+    except Exception as e:
+        logging.error(f"Error claiming OCR jobs for worker {worker_id}: {e}")
+        return []
+
+def leased_ocr_job(job_id: str, worker_id: str):
+    """The job while `worker_id` still holds it: RUNNING and not reclaimed by another worker."""
+    return sa.and_(OcrJobs.job_id == job_id, OcrJobs.status == "RUNNING", OcrJobs.locked_by == worker_id)
+
+def complete_ocr_job_stmt(job_id: str, worker_id: str, ocr_id: str):
+    return (
+        sa.update(OcrJobs)
+        .where(leased_ocr_job(job_id, worker_id))
+        .values(status="DONE", ocr_id=ocr_id, error=None, locked_by=None)
+    )
+
+def complete_ocr_job(job_id: str, worker_id: str, ocr_id: str):
+    """Marks a claimed job as done. Returns False if the worker lost its lease on the job,
+    None on error."""
+    try:
+        with SessionLocal() as session:
+            updated = session.execute(complete_ocr_job_stmt(job_id, worker_id, ocr_id)).rowcount
+            session.commit()
+            return updated == 1
+    except Exception as e:
+        logging.error(f"Error completing OCR job {job_id}: {e}")
+        return None
+
+def apply_ocr_job_failure(job: OcrJobs, error: str, retry_delay_s: int):
+    """Re-queues a job after a delay, or marks it FAILED once it is out of attempts."""
+    job.error = error
+    job.locked_by = None
+    if job.attempts >= job.max_attempts:
+        job.status = "FAILED"
+    else:
+        job.status = "QUEUED"
+        job.available_at = datetime.now(timezone.utc) + timedelta(seconds=retry_delay_s)
+
+def fail_ocr_job(job_id: str, worker_id: str, error: str, retry_delay_s: int = 30):
+    """Records a failed attempt; the job is re-queued until it runs out of attempts.
+    Returns False if the worker lost its lease on the job, None on error."""
+    try:
+        with SessionLocal() as session:
+            job = session.query(OcrJobs).filter(leased_ocr_job(job_id, worker_id)).with_for_update().first()
+            if not job:
+                return False
+            apply_ocr_job_failure(job, error, retry_delay_s)
+            session.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error failing OCR job {job_id}: {e}")
+        return None
+
+def get_ocr_job(ingestion_id: str):
+    """Retrieves the most recent OCR job for an ingestion."""
+    try:
+        with SessionLocal() as session:
+            return (
+                session.query(OcrJobs)
+                .filter(OcrJobs.ingestion_id == ingestion_id)
+                .order_by(OcrJobs.created_at.desc())
+                .first()
+            )
     except Exception as e:
-        logging.error(f"Error getting validation logs for {validation_id}: {e}")
+        logging.error(f"Error getting OCR job for {ingestion_id}: {e}")
         return None
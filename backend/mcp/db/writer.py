@@ -0,0 +1,164 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+class BatchWriter:
+    """Write-behind buffer that coalesces single-row writes into bulk flushes.
+
+    Rows are queued by `submit` and written by a background thread through `flush_fn`
+    once `max_batch_size` rows are pending or `flush_interval_s` has passed since the
+    first pending row. The queue is bounded: when it is full `submit` blocks for up to
+    `put_timeout_s` and then rejects the row, so slow flushes push back on callers
+    instead of growing memory. `close` (also registered with atexit) drains the queue.
+
+    A batch that fails to flush is retried, in order and ahead of newer rows, with a
+    backoff from `retry_backoff_s` doubling up to `max_retry_backoff_s`, while the
+    queue behind it pushes back on callers. After `max_flush_attempts` it is flushed
+    one row at a time, so only rows that still fail are dropped (`rows_failed`).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush_fn: Callable[[List[Any]], None],
+        max_batch_size: int = 500,
+        flush_interval_s: float = 0.5,
+        max_queue_size: int = 10000,
+        put_timeout_s: float = 5.0,
+        max_flush_attempts: int = 8,
+        retry_backoff_s: float = 0.5,
+        max_retry_backoff_s: float = 30.0,
+    ):
+        self.name = name
+        self.flush_fn = flush_fn
+        self.max_batch_size = max_batch_size
+        self.flush_interval_s = flush_interval_s
+        self.put_timeout_s = put_timeout_s
+        self.max_flush_attempts = max_flush_attempts
+        self.retry_backoff_s = retry_backoff_s
+        self.max_retry_backoff_s = max_retry_backoff_s
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Callers (rejections) and the flush thread both update the counters.
+        self._stats_lock = threading.Lock()
+        self.rows_written = 0
+        self.rows_failed = 0
+        self.rows_rejected = 0
+        self.batches = 0
+        self.flush_retries = 0
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        return self
+
+    def submit(self, row: Any) -> bool:
+        """Queues a row. Returns False if the writer is closed or stayed full for put_timeout_s."""
+        if self._closed.is_set():
+            return False
+        try:
+            self._queue.put(row, timeout=self.put_timeout_s)
+            return True
+        except queue.Full:
+            with self._stats_lock:
+                self.rows_rejected += 1
+            logging.error(f"{self.name} writer queue full, rejecting row")
+            return False
+
+    def try_submit(self, row: Any) -> bool:
+        """Queues a row without blocking. Returns False if the writer is closed or full."""
+        if self._closed.is_set():
+            return False
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            return False
+
+    def close(self, timeout: Optional[float] = None):
+        """Stops accepting rows and waits until everything queued has been flushed."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._thread:
+            self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "pending": self._queue.qsize(),
+                "rows_written": self.rows_written,
+                "rows_failed": self.rows_failed,
+                "rows_rejected": self.rows_rejected,
+                "batches": self.batches,
+                "flush_retries": self.flush_retries,
+            }
+
+    def _next_batch(self) -> List[Any]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval_s)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.flush_interval_s
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._closed.is_set():
+                # On shutdown take what is already queued without waiting for more.
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch: List[Any]):
+        delay = self.retry_backoff_s
+        for attempt in range(1, self.max_flush_attempts + 1):
+            try:
+                self.flush_fn(batch)
+                with self._stats_lock:
+                    self.rows_written += len(batch)
+                    self.batches += 1
+                return
+            except Exception as e:
+                logging.error(f"{self.name} writer failed to flush {len(batch)} rows (attempt {attempt}): {e}")
+            if attempt < self.max_flush_attempts:
+                with self._stats_lock:
+                    self.flush_retries += 1
+                # On shutdown retry without waiting, so close is not held up by the backoff.
+                self._closed.wait(delay)
+                delay = min(delay * 2, self.max_retry_backoff_s)
+
+        if len(batch) == 1:
+            with self._stats_lock:
+                self.rows_failed += 1
+            logging.error(f"{self.name} writer dropped a row after {self.max_flush_attempts} attempts")
+            return
+        # Likely a row the database rejects rather than an outage: keep the others.
+        for row in batch:
+            try:
+                self.flush_fn([row])
+                with self._stats_lock:
+                    self.rows_written += 1
+                    self.batches += 1
+            except Exception as e:
+                with self._stats_lock:
+                    self.rows_failed += 1
+                logging.error(f"{self.name} writer dropped a row: {e}")
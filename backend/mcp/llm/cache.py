@@ -0,0 +1,71 @@
+import logging
+import threading
+from typing import Callable
+
+from backend.mcp.db import repository
+
+class LLMResponseCache:
+    """Persistent cache of LLM responses in the llm_cache table.
+
+    Entries expire `ttl_s` after they were written. Every `prune_every` new entries,
+    expired entries and the least recently used ones beyond `max_entries` are deleted.
+    Concurrent misses for the same key in this process wait for the first caller's
+    LLM call instead of making their own.
+    """
+
+    def __init__(self, ttl_s: int, max_entries: int, prune_every: int = 100):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.prune_every = max(prune_every, 1)
+        self._lock = threading.Lock()
+        self._key_locks: dict = {}
+        self._inserts = 0
+
+    def get_or_query(self, key: str, model: str, query_fn: Callable[[], dict]) -> tuple[dict, bool]:
+        """Returns the cached response for `key`, or calls `query_fn` and caches its result.
+
+        The second value tells whether the response came from the cache.
+        """
+        with self._lock:
+            key_lock, waiters = self._key_locks.get(key, (threading.Lock(), 0))
+            self._key_locks[key] = (key_lock, waiters + 1)
+        try:
+            with key_lock:
+                cached = self.lookup(key)
+                if cached is not None:
+                    return cached, True
+                result = query_fn()
+                self.store(key, model, result)
+                return result, False
+        finally:
+            with self._lock:
+                key_lock, waiters = self._key_locks[key]
+                if waiters == 1:
+                    del self._key_locks[key]
+                else:
+                    self._key_locks[key] = (key_lock, waiters - 1)
+
+    def lookup(self, key: str):
+        """Returns the unexpired response cached under `key`, or None."""
+        row = repository.get_llm_cache_entry(key, self.ttl_s)
+        if row is None:
+            return None
+        return {"text": row.text, "confidence": row.confidence, "raw_response": row.raw_response}
+
+    def store(self, key: str, model: str, result: dict):
+        saved = repository.save_llm_cache_entry(
+            key=key,
+            model=model,
+            text=result.get("text", ""),
+            confidence=result.get("confidence", 0.0),
+            raw_response=result.get("raw_response", ""),
+        )
+        if not saved:
+            return
+        with self._lock:
+            self._inserts += 1
+            due = self._inserts % self.prune_every == 0
+        if due:
+            evicted = repository.prune_llm_cache(self.ttl_s, self.max_entries)
+            if evicted:
+                logging.info(f"Evicted {evicted} LLM cache entries")
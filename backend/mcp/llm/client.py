@@ -1,20 +1,230 @@
-class LLMClient:
-    """A fake LLM client that returns a deterministic dummy response."""
+import json
+import math
+import os
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator, List
 
-    def query(self, prompt: str, model: str = "fake-model", options: dict | None = None) -> dict:
-        """
-        Simulates querying an LLM.
+import httpx
 
-        Args:
-            prompt: The input prompt for the LLM.
-            model: The model to use (ignored in this fake client).
-            options: Additional options for the LLM call (ignored).
+# Default provider for QueryLLM calls; a call can pick another with options["provider"].
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "fake").lower()
+LLM_TIMEOUT_S = float(os.getenv("LLM_TIMEOUT_S", "60"))
 
-        Returns:
-            A dictionary containing a fake LLM response.
-        """
+def provider_setting(provider: str, name: str, default: str) -> str:
+    """LLM_<PROVIDER>_<NAME>, falling back to LLM_<NAME>, then `default`."""
+    return os.getenv(f"LLM_{provider.upper()}_{name}", os.getenv(f"LLM_{name}", default))
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token) for providers that report none."""
+    return math.ceil(len(text) / 4)
+
+@dataclass
+class LLMResult:
+    text: str
+    confidence: float = 1.0
+    raw_response: str = ""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+class LLMProvider(ABC):
+    """A backend QueryLLM can send prompts to.
+
+    `complete` answers a list of prompts for one model and option set, in order.
+    Providers with `supports_batching` answer the whole list in one request; the
+    others are only ever given one prompt at a time. `stream` answers one prompt as
+    a series of text deltas; token counts, when the provider reports them, come on
+    the last piece.
+    """
+
+    name = ""
+    supports_batching = False
+
+    @abstractmethod
+    def complete(self, prompts: List[str], model: str, options: dict) -> List[LLMResult]:
+        """Returns one result per prompt, in order."""
+
+    def stream(self, prompt: str, model: str, options: dict) -> Iterator[LLMResult]:
+        yield from self.complete([prompt], model, options)
+
+    def close(self):
+        pass
+
+class FakeLLMProvider(LLMProvider):
+    """A local stand-in that returns deterministic dummy responses.
+
+    Prompts that end with an "Extracted text:" section (EXTRACTION_SCHEMA_PROMPT) are
+    answered with an invoice JSON object, filling the invoice number, date and total
+    from simple "Label: value" lines of the text, so extraction runs end to end
+    without a model.
+    """
+
+    name = "fake"
+    supports_batching = True
+
+    # Streamed answers are cut into pieces of this many characters.
+    stream_chunk_chars = 16
+
+    def complete(self, prompts: List[str], model: str, options: dict) -> List[LLMResult]:
+        return [self._answer(prompt) for prompt in prompts]
+
+    def stream(self, prompt: str, model: str, options: dict) -> Iterator[LLMResult]:
+        answer = self._answer(prompt)
+        for start in range(0, len(answer.text), self.stream_chunk_chars):
+            yield LLMResult(answer.text[start:start + self.stream_chunk_chars], answer.confidence)
+        yield LLMResult("", answer.confidence, answer.raw_response, answer.prompt_tokens, answer.completion_tokens)
+
+    def _answer(self, prompt: str) -> LLMResult:
+        if "Extracted text:" in prompt:
+            text = json.dumps(self._fake_invoice(prompt.rsplit("Extracted text:", 1)[1]))
+            raw_response = text
+        else:
+            text = f"FAKE_LLM_RESPONSE for: {prompt[:50]}"
+            raw_response = "{}"
+        return LLMResult(text, 0.99, raw_response, estimate_tokens(prompt), estimate_tokens(text))
+
+    @staticmethod
+    def _fake_invoice(text: str) -> dict:
+        def field(label: str):
+            match = re.search(rf"{label}\s*:\s*(\S+)", text, re.IGNORECASE)
+            return match.group(1) if match else None
+
+        total = field("Total")
+        try:
+            total = float(total.replace(",", "")) if total else 0.0
+        except ValueError:
+            total = 0.0
         return {
-            "text": f"FAKE_LLM_RESPONSE for: {prompt[:50]}",
-            "confidence": 0.99,
-            "raw_response": "{}",
+            "invoiceNumber": field("Invoice Number"),
+            "invoiceDate": field("Date"),
+            "dueDate": field("Due Date"),
+            "vendor": {"name": "Dummy Vendor", "gstin": field("GSTIN"), "pan": None, "address": None},
+            "customer": {"name": "Dummy Customer", "address": None},
+            "lineItems": [],
+            "totals": {"subtotal": total, "gstAmount": 0.0, "roundOff": None, "grandTotal": total},
+            "paymentDetails": {"mode": None, "reference": None, "status": None},
         }
+
+def _option_value(value: str):
+    # Options arrive as map<string,string>; numeric values are sent as numbers.
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
+
+class _HTTPProvider(LLMProvider):
+    default_api_base = ""
+
+    def __init__(self, api_base: str = None, api_key: str = None, timeout_s: float = LLM_TIMEOUT_S):
+        api_base = api_base or provider_setting(self.name, "API_BASE", self.default_api_base)
+        api_key = api_key if api_key is not None else provider_setting(self.name, "API_KEY", "")
+        self.http = httpx.Client(
+            base_url=api_base.rstrip("/"),
+            headers={"Authorization": f"Bearer {api_key}"} if api_key else {},
+            timeout=timeout_s,
+        )
+
+    def _post(self, path: str, body: dict, options: dict) -> httpx.Response:
+        body.update({key: _option_value(value) for key, value in options.items()})
+        response = self.http.post(path, json=body)
+        response.raise_for_status()
+        return response
+
+    def _events(self, path: str, body: dict, options: dict) -> Iterator[dict]:
+        """Streams a request and yields its server-sent JSON events."""
+        body.update({key: _option_value(value) for key, value in options.items()})
+        body.update(stream=True, stream_options={"include_usage": True})
+        with self.http.stream("POST", path, json=body) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    return
+                yield json.loads(data)
+
+    def _stream(self, path: str, body: dict, options: dict, delta_of) -> Iterator[LLMResult]:
+        for event in self._events(path, body, options):
+            if event.get("choices"):
+                delta = delta_of(event["choices"][0]) or ""
+                if delta:
+                    yield LLMResult(delta)
+            if event.get("usage"):
+                usage = event["usage"]
+                yield LLMResult("", 1.0, "", usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0))
+
+    def close(self):
+        self.http.close()
+
+class OpenAICompatibleProvider(_HTTPProvider):
+    """An OpenAI-compatible /chat/completions endpoint (LLM_OPENAI_API_BASE,
+    LLM_OPENAI_API_KEY). Chat completions take one conversation per request, so
+    prompts are not batched."""
+
+    name = "openai"
+    default_api_base = "https://api.openai.com/v1"
+
+    def complete(self, prompts: List[str], model: str, options: dict) -> List[LLMResult]:
+        (prompt,) = prompts
+        response = self._post("/chat/completions", {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+        }, options)
+        body = response.json()
+        text = body["choices"][0]["message"]["content"] or ""
+        usage = body.get("usage") or {}
+        return [LLMResult(
+            text, 1.0, response.text,
+            usage.get("prompt_tokens", estimate_tokens(prompt)),
+            usage.get("completion_tokens", estimate_tokens(text)),
+        )]
+
+    def stream(self, prompt: str, model: str, options: dict) -> Iterator[LLMResult]:
+        yield from self._stream("/chat/completions", {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+        }, options, lambda choice: (choice.get("delta") or {}).get("content"))
+
+class LocalModelProvider(_HTTPProvider):
+    """A local model server exposing the OpenAI-compatible /completions endpoint
+    (vLLM, llama.cpp server, ...) at LLM_LOCAL_API_BASE. A batch of prompts is sent as
+    one request with a list `prompt`, which such servers schedule together."""
+
+    name = "local"
+    supports_batching = True
+    default_api_base = "http://localhost:8080/v1"
+
+    def complete(self, prompts: List[str], model: str, options: dict) -> List[LLMResult]:
+        response = self._post("/completions", {"model": model, "prompt": prompts}, options)
+        body = response.json()
+        texts = [""] * len(prompts)
+        for choice in body["choices"]:
+            texts[choice.get("index", 0)] = choice.get("text") or ""
+        # Usage covers the whole batch; split it by each prompt's share.
+        usage = body.get("usage") or {}
+        estimated = [(estimate_tokens(prompt), estimate_tokens(text)) for prompt, text in zip(prompts, texts)]
+        prompt_total = sum(p for p, _ in estimated) or 1
+        completion_total = sum(c for _, c in estimated) or 1
+        return [
+            LLMResult(
+                text, 1.0, json.dumps({"choice": text, "batch_usage": usage}),
+                round(usage.get("prompt_tokens", prompt_total) * p / prompt_total),
+                round(usage.get("completion_tokens", completion_total) * c / completion_total),
+            )
+            for text, (p, c) in zip(texts, estimated)
+        ]
+
+    def stream(self, prompt: str, model: str, options: dict) -> Iterator[LLMResult]:
+        yield from self._stream("/completions", {"model": model, "prompt": prompt}, options,
+                                lambda choice: choice.get("text"))
+
+PROVIDERS = {provider.name: provider for provider in (FakeLLMProvider, OpenAICompatibleProvider, LocalModelProvider)}
+
+def create_provider(name: str) -> LLMProvider:
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown LLM provider: {name}")
+    return PROVIDERS[name]()
@@ -0,0 +1,234 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from backend.mcp.llm.client import LLMProvider, LLMResult, create_provider, estimate_tokens, provider_setting
+
+class RateLimiter:
+    """Token bucket allowing `per_minute` requests a minute, in bursts of up to `burst`.
+    A limit <= 0 disables it."""
+
+    def __init__(self, per_minute: float, burst: Optional[int] = None):
+        self.rate_per_s = per_minute / 60
+        self.capacity = burst or max(int(per_minute / 60), 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate_per_s <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_s)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_s = (1 - self._tokens) / self.rate_per_s
+            time.sleep(wait_s)
+
+@dataclass
+class _Pending:
+    prompt: str
+    enqueued_at: float
+    future: Future = field(default_factory=Future)
+
+@dataclass
+class _Batch:
+    items: List[_Pending] = field(default_factory=list)
+    full: threading.Event = field(default_factory=threading.Event)
+
+class LLMDispatcher:
+    """Sends one provider's prompts within its concurrency and rate limits.
+
+    For providers that support batching, prompts for the same model and options that
+    arrive within `batch_window_s` of each other are coalesced into one request of up
+    to `max_batch_size` prompts. The first caller of a batch waits out the window (or
+    until the batch is full) and sends it; the others wait for their share of the
+    answer. Each request to the provider takes one of `max_concurrency` slots and
+    one rate limiter token.
+    """
+
+    def __init__(self, provider: LLMProvider, max_concurrency: int = 4, rate_limit_rpm: float = 0,
+                 max_batch_size: int = 8, batch_window_s: float = 0.01):
+        self.provider = provider
+        self.max_batch_size = max(max_batch_size, 1) if provider.supports_batching else 1
+        self.batch_window_s = batch_window_s
+        self._slots = threading.BoundedSemaphore(max(max_concurrency, 1))
+        self._rate_limiter = RateLimiter(rate_limit_rpm)
+        self._lock = threading.Lock()
+        self._open: Dict[tuple, _Batch] = {}
+
+    def query(self, prompt: str, model: str, options: dict) -> Tuple[LLMResult, dict]:
+        """Returns the provider's answer and how it was served (batch_size, queue_ms, latency_ms)."""
+        item = _Pending(prompt, time.monotonic())
+        if self.max_batch_size == 1:
+            self._send([item], model, options)
+            return item.future.result()
+
+        key = (model, tuple(sorted(options.items())))
+        with self._lock:
+            batch = self._open.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._open[key] = _Batch()
+            batch.items.append(item)
+            if len(batch.items) >= self.max_batch_size:
+                del self._open[key]
+                batch.full.set()
+        if leader:
+            batch.full.wait(self.batch_window_s)
+            with self._lock:
+                if self._open.get(key) is batch:
+                    del self._open[key]
+            self._send(batch.items, model, options)
+        return item.future.result()
+
+    def _send(self, items: List[_Pending], model: str, options: dict):
+        try:
+            with self._slots:
+                self._rate_limiter.acquire()
+                sent_at = time.monotonic()
+                results = self.provider.complete([item.prompt for item in items], model, options)
+                latency_ms = (time.monotonic() - sent_at) * 1000
+        except Exception as e:
+            for item in items:
+                item.future.set_exception(e)
+            return
+        for item, result in zip(items, results):
+            item.future.set_result((result, {
+                "batch_size": len(items),
+                "queue_ms": round((sent_at - item.enqueued_at) * 1000, 2),
+                "latency_ms": round(latency_ms, 2),
+            }))
+
+    def stream(self, prompt: str, model: str, options: dict) -> Iterator[LLMResult]:
+        """Streams one answer; the request holds its concurrency slot until it ends."""
+        with self._slots:
+            self._rate_limiter.acquire()
+            yield from self.provider.stream(prompt, model, options)
+
+    def close(self):
+        self.provider.close()
+
+class LLMService:
+    """Routes QueryLLM calls to provider dispatchers and accounts for each call.
+
+    The provider is `options["provider"]` or the default. Limits, batching and prices
+    are read per provider from LLM_<PROVIDER>_<SETTING> (falling back to
+    LLM_<SETTING>): MAX_CONCURRENCY, RATE_LIMIT_RPM, MAX_BATCH_SIZE, BATCH_WINDOW_MS,
+    PROMPT_PRICE_PER_1K and COMPLETION_PRICE_PER_1K (USD per 1000 tokens). Every call
+    is passed to `record_metric(ingestion_id, metrics)` with its tokens, latency and
+    cost.
+    """
+
+    def __init__(self, default_provider: str, record_metric: Optional[Callable[[str, dict], None]] = None,
+                 create: Callable[[str], LLMProvider] = create_provider):
+        self.default_provider = default_provider
+        self.record_metric = record_metric
+        self._create = create
+        self._lock = threading.Lock()
+        self._dispatchers: Dict[str, LLMDispatcher] = {}
+        self._prices: Dict[str, Tuple[float, float]] = {}
+
+    def dispatcher(self, name: str) -> LLMDispatcher:
+        with self._lock:
+            if name not in self._dispatchers:
+                self._dispatchers[name] = LLMDispatcher(
+                    self._create(name),
+                    max_concurrency=int(provider_setting(name, "MAX_CONCURRENCY", "4")),
+                    rate_limit_rpm=float(provider_setting(name, "RATE_LIMIT_RPM", "0")),
+                    max_batch_size=int(provider_setting(name, "MAX_BATCH_SIZE", "8")),
+                    batch_window_s=float(provider_setting(name, "BATCH_WINDOW_MS", "10")) / 1000,
+                )
+                self._prices[name] = (
+                    float(provider_setting(name, "PROMPT_PRICE_PER_1K", "0")),
+                    float(provider_setting(name, "COMPLETION_PRICE_PER_1K", "0")),
+                )
+            return self._dispatchers[name]
+
+    def query(self, prompt: str, model: str, options: dict, ingestion_id: str = "") -> dict:
+        options = dict(options)
+        provider = options.pop("provider", None) or self.default_provider
+        dispatcher = self.dispatcher(provider)
+        started = time.monotonic()
+        try:
+            result, served = dispatcher.query(prompt, model, options)
+        except Exception:
+            self._record(ingestion_id, {
+                "provider": provider, "model": model, "success": False,
+                "total_ms": round((time.monotonic() - started) * 1000, 2),
+            })
+            raise
+        prompt_price, completion_price = self._prices[provider]
+        self._record(ingestion_id, {
+            "provider": provider,
+            "model": model,
+            "success": True,
+            "cached": False,
+            "prompt_tokens": result.prompt_tokens,
+            "completion_tokens": result.completion_tokens,
+            "cost_usd": round((result.prompt_tokens * prompt_price + result.completion_tokens * completion_price) / 1000, 6),
+            "total_ms": round((time.monotonic() - started) * 1000, 2),
+            **served,
+        })
+        return {"text": result.text, "confidence": result.confidence, "raw_response": result.raw_response}
+
+    def stream(self, prompt: str, model: str, options: dict, ingestion_id: str = "") -> Iterator[LLMResult]:
+        """Streams an answer as LLMResult pieces (text deltas) and records the call once
+        it ends, with time to first token; tokens are estimated if the provider sends
+        no usage."""
+        options = dict(options)
+        provider = options.pop("provider", None) or self.default_provider
+        dispatcher = self.dispatcher(provider)
+        started = time.monotonic()
+        first_token_ms = None
+        text, prompt_tokens, completion_tokens = [], 0, 0
+        try:
+            for piece in dispatcher.stream(prompt, model, options):
+                if piece.text and first_token_ms is None:
+                    first_token_ms = round((time.monotonic() - started) * 1000, 2)
+                text.append(piece.text)
+                prompt_tokens += piece.prompt_tokens
+                completion_tokens += piece.completion_tokens
+                yield piece
+        except Exception:
+            self._record(ingestion_id, {
+                "provider": provider, "model": model, "success": False, "streamed": True,
+                "total_ms": round((time.monotonic() - started) * 1000, 2),
+            })
+            raise
+        prompt_tokens = prompt_tokens or estimate_tokens(prompt)
+        completion_tokens = completion_tokens or estimate_tokens("".join(text))
+        prompt_price, completion_price = self._prices[provider]
+        self._record(ingestion_id, {
+            "provider": provider,
+            "model": model,
+            "success": True,
+            "cached": False,
+            "streamed": True,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cost_usd": round((prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000, 6),
+            "first_token_ms": first_token_ms,
+            "total_ms": round((time.monotonic() - started) * 1000, 2),
+        })
+
+    def _record(self, ingestion_id: str, metrics: dict):
+        if not self.record_metric:
+            return
+        try:
+            self.record_metric(ingestion_id, metrics)
+        except Exception as e:
+            logging.warning(f"Could not record LLM metrics: {e}")
+
+    def close(self):
+        with self._lock:
+            dispatchers, self._dispatchers = self._dispatchers, {}
+        for dispatcher in dispatchers.values():
+            dispatcher.close()
@@ -4,42 +4,434 @@ import grpc
 from fastapi import FastAPI
 import uvicorn
 import threading
+import os
+import signal
+from datetime import datetime, timezone
 
 # Import gRPC stubs and messages
 from backend.shared.grpc import mcp_pb2, mcp_pb2_grpc
 import json
+import time
 
 # Import repository functions for DB access
 from backend.mcp.db import repository
 
-# Import the fake LLM client
-from backend.mcp.llm.client import LLMClient
+# LLM providers (the local fake by default, see LLM_PROVIDER) and the persistent response cache
+from backend.mcp.llm.client import LLM_PROVIDER
+from backend.mcp.llm.dispatcher import LLMService
+from backend.mcp.llm.cache import LLMResponseCache
+
+# Content-addressed storage for document bytes
+from backend.mcp.storage.blob_store import get_blob_store
+
+# Write-behind buffer for metrics and audit events
+from backend.mcp.db.writer import BatchWriter
+
+# Connection pool metrics
+from backend.mcp.db.engine import get_pool_stats
+from backend.mcp.db.async_engine import get_async_pool_stats
+
+# Read-through cache for write-once pipeline artifacts
+from backend.mcp.cache import ArtifactCache
+
+DOCUMENT_CHUNK_SIZE = int(os.getenv("DOCUMENT_CHUNK_SIZE", str(1024 * 1024)))
+MCP_GRPC_WORKERS = int(os.getenv("MCP_GRPC_WORKERS", "10"))
+# "threaded" runs every RPC on the MCP_GRPC_WORKERS thread pool; "aio" serves the database
+# bound RPCs on an asyncio event loop with asyncpg (see backend/mcp/aio_server.py).
+MCP_SERVER_MODE = os.getenv("MCP_SERVER_MODE", "threaded").lower()
+
+# When enabled, WriteMetric/WriteAudit acknowledge once the row is queued and rows are
+# flushed in bulk; disable to write (and commit) each row inside the RPC.
+WRITE_BUFFER_ENABLED = os.getenv("WRITE_BUFFER_ENABLED", "true").lower() == "true"
+WRITE_BUFFER_MAX_BATCH = int(os.getenv("WRITE_BUFFER_MAX_BATCH", "500"))
+WRITE_BUFFER_FLUSH_INTERVAL_S = float(os.getenv("WRITE_BUFFER_FLUSH_INTERVAL_S", "0.5"))
+WRITE_BUFFER_MAX_QUEUE = int(os.getenv("WRITE_BUFFER_MAX_QUEUE", "10000"))
+WRITE_BUFFER_PUT_TIMEOUT_S = float(os.getenv("WRITE_BUFFER_PUT_TIMEOUT_S", "5"))
+# A failed flush is retried with backoff (doubling from WRITE_BUFFER_RETRY_BACKOFF_S, up
+# to 30s) this many times before its rows are written one by one and the failing ones dropped.
+WRITE_BUFFER_MAX_FLUSH_ATTEMPTS = int(os.getenv("WRITE_BUFFER_MAX_FLUSH_ATTEMPTS", "8"))
+WRITE_BUFFER_RETRY_BACKOFF_S = float(os.getenv("WRITE_BUFFER_RETRY_BACKOFF_S", "0.5"))
+SHUTDOWN_GRACE_S = float(os.getenv("SHUTDOWN_GRACE_S", "10"))
+LIST_DOCUMENTS_MAX_LIMIT = int(os.getenv("LIST_DOCUMENTS_MAX_LIMIT", "1000"))
+# StreamMappedSchemas reads the mapped_schema table this many rows per query.
+MAPPED_SCHEMA_STREAM_PAGE_SIZE = int(os.getenv("MAPPED_SCHEMA_STREAM_PAGE_SIZE", "500"))
+# Clients keep long-lived channels open and ping them while idle (GRPC_KEEPALIVE_TIME_MS
+# in the shared Settings); accept those pings instead of answering with GOAWAY.
+GRPC_MIN_PING_INTERVAL_MS = int(os.getenv("GRPC_MIN_PING_INTERVAL_MS", "30000"))
+GRPC_SERVER_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_recv_ping_interval_without_data_ms", GRPC_MIN_PING_INTERVAL_MS),
+]
+# Pipeline artifacts (OCR outputs, mapped schemas, validation/conversion/integration
+# logs, reports) are effectively write-once, so reads are served from memory after the
+# first fetch; a Save* RPC drops the cached copy. ARTIFACT_CACHE_MAX_BYTES=0 disables it.
+ARTIFACT_CACHE_MAX_BYTES = int(os.getenv("ARTIFACT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+ARTIFACT_CACHE_TTL_S = float(os.getenv("ARTIFACT_CACHE_TTL_S", "3600"))
+# QueryLLM calls that carry a cache_key are answered from llm_cache when an entry younger
+# than LLM_CACHE_TTL_S exists; beyond LLM_CACHE_MAX_ENTRIES the least recently used
+# entries are evicted (checked every LLM_CACHE_PRUNE_EVERY new entries).
+# LLM_CACHE_ENABLED=false sends every call to the LLM.
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_TTL_S = int(os.getenv("LLM_CACHE_TTL_S", str(30 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "100000"))
+LLM_CACHE_PRUNE_EVERY = int(os.getenv("LLM_CACHE_PRUNE_EVERY", "100"))
+# Agent name of the per-call LLM rows (tokens, latency, cost) in the metrics table.
+LLM_METRIC_AGENT = os.getenv("LLM_METRIC_AGENT", "MCP-LLM")
+
+def _batch_writer(name: str, flush_fn) -> BatchWriter:
+    return BatchWriter(
+        name,
+        flush_fn,
+        max_batch_size=WRITE_BUFFER_MAX_BATCH,
+        flush_interval_s=WRITE_BUFFER_FLUSH_INTERVAL_S,
+        max_queue_size=WRITE_BUFFER_MAX_QUEUE,
+        put_timeout_s=WRITE_BUFFER_PUT_TIMEOUT_S,
+        max_flush_attempts=WRITE_BUFFER_MAX_FLUSH_ATTEMPTS,
+        retry_backoff_s=WRITE_BUFFER_RETRY_BACKOFF_S,
+    ).start()
+
+def _ocr_job_message(job) -> mcp_pb2.OcrJob:
+    return mcp_pb2.OcrJob(
+        job_id=job.job_id,
+        ingestion_id=job.ingestion_id,
+        file_url=job.file_url or "",
+        metadata={k: str(v) for k, v in job.metadata_.items()} if job.metadata_ else {},
+        priority=job.priority,
+        status=job.status,
+        attempts=job.attempts,
+        ocr_id=job.ocr_id or "",
+        error=job.error or "",
+    )
+
+def _set_ocr_job_update_status(context, success, request, verb: str):
+    """Status of CompleteOcrJob/FailOcrJob: None from the repository is an error, False a lost lease."""
+    if success is None:
+        context.set_details(f"Failed to {verb} OCR job {request.job_id}")
+        context.set_code(grpc.StatusCode.INTERNAL)
+    elif not success:
+        context.set_details(f"Worker {request.worker_id} no longer holds OCR job {request.job_id}; it was reclaimed or finished")
+        context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+
+def _document_message(doc, file_bytes: bytes = b"") -> mcp_pb2.GetDocResp:
+    # Convert metadata from JSONB (dict) to map<string, string>
+    metadata_map = {k: str(v) for k, v in doc.metadata.items()} if doc.metadata else {}
+    return mcp_pb2.GetDocResp(
+        doc_ref=doc.ingestion_id,
+        file_url=doc.file_url or "",
+        file_bytes=file_bytes,
+        metadata=metadata_map,
+        file_name=doc.file_name,
+    )
+
+def _orchestration_message(ingestion_id: str, orchestration, steps) -> mcp_pb2.OrchestrationState:
+    """The compacted state with every step recorded after it applied on top."""
+    state = dict(orchestration.state or {}) if orchestration else {}
+    for step in steps:
+        state.update(step.state_delta or {})
+    return mcp_pb2.OrchestrationState(
+        ingestion_id=ingestion_id,
+        state_bytes=json.dumps(state).encode('utf-8')
+    )
+
+def _orchestration_checkpoints_message(orchestration, steps) -> mcp_pb2.OrchestrationCheckpoints:
+    message = mcp_pb2.OrchestrationCheckpoints(steps=[
+        mcp_pb2.OrchestrationStep(
+            ingestion_id=step.ingestion_id,
+            version=step.version,
+            state_delta=_json_bytes(step.state_delta or {}),
+            status=step.status or "",
+            checkpoint_type=step.checkpoint_type or "",
+            checkpoint=step.checkpoint or b"",
+        )
+        for step in steps
+    ])
+    if orchestration and orchestration.checkpoint:
+        message.base.CopyFrom(mcp_pb2.OrchestrationSnapshot(
+            ingestion_id=orchestration.ingestion_id,
+            version=orchestration.version,
+            state_bytes=_json_bytes(orchestration.state or {}),
+            status=orchestration.status or "",
+            checkpoint_type=orchestration.checkpoint_type or "",
+            checkpoint=orchestration.checkpoint,
+        ))
+    return message
+
+def _orchestration_step_row(request) -> dict:
+    if request.version <= 0:
+        raise ValueError("version must be positive")
+    return dict(
+        ingestion_id=request.ingestion_id,
+        version=request.version,
+        state_delta=_json_field(request.state_delta) or {},
+        status=request.status or None,
+        checkpoint_type=request.checkpoint_type or None,
+        checkpoint=request.checkpoint or None,
+    )
+
+def _orchestration_snapshot_row(request) -> dict:
+    if request.version <= 0:
+        raise ValueError("version must be positive")
+    state = _json_field(request.state_bytes) or {}
+    return dict(
+        ingestion_id=request.ingestion_id,
+        version=request.version,
+        state=state,
+        status=request.status or state.get("status", "UNKNOWN"),
+        checkpoint_type=request.checkpoint_type or None,
+        checkpoint=request.checkpoint or None,
+    )
+
+def _valid_lease_request(request, context) -> bool:
+    """Lease RPCs need an owner and a positive TTL; sets INVALID_ARGUMENT otherwise."""
+    if request.owner and request.ttl_s > 0:
+        return True
+    context.set_details("Lease owner and a positive ttl_s are required.")
+    context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+    return False
+
+def _idempotency_record_message(record) -> mcp_pb2.IdempotencyRecord:
+    if not record:
+        return mcp_pb2.IdempotencyRecord()
+    return mcp_pb2.IdempotencyRecord(key=record.key, agent=record.agent, response=record.response or b"")
+
+def _list_documents_message(ids, limit: int, context) -> mcp_pb2.ListDocumentsResp:
+    if ids is None:
+        context.set_details("Failed to list documents.")
+        context.set_code(grpc.StatusCode.INTERNAL)
+        return mcp_pb2.ListDocumentsResp()
+    # A full page means there may be more; the client stops on an empty next_after.
+    next_after = ids[-1] if len(ids) == limit else ""
+    return mcp_pb2.ListDocumentsResp(ingestion_ids=ids, next_after=next_after)
+
+def _json_bytes(value) -> bytes:
+    return json.dumps(value).encode('utf-8')
+
+def _json_field(data: bytes):
+    """Decodes a JSON bytes field; empty means NULL. Raises ValueError on invalid JSON."""
+    return json.loads(data) if data else None
+
+def _timestamp_field(ts: int):
+    return datetime.fromtimestamp(ts, tz=timezone.utc) if ts else None
+
+def _ocr_output_message(ocr_output) -> mcp_pb2.OcrOutput:
+    return mcp_pb2.OcrOutput(
+        ocr_id=ocr_output.ocr_id,
+        ingestion_id=ocr_output.ingestion_id or "",
+        raw_text=ocr_output.raw_text or "",
+        detected_fields=_json_bytes(ocr_output.detected_fields),
+        confidence=ocr_output.confidence or 0.0,
+        status=ocr_output.status or "",
+    )
+
+def _mapped_schema_message(mapped_schema) -> mcp_pb2.MappedSchema:
+    return mcp_pb2.MappedSchema(
+        schema_id=mapped_schema.schema_id,
+        ocr_id=mapped_schema.ocr_id or "",
+        mapped_data=_json_bytes(mapped_schema.mapped_data),
+        mapping_confidence=mapped_schema.mapping_confidence or 0.0,
+    )
+
+def _streamed_mapped_schema_message(row) -> mcp_pb2.MappedSchema:
+    # Rows of repository.iter_mapped_schemas carry mapped_data as JSON text already.
+    return mcp_pb2.MappedSchema(
+        schema_id=row.schema_id,
+        ocr_id=row.ocr_id or "",
+        mapped_data=(row.mapped_json or "null").encode('utf-8'),
+        mapping_confidence=row.mapping_confidence or 0.0,
+    )
+
+def _validation_logs_message(validation_logs) -> mcp_pb2.ValidationLogs:
+    return mcp_pb2.ValidationLogs(
+        validation_id=validation_logs.validation_id,
+        schema_id=validation_logs.schema_id or "",
+        status=validation_logs.status or "",
+        errors=_json_bytes(validation_logs.errors),
+        warnings=_json_bytes(validation_logs.warnings),
+    )
+
+def _conversion_log_message(conversion_log) -> mcp_pb2.ConversionLog:
+    return mcp_pb2.ConversionLog(
+        conversion_id=conversion_log.conversion_id,
+        validation_id=conversion_log.validation_id or "",
+        target=conversion_log.target or "",
+        output=conversion_log.output or "",
+        artifact_url=conversion_log.artifact_url or "",
+        status=conversion_log.status or "",
+    )
+
+def _integration_log_message(integration_log) -> mcp_pb2.IntegrationLog:
+    return mcp_pb2.IntegrationLog(
+        integration_id=integration_log.integration_id,
+        conversion_id=integration_log.conversion_id or "",
+        target=integration_log.target or "",
+        platform_response=integration_log.platform_response or "",
+        status=integration_log.status or "",
+        retry=integration_log.retry or 0,
+        platform_status_code=integration_log.platform_status_code or 0,
+        last_attempt_at=int(integration_log.last_attempt_at.timestamp()) if integration_log.last_attempt_at else 0,
+        next_retry_at=int(integration_log.next_retry_at.timestamp()) if integration_log.next_retry_at else 0,
+    )
+
+def _report_message(report) -> mcp_pb2.Report:
+    return mcp_pb2.Report(
+        report_id=report.report_id,
+        validation_id=report.validation_id or "",
+        schema_id=report.schema_id or "",
+        user_id=report.user_id or "",
+        status=report.status or "",
+        summary=_json_bytes(report.summary),
+        report_url=report.report_url or "",
+    )
+
+# Request message -> repository row. Empty proto strings become NULL for the optional
+# foreign keys so a missing parent id does not violate the constraint.
+def _ocr_output_row(request) -> dict:
+    return dict(
+        ocr_id=request.ocr_id,
+        ingestion_id=request.ingestion_id or None,
+        raw_text=request.raw_text,
+        detected_fields=_json_field(request.detected_fields),
+        confidence=request.confidence,
+        status=request.status,
+    )
+
+def _mapped_schema_row(request) -> dict:
+    return dict(
+        schema_id=request.schema_id,
+        ocr_id=request.ocr_id or None,
+        mapped_data=_json_field(request.mapped_data),
+        mapping_confidence=request.mapping_confidence,
+    )
+
+def _validation_logs_row(request) -> dict:
+    return dict(
+        validation_id=request.validation_id,
+        schema_id=request.schema_id or None,
+        status=request.status,
+        errors=_json_field(request.errors) or [],
+        warnings=_json_field(request.warnings) or [],
+    )
+
+def _conversion_log_row(request) -> dict:
+    return dict(
+        conversion_id=request.conversion_id,
+        validation_id=request.validation_id or None,
+        target=request.target,
+        output=request.output,
+        artifact_url=request.artifact_url or None,
+        status=request.status,
+    )
+
+def _integration_log_row(request) -> dict:
+    return dict(
+        integration_id=request.integration_id,
+        conversion_id=request.conversion_id or None,
+        target=request.target,
+        platform_response=request.platform_response or None,
+        status=request.status,
+        retry=request.retry,
+        platform_status_code=request.platform_status_code or None,
+        last_attempt_at=_timestamp_field(request.last_attempt_at),
+        next_retry_at=_timestamp_field(request.next_retry_at),
+    )
+
+def _report_row(request) -> dict:
+    return dict(
+        report_id=request.report_id,
+        validation_id=request.validation_id or None,
+        schema_id=request.schema_id or None,
+        user_id=request.user_id or None,
+        status=request.status,
+        summary=_json_field(request.summary),
+        report_url=request.report_url or None,
+    )
+
+def _warning_row(request) -> dict:
+    return dict(
+        warning_id=request.warning_id,
+        ingestion_id=request.ingestion_id or None,
+        validation_id=request.validation_id or None,
+        field_name=request.field_name,
+        severity=request.severity,
+        message=request.message,
+        suggested_fix=_json_field(request.suggested_fix),
+    )
 
 class MCPServicer(mcp_pb2_grpc.MCPServicer):
     """Implements the MCP gRPC service."""
 
     def __init__(self):
-        self.llm_client = LLMClient()
+        self.llm = LLMService(LLM_PROVIDER, record_metric=self._record_llm_metric)
+        self.llm_cache = (
+            LLMResponseCache(LLM_CACHE_TTL_S, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_PRUNE_EVERY)
+            if LLM_CACHE_ENABLED else None
+        )
+        self.blob_store = get_blob_store()
+        self.artifact_cache = ArtifactCache(ARTIFACT_CACHE_MAX_BYTES, ARTIFACT_CACHE_TTL_S)
+        self.metric_writer = None
+        self.audit_writer = None
+        if WRITE_BUFFER_ENABLED:
+            self.metric_writer = _batch_writer("metrics", repository.bulk_write_metrics)
+            self.audit_writer = _batch_writer("audit", repository.bulk_write_audits)
+
+    def close(self):
+        """Flushes buffered metric and audit rows and closes the LLM providers."""
+        for writer in (self.metric_writer, self.audit_writer):
+            if writer:
+                writer.close()
+        self.llm.close()
+
+    def _record_llm_metric(self, ingestion_id: str, metrics: dict):
+        """Records one QueryLLM call (tokens, latency, cost) in the metrics table."""
+        args = (LLM_METRIC_AGENT, ingestion_id, json.dumps(metrics), int(time.time()))
+        if self.metric_writer:
+            self._submit(self.metric_writer, repository.metric_row, *args)
+        else:
+            repository.write_metric(*args)
 
     def SaveDocument(self, request, context):
         """Stores document metadata in the database."""
         logging.info(f"SaveDocument called for ingestion_id: {request.ingestion_id}")
 
-        # The gRPC metadata is a map<string, string>, which is dict-like
-        metadata_dict = dict(request.metadata)
-
-        # You can handle file_bytes here, e.g., save to a file system or blob storage.
-        # For now, we just acknowledge its presence.
+        # Bytes go to the content-addressed blob store; identical uploads share one blob.
+        content_hash, size_bytes = None, None
         if request.file_bytes:
             logging.info(f"Received {len(request.file_bytes)} bytes for {request.ingestion_id}")
-            with open(f"/tmp/{request.ingestion_id}", "wb") as f:
-                f.write(request.file_bytes)
+            content_hash, size_bytes = self.blob_store.put(request.file_bytes)
+
+        return self._save_document(request, content_hash, size_bytes, context)
+
+    def UploadDocument(self, request_iterator, context):
+        """Stores a document streamed as a header message followed by byte chunks."""
+        first = next(request_iterator, None)
+        if first is None or first.WhichOneof("payload") != "header":
+            context.set_details("UploadDocument stream must start with a header message.")
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            return mcp_pb2.SaveDocResp(ok=False, message="Missing header.")
+
+        header = first.header
+        logging.info(f"UploadDocument called for ingestion_id: {header.ingestion_id}")
+
+        chunks = (msg.chunk for msg in request_iterator if msg.chunk)
+        content_hash, size_bytes = self.blob_store.put_stream(chunks)
+        if size_bytes == 0:
+            content_hash, size_bytes = None, None
+        else:
+            logging.info(f"Received {size_bytes} streamed bytes for {header.ingestion_id}")
+
+        return self._save_document(header, content_hash, size_bytes, context)
+
+    def _save_document(self, header, content_hash, size_bytes, context):
+        # The gRPC metadata is a map<string, string>, which is dict-like
+        metadata_dict = dict(header.metadata)
 
         doc = repository.save_document(
-            ingestion_id=request.ingestion_id,
-            file_name=request.file_name,
-            file_url=request.file_url,
-            metadata=metadata_dict
+            ingestion_id=header.ingestion_id,
+            file_name=header.file_name,
+            file_url=header.file_url,
+            metadata=metadata_dict,
+            content_hash=content_hash,
+            size_bytes=size_bytes,
         )
 
         if doc:
@@ -49,7 +441,7 @@ class MCPServicer(mcp_pb2_grpc.MCPServicer):
                 message="Document saved successfully."
             )
         else:
-            context.set_details(f"Failed to save document {request.ingestion_id}")
+            context.set_details(f"Failed to save document {header.ingestion_id}")
             context.set_code(grpc.StatusCode.INTERNAL)
             return mcp_pb2.SaveDocResp(ok=False, message="Database operation failed.")
 
@@ -60,57 +452,143 @@ class MCPServicer(mcp_pb2_grpc.MCPServicer):
         doc = repository.get_document(request.ingestion_id)
 
         if doc:
-            # Convert metadata from JSONB (dict) to map<string, string>
-            metadata_map = {k: str(v) for k, v in doc.metadata.items()} if doc.metadata else {}
-
-            file_bytes = b""
-            try:
-                with open(f"/tmp/{doc.ingestion_id}", "rb") as f:
-                    file_bytes = f.read()
-            except FileNotFoundError:
-                logging.warning(f"File not found for ingestion_id {doc.ingestion_id}")
-
-            return mcp_pb2.GetDocResp(
-                doc_ref=doc.ingestion_id,
-                file_url=doc.file_url or "",
-                file_bytes=file_bytes,
-                metadata=metadata_map,
-                file_name=doc.file_name,
-            )
+            return _document_message(doc, self._read_blob(doc))
         else:
             context.set_details(f"Document with ingestion_id '{request.ingestion_id}' not found.")
             context.set_code(grpc.StatusCode.NOT_FOUND)
             return mcp_pb2.GetDocResp()
 
+    def _read_blob(self, doc) -> bytes:
+        if not doc.content_hash:
+            logging.warning(f"No stored content for ingestion_id {doc.ingestion_id}")
+            return b""
+        try:
+            return self.blob_store.read(doc.content_hash)
+        except FileNotFoundError:
+            logging.warning(f"Blob {doc.content_hash} missing for ingestion_id {doc.ingestion_id}")
+            return b""
+
+    def DownloadDocument(self, request, context):
+        """Streams a document as a header message followed by fixed-size byte chunks."""
+        logging.info(f"DownloadDocument called for ingestion_id: {request.ingestion_id}")
+
+        doc = repository.get_document(request.ingestion_id)
+        if not doc:
+            context.set_details(f"Document with ingestion_id '{request.ingestion_id}' not found.")
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            return
+
+        yield mcp_pb2.DocChunk(header=_document_message(doc))
+
+        if not doc.content_hash:
+            logging.warning(f"No stored content for ingestion_id {doc.ingestion_id}")
+            return
+        try:
+            for chunk in self.blob_store.iter_chunks(doc.content_hash, DOCUMENT_CHUNK_SIZE):
+                yield mcp_pb2.DocChunk(chunk=chunk)
+        except FileNotFoundError:
+            logging.warning(f"Blob {doc.content_hash} missing for ingestion_id {doc.ingestion_id}")
+            context.set_details(f"Content for '{request.ingestion_id}' is missing.")
+            context.set_code(grpc.StatusCode.DATA_LOSS)
+
+    def ListDocuments(self, request, context):
+        """Returns a keyset page of ingestion ids, optionally filtered by status."""
+        limit = min(request.limit or LIST_DOCUMENTS_MAX_LIMIT, LIST_DOCUMENTS_MAX_LIMIT)
+        ids = repository.list_document_ids(request.status or None, limit, request.after or None)
+        return _list_documents_message(ids, limit, context)
+
     def QueryLLM(self, request, context):
-        """Queries the fake LLM."""
+        """Queries the LLM, through the response cache when the request has a cache_key.
+
+        Every call is recorded in the metrics table under LLM_METRIC_AGENT; cache hits
+        are recorded with cached=true and no tokens.
+        """
         logging.info(f"QueryLLM called with model: {request.model}")
 
         # Convert map<string, string> to dict
         options_dict = dict(request.options)
 
-        result = self.llm_client.query(
-            prompt=request.prompt,
-            model=request.model,
-            options=options_dict
-        )
+        def query():
+            return self.llm.query(request.prompt, request.model, options_dict, request.ingestion_id)
+
+        cached = False
+        try:
+            if request.cache_key and self.llm_cache:
+                result, cached = self.llm_cache.get_or_query(request.cache_key, request.model, query)
+            else:
+                result = query()
+        except Exception as e:
+            logging.error(f"LLM query failed for model {request.model}: {e}")
+            context.set_details(f"LLM query failed: {e}")
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            return mcp_pb2.QueryLLMResp()
 
+        if cached:
+            self._record_llm_cache_hit(request)
         return mcp_pb2.QueryLLMResp(
             text=result.get("text", ""),
             confidence=result.get("confidence", 0.0),
-            raw_response=result.get("raw_response", "")
+            raw_response=result.get("raw_response", ""),
+            cached=cached,
         )
 
+    def QueryLLMStream(self, request, context):
+        """Streams the LLM's answer as it is generated.
+
+        A cached answer is sent as a single chunk; a generated one is cached once the
+        stream completes. The last chunk has done set.
+        """
+        logging.info(f"QueryLLMStream called with model: {request.model}")
+        use_cache = bool(request.cache_key and self.llm_cache)
+
+        if use_cache:
+            cached = self.llm_cache.lookup(request.cache_key)
+            if cached is not None:
+                self._record_llm_cache_hit(request)
+                yield mcp_pb2.QueryLLMChunk(delta=cached["text"], cached=True, confidence=cached["confidence"])
+                yield mcp_pb2.QueryLLMChunk(done=True, cached=True, confidence=cached["confidence"])
+                return
+
+        text, confidence, raw_response = [], 0.0, ""
+        try:
+            for piece in self.llm.stream(request.prompt, request.model, dict(request.options), request.ingestion_id):
+                confidence = piece.confidence
+                raw_response = piece.raw_response or raw_response
+                if piece.text:
+                    text.append(piece.text)
+                    yield mcp_pb2.QueryLLMChunk(delta=piece.text)
+        except Exception as e:
+            logging.error(f"LLM stream failed for model {request.model}: {e}")
+            context.set_details(f"LLM query failed: {e}")
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            return
+
+        if use_cache:
+            self.llm_cache.store(request.cache_key, request.model, {
+                "text": "".join(text), "confidence": confidence, "raw_response": raw_response or "".join(text),
+            })
+        yield mcp_pb2.QueryLLMChunk(done=True, confidence=confidence)
+
+    def _record_llm_cache_hit(self, request):
+        self._record_llm_metric(request.ingestion_id, {
+            "provider": request.options.get("provider") or LLM_PROVIDER, "model": request.model,
+            "success": True, "cached": True, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0,
+        })
+
     def WriteMetric(self, request, context):
         """Writes a metric to the database."""
         logging.info(f"WriteMetric called for agent: {request.agent}")
 
-        success = repository.write_metric(
-            agent=request.agent,
-            ingestion_id=request.ingestion_id,
-            metric_json=request.metric_json,
-            metric_ts=request.metric_ts
-        )
+        if self.metric_writer:
+            success = self._submit(self.metric_writer, repository.metric_row, request.agent,
+                                   request.ingestion_id, request.metric_json, request.metric_ts)
+        else:
+            success = repository.write_metric(
+                agent=request.agent,
+                ingestion_id=request.ingestion_id,
+                metric_json=request.metric_json,
+                metric_ts=request.metric_ts
+            )
 
         if not success:
             context.set_details("Failed to write metric to database.")
@@ -122,13 +600,17 @@ class MCPServicer(mcp_pb2_grpc.MCPServicer):
         """Writes an audit event to the database."""
         logging.info(f"WriteAudit called for agent: {request.agent}, action: {request.action}")
 
-        success = repository.write_audit(
-            agent=request.agent,
-            action=request.action,
-            reference_id=request.reference_id,
-            payload_json=request.payload_json,
-            ts=request.ts
-        )
+        if self.audit_writer:
+            success = self._submit(self.audit_writer, repository.audit_row, request.agent,
+                                   request.action, request.reference_id, request.payload_json, request.ts)
+        else:
+            success = repository.write_audit(
+                agent=request.agent,
+                action=request.action,
+                reference_id=request.reference_id,
+                payload_json=request.payload_json,
+                ts=request.ts
+            )
 
         if not success:
             context.set_details("Failed to write audit event to database.")
@@ -136,6 +618,57 @@ class MCPServicer(mcp_pb2_grpc.MCPServicer):
 
         return mcp_pb2.WriteAck(ok=success)
 
+    def WriteMetrics(self, request_iterator, context):
+        """Writes a client-streamed batch of metrics."""
+        accepted, rejected = self._write_batch(
+            self.metric_writer, repository.metric_row, repository.bulk_write_metrics,
+            ((r.agent, r.ingestion_id, r.metric_json, r.metric_ts) for r in request_iterator),
+        )
+        logging.info(f"WriteMetrics accepted {accepted} metrics, rejected {rejected}")
+        return mcp_pb2.WriteBatchAck(accepted=accepted, rejected=rejected)
+
+    def WriteAudits(self, request_iterator, context):
+        """Writes a client-streamed batch of audit events."""
+        accepted, rejected = self._write_batch(
+            self.audit_writer, repository.audit_row, repository.bulk_write_audits,
+            ((r.agent, r.action, r.reference_id, r.payload_json, r.ts) for r in request_iterator),
+        )
+        logging.info(f"WriteAudits accepted {accepted} audit events, rejected {rejected}")
+        return mcp_pb2.WriteBatchAck(accepted=accepted, rejected=rejected)
+
+    def _write_batch(self, writer, build_row, bulk_write, args_iter):
+        """Queues each row on the writer, or bulk writes them all at once when buffering is off."""
+        accepted, rejected, rows = 0, 0, []
+        for args in args_iter:
+            if writer:
+                if self._submit(writer, build_row, *args):
+                    accepted += 1
+                else:
+                    rejected += 1
+                continue
+            try:
+                rows.append(build_row(*args))
+            except (ValueError, OverflowError, OSError) as e:
+                logging.error(f"Rejected row from {args[0]}: {e}")
+                rejected += 1
+
+        if rows:
+            try:
+                bulk_write(rows)
+                accepted += len(rows)
+            except Exception as e:
+                logging.error(f"Error bulk writing {len(rows)} rows: {e}")
+                rejected += len(rows)
+        return accepted, rejected
+
+    def _submit(self, writer: BatchWriter, build_row, *args) -> bool:
+        try:
+            row = build_row(*args)
+        except (ValueError, OverflowError, OSError) as e:
+            logging.error(f"Rejected {writer.name} row from {args[0]}: {e}")
+            return False
+        return writer.submit(row)
+
     def SaveOrchestration(self, request, context):
         """Saves orchestration state to the database."""
         logging.info(f"SaveOrchestration called for ingestion_id: {request.ingestion_id}")
@@ -150,85 +683,351 @@ class MCPServicer(mcp_pb2_grpc.MCPServicer):
         return mcp_pb2.WriteAck(ok=success)
 
     def GetOrchestration(self, request, context):
-        """Retrieves orchestration state from the database."""
+        """Retrieves orchestration state, including steps not yet compacted."""
         logging.info(f"GetOrchestration called for ingestion_id: {request.ingestion_id}")
-        orchestration = repository.get_orchestration(request.ingestion_id)
-        if orchestration:
-            return mcp_pb2.OrchestrationState(
-                ingestion_id=orchestration.ingestion_id,
-                state_bytes=json.dumps(orchestration.state).encode('utf-8')
-            )
+        checkpoints = repository.get_orchestration_checkpoints(request.ingestion_id)
+        if checkpoints and (checkpoints[0] or checkpoints[1]):
+            return _orchestration_message(request.ingestion_id, *checkpoints)
         else:
             context.set_details(f"Orchestration with ingestion_id '{request.ingestion_id}' not found.")
             context.set_code(grpc.StatusCode.NOT_FOUND)
             return mcp_pb2.OrchestrationState()
 
-    def GetOcrOutput(self, request, context):
-        ocr_output = repository.get_ocr_output(request.ingestion_id)
-        if ocr_output:
-            return mcp_pb2.OcrOutput(
-                ocr_id=ocr_output.ocr_id,
-                ingestion_id=ocr_output.ingestion_id,
-                raw_text=ocr_output.raw_text,
-                detected_fields=json.dumps(ocr_output.detected_fields).encode('utf-8'),
-                confidence=ocr_output.confidence,
-                status=ocr_output.status,
-            )
+    def AppendOrchestrationStep(self, request, context):
+        """Records the state delta and checkpoint of one orchestration step."""
+        row = self._artifact_row("orchestration step", request.ingestion_id, _orchestration_step_row, request, context)
+        if row is None:
+            return mcp_pb2.WriteAck(ok=False)
+        return self._orchestration_written("step", request.ingestion_id, repository.append_orchestration_step(**row), context)
+
+    def CompactOrchestration(self, request, context):
+        """Saves a full orchestration snapshot and drops the steps it covers."""
+        row = self._artifact_row("orchestration snapshot", request.ingestion_id, _orchestration_snapshot_row, request, context)
+        if row is None:
+            return mcp_pb2.WriteAck(ok=False)
+        return self._orchestration_written("snapshot", request.ingestion_id, repository.compact_orchestration(**row), context)
+
+    def GetOrchestrationCheckpoints(self, request, context):
+        """Returns the last snapshot and the steps after it; empty for an unknown id."""
+        checkpoints = repository.get_orchestration_checkpoints(request.ingestion_id)
+        if checkpoints is None:
+            context.set_details(f"Failed to load checkpoints for '{request.ingestion_id}'.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.OrchestrationCheckpoints()
+        return _orchestration_checkpoints_message(*checkpoints)
+
+    def DeleteOrchestrationCheckpoints(self, request, context):
+        success = repository.delete_orchestration_checkpoints(request.ingestion_id)
+        return self._orchestration_written("checkpoints", request.ingestion_id, success, context)
+
+    def AcquireOrchestrationLease(self, request, context):
+        """Takes the run lease of an orchestration unless another live owner holds it."""
+        if not _valid_lease_request(request, context):
+            return mcp_pb2.OrchestrationLease()
+        acquired = repository.acquire_orchestration_lease(request.ingestion_id, request.owner, request.ttl_s)
+        if acquired is None:
+            context.set_details(f"Failed to acquire the lease of {request.ingestion_id}.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.OrchestrationLease()
+        return mcp_pb2.OrchestrationLease(acquired=acquired)
+
+    def RenewOrchestrationLeases(self, request, context):
+        """Extends the caller's leases; `accepted` counts those still held, `rejected` the lost ones."""
+        if not _valid_lease_request(request, context):
+            return mcp_pb2.WriteBatchAck()
+        ids = list(request.ingestion_ids)
+        renewed = repository.renew_orchestration_leases(request.owner, ids, request.ttl_s) if ids else 0
+        if renewed is None:
+            context.set_details("Failed to renew orchestration leases.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.WriteBatchAck()
+        return mcp_pb2.WriteBatchAck(accepted=renewed, rejected=len(ids) - renewed)
+
+    def ReleaseOrchestrationLease(self, request, context):
+        success = repository.release_orchestration_lease(request.ingestion_id, request.owner)
+        return self._orchestration_written("lease", request.ingestion_id, success, context)
+
+    def ClaimStaleOrchestrations(self, request, context):
+        """Hands orchestrations whose lease lapsed to the calling sweeper."""
+        if not _valid_lease_request(request, context):
+            return mcp_pb2.ClaimStaleOrchestrationsResp()
+        claimed = repository.claim_stale_orchestrations(
+            request.owner, request.ttl_s, request.limit or 10, request.max_recoveries or 3,
+        )
+        if claimed is None:
+            context.set_details("Failed to claim stale orchestrations.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.ClaimStaleOrchestrationsResp()
+        if claimed:
+            logging.info(f"{request.owner} claimed {len(claimed)} stale orchestrations")
+        return mcp_pb2.ClaimStaleOrchestrationsResp(ingestion_ids=claimed)
+
+    def GetIdempotencyRecord(self, request, context):
+        """Returns the recorded response for a key; an empty record if there is none."""
+        record = repository.get_idempotency_record(request.id) if request.id else None
+        return _idempotency_record_message(record)
+
+    def SaveIdempotencyRecord(self, request, context):
+        if not request.key or not request.agent:
+            context.set_details("Idempotency key and agent are required.")
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            return mcp_pb2.WriteAck(ok=False)
+        success = repository.save_idempotency_record(request.key, request.agent, request.response)
+        if not success:
+            context.set_details(f"Failed to save idempotency record {request.key}.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+        return mcp_pb2.WriteAck(ok=success)
+
+    def _orchestration_written(self, what: str, ingestion_id: str, success: bool, context) -> mcp_pb2.WriteAck:
+        if not success:
+            context.set_details(f"Failed to write orchestration {what} for {ingestion_id}.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+        return mcp_pb2.WriteAck(ok=success)
+
+    def _cached_artifact(self, kind: str, key: str, load, to_message):
+        """Returns the cached message for an artifact, loading and caching it on a miss."""
+        message = self.artifact_cache.get(kind, key)
+        if message is None:
+            row = load(key)
+            if row is None:
+                return None
+            message = to_message(row)
+            self.artifact_cache.put(kind, key, message)
+        return message
+
+    def _get_artifact(self, kind: str, request, load, to_message, empty, context):
+        message = self._cached_artifact(kind, request.id, load, to_message)
+        if message:
+            return message
+        context.set_details(f"{kind} with id '{request.id}' not found.")
+        context.set_code(grpc.StatusCode.NOT_FOUND)
+        return empty
+
+    def _artifact_row(self, kind: str, key: str, build_row, request, context):
+        """Builds the row for a Save* request, or sets INVALID_ARGUMENT and returns None."""
+        logging.info(f"Save {kind} called for id: {key}")
+        if not key:
+            context.set_details(f"{kind} id is required.")
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            return None
+        try:
+            return build_row(request)
+        except ValueError as e:
+            context.set_details(f"Invalid {kind} {key}: {e}")
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            return None
+
+    def _saved_artifact(self, kind: str, key: str, success: bool, context) -> mcp_pb2.WriteAck:
+        if success:
+            self.artifact_cache.invalidate(kind, key)
         else:
-            context.set_details(f"OCR output with id '{request.ingestion_id}' not found.")
-            context.set_code(grpc.StatusCode.NOT_FOUND)
-            return mcp_pb2.OcrOutput()
+            context.set_details(f"Failed to save {kind} {key}.")
+            context.set_code(grpc.StatusCode.INTERNAL)
+        return mcp_pb2.WriteAck(ok=success)
+
+    def _save_artifact(self, kind: str, key: str, save, build_row, request, context):
+        """Upserts an artifact row and drops any cached copy of it."""
+        row = self._artifact_row(kind, key, build_row, request, context)
+        if row is None:
+            return mcp_pb2.WriteAck(ok=False)
+        return self._saved_artifact(kind, key, save(**row), context)
+
+    def SaveOcrOutput(self, request, context):
+        return self._save_artifact("ocr_output", request.ocr_id, repository.save_ocr_output, _ocr_output_row, request, context)
+
+    def GetOcrOutput(self, request, context):
+        return self._get_artifact("ocr_output", request, repository.get_ocr_output, _ocr_output_message, mcp_pb2.OcrOutput(), context)
+
+    def SaveMappedSchema(self, request, context):
+        return self._save_artifact("mapped_schema", request.schema_id, repository.save_mapped_schema, _mapped_schema_row, request, context)
 
     def GetMappedSchema(self, request, context):
-        mapped_schema = repository.get_mapped_schema(request.ingestion_id)
-        if mapped_schema:
-            return mcp_pb2.MappedSchema(
-                schema_id=mapped_schema.schema_id,
-                ocr_id=mapped_schema.ocr_id,
-                mapped_data=json.dumps(mapped_schema.mapped_data).encode('utf-8'),
-                mapping_confidence=mapped_schema.mapping_confidence,
-            )
-        else:
-            context.set_details(f"Mapped schema with id '{request.ingestion_id}' not found.")
-            context.set_code(grpc.StatusCode.NOT_FOUND)
-            return mcp_pb2.MappedSchema()
+        return self._get_artifact("mapped_schema", request, repository.get_mapped_schema, _mapped_schema_message, mcp_pb2.MappedSchema(), context)
+
+    def SaveValidationLogs(self, request, context):
+        return self._save_artifact("validation_logs", request.validation_id, repository.save_validation_logs, _validation_logs_row, request, context)
 
     def GetValidationLogs(self, request, context):
-        validation_logs = repository.get_validation_logs(request.ingestion_id)
-        if validation_logs:
-            return mcp_pb2.ValidationLogs(
-                validation_id=validation_logs.validation_id,
-                schema_id=validation_logs.schema_id,
-                status=validation_logs.status,
-                errors=json.dumps(validation_logs.errors).encode('utf-8'),
-                warnings=json.dumps(validation_logs.warnings).encode('utf-8'),
-            )
-        else:
-            context.set_details(f"Validation logs with id '{request.ingestion_id}' not found.")
+        return self._get_artifact("validation_logs", request, repository.get_validation_logs, _validation_logs_message, mcp_pb2.ValidationLogs(), context)
+
+    def StreamMappedSchemas(self, request, context):
+        """Streams the requested mapped schemas, reading them from the database a page at a time."""
+        logging.info(
+            f"StreamMappedSchemas called for {len(request.schema_ids) or 'all'} schemas "
+            f"created in [{request.created_from}, {request.created_to})"
+        )
+        rows = repository.iter_mapped_schemas(
+            list(request.schema_ids),
+            _timestamp_field(request.created_from),
+            _timestamp_field(request.created_to),
+            MAPPED_SCHEMA_STREAM_PAGE_SIZE,
+        )
+        sent = 0
+        try:
+            for row in rows:
+                yield _streamed_mapped_schema_message(row)
+                sent += 1
+        except Exception as e:
+            logging.error(f"Error streaming mapped schemas after {sent} rows: {e}")
+            context.set_details(f"Failed to read mapped schemas: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return
+        logging.info(f"StreamMappedSchemas sent {sent} schemas")
+
+    def SaveValidationResults(self, request_iterator, context):
+        """Saves a client-streamed batch of validation logs and their warnings in one bulk
+        write. Results that do not parse are rejected; if the write fails, all are. The ack
+        lists the stream positions of the rejected results."""
+        rejected, parsed, log_rows, warning_rows = [], [], [], []
+        for index, result in enumerate(request_iterator):
+            try:
+                if not result.log.validation_id:
+                    raise ValueError("validation_id is required")
+                log_row = _validation_logs_row(result.log)
+                warnings = [_warning_row(warning) for warning in result.warnings]
+            except ValueError as e:
+                logging.error(f"Rejected validation result {result.log.validation_id}: {e}")
+                rejected.append(index)
+                continue
+            for warning in warnings:
+                warning["validation_id"] = warning["validation_id"] or log_row["validation_id"]
+            parsed.append(index)
+            log_rows.append(log_row)
+            warning_rows.extend(warnings)
+
+        accepted = 0
+        if log_rows:
+            try:
+                repository.bulk_save_validation_results(log_rows, warning_rows)
+                accepted = len(log_rows)
+            except Exception as e:
+                logging.error(f"Error bulk saving {len(log_rows)} validation results: {e}")
+                rejected = sorted(rejected + parsed)
+        logging.info(f"SaveValidationResults accepted {accepted} results, rejected {len(rejected)}")
+        return mcp_pb2.WriteBatchAck(accepted=accepted, rejected=len(rejected), rejected_indexes=rejected)
+
+    def SaveConversionLog(self, request, context):
+        return self._save_artifact("conversion_log", request.conversion_id, repository.save_conversion_log, _conversion_log_row, request, context)
+
+    def GetConversionLog(self, request, context):
+        return self._get_artifact("conversion_log", request, repository.get_conversion_log, _conversion_log_message, mcp_pb2.ConversionLog(), context)
+
+    def SaveIntegrationLog(self, request, context):
+        return self._save_artifact("integration_log", request.integration_id, repository.save_integration_log, _integration_log_row, request, context)
+
+    def GetIntegrationLog(self, request, context):
+        return self._get_artifact("integration_log", request, repository.get_integration_log, _integration_log_message, mcp_pb2.IntegrationLog(), context)
+
+    def SaveReport(self, request, context):
+        return self._save_artifact("report", request.report_id, repository.save_report, _report_row, request, context)
+
+    def GetReport(self, request, context):
+        return self._get_artifact("report", request, repository.get_report, _report_message, mcp_pb2.Report(), context)
+
+    def SaveWarning(self, request, context):
+        return self._save_artifact("warning", request.warning_id, repository.save_warning, _warning_row, request, context)
+
+    def EnqueueOcrJob(self, request, context):
+        """Adds an OCR job to the durable work queue."""
+        logging.info(f"EnqueueOcrJob called for ingestion_id: {request.ingestion_id}, priority: {request.priority}")
+        job = repository.enqueue_ocr_job(
+            ingestion_id=request.ingestion_id,
+            file_url=request.file_url,
+            metadata=dict(request.metadata),
+            priority=request.priority or "normal",
+        )
+        if not job:
+            context.set_details(f"Failed to enqueue OCR job for {request.ingestion_id}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return mcp_pb2.OcrJob()
+        return _ocr_job_message(job)
+
+    def ClaimOcrJobs(self, request, context):
+        """Claims queued OCR jobs for a worker, highest priority lane first."""
+        jobs = repository.claim_ocr_jobs(
+            worker_id=request.worker_id,
+            max_jobs=request.max_jobs or 1,
+            priorities=list(request.priorities),
+        )
+        if jobs:
+            logging.info(f"Worker {request.worker_id} claimed {len(jobs)} OCR job(s)")
+        return mcp_pb2.ClaimOcrJobsResp(jobs=[_ocr_job_message(job) for job in jobs])
+
+    def CompleteOcrJob(self, request, context):
+        """Marks an OCR job as done."""
+        success = repository.complete_ocr_job(request.job_id, request.worker_id, request.ocr_id)
+        _set_ocr_job_update_status(context, success, request, "complete")
+        return mcp_pb2.WriteAck(ok=bool(success))
+
+    def FailOcrJob(self, request, context):
+        """Records a failed OCR attempt; the job is retried until it runs out of attempts."""
+        success = repository.fail_ocr_job(
+            request.job_id, request.worker_id, request.error, request.retry_delay_s
+        )
+        _set_ocr_job_update_status(context, success, request, "update")
+        return mcp_pb2.WriteAck(ok=bool(success))
+
+    def GetOcrJob(self, request, context):
+        """Retrieves the latest OCR job for an ingestion."""
+        job = repository.get_ocr_job(request.ingestion_id)
+        if not job:
+            context.set_details(f"No OCR job found for ingestion_id '{request.ingestion_id}'.")
             context.set_code(grpc.StatusCode.NOT_FOUND)
-            return mcp_pb2.ValidationLogs()
+            return mcp_pb2.OcrJob()
+        return _ocr_job_message(job)
 
 
 def serve():
     """Starts the gRPC server and waits for termination."""
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    mcp_pb2_grpc.add_MCPServicer_to_server(MCPServicer(), server)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=MCP_GRPC_WORKERS), options=GRPC_SERVER_OPTIONS)
+    servicer = MCPServicer()
+    mcp_pb2_grpc.add_MCPServicer_to_server(servicer, server)
     server.add_insecure_port('[::]:50051')
     server.start()
     logging.info("MCP gRPC server started on port 50051")
 
-    # Start FastAPI in a separate thread
+    # Stop taking RPCs on SIGTERM, then flush buffered writes before exiting.
+    signal.signal(signal.SIGTERM, lambda *_: server.stop(SHUTDOWN_GRACE_S))
+
+    start_http_server(servicer)
+
+    try:
+        server.wait_for_termination()
+    finally:
+        servicer.close()
+
+def db_pool_stats() -> dict:
+    """Stats of the psycopg2 pool, plus the asyncpg pool under "asyncpg" in aio mode, where
+    most RPCs use it."""
+    stats = get_pool_stats()
+    async_stats = get_async_pool_stats()
+    if async_stats is not None:
+        stats["asyncpg"] = async_stats
+    return stats
+
+def start_http_server(servicer: MCPServicer):
+    """Starts the health/metrics FastAPI app in a daemon thread."""
     app = FastAPI()
     @app.get("/health")
     def health_check():
-        return {"status": "ok"}
+        return {"status": "ok", "mode": MCP_SERVER_MODE}
+
+    @app.get("/metrics/db-pool")
+    def db_pool_metrics():
+        return db_pool_stats()
+
+    @app.get("/metrics/artifact-cache")
+    def artifact_cache_metrics():
+        return servicer.artifact_cache.stats()
 
     http_server = threading.Thread(target=uvicorn.run, args=(app,), kwargs={"host": "0.0.0.0", "port": 8001})
     http_server.daemon = True
     http_server.start()
 
-    server.wait_for_termination()
-
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
-    serve()
+    if MCP_SERVER_MODE == "aio":
+        from backend.mcp.aio_server import serve as serve_aio
+        serve_aio()
+    else:
+        serve()
@@ -0,0 +1 @@
+# This file makes the 'storage' directory a Python package.
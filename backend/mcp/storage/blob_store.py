@@ -0,0 +1,169 @@
+import hashlib
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple
+
+CHUNK_SIZE = 1024 * 1024
+
+class BlobStore(ABC):
+    """Content-addressed storage for document bytes, keyed by SHA-256 hex digest."""
+
+    @abstractmethod
+    def put_stream(self, chunks: Iterable[bytes]) -> Tuple[str, int]:
+        """Stores the concatenated chunks and returns (content_hash, size_bytes).
+
+        Identical content is stored only once; writing bytes that already exist is a no-op.
+        """
+
+    @abstractmethod
+    def exists(self, content_hash: str) -> bool:
+        """Returns True if a blob with this hash is stored."""
+
+    @abstractmethod
+    def open(self, content_hash: str) -> BinaryIO:
+        """Opens a stored blob for reading. Raises FileNotFoundError if missing."""
+
+    @abstractmethod
+    def delete(self, content_hash: str) -> None:
+        """Removes a blob. Missing blobs are ignored."""
+
+    def put(self, data: bytes) -> Tuple[str, int]:
+        """Stores a single in-memory buffer."""
+        return self.put_stream([data])
+
+    def iter_chunks(self, content_hash: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """Yields the blob in fixed-size chunks without loading it fully into memory."""
+        with self.open(content_hash) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def read(self, content_hash: str) -> bytes:
+        """Reads a whole blob into memory."""
+        return b"".join(self.iter_chunks(content_hash))
+
+
+class LocalBlobStore(BlobStore):
+    """Stores blobs on the local filesystem, sharded by hash prefix (e.g. ab/cd/abcd...)."""
+
+    def __init__(self, root: str, shard_depth: int = 2, shard_width: int = 2):
+        self.root = root
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+        self._tmp_dir = os.path.join(root, ".tmp")
+        os.makedirs(self._tmp_dir, exist_ok=True)
+
+    def _path(self, content_hash: str) -> str:
+        shards = [
+            content_hash[i * self.shard_width:(i + 1) * self.shard_width]
+            for i in range(self.shard_depth)
+        ]
+        return os.path.join(self.root, *shards, content_hash)
+
+    def put_stream(self, chunks: Iterable[bytes]) -> Tuple[str, int]:
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    size += len(chunk)
+                    tmp.write(chunk)
+
+            content_hash = digest.hexdigest()
+            final_path = self._path(content_hash)
+            if os.path.exists(final_path):
+                logging.info(f"Blob {content_hash} already stored, skipping write")
+                os.unlink(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(tmp_path, final_path)
+            return content_hash, size
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def exists(self, content_hash: str) -> bool:
+        return os.path.exists(self._path(content_hash))
+
+    def open(self, content_hash: str) -> BinaryIO:
+        return open(self._path(content_hash), "rb")
+
+    def delete(self, content_hash: str) -> None:
+        try:
+            os.unlink(self._path(content_hash))
+        except FileNotFoundError:
+            pass
+
+
+class S3BlobStore(BlobStore):
+    """Stores blobs in an S3-compatible bucket under `{prefix}/{hash}`.
+
+    boto3 is imported lazily so that deployments using the local backend do not need it.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "blobs", endpoint_url: Optional[str] = None, client=None):
+        if client is None:
+            import boto3
+            client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+
+    def _key(self, content_hash: str) -> str:
+        return f"{self.prefix}/{content_hash}" if self.prefix else content_hash
+
+    def put_stream(self, chunks: Iterable[bytes]) -> Tuple[str, int]:
+        digest = hashlib.sha256()
+        size = 0
+        # The key depends on the hash, so spool to disk first (bounded memory).
+        with tempfile.TemporaryFile() as tmp:
+            for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                tmp.write(chunk)
+
+            content_hash = digest.hexdigest()
+            if self.exists(content_hash):
+                logging.info(f"Blob {content_hash} already stored, skipping upload")
+            else:
+                tmp.seek(0)
+                self.client.upload_fileobj(tmp, self.bucket, self._key(content_hash))
+        return content_hash, size
+
+    def exists(self, content_hash: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(content_hash))
+            return True
+        except Exception:
+            return False
+
+    def open(self, content_hash: str) -> BinaryIO:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._key(content_hash))
+        except Exception as e:
+            raise FileNotFoundError(content_hash) from e
+        return response["Body"]
+
+    def delete(self, content_hash: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(content_hash))
+
+
+@lru_cache()
+def get_blob_store() -> BlobStore:
+    """Returns the blob store configured through the environment."""
+    backend = os.getenv("BLOB_STORE_BACKEND", "local").lower()
+    if backend == "s3":
+        return S3BlobStore(
+            bucket=os.environ["BLOB_STORE_BUCKET"],
+            prefix=os.getenv("BLOB_STORE_PREFIX", "blobs"),
+            endpoint_url=os.getenv("BLOB_STORE_ENDPOINT_URL"),
+        )
+    return LocalBlobStore(os.getenv("BLOB_STORE_ROOT", "/var/lib/mcp/blobs"))
@@ -1,24 +1,77 @@
+from contextlib import asynccontextmanager
+from itertools import islice
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 from backend.orchestrator import service
 from backend.orchestrator.flow.graph import OrchestrationState
-from backend.shared.clients.mcp import MCPClient
+from backend.orchestrator.recovery import OrchestrationBusy
+from backend.shared.clients.registry import get_channel_registry
+from backend.shared.dependencies.config import get_settings
 
-app = FastAPI(title="Orchestrator Service", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Resume flows whose orchestrator process died (see backend/orchestrator/recovery.py).
+    sweeper = service.get_sweeper().start() if get_settings().ORCHESTRATION_SWEEPER_ENABLED else None
+    yield
+    if sweeper:
+        sweeper.stop()
+    service.get_leases().close()
+
+app = FastAPI(title="Orchestrator Service", version="1.0.0", lifespan=lifespan)
 
 class HumanReviewRequest(BaseModel):
     decision: str
     notes: Optional[str] = None
 
+class BatchOrchestrationRequest(BaseModel):
+    # Either explicit ids, or a filter over documents_ingested.status.
+    ingestion_ids: Optional[List[str]] = None
+    status: Optional[str] = None
+    limit: Optional[int] = Field(default=None, gt=0)
+
+@app.post("/orchestrate/batch")
+def start_batch_orchestration(request: BatchOrchestrationRequest):
+    """Runs many flows concurrently and streams NDJSON progress: one line per finished
+    flow and a final summary with throughput. The batch keeps running if the client
+    disconnects; poll GET /orchestrate/batch/{batch_id} (X-Batch-Id header) instead.
+    """
+    if (request.ingestion_ids is None) == (request.status is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of 'ingestion_ids' or 'status'.")
+
+    if request.ingestion_ids is not None:
+        ingestion_ids = request.ingestion_ids
+    else:
+        ingestion_ids = service.get_clients().mcp.iter_document_ids(status=request.status)
+    if request.limit:
+        ingestion_ids = islice(ingestion_ids, request.limit)
+
+    batch = service.start_batch(ingestion_ids)
+    return StreamingResponse(
+        batch.stream(),
+        media_type="application/x-ndjson",
+        headers={"X-Batch-Id": batch.batch_id},
+    )
+
+@app.get("/orchestrate/batch/{batch_id}")
+def get_batch_orchestration(batch_id: str):
+    batch = service.get_batch(batch_id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Batch not found.")
+    return {**batch.progress(), "agent_limits": service.agent_limits.stats()}
+
 @app.post("/orchestrate/{ingestion_id}")
 def start_orchestration(ingestion_id: str):
-    return service.run_flow(ingestion_id)
+    try:
+        return service.run_flow(ingestion_id)
+    except OrchestrationBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
 @app.post("/human-review/{ingestion_id}/resolve")
 def resolve_human_review(ingestion_id: str, request: HumanReviewRequest):
-    mcp_client = MCPClient()
+    mcp_client = service.get_clients().mcp
     state_dict = mcp_client.get_orchestration(ingestion_id)
 
     if not state_dict:
@@ -30,10 +83,10 @@ def resolve_human_review(ingestion_id: str, request: HumanReviewRequest):
         raise HTTPException(status_code=400, detail="Orchestration is not pending human review.")
 
     if request.decision == "approve":
-        state.requires_human_review = False
-        state.valid = True
-        state.status = "RESUMING"
-        return service.resume_after_human_review(state.dict())
+        try:
+            return service.resume_after_human_review(ingestion_id, {"requires_human_review": False, "valid": True})
+        except OrchestrationBusy as e:
+            raise HTTPException(status_code=409, detail=str(e))
     elif request.decision == "reject":
         state.status = "REJECTED_BY_HUMAN"
         mcp_client.save_orchestration(ingestion_id, state.dict())
@@ -43,7 +96,7 @@ def resolve_human_review(ingestion_id: str, request: HumanReviewRequest):
 
 @app.get("/orchestrations/{ingestion_id}")
 def get_orchestration_status(ingestion_id: str):
-    mcp_client = MCPClient()
+    mcp_client = service.get_clients().mcp
     state = mcp_client.get_orchestration(ingestion_id)
     if not state:
         raise HTTPException(status_code=404, detail="Orchestration not found.")
@@ -52,3 +105,11 @@ def get_orchestration_status(ingestion_id: str):
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+@app.get("/health/dependencies")
+def dependencies_health_check():
+    """Connects the shared MCP and agent channels and reports each target's state."""
+    service.get_clients()
+    targets = get_channel_registry().check_health(get_settings().GRPC_HEALTH_CHECK_TIMEOUT_S)
+    status = "ok" if all(state == "READY" for state in targets.values()) else "degraded"
+    return {"status": status, "targets": targets}
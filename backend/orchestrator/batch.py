@@ -0,0 +1,188 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Optional
+
+class AgentLimits:
+    """Per-agent caps on how many flows may be inside a call to that agent at once.
+
+    Shared by every flow in the process so a large batch cannot flood one agent (the
+    extraction agent in particular) while the others sit idle. Agents without a limit,
+    or with a limit <= 0, are not capped.
+    """
+
+    def __init__(self, limits: dict):
+        self.limits = {agent: limit for agent, limit in limits.items() if limit > 0}
+        self._semaphores = {agent: threading.BoundedSemaphore(limit) for agent, limit in self.limits.items()}
+        self._lock = threading.Lock()
+        self._in_flight = Counter()
+        self._waits = Counter()
+
+    @classmethod
+    def from_settings(cls, settings) -> "AgentLimits":
+        return cls({
+            "extraction": settings.EXTRACTION_AGENT_MAX_CONCURRENCY,
+            "mapping": settings.MAPPING_AGENT_MAX_CONCURRENCY,
+            "validation": settings.VALIDATION_AGENT_MAX_CONCURRENCY,
+            "report": settings.REPORT_AGENT_MAX_CONCURRENCY,
+            "conversion": settings.CONVERSION_AGENT_MAX_CONCURRENCY,
+            "integration": settings.INTEGRATION_AGENT_MAX_CONCURRENCY,
+        })
+
+    @contextmanager
+    def slot(self, agent: str):
+        semaphore = self._semaphores.get(agent)
+        if semaphore is None:
+            yield
+            return
+        if not semaphore.acquire(blocking=False):
+            with self._lock:
+                self._waits[agent] += 1
+            semaphore.acquire()
+        with self._lock:
+            self._in_flight[agent] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight[agent] -= 1
+            semaphore.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                agent: {"limit": limit, "in_flight": self._in_flight[agent], "waits": self._waits[agent]}
+                for agent, limit in self.limits.items()
+            }
+
+class BatchRun:
+    """Runs one flow per ingestion id on a bounded thread pool and records progress.
+
+    Ids are pulled lazily from `ingestion_ids` and at most `max_in_flight` flows are
+    queued or running at a time, so a filter over tens of thousands of documents is
+    paged in as the batch advances instead of being materialized up front. Results are
+    appended in completion order; `stream` replays them and then follows new ones.
+    """
+
+    def __init__(
+        self,
+        ingestion_ids: Iterable[str],
+        run_fn: Callable[[str], dict],
+        max_workers: int,
+        max_in_flight: Optional[int] = None,
+    ):
+        self.batch_id = f"BATCH-{uuid.uuid4()}"
+        self.run_fn = run_fn
+        self.max_workers = max_workers
+        self._ids = ingestion_ids
+        self._slots = threading.BoundedSemaphore(max_in_flight or 2 * max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-flow")
+        self._cond = threading.Condition()
+        self._results: list = []
+        self._statuses = Counter()
+        self._flow_time_s = 0.0
+        self.submitted = 0
+        self.failed = 0
+        self.done = False
+        self.error: Optional[str] = None
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self) -> "BatchRun":
+        self.started_at = time.monotonic()
+        threading.Thread(target=self._feed, name=f"{self.batch_id}-feeder", daemon=True).start()
+        return self
+
+    def _feed(self):
+        try:
+            for ingestion_id in self._ids:
+                self._slots.acquire()
+                with self._cond:
+                    self.submitted += 1
+                self._executor.submit(self._run_one, ingestion_id)
+        except Exception as e:
+            # Typically the MCP failing while paging a status filter; flows already
+            # submitted still finish.
+            logging.error(f"Batch {self.batch_id} stopped listing documents: {e}")
+            self.error = str(e)
+        finally:
+            self._executor.shutdown(wait=True)
+            with self._cond:
+                self.done = True
+                self.finished_at = time.monotonic()
+                self._cond.notify_all()
+            summary = self.progress()
+            logging.info(
+                f"Batch {self.batch_id} finished {summary['completed']} flows in {summary['elapsed_s']:.1f}s "
+                f"({summary['throughput_per_s']:.1f}/s, {summary['failed']} failed)"
+            )
+
+    def _run_one(self, ingestion_id: str):
+        start = time.perf_counter()
+        result = {"ingestion_id": ingestion_id}
+        try:
+            final_state = self.run_fn(ingestion_id) or {}
+            result["status"] = final_state.get("status", "UNKNOWN")
+            if final_state.get("errors"):
+                result["errors"] = final_state["errors"]
+        except Exception as e:
+            logging.error(f"Batch {self.batch_id} flow for {ingestion_id} failed: {e}")
+            result["status"] = "ERROR"
+            result["error"] = str(e)
+        finally:
+            self._slots.release()
+        result["duration_s"] = round(time.perf_counter() - start, 4)
+
+        with self._cond:
+            self._results.append(result)
+            self._statuses[result["status"]] += 1
+            self._flow_time_s += result["duration_s"]
+            if result["status"] in ("ERROR", "FAILED"):
+                self.failed += 1
+            self._cond.notify_all()
+
+    def progress(self) -> dict:
+        with self._cond:
+            completed = len(self._results)
+            end = self.finished_at or time.monotonic()
+            elapsed = end - self.started_at if self.started_at else 0.0
+            return {
+                "batch_id": self.batch_id,
+                "state": "DONE" if self.done else "RUNNING",
+                "submitted": self.submitted,
+                "completed": completed,
+                "failed": self.failed,
+                "statuses": dict(self._statuses),
+                "elapsed_s": round(elapsed, 3),
+                "throughput_per_s": round(completed / elapsed, 2) if elapsed else 0.0,
+                "avg_flow_s": round(self._flow_time_s / completed, 4) if completed else 0.0,
+                "max_workers": self.max_workers,
+                "error": self.error,
+            }
+
+    def stream(self, heartbeat_s: float = 5.0) -> Iterator[str]:
+        """Yields one NDJSON line per finished flow, then a final summary line.
+
+        While nothing finishes a progress line is emitted every `heartbeat_s` so
+        proxies keep the connection open.
+        """
+        sent = 0
+        while True:
+            with self._cond:
+                if sent == len(self._results) and not self.done:
+                    self._cond.wait(heartbeat_s)
+                new = self._results[sent:]
+                done = self.done and sent + len(new) == len(self._results)
+            for result in new:
+                sent += 1
+                yield json.dumps({"event": "flow", "completed": sent, **result}) + "\n"
+            if done:
+                yield json.dumps({"event": "summary", **self.progress()}) + "\n"
+                return
+            if not new:
+                yield json.dumps({"event": "progress", **self.progress()}) + "\n"
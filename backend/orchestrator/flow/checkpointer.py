@@ -0,0 +1,236 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+@dataclass
+class _ThreadLog:
+    """What the saver knows about a thread between its puts."""
+    version: int
+    base_version: int
+    latest: Optional[dict] = None
+
+class MCPCheckpointSaver(BaseCheckpointSaver[int]):
+    """LangGraph checkpointer that stores each super-step as a delta through the MCP.
+
+    `put` sends only the channels the step changed (LangGraph's `new_versions`): the
+    changed state fields as JSON, so GetOrchestration can show a running flow, and the
+    serialized checkpoint with the changed channel values, so the graph can be
+    restored. Each step gets the next version number of its thread. After
+    `compact_every` steps, and when a run ends with `compact`, the full checkpoint is
+    written as a snapshot and the steps it covers are dropped, so restoring a thread
+    replays at most `compact_every` deltas on top of one snapshot.
+
+    The thread id is the ingestion id. Only the root graph namespace is stored (the
+    orchestration graph has no subgraphs), and pending writes are not persisted: a
+    flow that dies mid-step re-runs that whole step when it is resumed.
+    """
+
+    def __init__(self, mcp, state_keys: Iterable[str], compact_every: int = 16, serde=None):
+        super().__init__(serde=serde)
+        self.mcp = mcp
+        self.state_keys = frozenset(state_keys)
+        self.compact_every = max(compact_every, 1)
+        self._lock = threading.Lock()
+        self._threads: dict[str, _ThreadLog] = {}
+
+    def _payload(self, checkpoint: Checkpoint, metadata: CheckpointMetadata, parent_id: Optional[str],
+                 values: dict, cleared: Sequence[str] = (), previous: Optional[Checkpoint] = None,
+                 new_versions: Optional[ChannelVersions] = None) -> tuple[str, bytes]:
+        """Serializes a checkpoint. Given the `previous` checkpoint of the thread, only the
+        channel versions and versions_seen entries that changed since then are kept."""
+        header = {key: value for key, value in checkpoint.items() if key != "channel_values"}
+        if previous is not None:
+            header["channel_versions"] = dict(new_versions or {})
+            header["versions_seen"] = {
+                node: seen for node, seen in checkpoint["versions_seen"].items()
+                if previous["versions_seen"].get(node) != seen
+            }
+        return self.serde.dumps_typed({
+            "checkpoint": header,
+            "metadata": metadata,
+            "parent_checkpoint_id": parent_id,
+            "values": values,
+            "cleared": list(cleared),
+        })
+
+    def _replay(self, thread_id: str) -> tuple[int, list[tuple[int, CheckpointTuple]]]:
+        """Returns the snapshot version (0 if none) and (version, tuple) for the snapshot
+        and each step after it, oldest first."""
+        response = self.mcp.get_orchestration_checkpoints(thread_id)
+        base_version = response.base.version if response.HasField("base") else 0
+        records = ([response.base] if response.HasField("base") else []) + list(response.steps)
+        values: dict[str, Any] = {}
+        channel_versions: dict[str, Any] = {}
+        versions_seen: dict[str, dict] = {}
+        checkpoints = []
+        for record in records:
+            payload = self.serde.loads_typed((record.checkpoint_type, record.checkpoint))
+            values.update(payload["values"])
+            for channel in payload["cleared"]:
+                values.pop(channel, None)
+            channel_versions.update(payload["checkpoint"]["channel_versions"])
+            versions_seen.update(payload["checkpoint"]["versions_seen"])
+            checkpoint = {
+                **payload["checkpoint"],
+                "channel_values": dict(values),
+                "channel_versions": dict(channel_versions),
+                "versions_seen": dict(versions_seen),
+            }
+            checkpoints.append((record.version, self._tuple(thread_id, payload, checkpoint)))
+        return base_version, checkpoints
+
+    def _tuple(self, thread_id: str, payload: dict, checkpoint: Checkpoint) -> CheckpointTuple:
+        parent_id = payload["parent_checkpoint_id"]
+        return CheckpointTuple(
+            config={"configurable": {
+                "thread_id": thread_id, "checkpoint_ns": "", "checkpoint_id": checkpoint["id"],
+            }},
+            checkpoint=checkpoint,
+            metadata=payload["metadata"],
+            parent_config=(
+                {"configurable": {"thread_id": thread_id, "checkpoint_ns": "", "checkpoint_id": parent_id}}
+                if parent_id else None
+            ),
+            pending_writes=[],
+        )
+
+    def _load(self, thread_id: str) -> Optional[CheckpointTuple]:
+        """Restores the latest checkpoint of a thread and resumes its version numbering."""
+        base_version, checkpoints = self._replay(thread_id)
+        version, latest = checkpoints[-1] if checkpoints else (0, None)
+        log = _ThreadLog(version=version, base_version=base_version)
+        if latest:
+            log.latest = {
+                "checkpoint": latest.checkpoint,
+                "metadata": latest.metadata,
+                "parent_id": latest.parent_config["configurable"]["checkpoint_id"] if latest.parent_config else None,
+                "version": version,
+            }
+        with self._lock:
+            self._threads[thread_id] = log
+        return latest
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_id = get_checkpoint_id(config)
+        if not checkpoint_id:
+            with self._lock:
+                log = self._threads.get(thread_id)
+            if log is not None and log.version == 0:
+                # Just reset by delete_thread: nothing to restore, skip the round trip.
+                return None
+            return self._load(thread_id)
+        for _, checkpoint_tuple in self._replay(thread_id)[1]:
+            if checkpoint_tuple.checkpoint["id"] == checkpoint_id:
+                return checkpoint_tuple
+        return None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """Lists the retained checkpoints of a thread (its snapshot and later steps), newest first."""
+        if not config:
+            return
+        checkpoints = [checkpoint_tuple for _, checkpoint_tuple in self._replay(config["configurable"]["thread_id"])[1]]
+        before_id = get_checkpoint_id(before) if before else None
+        for checkpoint_tuple in reversed(checkpoints):
+            if before_id and checkpoint_tuple.checkpoint["id"] >= before_id:
+                continue
+            if filter and any(checkpoint_tuple.metadata.get(key) != value for key, value in filter.items()):
+                continue
+            if limit is not None and limit <= 0:
+                return
+            if limit is not None:
+                limit -= 1
+            yield checkpoint_tuple
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        parent_id = config["configurable"].get("checkpoint_id")
+        metadata = get_checkpoint_metadata(config, metadata)
+        values = checkpoint["channel_values"]
+        changed = {channel: values[channel] for channel in new_versions if channel in values}
+        cleared = [channel for channel in new_versions if channel not in values]
+
+        with self._lock:
+            log = self._threads.get(thread_id)
+        if log is None:
+            self._load(thread_id)
+        with self._lock:
+            log = self._threads[thread_id]
+            previous = log.latest["checkpoint"] if log.latest else None
+            log.version += 1
+            version = log.version
+            log.latest = {"checkpoint": checkpoint, "metadata": metadata, "parent_id": parent_id, "version": version}
+            due = version - log.base_version >= self.compact_every
+
+        checkpoint_type, data = self._payload(checkpoint, metadata, parent_id, changed, cleared, previous, new_versions)
+        state_delta = {key: value for key, value in changed.items() if key in self.state_keys}
+        ack = self.mcp.append_orchestration_step(
+            thread_id, version, state_delta, state_delta.get("status", ""), checkpoint_type, data,
+        )
+        if not ack.ok:
+            raise RuntimeError(f"MCP rejected orchestration step {version} for {thread_id}")
+        if due:
+            self._compact(thread_id, forget=False)
+
+        return {"configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": config["configurable"].get("checkpoint_ns", ""),
+            "checkpoint_id": checkpoint["id"],
+        }}
+
+    def put_writes(self, config: RunnableConfig, writes: Sequence[tuple[str, Any]], task_id: str,
+                   task_path: str = "") -> None:
+        # Not persisted, see the class docstring.
+        return None
+
+    def compact(self, thread_id: str):
+        """Snapshots the thread's latest checkpoint and forgets the thread; call when a run ends."""
+        self._compact(thread_id, forget=True)
+
+    def _compact(self, thread_id: str, forget: bool):
+        with self._lock:
+            log = self._threads.pop(thread_id, None) if forget else self._threads.get(thread_id)
+            if log is None or log.latest is None or log.latest["version"] <= log.base_version:
+                return
+            latest = log.latest
+            log.base_version = latest["version"]
+
+        values = latest["checkpoint"]["channel_values"]
+        checkpoint_type, data = self._payload(latest["checkpoint"], latest["metadata"], latest["parent_id"], values)
+        state = {key: value for key, value in values.items() if key in self.state_keys}
+        ack = self.mcp.compact_orchestration(
+            thread_id, latest["version"], state, state.get("status", ""), checkpoint_type, data,
+        )
+        if not ack.ok:
+            # The steps are still there, so nothing is lost; the next compaction covers them.
+            logging.error(f"Failed to compact orchestration {thread_id} at version {latest['version']}")
+
+    def delete_thread(self, thread_id: str) -> None:
+        self.mcp.delete_orchestration_checkpoints(thread_id)
+        with self._lock:
+            self._threads[thread_id] = _ThreadLog(version=0, base_version=0)
@@ -1,9 +1,18 @@
+import logging
+import operator
+from typing import Annotated, List, Optional
+
 from pydantic import BaseModel, Field
-from typing import Optional, List
 from langgraph.graph import StateGraph, END
 
+# Accounting platforms every valid invoice is pushed to. Each target runs its own
+# conversion -> integration branch; the branches run concurrently and meet in node_join.
+TARGETS = ("tally", "zoho")
+
 class OrchestrationState(BaseModel):
     ingestion_id: str
+    # New for every run_flow; scopes the idempotency keys of the run's agent calls.
+    run_id: Optional[str] = None
     ocr_id: Optional[str] = None
     schema_id: Optional[str] = None
     validation_id: Optional[str] = None
@@ -14,83 +23,144 @@ class OrchestrationState(BaseModel):
     zoho_conversion_id: Optional[str] = None
     tally_integration_id: Optional[str] = None
     zoho_integration_id: Optional[str] = None
+    # Per-target branch status: CONVERTED, INTEGRATED or FAILED.
+    tally_status: Optional[str] = None
+    zoho_status: Optional[str] = None
     status: str = "STARTED"
-    errors: List[str] = Field(default_factory=list)
+    # Concatenated rather than replaced so parallel branches can both report errors.
+    errors: Annotated[List[str], operator.add] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
 
+def step_key(state: OrchestrationState, agent: str, target: str = "") -> str:
+    """Idempotency key for one agent call of a run.
+
+    A step re-executed after a crash (see backend/orchestrator/recovery.py) sends the
+    same key, and the agent replays its recorded response instead of redoing the work.
+    """
+    key = f"{state.run_id or state.ingestion_id}:{agent}"
+    return f"{key}:{target}" if target else key
+
 def node_extraction(state: OrchestrationState, clients):
-    # In a real implementation, you would call the extraction agent
-    state.ocr_id = "OCR-TEST-123"
-    return state
+    # In a real implementation, you would call the extraction agent, passing
+    # idempotency_key=step_key(state, "extraction") like every agent call
+    return {"ocr_id": "OCR-TEST-123"}
 
 def node_mapping(state: OrchestrationState, clients):
     # In a real implementation, you would call the mapping agent
-    state.schema_id = "SCHEMA-TEST-123"
-    return state
+    return {"schema_id": "SCHEMA-TEST-123"}
 
 def node_validation(state: OrchestrationState, clients):
     # In a real implementation, you would call the validation agent
-    state.validation_id = "VALIDATION-TEST-123"
-    state.valid = True  # Or False, or requires_human_review
-    state.requires_human_review = False # Or True
-    return state
+    return {
+        "validation_id": "VALIDATION-TEST-123",
+        "valid": True,  # Or False, or requires_human_review
+        "requires_human_review": False,  # Or True
+    }
 
 def node_report(state: OrchestrationState, clients):
     # In a real implementation, you would call the report agent
-    state.report_id = "REPORT-TEST-123"
-    return state
+    return {"report_id": "REPORT-TEST-123"}
 
 def node_check_review_or_valid(state: OrchestrationState, clients):
     if state.requires_human_review:
         return "human_review_pending"
     elif state.valid:
-        return "conversion"
+        return conversion_branches()
     else:
-        return "end"
+        return END
 
 def node_human_review_pending(state: OrchestrationState, clients):
-    state.status = "PENDING_REVIEW"
-    return state
-
-def node_conversion(state: OrchestrationState, clients):
-    # In a real implementation, you would call the conversion agent
-    state.tally_conversion_id = "CONVERSION-TEST-TALLY-123"
-    state.zoho_conversion_id = "CONVERSION-TEST-ZOHO-123"
-    return state
-
-def node_integration(state: OrchestrationState, clients):
-    # In a real implementation, you would call the integration agent
-    state.tally_integration_id = "INTEGRATION-TEST-TALLY-123"
-    state.zoho_integration_id = "INTEGRATION-TEST-ZOHO-123"
-    state.status = "COMPLETED"
-    return state
-
-def build_graph(clients):
+    return {"status": "PENDING_REVIEW"}
+
+def convert_target(target: str, state: OrchestrationState, clients) -> str:
+    """Converts the validated invoice for one target and returns the conversion_id."""
+    # In a real implementation, you would call the conversion agent with
+    # idempotency_key=step_key(state, "conversion", target)
+    return f"CONVERSION-TEST-{target.upper()}-123"
+
+def integrate_target(target: str, conversion_id: str, state: OrchestrationState, clients) -> str:
+    """Pushes one target's converted invoice and returns the integration_id."""
+    # In a real implementation, you would call the integration agent with
+    # idempotency_key=step_key(state, "integration", target)
+    return f"INTEGRATION-TEST-{target.upper()}-123"
+
+def node_conversion(target: str, state: OrchestrationState, clients):
+    try:
+        conversion_id = convert_target(target, state, clients)
+    except Exception as e:
+        logging.error(f"{target} conversion failed for {state.ingestion_id}: {e}")
+        return {f"{target}_status": "FAILED", "errors": [f"{target} conversion failed: {e}"]}
+    return {f"{target}_conversion_id": conversion_id, f"{target}_status": "CONVERTED"}
+
+def node_integration(target: str, state: OrchestrationState, clients):
+    conversion_id = getattr(state, f"{target}_conversion_id")
+    if getattr(state, f"{target}_status") != "CONVERTED":
+        return {}
+    try:
+        integration_id = integrate_target(target, conversion_id, state, clients)
+    except Exception as e:
+        logging.error(f"{target} integration failed for {state.ingestion_id}: {e}")
+        return {f"{target}_status": "FAILED", "errors": [f"{target} integration failed: {e}"]}
+    return {f"{target}_integration_id": integration_id, f"{target}_status": "INTEGRATED"}
+
+def node_join(state: OrchestrationState, clients):
+    """Waits for every target branch and derives the overall status from theirs."""
+    integrated = [getattr(state, f"{target}_status") == "INTEGRATED" for target in TARGETS]
+    if all(integrated):
+        return {"status": "COMPLETED"}
+    if any(integrated):
+        return {"status": "PARTIALLY_COMPLETED"}
+    return {"status": "FAILED"}
+
+def conversion_branches() -> list:
+    return [f"conversion_{target}" for target in TARGETS]
+
+def node_route_entry(state: OrchestrationState, clients):
+    # A human-approved orchestration resumes straight at the conversion fan-out.
+    if state.status == "RESUMING":
+        return conversion_branches()
+    return "extraction"
+
+def _limited(agent: str, node, limits):
+    """Runs a node while holding one of the agent's concurrency slots (see AgentLimits)."""
+    if limits is None:
+        return node
+    def run(state):
+        with limits.slot(agent):
+            return node(state)
+    return run
+
+def build_graph(clients, limits=None, checkpointer=None):
     graph = StateGraph(OrchestrationState)
 
-    graph.add_node("extraction", lambda state: node_extraction(state, clients))
-    graph.add_node("mapping", lambda state: node_mapping(state, clients))
-    graph.add_node("validation", lambda state: node_validation(state, clients))
-    graph.add_node("report", lambda state: node_report(state, clients))
+    graph.add_node("extraction", _limited("extraction", lambda state: node_extraction(state, clients), limits))
+    graph.add_node("mapping", _limited("mapping", lambda state: node_mapping(state, clients), limits))
+    graph.add_node("validation", _limited("validation", lambda state: node_validation(state, clients), limits))
+    graph.add_node("report", _limited("report", lambda state: node_report(state, clients), limits))
     graph.add_node("human_review_pending", lambda state: node_human_review_pending(state, clients))
-    graph.add_node("conversion", lambda state: node_conversion(state, clients))
-    graph.add_node("integration", lambda state: node_integration(state, clients))
+    for target in TARGETS:
+        graph.add_node(f"conversion_{target}", _limited(
+            "conversion", lambda state, target=target: node_conversion(target, state, clients), limits))
+        graph.add_node(f"integration_{target}", _limited(
+            "integration", lambda state, target=target: node_integration(target, state, clients), limits))
+    graph.add_node("join", lambda state: node_join(state, clients))
 
-    graph.set_entry_point("extraction")
+    graph.set_conditional_entry_point(
+        lambda state: node_route_entry(state, clients),
+        ["extraction", *conversion_branches()],
+    )
     graph.add_edge("extraction", "mapping")
     graph.add_edge("mapping", "validation")
     graph.add_edge("validation", "report")
     graph.add_conditional_edges(
         "report",
         lambda state: node_check_review_or_valid(state, clients),
-        {
-            "human_review_pending": "human_review_pending",
-            "conversion": "conversion",
-            "end": END,
-        },
+        ["human_review_pending", *conversion_branches(), END],
     )
     graph.add_edge("human_review_pending", END)
-    graph.add_edge("conversion", "integration")
-    graph.add_edge("integration", END)
+    for target in TARGETS:
+        graph.add_edge(f"conversion_{target}", f"integration_{target}")
+    graph.add_edge([f"integration_{target}" for target in TARGETS], "join")
+    graph.add_edge("join", END)
 
-    return graph.compile()
+    return graph.compile(checkpointer=checkpointer)
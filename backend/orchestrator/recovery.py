@@ -0,0 +1,185 @@
+import logging
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+import grpc
+
+class OrchestrationBusy(Exception):
+    """Another orchestrator process holds the lease of the flow."""
+
+    def __init__(self, ingestion_id: str):
+        super().__init__(f"Orchestration {ingestion_id} is already running")
+        self.ingestion_id = ingestion_id
+
+def new_owner_id() -> str:
+    """Lease owner id of this process: unique across hosts and restarts."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+class LeaseKeeper:
+    """Holds the leases of the flows this process is running and keeps them alive.
+
+    A heartbeat thread renews every held lease in one RPC each third of `ttl_s`. When
+    the process dies the heartbeats stop, the leases lapse, and a RecoverySweeper in
+    any orchestrator process picks the flows up again. A flow whose run failed is
+    `abandon`ed rather than released for the same reason: its lease lapses and the
+    sweeper retries it from the last checkpoint.
+    """
+
+    def __init__(self, mcp, owner: str, ttl_s: int):
+        self.mcp = mcp
+        self.owner = owner
+        self.ttl_s = max(int(ttl_s), 1)
+        self._lock = threading.Lock()
+        self._held: set = set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LeaseKeeper":
+        self._thread = threading.Thread(target=self._heartbeat, name="orchestration-leases", daemon=True)
+        self._thread.start()
+        return self
+
+    def acquire(self, ingestion_id: str) -> bool:
+        """Takes the lease of a flow; False if it is running here or in another process."""
+        with self._lock:
+            if ingestion_id in self._held:
+                return False
+            self._held.add(ingestion_id)
+        try:
+            acquired = self.mcp.acquire_orchestration_lease(ingestion_id, self.owner, self.ttl_s)
+        except BaseException:
+            self.abandon(ingestion_id)
+            raise
+        if not acquired:
+            self.abandon(ingestion_id)
+        return acquired
+
+    def adopt(self, ingestion_ids: List[str]):
+        """Starts renewing leases taken on this owner's behalf (by a sweeper claim)."""
+        with self._lock:
+            self._held.update(ingestion_ids)
+
+    def release(self, ingestion_id: str):
+        with self._lock:
+            self._held.discard(ingestion_id)
+        try:
+            if not self.mcp.release_orchestration_lease(ingestion_id, self.owner).ok:
+                logging.warning(f"Lease of orchestration {ingestion_id} was not released")
+        except grpc.RpcError as e:
+            # It lapses on its own; the sweeper then finds the flow finished.
+            logging.warning(f"Could not release the lease of orchestration {ingestion_id}: {e}")
+
+    def abandon(self, ingestion_id: str):
+        """Stops renewing a lease without releasing it, so it lapses and is swept."""
+        with self._lock:
+            self._held.discard(ingestion_id)
+
+    def held(self) -> List[str]:
+        with self._lock:
+            return sorted(self._held)
+
+    def renew(self):
+        held = self.held()
+        if not held:
+            return
+        try:
+            ack = self.mcp.renew_orchestration_leases(self.owner, held, self.ttl_s)
+        except grpc.RpcError as e:
+            logging.error(f"Failed to renew {len(held)} orchestration leases: {e}")
+            return
+        if ack.rejected:
+            # Lapsed before this heartbeat (e.g. a long pause) and possibly taken over.
+            logging.warning(f"{ack.rejected} of {len(held)} orchestration leases held by {self.owner} were lost")
+
+    def _heartbeat(self):
+        while not self._stop.wait(self.ttl_s / 3):
+            self.renew()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+class RecoverySweeper:
+    """Resumes flows whose orchestrator process died.
+
+    Every `interval_s` it claims up to one flow per idle worker among those whose
+    lease lapsed (the claim is atomic in the MCP, so several orchestrator processes
+    can sweep at once), adopts their leases and runs `recover_fn(ingestion_id)` for
+    each on its own pool. A flow is claimed at most `max_recoveries` times before it
+    is left for an operator.
+    """
+
+    def __init__(
+        self,
+        mcp,
+        leases: LeaseKeeper,
+        recover_fn: Callable[[str], dict],
+        interval_s: float,
+        workers: int,
+        max_recoveries: int,
+    ):
+        self.mcp = mcp
+        self.leases = leases
+        self.recover_fn = recover_fn
+        self.interval_s = interval_s
+        self.workers = max(workers, 1)
+        self.max_recoveries = max_recoveries
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="orchestration-recovery")
+        self._lock = threading.Lock()
+        self._in_flight: set = set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sweep_once(self) -> List[str]:
+        """Claims stale flows and submits them for recovery; returns the claimed ids."""
+        with self._lock:
+            capacity = self.workers - len(self._in_flight)
+        if capacity <= 0:
+            return []
+        claimed = self.mcp.claim_stale_orchestrations(
+            self.leases.owner, self.leases.ttl_s, capacity, self.max_recoveries,
+        )
+        if not claimed:
+            return []
+        self.leases.adopt(claimed)
+        with self._lock:
+            self._in_flight.update(claimed)
+        logging.info(f"Recovering {len(claimed)} orchestrations: {', '.join(claimed)}")
+        for ingestion_id in claimed:
+            self._executor.submit(self._recover, ingestion_id)
+        return claimed
+
+    def _recover(self, ingestion_id: str):
+        try:
+            self.recover_fn(ingestion_id)
+        except Exception as e:
+            logging.error(f"Recovery of orchestration {ingestion_id} failed: {e}")
+            # Let the lease lapse so a later sweep retries, up to max_recoveries.
+            self.leases.abandon(ingestion_id)
+        finally:
+            with self._lock:
+                self._in_flight.discard(ingestion_id)
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.sweep_once()
+            except Exception as e:
+                logging.error(f"Orchestration sweep failed: {e}")
+
+    def start(self) -> "RecoverySweeper":
+        self._thread = threading.Thread(target=self._run, name="orchestration-sweeper", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, wait: bool = False):
+        """Stops sweeping; with `wait`, also waits for the recoveries in progress."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown(wait=wait)
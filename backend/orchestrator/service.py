@@ -1,43 +1,147 @@
+import threading
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from backend.orchestrator.batch import AgentLimits, BatchRun
+from backend.orchestrator.flow.checkpointer import MCPCheckpointSaver
 from backend.orchestrator.flow.graph import build_graph, OrchestrationState
+from backend.orchestrator.recovery import LeaseKeeper, OrchestrationBusy, RecoverySweeper, new_owner_id
 from backend.shared.clients.mcp import MCPClient
 from backend.shared.clients.agents import AgentsClient
+from backend.shared.dependencies.config import get_settings
+
+# Process-wide, so concurrent flows (single requests and batches alike) share each
+# agent's concurrency budget.
+agent_limits = AgentLimits.from_settings(get_settings())
+
+# Most recent batch runs by batch_id, for progress lookups after the stream is gone.
+_batches: OrderedDict = OrderedDict()
+_batches_lock = threading.Lock()
 
 class Clients:
     def __init__(self):
         self.mcp = MCPClient()
         self.agents = AgentsClient()
 
-    def save_state(self, state: dict):
-        ingestion_id = state.get("ingestion_id")
-        if ingestion_id:
-            self.mcp.save_orchestration(ingestion_id, state)
+@lru_cache()
+def get_clients() -> Clients:
+    """Clients shared by every flow; their gRPC channels come from the process-wide registry."""
+    return Clients()
 
-def run_flow(ingestion_id: str) -> dict:
+@lru_cache()
+def get_checkpointer() -> MCPCheckpointSaver:
+    """Records each flow's steps as deltas in the MCP, keyed by ingestion_id."""
+    return MCPCheckpointSaver(
+        get_clients().mcp,
+        OrchestrationState.model_fields,
+        compact_every=get_settings().ORCHESTRATION_COMPACT_EVERY,
+    )
+
+@lru_cache()
+def get_graph():
+    """The orchestration graph, compiled once. Flow state lives in the checkpointer,
+    not in the compiled graph, so concurrent runs can share it."""
+    return build_graph(get_clients(), agent_limits, get_checkpointer())
+
+@lru_cache()
+def get_leases() -> LeaseKeeper:
+    """Leases of the flows running in this process, renewed by a heartbeat thread."""
+    return LeaseKeeper(get_clients().mcp, new_owner_id(), get_settings().ORCHESTRATION_LEASE_TTL_S).start()
+
+@lru_cache()
+def get_sweeper() -> RecoverySweeper:
+    """Resumes flows left behind by a dead orchestrator process; started by the API."""
+    settings = get_settings()
+    return RecoverySweeper(
+        get_clients().mcp,
+        get_leases(),
+        recover_flow,
+        interval_s=settings.ORCHESTRATION_SWEEP_INTERVAL_S,
+        workers=settings.ORCHESTRATION_RECOVERY_WORKERS,
+        max_recoveries=settings.ORCHESTRATION_MAX_RECOVERIES,
+    )
+
+def _config(ingestion_id: str) -> dict:
+    return {"configurable": {"thread_id": ingestion_id}, "recursion_limit": 100}
+
+def _lease(ingestion_id: str):
+    if not get_leases().acquire(ingestion_id):
+        raise OrchestrationBusy(ingestion_id)
+
+def _stream(ingestion_id: str, graph_input: Optional[dict]) -> dict:
+    """Runs the graph for a flow whose lease this process holds.
+
+    The lease is released when the run ends. If the run raises, the lease is
+    abandoned instead, so the sweeper resumes the flow from its last checkpoint.
     """
-    Builds and executes the LangGraph orchestration flow.
+    final_state_data = graph_input or {}
+    try:
+        for final_state_data in get_graph().stream(graph_input, _config(ingestion_id), stream_mode="values"):
+            pass
+    except BaseException:
+        get_leases().abandon(ingestion_id)
+        raise
+    finally:
+        get_checkpointer().compact(ingestion_id)
+    get_leases().release(ingestion_id)
+    return final_state_data
+
+def _fresh_input(ingestion_id: str) -> dict:
+    # A new run_id gives the run's agent calls new idempotency keys.
+    return {"ingestion_id": ingestion_id, "run_id": str(uuid.uuid4())}
+
+def run_flow(ingestion_id: str) -> dict:
     """
-    clients = Clients()
-    graph = build_graph(clients)
+    Executes the LangGraph orchestration flow from the start.
 
-    initial_state = {"ingestion_id": ingestion_id}
+    Any checkpoints of an earlier run for the same ingestion_id are dropped first.
+    Raises OrchestrationBusy if the flow is running in another process.
+    """
+    _lease(ingestion_id)
+    try:
+        get_checkpointer().delete_thread(ingestion_id)
+    except BaseException:
+        get_leases().release(ingestion_id)
+        raise
+    return _stream(ingestion_id, _fresh_input(ingestion_id))
 
-    final_state_data = {}
-    for state_update in graph.stream(initial_state):
-        final_state_data.update(state_update)
-        clients.save_state(final_state_data)
+def resume_after_human_review(ingestion_id: str, decision: dict) -> dict:
+    """
+    Resumes a flow paused for human review from its checkpoint.
 
-    return final_state_data
+    `decision` holds the reviewed fields; with status RESUMING the graph routes the
+    restored state straight to the per-target conversion branches.
+    """
+    _lease(ingestion_id)
+    return _stream(ingestion_id, {**decision, "ingestion_id": ingestion_id, "status": "RESUMING"})
 
-def resume_after_human_review(state: dict) -> dict:
+def recover_flow(ingestion_id: str) -> dict:
     """
-    Resumes the graph from the conversion node after human approval.
+    Resumes a flow claimed by the sweeper (its lease is already held) from its last
+    checkpoint, re-running only the step that was interrupted. Agent calls of that
+    step repeat their idempotency keys, so work the agents finished is not redone.
+    A flow that died before its first checkpoint starts over.
     """
-    clients = Clients()
-    graph = build_graph(clients)
+    snapshot = get_graph().get_state(_config(ingestion_id))
+    if not snapshot.values:
+        return _stream(ingestion_id, _fresh_input(ingestion_id))
+    return _stream(ingestion_id, None)
 
-    final_state_data = state.copy()
-    for state_update in graph.stream(state, {"recursion_limit": 100, "start_node": "conversion"}):
-        final_state_data.update(state_update)
-        clients.save_state(final_state_data)
+def start_batch(ingestion_ids: Iterable[str]) -> BatchRun:
+    """Starts running one flow per ingestion id in the background and returns the run."""
+    settings = get_settings()
+    batch = BatchRun(ingestion_ids, run_flow, max_workers=settings.ORCHESTRATOR_BATCH_WORKERS)
+    with _batches_lock:
+        _batches[batch.batch_id] = batch
+        while len(_batches) > settings.ORCHESTRATOR_BATCH_HISTORY:
+            _, oldest = next(iter(_batches.items()))
+            if not oldest.done:
+                break
+            _batches.popitem(last=False)
+    return batch.start()
 
-    return final_state_data
+def get_batch(batch_id: str) -> Optional[BatchRun]:
+    with _batches_lock:
+        return _batches.get(batch_id)
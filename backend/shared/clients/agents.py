@@ -1,16 +1,29 @@
+from typing import Iterator, List, Optional
+
 import grpc
 from backend.shared.grpc import agent_comm_pb2, agent_comm_pb2_grpc
+from backend.shared.clients.registry import get_channel
 from backend.shared.dependencies.config import get_settings
 
+# gRPC metadata key carrying an idempotency key; agents replay their recorded response
+# for a key they have already answered (backend/agents/common/idempotency.py).
+IDEMPOTENCY_KEY_HEADER = "idempotency-key"
+
+def _idempotency_metadata(idempotency_key: str):
+    """Call metadata that lets the agent replay its recorded response for a repeated key."""
+    return ((IDEMPOTENCY_KEY_HEADER, idempotency_key),) if idempotency_key else None
+
 class AgentsClient:
     def __init__(self):
         settings = get_settings()
 
-        extraction_channel = grpc.insecure_channel(f"{settings.EXTRACTION_AGENT_HOST}:{settings.EXTRACTION_AGENT_PORT}")
-        validation_channel = grpc.insecure_channel(f"{settings.VALIDATION_AGENT_HOST}:{settings.VALIDATION_AGENT_PORT}")
-        report_channel = grpc.insecure_channel(f"{settings.REPORT_AGENT_HOST}:{settings.REPORT_AGENT_PORT}")
-        conversion_channel = grpc.insecure_channel(f"{settings.CONVERSION_AGENT_HOST}:{settings.CONVERSION_AGENT_PORT}")
-        integration_channel = grpc.insecure_channel(f"{settings.INTEGRATION_AGENT_HOST}:{settings.INTEGRATION_AGENT_PORT}")
+        # Channels come from the process-wide registry, so every AgentsClient reuses
+        # the same connections.
+        extraction_channel = get_channel(f"{settings.EXTRACTION_AGENT_HOST}:{settings.EXTRACTION_AGENT_PORT}")
+        validation_channel = get_channel(f"{settings.VALIDATION_AGENT_HOST}:{settings.VALIDATION_AGENT_PORT}")
+        report_channel = get_channel(f"{settings.REPORT_AGENT_HOST}:{settings.REPORT_AGENT_PORT}")
+        conversion_channel = get_channel(f"{settings.CONVERSION_AGENT_HOST}:{settings.CONVERSION_AGENT_PORT}")
+        integration_channel = get_channel(f"{settings.INTEGRATION_AGENT_HOST}:{settings.INTEGRATION_AGENT_PORT}")
 
         self.extraction_stub = agent_comm_pb2_grpc.AgentCommStub(extraction_channel)
         self.validation_stub = agent_comm_pb2_grpc.AgentCommStub(validation_channel)
@@ -18,31 +31,94 @@ class AgentsClient:
         self.conversion_stub = agent_comm_pb2_grpc.AgentCommStub(conversion_channel)
         self.integration_stub = agent_comm_pb2_grpc.AgentCommStub(integration_channel)
 
-    def start_ocr(self, ingestion_id: str, file_url: str, metadata: dict, priority: str = "normal") -> agent_comm_pb2.OCRResponse:
+    def start_ocr(self, ingestion_id: str, file_url: str, metadata: dict, priority: str = "normal", idempotency_key: str = "") -> agent_comm_pb2.OCRResponse:
         ingestion_ref = agent_comm_pb2.IngestionRef(
             ingestion_id=ingestion_id,
             file_url=file_url,
             metadata=metadata,
         )
         request = agent_comm_pb2.OCRRequest(ingestion=ingestion_ref, priority=priority)
-        return self.extraction_stub.StartOCR(request)
+        return self.extraction_stub.StartOCR(request, metadata=_idempotency_metadata(idempotency_key))
 
-    def validate_schema(self, schema_id: str, ruleset: str = "default") -> agent_comm_pb2.ValidateResponse:
+    def validate_schema(self, schema_id: str, ruleset: str = "default", idempotency_key: str = "") -> agent_comm_pb2.ValidateResponse:
         request = agent_comm_pb2.ValidateRequest(schema_id=schema_id, ruleset=ruleset)
-        return self.validation_stub.ValidateSchema(request)
+        return self.validation_stub.ValidateSchema(request, metadata=_idempotency_metadata(idempotency_key))
+
+    def validate_schemas(self, schema_ids: Optional[List[str]] = None, ruleset: str = "default",
+                         created_from: int = 0, created_to: int = 0) -> Iterator[agent_comm_pb2.ValidateBatchResult]:
+        """Validates the given schemas, or all created in [created_from, created_to); yields one result per schema."""
+        request = agent_comm_pb2.ValidateBatchRequest(
+            schema_ids=schema_ids or [], ruleset=ruleset, created_from=created_from, created_to=created_to,
+        )
+        return self.validation_stub.ValidateSchemas(request)
 
-    def generate_report(self, validation_id: str, schema_id: str, user_id: str) -> agent_comm_pb2.ReportResponse:
+    def generate_report(self, validation_id: str, schema_id: str, user_id: str, idempotency_key: str = "") -> agent_comm_pb2.ReportResponse:
         request = agent_comm_pb2.ReportRequest(validation_id=validation_id, schema_id=schema_id, user_id=user_id)
-        return self.report_stub.GenerateReport(request)
+        return self.report_stub.GenerateReport(request, metadata=_idempotency_metadata(idempotency_key))
 
-    def convert_to_tally(self, validation_id: str, dry_run: bool = False) -> agent_comm_pb2.ConvertResponse:
+    def convert_to_tally(self, validation_id: str, dry_run: bool = False, idempotency_key: str = "") -> agent_comm_pb2.ConvertResponse:
         request = agent_comm_pb2.ConvertRequest(validation_id=validation_id, target="tally", dry_run=dry_run)
-        return self.conversion_stub.Convert(request)
+        return self.conversion_stub.Convert(request, metadata=_idempotency_metadata(idempotency_key))
 
-    def convert_to_zoho(self, validation_id: str, dry_run: bool = False) -> agent_comm_pb2.ConvertResponse:
+    def convert_to_zoho(self, validation_id: str, dry_run: bool = False, idempotency_key: str = "") -> agent_comm_pb2.ConvertResponse:
         request = agent_comm_pb2.ConvertRequest(validation_id=validation_id, target="zoho", dry_run=dry_run)
-        return self.conversion_stub.Convert(request)
+        return self.conversion_stub.Convert(request, metadata=_idempotency_metadata(idempotency_key))
 
-    def push_integration(self, conversion_id: str, target: str, credentials_id: str) -> agent_comm_pb2.IntegrationResponse:
+    def push_integration(self, conversion_id: str, target: str, credentials_id: str, idempotency_key: str = "") -> agent_comm_pb2.IntegrationResponse:
         request = agent_comm_pb2.IntegrationRequest(conversion_id=conversion_id, target=target, credentials_id=credentials_id)
-        return self.integration_stub.PushIntegration(request)
+        return self.integration_stub.PushIntegration(request, metadata=_idempotency_metadata(idempotency_key))
+
+
+class AsyncAgentsClient:
+    """grpc.aio variant of AgentsClient for use from asyncio code such as the gateway."""
+
+    def __init__(self):
+        settings = get_settings()
+
+        self.channels = [
+            grpc.aio.insecure_channel(f"{settings.EXTRACTION_AGENT_HOST}:{settings.EXTRACTION_AGENT_PORT}"),
+            grpc.aio.insecure_channel(f"{settings.VALIDATION_AGENT_HOST}:{settings.VALIDATION_AGENT_PORT}"),
+            grpc.aio.insecure_channel(f"{settings.REPORT_AGENT_HOST}:{settings.REPORT_AGENT_PORT}"),
+            grpc.aio.insecure_channel(f"{settings.CONVERSION_AGENT_HOST}:{settings.CONVERSION_AGENT_PORT}"),
+            grpc.aio.insecure_channel(f"{settings.INTEGRATION_AGENT_HOST}:{settings.INTEGRATION_AGENT_PORT}"),
+        ]
+        extraction_channel, validation_channel, report_channel, conversion_channel, integration_channel = self.channels
+
+        self.extraction_stub = agent_comm_pb2_grpc.AgentCommStub(extraction_channel)
+        self.validation_stub = agent_comm_pb2_grpc.AgentCommStub(validation_channel)
+        self.report_stub = agent_comm_pb2_grpc.AgentCommStub(report_channel)
+        self.conversion_stub = agent_comm_pb2_grpc.AgentCommStub(conversion_channel)
+        self.integration_stub = agent_comm_pb2_grpc.AgentCommStub(integration_channel)
+
+    async def start_ocr(self, ingestion_id: str, file_url: str, metadata: dict, priority: str = "normal", idempotency_key: str = "") -> agent_comm_pb2.OCRResponse:
+        ingestion_ref = agent_comm_pb2.IngestionRef(
+            ingestion_id=ingestion_id,
+            file_url=file_url,
+            metadata=metadata,
+        )
+        request = agent_comm_pb2.OCRRequest(ingestion=ingestion_ref, priority=priority)
+        return await self.extraction_stub.StartOCR(request, metadata=_idempotency_metadata(idempotency_key))
+
+    async def validate_schema(self, schema_id: str, ruleset: str = "default", idempotency_key: str = "") -> agent_comm_pb2.ValidateResponse:
+        request = agent_comm_pb2.ValidateRequest(schema_id=schema_id, ruleset=ruleset)
+        return await self.validation_stub.ValidateSchema(request, metadata=_idempotency_metadata(idempotency_key))
+
+    async def generate_report(self, validation_id: str, schema_id: str, user_id: str, idempotency_key: str = "") -> agent_comm_pb2.ReportResponse:
+        request = agent_comm_pb2.ReportRequest(validation_id=validation_id, schema_id=schema_id, user_id=user_id)
+        return await self.report_stub.GenerateReport(request, metadata=_idempotency_metadata(idempotency_key))
+
+    async def convert_to_tally(self, validation_id: str, dry_run: bool = False, idempotency_key: str = "") -> agent_comm_pb2.ConvertResponse:
+        request = agent_comm_pb2.ConvertRequest(validation_id=validation_id, target="tally", dry_run=dry_run)
+        return await self.conversion_stub.Convert(request, metadata=_idempotency_metadata(idempotency_key))
+
+    async def convert_to_zoho(self, validation_id: str, dry_run: bool = False, idempotency_key: str = "") -> agent_comm_pb2.ConvertResponse:
+        request = agent_comm_pb2.ConvertRequest(validation_id=validation_id, target="zoho", dry_run=dry_run)
+        return await self.conversion_stub.Convert(request, metadata=_idempotency_metadata(idempotency_key))
+
+    async def push_integration(self, conversion_id: str, target: str, credentials_id: str, idempotency_key: str = "") -> agent_comm_pb2.IntegrationResponse:
+        request = agent_comm_pb2.IntegrationRequest(conversion_id=conversion_id, target=target, credentials_id=credentials_id)
+        return await self.integration_stub.PushIntegration(request, metadata=_idempotency_metadata(idempotency_key))
+
+    async def close(self):
+        for channel in self.channels:
+            await channel.close()
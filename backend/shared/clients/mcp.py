@@ -1,17 +1,52 @@
+import atexit
+import fcntl
+import glob
 import grpc
 import logging
 import json
+import os
+import queue
+import threading
 import time
-from typing import Optional
+from contextlib import contextmanager
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Iterable, Iterator, List, Optional, Tuple
 
+from google.protobuf import json_format
+
+from backend.mcp.cache import ArtifactCache
 from backend.mcp.grpc import mcp_pb2, mcp_pb2_grpc
+from backend.shared.clients.registry import get_channel
 from backend.shared.dependencies.config import get_settings
 
+def iter_file_chunks(fileobj: BinaryIO, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+    """Yields a file-like object in fixed-size chunks."""
+    chunk_size = chunk_size or get_settings().DOCUMENT_CHUNK_SIZE
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
 class MCPClient:
     def __init__(self):
         settings = get_settings()
-        channel = grpc.insecure_channel(f"{settings.MCP_HOST}:{settings.MCP_PORT}")
-        self.stub = mcp_pb2_grpc.MCPStub(channel)
+        self.stub = mcp_pb2_grpc.MCPStub(get_channel(f"{settings.MCP_HOST}:{settings.MCP_PORT}"))
+        # Pipeline artifacts are write-once, so repeat reads in this process skip the MCP
+        # round trip entirely.
+        self.artifact_cache = ArtifactCache(settings.MCP_CLIENT_CACHE_MAX_BYTES, settings.MCP_CLIENT_CACHE_TTL_S)
+
+    def _save_artifact(self, kind: str, artifact_id: str, rpc, request):
+        response = rpc(request)
+        self.artifact_cache.invalidate(kind, artifact_id)
+        return response
+
+    def _get_artifact(self, kind: str, artifact_id: str, rpc, id_field: str):
+        response = self.artifact_cache.get(kind, artifact_id)
+        if response is None:
+            response = rpc(mcp_pb2.ArtifactReq(id=artifact_id))
+            if response and getattr(response, id_field):
+                self.artifact_cache.put(kind, artifact_id, response)
+        return response
 
     def save_document(self, ingestion_id: str, file_name: str, file_url: Optional[str], metadata: dict, file_bytes: Optional[bytes] = None) -> mcp_pb2.SaveDocResp:
         request = mcp_pb2.SaveDocReq(
@@ -23,7 +58,22 @@ class MCPClient:
         )
         return self.stub.SaveDocument(request)
 
-    def write_metric(self, agent: str, ingestion_id: Optional[str], metrics: dict, metric_ts: Optional[int]):
+    def upload_document(self, ingestion_id: str, file_name: str, file_url: Optional[str], metadata: dict, chunks: Iterable[bytes]) -> mcp_pb2.SaveDocResp:
+        """Streams a document to the MCP chunk by chunk so it never has to fit in one message."""
+        def requests():
+            yield mcp_pb2.UploadDocChunk(header=mcp_pb2.SaveDocReq(
+                ingestion_id=ingestion_id,
+                file_name=file_name,
+                file_url=file_url,
+                metadata=metadata,
+            ))
+            for chunk in chunks:
+                if chunk:
+                    yield mcp_pb2.UploadDocChunk(chunk=chunk)
+
+        return self.stub.UploadDocument(requests())
+
+    def write_metric(self, agent: str, ingestion_id: Optional[str], metrics: dict, metric_ts: Optional[int] = None):
         ts = metric_ts or int(time.time())
         request = mcp_pb2.WriteMetricReq(
             agent=agent,
@@ -33,7 +83,7 @@ class MCPClient:
         )
         self.stub.WriteMetric(request)
 
-    def write_audit(self, agent: str, action: str, reference_id: str, payload: dict, ts: Optional[int]):
+    def write_audit(self, agent: str, action: str, reference_id: str, payload: dict, ts: Optional[int] = None):
         timestamp = ts or int(time.time())
         request = mcp_pb2.WriteAuditReq(
             agent=agent,
@@ -44,10 +94,116 @@ class MCPClient:
         )
         self.stub.WriteAudit(request)
 
+    def write_metrics(self, requests: Iterable[mcp_pb2.WriteMetricReq], timeout: Optional[float] = None) -> mcp_pb2.WriteBatchAck:
+        """Sends a batch of metrics over a single client stream."""
+        return self.stub.WriteMetrics(iter(requests), timeout=timeout)
+
+    def write_audits(self, requests: Iterable[mcp_pb2.WriteAuditReq], timeout: Optional[float] = None) -> mcp_pb2.WriteBatchAck:
+        """Sends a batch of audit events over a single client stream."""
+        return self.stub.WriteAudits(iter(requests), timeout=timeout)
+
     def get_document(self, ingestion_id: str):
         request = mcp_pb2.GetDocReq(ingestion_id=ingestion_id)
         return self.stub.GetDocument(request)
 
+    def download_document(self, ingestion_id: str) -> Tuple[Optional[mcp_pb2.GetDocResp], Iterator[bytes]]:
+        """Opens a streamed download and returns (header, chunk iterator).
+
+        The header is None when the stream is empty. Chunks are pulled from the server lazily.
+        """
+        responses = self.stub.DownloadDocument(mcp_pb2.GetDocReq(ingestion_id=ingestion_id))
+        first = next(responses, None)
+        header = first.header if first is not None and first.WhichOneof("payload") == "header" else None
+        return header, (msg.chunk for msg in responses)
+
+    def download_document_to(self, ingestion_id: str, fileobj: BinaryIO) -> Optional[mcp_pb2.GetDocResp]:
+        """Streams a document into a writable file-like object and returns its header."""
+        header, chunks = self.download_document(ingestion_id)
+        for chunk in chunks:
+            fileobj.write(chunk)
+        return header
+
+    def list_documents(self, status: Optional[str] = None, limit: int = 1000, after: Optional[str] = None) -> mcp_pb2.ListDocumentsResp:
+        request = mcp_pb2.ListDocumentsReq(status=status, limit=limit, after=after)
+        return self.stub.ListDocuments(request)
+
+    def iter_document_ids(self, status: Optional[str] = None, page_size: int = 1000) -> Iterator[str]:
+        """Yields every ingestion id (optionally with the given status), one page at a time."""
+        after = None
+        while True:
+            page = self.list_documents(status, page_size, after)
+            yield from page.ingestion_ids
+            if not page.next_after:
+                return
+            after = page.next_after
+
+    def enqueue_ocr_job(self, ingestion_id: str, file_url: Optional[str], metadata: dict, priority: str = "normal") -> mcp_pb2.OcrJob:
+        request = mcp_pb2.EnqueueOcrJobReq(
+            ingestion_id=ingestion_id,
+            file_url=file_url,
+            metadata=metadata,
+            priority=priority,
+        )
+        return self.stub.EnqueueOcrJob(request)
+
+    def claim_ocr_jobs(self, worker_id: str, max_jobs: int = 1, priorities: Optional[list] = None) -> list:
+        request = mcp_pb2.ClaimOcrJobsReq(worker_id=worker_id, max_jobs=max_jobs, priorities=priorities or [])
+        return list(self.stub.ClaimOcrJobs(request).jobs)
+
+    def complete_ocr_job(self, job_id: str, worker_id: str, ocr_id: str) -> bool:
+        """Returns False if the worker no longer holds the job."""
+        request = mcp_pb2.CompleteOcrJobReq(job_id=job_id, worker_id=worker_id, ocr_id=ocr_id)
+        try:
+            return self.stub.CompleteOcrJob(request).ok
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.FAILED_PRECONDITION:
+                return False
+            raise
+
+    def fail_ocr_job(self, job_id: str, worker_id: str, error: str, retry_delay_s: int = 30) -> bool:
+        """Returns False if the worker no longer holds the job."""
+        request = mcp_pb2.FailOcrJobReq(job_id=job_id, worker_id=worker_id, error=error, retry_delay_s=retry_delay_s)
+        try:
+            return self.stub.FailOcrJob(request).ok
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.FAILED_PRECONDITION:
+                return False
+            raise
+
+    def get_ocr_job(self, ingestion_id: str) -> Optional[mcp_pb2.OcrJob]:
+        request = mcp_pb2.GetDocReq(ingestion_id=ingestion_id)
+        try:
+            return self.stub.GetOcrJob(request)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+
+    def query_llm(self, prompt: str, model: str, options: Optional[dict] = None,
+                  cache_key: str = "", ingestion_id: str = "") -> mcp_pb2.QueryLLMResp:
+        """Queries the MCP's LLM; with a cache_key an equivalent earlier answer is reused.
+        options["provider"] picks an LLM provider other than the MCP's default."""
+        request = mcp_pb2.QueryLLMReq(
+            prompt=prompt,
+            model=model,
+            options={key: str(value) for key, value in (options or {}).items()},
+            cache_key=cache_key,
+            ingestion_id=ingestion_id,
+        )
+        return self.stub.QueryLLM(request)
+
+    def query_llm_stream(self, prompt: str, model: str, options: Optional[dict] = None,
+                         cache_key: str = "", ingestion_id: str = "") -> Iterator[mcp_pb2.QueryLLMChunk]:
+        """Like query_llm, but yields the answer in chunks as the model generates it."""
+        request = mcp_pb2.QueryLLMReq(
+            prompt=prompt,
+            model=model,
+            options={key: str(value) for key, value in (options or {}).items()},
+            cache_key=cache_key,
+            ingestion_id=ingestion_id,
+        )
+        return self.stub.QueryLLMStream(request)
+
     def save_orchestration(self, ingestion_id: str, state: dict):
         request = mcp_pb2.OrchestrationState(
             ingestion_id=ingestion_id,
@@ -62,9 +218,76 @@ class MCPClient:
             return json.loads(response.state_bytes.decode('utf-8'))
         return None
 
+    def append_orchestration_step(self, ingestion_id: str, version: int, state_delta: dict, status: str,
+                                  checkpoint_type: str, checkpoint: bytes) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.OrchestrationStep(
+            ingestion_id=ingestion_id,
+            version=version,
+            state_delta=json.dumps(state_delta).encode('utf-8'),
+            status=status,
+            checkpoint_type=checkpoint_type,
+            checkpoint=checkpoint,
+        )
+        return self.stub.AppendOrchestrationStep(request)
+
+    def compact_orchestration(self, ingestion_id: str, version: int, state: dict, status: str,
+                              checkpoint_type: str, checkpoint: bytes) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.OrchestrationSnapshot(
+            ingestion_id=ingestion_id,
+            version=version,
+            state_bytes=json.dumps(state).encode('utf-8'),
+            status=status,
+            checkpoint_type=checkpoint_type,
+            checkpoint=checkpoint,
+        )
+        return self.stub.CompactOrchestration(request)
+
+    def get_orchestration_checkpoints(self, ingestion_id: str) -> mcp_pb2.OrchestrationCheckpoints:
+        return self.stub.GetOrchestrationCheckpoints(mcp_pb2.GetDocReq(ingestion_id=ingestion_id))
+
+    def delete_orchestration_checkpoints(self, ingestion_id: str) -> mcp_pb2.WriteAck:
+        return self.stub.DeleteOrchestrationCheckpoints(mcp_pb2.GetDocReq(ingestion_id=ingestion_id))
+
+    def acquire_orchestration_lease(self, ingestion_id: str, owner: str, ttl_s: int) -> bool:
+        request = mcp_pb2.OrchestrationLeaseReq(ingestion_id=ingestion_id, owner=owner, ttl_s=ttl_s)
+        return self.stub.AcquireOrchestrationLease(request).acquired
+
+    def renew_orchestration_leases(self, owner: str, ingestion_ids: List[str], ttl_s: int) -> mcp_pb2.WriteBatchAck:
+        request = mcp_pb2.RenewOrchestrationLeasesReq(owner=owner, ingestion_ids=ingestion_ids, ttl_s=ttl_s)
+        return self.stub.RenewOrchestrationLeases(request)
+
+    def release_orchestration_lease(self, ingestion_id: str, owner: str) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.OrchestrationLeaseReq(ingestion_id=ingestion_id, owner=owner)
+        return self.stub.ReleaseOrchestrationLease(request)
+
+    def claim_stale_orchestrations(self, owner: str, ttl_s: int, limit: int, max_recoveries: int) -> List[str]:
+        request = mcp_pb2.ClaimStaleOrchestrationsReq(
+            owner=owner, ttl_s=ttl_s, limit=limit, max_recoveries=max_recoveries,
+        )
+        return list(self.stub.ClaimStaleOrchestrations(request).ingestion_ids)
+
+    def get_idempotency_record(self, key: str) -> Optional[bytes]:
+        """Returns the serialized response recorded for `key`, or None."""
+        response = self.stub.GetIdempotencyRecord(mcp_pb2.ArtifactReq(id=key))
+        return response.response if response.key else None
+
+    def save_idempotency_record(self, key: str, agent: str, response: bytes) -> mcp_pb2.WriteAck:
+        return self.stub.SaveIdempotencyRecord(mcp_pb2.IdempotencyRecord(key=key, agent=agent, response=response))
+
+    def save_ocr_output(self, ocr_id: str, ingestion_id: str, raw_text: str, detected_fields: dict,
+                        confidence: float, status: str) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.OcrOutput(
+            ocr_id=ocr_id,
+            ingestion_id=ingestion_id,
+            raw_text=raw_text,
+            detected_fields=json.dumps(detected_fields).encode('utf-8'),
+            confidence=confidence,
+            status=status,
+        )
+        return self._save_artifact("ocr_output", ocr_id, self.stub.SaveOcrOutput, request)
+
     def get_ocr_output(self, ocr_id: str):
-        request = mcp_pb2.GetDocReq(ingestion_id=ocr_id)
-        response = self.stub.GetOcrOutput(request)
+        response = self._get_artifact("ocr_output", ocr_id, self.stub.GetOcrOutput, "ocr_id")
         if response and response.ocr_id:
             return {
                 "ocr_id": response.ocr_id,
@@ -76,9 +299,17 @@ class MCPClient:
             }
         return None
 
+    def save_mapped_schema(self, schema_id: str, ocr_id: str, mapped_data: dict, mapping_confidence: float = 0.0) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.MappedSchema(
+            schema_id=schema_id,
+            ocr_id=ocr_id,
+            mapped_data=json.dumps(mapped_data).encode('utf-8'),
+            mapping_confidence=mapping_confidence,
+        )
+        return self._save_artifact("mapped_schema", schema_id, self.stub.SaveMappedSchema, request)
+
     def get_mapped_schema(self, schema_id: str):
-        request = mcp_pb2.GetDocReq(ingestion_id=schema_id)
-        response = self.stub.GetMappedSchema(request)
+        response = self._get_artifact("mapped_schema", schema_id, self.stub.GetMappedSchema, "schema_id")
         if response and response.schema_id:
             return {
                 "schema_id": response.schema_id,
@@ -88,9 +319,18 @@ class MCPClient:
             }
         return None
 
+    def save_validation_logs(self, validation_id: str, schema_id: str, status: str, errors: list, warnings: list) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.ValidationLogs(
+            validation_id=validation_id,
+            schema_id=schema_id,
+            status=status,
+            errors=json.dumps(errors).encode('utf-8'),
+            warnings=json.dumps(warnings).encode('utf-8'),
+        )
+        return self._save_artifact("validation_logs", validation_id, self.stub.SaveValidationLogs, request)
+
     def get_validation_logs(self, validation_id: str):
-        request = mcp_pb2.GetDocReq(ingestion_id=validation_id)
-        response = self.stub.GetValidationLogs(request)
+        response = self._get_artifact("validation_logs", validation_id, self.stub.GetValidationLogs, "validation_id")
         if response and response.validation_id:
             return {
                 "validation_id": response.validation_id,
@@ -100,3 +340,411 @@ class MCPClient:
                 "warnings": json.loads(response.warnings.decode('utf-8')),
             }
         return None
+
+    def stream_mapped_schemas(self, schema_ids: Optional[List[str]] = None, created_from: int = 0,
+                              created_to: int = 0) -> Iterator[mcp_pb2.MappedSchema]:
+        """Streams the given mapped schemas, or all created in [created_from, created_to).
+
+        Messages are yielded as they arrive with mapped_data still JSON-encoded, so bulk
+        callers can decode it where they process it.
+        """
+        request = mcp_pb2.StreamMappedSchemasReq(schema_ids=schema_ids or [], created_from=created_from, created_to=created_to)
+        return self.stub.StreamMappedSchemas(request)
+
+    def save_validation_results(self, results: Iterable[mcp_pb2.ValidationResult], timeout: Optional[float] = None) -> mcp_pb2.WriteBatchAck:
+        """Sends validation logs and their warnings over a single client stream; the MCP
+        saves them in one bulk write."""
+        return self.stub.SaveValidationResults(iter(results), timeout=timeout)
+
+    def save_conversion_log(self, conversion_id: str, validation_id: str, target: str, output: str,
+                            status: str, artifact_url: Optional[str] = None) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.ConversionLog(
+            conversion_id=conversion_id,
+            validation_id=validation_id,
+            target=target,
+            output=output,
+            artifact_url=artifact_url,
+            status=status,
+        )
+        return self._save_artifact("conversion_log", conversion_id, self.stub.SaveConversionLog, request)
+
+    def get_conversion_log(self, conversion_id: str):
+        response = self._get_artifact("conversion_log", conversion_id, self.stub.GetConversionLog, "conversion_id")
+        if response and response.conversion_id:
+            return {
+                "conversion_id": response.conversion_id,
+                "validation_id": response.validation_id,
+                "target": response.target,
+                "output": response.output,
+                "artifact_url": response.artifact_url,
+                "status": response.status,
+            }
+        return None
+
+    def save_integration_log(self, integration_id: str, conversion_id: str, target: str, status: str,
+                             retry: int = 0, platform_response: Optional[str] = None,
+                             platform_status_code: Optional[int] = None, last_attempt_at: Optional[int] = None,
+                             next_retry_at: Optional[int] = None) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.IntegrationLog(
+            integration_id=integration_id,
+            conversion_id=conversion_id,
+            target=target,
+            platform_response=platform_response,
+            status=status,
+            retry=retry,
+            platform_status_code=platform_status_code,
+            last_attempt_at=last_attempt_at,
+            next_retry_at=next_retry_at,
+        )
+        return self._save_artifact("integration_log", integration_id, self.stub.SaveIntegrationLog, request)
+
+    def get_integration_log(self, integration_id: str):
+        response = self._get_artifact("integration_log", integration_id, self.stub.GetIntegrationLog, "integration_id")
+        if response and response.integration_id:
+            return {
+                "integration_id": response.integration_id,
+                "conversion_id": response.conversion_id,
+                "target": response.target,
+                "platform_response": response.platform_response,
+                "status": response.status,
+                "retry": response.retry,
+                "platform_status_code": response.platform_status_code,
+                "last_attempt_at": response.last_attempt_at or None,
+                "next_retry_at": response.next_retry_at or None,
+            }
+        return None
+
+    def save_report(self, report_id: str, validation_id: str, status: str, summary: dict,
+                    schema_id: Optional[str] = None, user_id: Optional[str] = None,
+                    report_url: Optional[str] = None) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.Report(
+            report_id=report_id,
+            validation_id=validation_id,
+            schema_id=schema_id,
+            user_id=user_id,
+            status=status,
+            summary=json.dumps(summary).encode('utf-8'),
+            report_url=report_url,
+        )
+        return self._save_artifact("report", report_id, self.stub.SaveReport, request)
+
+    def get_report(self, report_id: str):
+        response = self._get_artifact("report", report_id, self.stub.GetReport, "report_id")
+        if response and response.report_id:
+            return {
+                "report_id": response.report_id,
+                "validation_id": response.validation_id,
+                "schema_id": response.schema_id,
+                "user_id": response.user_id,
+                "status": response.status,
+                "summary": json.loads(response.summary.decode('utf-8')),
+                "report_url": response.report_url,
+            }
+        return None
+
+    def save_warning(self, warning_id: str, field_name: str, severity: str, message: str,
+                     ingestion_id: Optional[str] = None, validation_id: Optional[str] = None,
+                     suggested_fix: Optional[dict] = None) -> mcp_pb2.WriteAck:
+        request = mcp_pb2.WarningLog(
+            warning_id=warning_id,
+            ingestion_id=ingestion_id,
+            validation_id=validation_id,
+            field_name=field_name,
+            severity=severity,
+            message=message,
+            suggested_fix=json.dumps(suggested_fix).encode('utf-8') if suggested_fix is not None else b"",
+        )
+        return self.stub.SaveWarning(request)
+
+
+@contextmanager
+def _locked_spill_file(path: str, mode: str):
+    """Opens a spill file holding an exclusive flock on it. If a replayer removed the
+    file while we waited for the lock, the file at `path` is opened again."""
+    while True:
+        f = open(path, mode, encoding="utf-8")
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            if os.fstat(f.fileno()).st_ino == os.stat(path).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        f.close()
+    try:
+        yield f
+    finally:
+        f.close()
+
+class TelemetrySender:
+    """Fire-and-forget metrics and audit events.
+
+    `write_metric`/`write_audit` only enqueue the event. A background thread ships
+    queued events in batches, one WriteMetrics/WriteAudits stream per batch, so agent
+    latency does not depend on the MCP or the database. When the queue is full or a
+    batch cannot be delivered, events are appended to this process's JSON-lines spill
+    file; without a spill directory they are dropped. Once the MCP is reachable, every
+    spill file in the directory is replayed, so events spilled before a restart, or by
+    another agent sharing the directory, are delivered too.
+    """
+
+    def __init__(
+        self,
+        mcp_client: MCPClient,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_s: Optional[float] = None,
+        spill_dir: Optional[str] = None,
+        max_spill_bytes: Optional[int] = None,
+        rpc_timeout_s: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.mcp_client = mcp_client
+        self.batch_size = batch_size or settings.TELEMETRY_BATCH_SIZE
+        self.flush_interval_s = flush_interval_s or settings.TELEMETRY_FLUSH_INTERVAL_S
+        self.rpc_timeout_s = rpc_timeout_s or settings.TELEMETRY_RPC_TIMEOUT_S
+        self.max_spill_bytes = max_spill_bytes or settings.TELEMETRY_MAX_SPILL_BYTES
+        self.spill_dir = spill_dir or settings.TELEMETRY_SPILL_DIR
+        self.spill_path = None
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            self.spill_path = os.path.join(self.spill_dir, f"telemetry-{os.getpid()}.jsonl")
+
+        self._queue = queue.Queue(maxsize=max_queue_size or settings.TELEMETRY_QUEUE_SIZE)
+        self._spill_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._replay_after = 0.0
+        self.sent = 0
+        self.spilled = 0
+        self.dropped = 0
+
+        self._thread = threading.Thread(target=self._run, name="telemetry-sender", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write_metric(self, agent: str, ingestion_id: Optional[str], metrics: dict, metric_ts: Optional[int] = None):
+        self._enqueue(mcp_pb2.WriteMetricReq(
+            agent=agent,
+            ingestion_id=ingestion_id,
+            metric_json=json.dumps(metrics),
+            metric_ts=metric_ts or int(time.time()),
+        ))
+
+    def write_audit(self, agent: str, action: str, reference_id: str, payload: dict, ts: Optional[int] = None):
+        self._enqueue(mcp_pb2.WriteAuditReq(
+            agent=agent,
+            action=action,
+            reference_id=reference_id,
+            payload_json=json.dumps(payload),
+            ts=ts or int(time.time()),
+        ))
+
+    def close(self, timeout: Optional[float] = None):
+        """Sends (or spills) everything still queued and stops the sender thread."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def stats(self) -> dict:
+        return {"queued": self._queue.qsize(), "sent": self.sent, "spilled": self.spilled, "dropped": self.dropped}
+
+    def _enqueue(self, event):
+        if self._closed.is_set():
+            self._spill([event])
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self._spill([event])
+
+    def _next_batch(self) -> list:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval_s)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if batch:
+                if self._send(batch) and not self._closed.is_set():
+                    self._replay_spill()
+            elif not self._closed.is_set():
+                self._replay_spill()
+
+    def _send(self, batch: list) -> bool:
+        """Ships a batch, spilling whatever could not be delivered. Returns True if all of it went out."""
+        metrics = [e for e in batch if isinstance(e, mcp_pb2.WriteMetricReq)]
+        audits = [e for e in batch if isinstance(e, mcp_pb2.WriteAuditReq)]
+        delivered = True
+        for events, send in ((metrics, self.mcp_client.write_metrics), (audits, self.mcp_client.write_audits)):
+            if not events:
+                continue
+            try:
+                send(events, timeout=self.rpc_timeout_s)
+                self.sent += len(events)
+            except grpc.RpcError as e:
+                logging.warning(f"Telemetry batch of {len(events)} events not delivered: {e.code()}")
+                self._spill(events)
+                self._replay_after = time.monotonic() + self.rpc_timeout_s
+                delivered = False
+        return delivered
+
+    def _spill(self, events: list):
+        if not events:
+            return
+        if not self.spill_path:
+            self.dropped += len(events)
+            return
+        lines = [
+            json.dumps({
+                "type": "metric" if isinstance(event, mcp_pb2.WriteMetricReq) else "audit",
+                "event": json_format.MessageToDict(event, preserving_proto_field_name=True),
+            }) + "\n"
+            for event in events
+        ]
+        with self._spill_lock, _locked_spill_file(self.spill_path, "a") as f:
+            if os.fstat(f.fileno()).st_size >= self.max_spill_bytes:
+                self.dropped += len(events)
+                return
+            f.writelines(lines)
+            self.spilled += len(events)
+
+    def _replay_spill(self):
+        if not self.spill_dir or time.monotonic() < self._replay_after:
+            return
+        events = []
+        # Taking the file's lock waits out a writer mid-append; removing it under the
+        # lock makes the next writer start a new file.
+        for path in glob.glob(os.path.join(self.spill_dir, "telemetry-*.jsonl")):
+            try:
+                with _locked_spill_file(path, "r") as f:
+                    for line in f:
+                        record = json.loads(line)
+                        message = mcp_pb2.WriteMetricReq() if record["type"] == "metric" else mcp_pb2.WriteAuditReq()
+                        events.append(json_format.ParseDict(record["event"], message))
+                    os.unlink(path)
+            except FileNotFoundError:
+                continue
+        if not events:
+            return
+
+        logging.info(f"Replaying {len(events)} spilled telemetry events")
+        for i in range(0, len(events), self.batch_size):
+            # A failed batch is spilled again by _send; keep the rest for a later replay.
+            if not self._send(events[i:i + self.batch_size]):
+                self._spill(events[i + self.batch_size:])
+                break
+
+
+class AsyncMCPClient:
+    """grpc.aio variant of MCPClient for use from asyncio code such as the gateway.
+
+    Calls never block the event loop. The channel is bound to the running loop, so create
+    the client from inside that loop and close it with `await client.close()`.
+    """
+
+    def __init__(self):
+        settings = get_settings()
+        self.channel = grpc.aio.insecure_channel(f"{settings.MCP_HOST}:{settings.MCP_PORT}")
+        self.stub = mcp_pb2_grpc.MCPStub(self.channel)
+
+    async def save_document(self, ingestion_id: str, file_name: str, file_url: Optional[str], metadata: dict, file_bytes: Optional[bytes] = None) -> mcp_pb2.SaveDocResp:
+        request = mcp_pb2.SaveDocReq(
+            ingestion_id=ingestion_id,
+            file_name=file_name,
+            file_url=file_url,
+            metadata=metadata,
+            file_bytes=file_bytes,
+        )
+        return await self.stub.SaveDocument(request)
+
+    async def upload_document(self, ingestion_id: str, file_name: str, file_url: Optional[str], metadata: dict, chunks: AsyncIterable[bytes]) -> mcp_pb2.SaveDocResp:
+        """Streams a document to the MCP from an async iterator of chunks."""
+        async def requests():
+            yield mcp_pb2.UploadDocChunk(header=mcp_pb2.SaveDocReq(
+                ingestion_id=ingestion_id,
+                file_name=file_name,
+                file_url=file_url,
+                metadata=metadata,
+            ))
+            async for chunk in chunks:
+                if chunk:
+                    yield mcp_pb2.UploadDocChunk(chunk=chunk)
+
+        return await self.stub.UploadDocument(requests())
+
+    async def write_metric(self, agent: str, ingestion_id: Optional[str], metrics: dict, metric_ts: Optional[int] = None):
+        ts = metric_ts or int(time.time())
+        request = mcp_pb2.WriteMetricReq(
+            agent=agent,
+            ingestion_id=ingestion_id,
+            metric_json=json.dumps(metrics),
+            metric_ts=ts,
+        )
+        await self.stub.WriteMetric(request)
+
+    async def write_audit(self, agent: str, action: str, reference_id: str, payload: dict, ts: Optional[int] = None):
+        timestamp = ts or int(time.time())
+        request = mcp_pb2.WriteAuditReq(
+            agent=agent,
+            action=action,
+            reference_id=reference_id,
+            payload_json=json.dumps(payload),
+            ts=timestamp,
+        )
+        await self.stub.WriteAudit(request)
+
+    async def get_document(self, ingestion_id: str):
+        request = mcp_pb2.GetDocReq(ingestion_id=ingestion_id)
+        return await self.stub.GetDocument(request)
+
+    async def download_document(self, ingestion_id: str) -> Tuple[Optional[mcp_pb2.GetDocResp], AsyncIterator[bytes]]:
+        """Opens a streamed download and returns (header, async chunk iterator)."""
+        call = self.stub.DownloadDocument(mcp_pb2.GetDocReq(ingestion_id=ingestion_id))
+        first = await call.read()
+        header = None
+        if first is not grpc.aio.EOF and first.WhichOneof("payload") == "header":
+            header = first.header
+
+        async def chunks():
+            # The iterator API may not be mixed with read() on one call.
+            while (msg := await call.read()) is not grpc.aio.EOF:
+                yield msg.chunk
+
+        return header, chunks()
+
+    async def enqueue_ocr_job(self, ingestion_id: str, file_url: Optional[str], metadata: dict, priority: str = "normal") -> mcp_pb2.OcrJob:
+        request = mcp_pb2.EnqueueOcrJobReq(
+            ingestion_id=ingestion_id,
+            file_url=file_url,
+            metadata=metadata,
+            priority=priority,
+        )
+        return await self.stub.EnqueueOcrJob(request)
+
+    async def get_ocr_job(self, ingestion_id: str) -> Optional[mcp_pb2.OcrJob]:
+        request = mcp_pb2.GetDocReq(ingestion_id=ingestion_id)
+        try:
+            return await self.stub.GetOcrJob(request)
+        except grpc.aio.AioRpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+
+    async def get_orchestration(self, ingestion_id: str):
+        request = mcp_pb2.GetDocReq(ingestion_id=ingestion_id)
+        response = await self.stub.GetOrchestration(request)
+        if response and response.ingestion_id:
+            return json.loads(response.state_bytes.decode('utf-8'))
+        return None
+
+    async def close(self):
+        await self.channel.close()
@@ -0,0 +1,95 @@
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+import grpc
+
+from backend.shared.dependencies.config import get_settings
+
+def channel_options(settings=None) -> list:
+    """Client keepalive: idle channels are pinged so dead connections are noticed
+    (and re-dialled) before the next RPC instead of failing it."""
+    settings = settings or get_settings()
+    return [
+        ("grpc.keepalive_time_ms", settings.GRPC_KEEPALIVE_TIME_MS),
+        ("grpc.keepalive_timeout_ms", settings.GRPC_KEEPALIVE_TIMEOUT_MS),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+    ]
+
+def server_options(settings=None) -> list:
+    """Server side of channel_options: accept keepalive pings from idle clients."""
+    settings = settings or get_settings()
+    return [
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.min_recv_ping_interval_without_data_ms", settings.GRPC_MIN_PING_INTERVAL_MS),
+    ]
+
+class ChannelRegistry:
+    """Process-wide pool of gRPC channels, one pool per target address.
+
+    A channel multiplexes concurrent RPCs over one HTTP/2 connection and is thread
+    safe, so clients share channels instead of dialling a new connection per request.
+    With `pool_size` > 1 a target gets several channels handed out round robin, which
+    spreads heavy concurrent traffic over more than one connection.
+    """
+
+    def __init__(self, pool_size: int = 1, options: Optional[list] = None):
+        self.pool_size = max(pool_size, 1)
+        self.options = options or []
+        self._lock = threading.Lock()
+        self._pools: Dict[str, List[grpc.Channel]] = {}
+        self._cursors: Dict[str, itertools.cycle] = {}
+
+    def get_channel(self, target: str) -> grpc.Channel:
+        with self._lock:
+            if target not in self._pools:
+                pool = [grpc.insecure_channel(target, options=self.options) for _ in range(self.pool_size)]
+                self._pools[target] = pool
+                self._cursors[target] = itertools.cycle(pool)
+            return next(self._cursors[target])
+
+    def check_health(self, timeout_s: float = 1.0) -> dict:
+        """Tries to connect every pooled channel, all at once, waiting at most
+        `timeout_s` overall; returns {target: "READY" | "UNAVAILABLE"}."""
+        with self._lock:
+            pools = dict(self._pools)
+        futures = {target: [grpc.channel_ready_future(channel) for channel in pool] for target, pool in pools.items()}
+        deadline = time.monotonic() + timeout_s
+        health = {}
+        for target, ready in futures.items():
+            try:
+                for future in ready:
+                    future.result(timeout=max(deadline - time.monotonic(), 0))
+                health[target] = "READY"
+            except grpc.FutureTimeoutError:
+                logging.warning(f"gRPC target {target} is not reachable")
+                health[target] = "UNAVAILABLE"
+            finally:
+                for future in ready:
+                    future.cancel()
+        return health
+
+    def close(self):
+        with self._lock:
+            pools, self._pools, self._cursors = self._pools, {}, {}
+        for pool in pools.values():
+            for channel in pool:
+                channel.close()
+
+_registry: Optional[ChannelRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_channel_registry() -> ChannelRegistry:
+    """Returns the process-wide ChannelRegistry, created from Settings on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            settings = get_settings()
+            _registry = ChannelRegistry(settings.GRPC_CHANNEL_POOL_SIZE, channel_options(settings))
+        return _registry
+
+def get_channel(target: str) -> grpc.Channel:
+    return get_channel_registry().get_channel(target)
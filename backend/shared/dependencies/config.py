@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -27,6 +28,112 @@ class Settings(BaseSettings):
     INTEGRATION_AGENT_HOST: str = "localhost"
     INTEGRATION_AGENT_PORT: int = 6006
 
+    # Shared gRPC channels (backend/shared/clients/registry.py): one pool of
+    # GRPC_CHANNEL_POOL_SIZE long-lived channels per target, pinged every
+    # GRPC_KEEPALIVE_TIME_MS while idle. Servers accept pings no more often than
+    # GRPC_MIN_PING_INTERVAL_MS, so keep it at or below the keepalive time.
+    GRPC_CHANNEL_POOL_SIZE: int = 1
+    GRPC_KEEPALIVE_TIME_MS: int = 60000
+    GRPC_KEEPALIVE_TIMEOUT_MS: int = 20000
+    GRPC_MIN_PING_INTERVAL_MS: int = 30000
+    GRPC_HEALTH_CHECK_TIMEOUT_S: float = 1.0
+
+    # Orchestrator batch runs: flows run concurrently on ORCHESTRATOR_BATCH_WORKERS
+    # threads, and each agent accepts at most *_AGENT_MAX_CONCURRENCY calls at a time
+    # across all flows in the orchestrator process (0 = unlimited)
+    ORCHESTRATOR_BATCH_WORKERS: int = 16
+    ORCHESTRATOR_BATCH_HISTORY: int = 100
+    EXTRACTION_AGENT_MAX_CONCURRENCY: int = 4
+    MAPPING_AGENT_MAX_CONCURRENCY: int = 8
+    VALIDATION_AGENT_MAX_CONCURRENCY: int = 8
+    REPORT_AGENT_MAX_CONCURRENCY: int = 8
+    CONVERSION_AGENT_MAX_CONCURRENCY: int = 8
+    INTEGRATION_AGENT_MAX_CONCURRENCY: int = 8
+
+    # Orchestration checkpoints: each graph step is stored as a delta, folded into a
+    # full snapshot every ORCHESTRATION_COMPACT_EVERY steps and when a run ends
+    ORCHESTRATION_COMPACT_EVERY: int = 16
+
+    # Crash recovery (backend/orchestrator/recovery.py): a running flow holds a lease
+    # renewed every third of ORCHESTRATION_LEASE_TTL_S. Every
+    # ORCHESTRATION_SWEEP_INTERVAL_S the sweeper claims flows whose lease lapsed and
+    # resumes them from their checkpoint on ORCHESTRATION_RECOVERY_WORKERS threads,
+    # giving up on a flow after ORCHESTRATION_MAX_RECOVERIES attempts
+    ORCHESTRATION_LEASE_TTL_S: int = 60
+    ORCHESTRATION_SWEEPER_ENABLED: bool = True
+    ORCHESTRATION_SWEEP_INTERVAL_S: float = 30.0
+    ORCHESTRATION_RECOVERY_WORKERS: int = 4
+    ORCHESTRATION_MAX_RECOVERIES: int = 3
+
+    # LLM used by the extraction agent to turn OCR text into the invoice schema. When
+    # streaming, header fields are checked as soon as the model has produced them.
+    EXTRACTION_LLM_MODEL: str = "fake-model"
+    EXTRACTION_LLM_STREAMING: bool = True
+
+    # Validation rulesets: YAML/JSON files in VALIDATION_RULESETS_DIR (default: the
+    # validation agent's bundled rulesets/), checked for changes every
+    # VALIDATION_RULES_RELOAD_INTERVAL_S (0 = never reload)
+    VALIDATION_RULESETS_DIR: Optional[str] = None
+    VALIDATION_RULES_RELOAD_INTERVAL_S: float = 5.0
+    # Vendor master snapshot (built with `python -m backend.agents.common.vendor_index`)
+    # used by the vendor_known and vendor_name checks, which pass everything when unset.
+    # A replaced snapshot is picked up on the same interval as the rulesets
+    VALIDATION_VENDOR_INDEX: Optional[str] = None
+    # HSN/SAC master dataset (CSV of code, description and rates) used by the hsn_known
+    # and hsn_tax_rate checks, which pass everything when unset. A new version of the
+    # file is loaded in full and swapped in on the same interval
+    VALIDATION_HSN_MASTER: Optional[str] = None
+    # ValidateSchemas validates VALIDATION_BATCH_CHUNK_SIZE schemas at a time on
+    # VALIDATION_BATCH_WORKERS processes (0 = one per available core) and saves each
+    # chunk's results in one bulk write
+    VALIDATION_BATCH_WORKERS: int = 0
+    VALIDATION_BATCH_CHUNK_SIZE: int = 200
+
+    # Chunk size used when streaming documents to and from the MCP
+    DOCUMENT_CHUNK_SIZE: int = 1024 * 1024
+
+    # OCR job queue ("mcp" = Postgres-backed via the MCP, "memory" = in-process)
+    OCR_JOB_QUEUE_BACKEND: str = "mcp"
+    OCR_WORKERS: int = 4
+    OCR_WORKER_POLL_INTERVAL_S: float = 1.0
+    OCR_JOB_RETRY_DELAY_S: int = 30
+
+    # OCR engine cascade (backend/shared/services/ocr.py): engines are tried in
+    # OCR_ENGINES order until one reaches OCR_CONFIDENCE_THRESHOLD. Each gets
+    # OCR_ENGINE_TIMEOUT_S unless overridden in OCR_ENGINE_TIMEOUTS
+    # ("typhoon=20,tesseract=60"). Engines without credentials or not installed are
+    # skipped; "stub" returns fixed text so development works without any of them
+    OCR_ENGINES: str = "typhoon,gpt4v,azure,tesseract,easyocr,stub"
+    OCR_CONFIDENCE_THRESHOLD: float = 0.8
+    OCR_ENGINE_TIMEOUT_S: float = 30.0
+    OCR_ENGINE_TIMEOUTS: str = ""
+    OCR_PDF_DPI: int = 300
+    # Worker processes rendering and OCRing the pages of a document in parallel
+    # (tesseract engine); 0 = one per available core
+    OCR_PAGE_WORKERS: int = 0
+    OCR_TESSERACT_LANG: str = "eng"
+    OCR_EASYOCR_LANGS: str = "en"
+    OCR_TYPHOON_API_BASE: str = "https://api.opentyphoon.ai/v1"
+    OCR_TYPHOON_API_KEY: Optional[str] = None
+    OCR_TYPHOON_MODEL: str = "typhoon-ocr-preview"
+    OCR_OPENAI_API_BASE: str = "https://api.openai.com/v1"
+    OCR_OPENAI_API_KEY: Optional[str] = None
+    OCR_OPENAI_MODEL: str = "gpt-4o"
+    OCR_AZURE_ENDPOINT: Optional[str] = None
+    OCR_AZURE_API_KEY: Optional[str] = None
+
+    # Background telemetry sender used by the agents for metrics and audit events
+    TELEMETRY_QUEUE_SIZE: int = 10000
+    TELEMETRY_BATCH_SIZE: int = 200
+    TELEMETRY_FLUSH_INTERVAL_S: float = 1.0
+    TELEMETRY_RPC_TIMEOUT_S: float = 5.0
+    TELEMETRY_SPILL_DIR: Optional[str] = None
+    TELEMETRY_MAX_SPILL_BYTES: int = 64 * 1024 * 1024
+
+    # In-process cache of write-once artifacts fetched through MCPClient (0 disables)
+    MCP_CLIENT_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+    MCP_CLIENT_CACHE_TTL_S: float = 300.0
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding='utf-8', extra='ignore')
 
 @lru_cache()
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x61gent_comm.proto\x12\x05\x61gent\"\x9c\x01\n\x0cIngestionRef\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ile_url\x18\x02 \x01(\t\x12\x33\n\x08metadata\x18\x03 \x03(\x0b\x32!.agent.IngestionRef.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"F\n\nOCRRequest\x12&\n\tingestion\x18\x01 \x01(\x0b\x32\x13.agent.IngestionRef\x12\x10\n\x08priority\x18\x02 \x01(\t\">\n\x0bOCRResponse\x12\x0e\n\x06ocr_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"\x1c\n\nMapRequest\x12\x0e\n\x06ocr_id\x18\x01 \x01(\t\"L\n\x0bMapResponse\x12\x11\n\tschema_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x1a\n\x12mapped_schema_json\x18\x03 \x01(\t\"5\n\x0fValidateRequest\x12\x11\n\tschema_id\x18\x01 \x01(\t\x12\x0f\n\x07ruleset\x18\x02 \x01(\t\"Z\n\x10ValidateResponse\x12\x15\n\rvalidation_id\x18\x01 \x01(\t\x12\r\n\x05valid\x18\x02 \x01(\x08\x12\x0e\n\x06\x65rrors\x18\x03 \x03(\t\x12\x10\n\x08warnings\x18\x04 \x03(\t\"J\n\rReportRequest\x12\x15\n\rvalidation_id\x18\x01 \x01(\t\x12\x11\n\tschema_id\x18\x02 \x01(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\t\"3\n\x0eReportResponse\x12\x11\n\treport_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\"H\n\x0e\x43onvertRequest\x12\x15\n\rvalidation_id\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t\x12\x0f\n\x07\x64ry_run\x18\x03 \x01(\x08\"N\n\x0f\x43onvertResponse\x12\x15\n\rconversion_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x14\n\x0c\x61rtifact_url\x18\x03 \x01(\t\"S\n\x12IntegrationRequest\x12\x15\n\rconversion_id\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t\x12\x16\n\x0e\x63redentials_id\x18\x03 \x01(\t\"=\n\x13IntegrationResponse\x12\x16\n\x0eintegration_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\"g\n\nAgentEvent\x12\r\n\x05\x61gent\x18\x01 \x01(\t\x12\x12\n\nevent_type\x18\x02 \x01(\t\x12\x14\n\x0creference_id\x18\x03 \x01(\t\x12\x14\n\x0cpayload_json\x18\x04 \x01(\t\x12\n\n\x02ts\x18\x05 \x01(\x03\"+\n\x08\x41gentAck\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t2\xaf\x03\n\tAgentComm\x12\x31\n\x08StartOCR\x12\x11.agent.OCRRequest\x1a\x12.agent.OCRResponse\x12\x32\n\tMapSchema\x12\x11.agent.MapRequest\x1a\x12.agent.MapResponse\x12\x41\n\x0eValidateSchema\x12\x16.agent.ValidateRequest\x1a\x17.agent.ValidateResponse\x12=\n\x0eGenerateReport\x12\x14.agent.ReportRequest\x1a\x15.agent.ReportResponse\x12\x38\n\x07\x43onvert\x12\x15.agent.ConvertRequest\x1a\x16.agent.ConvertResponse\x12H\n\x0fPushIntegration\x12\x19.agent.IntegrationRequest\x1a\x1a.agent.IntegrationResponse\x12\x35\n\x0b\x45ventStream\x12\x11.agent.AgentEvent\x1a\x0f.agent.AgentAck(\x01\x30\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x61gent_comm.proto\x12\x05\x61gent\"\x9c\x01\n\x0cIngestionRef\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ile_url\x18\x02 \x01(\t\x12\x33\n\x08metadata\x18\x03 \x03(\x0b\x32!.agent.IngestionRef.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"F\n\nOCRRequest\x12&\n\tingestion\x18\x01 \x01(\x0b\x32\x13.agent.IngestionRef\x12\x10\n\x08priority\x18\x02 \x01(\t\">\n\x0bOCRResponse\x12\x0e\n\x06ocr_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"\x1c\n\nMapRequest\x12\x0e\n\x06ocr_id\x18\x01 \x01(\t\"L\n\x0bMapResponse\x12\x11\n\tschema_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x1a\n\x12mapped_schema_json\x18\x03 \x01(\t\"5\n\x0fValidateRequest\x12\x11\n\tschema_id\x18\x01 \x01(\t\x12\x0f\n\x07ruleset\x18\x02 \x01(\t\"w\n\x11ValidationFinding\x12\x0f\n\x07rule_id\x18\x01 \x01(\t\x12\r\n\x05\x66ield\x18\x02 \x01(\t\x12\x10\n\x08severity\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x10\n\x08\x65xpected\x18\x05 \x01(\t\x12\r\n\x05\x66ound\x18\x06 \x01(\t\"\x86\x01\n\x10ValidateResponse\x12\x15\n\rvalidation_id\x18\x01 \x01(\t\x12\r\n\x05valid\x18\x02 \x01(\x08\x12\x0e\n\x06\x65rrors\x18\x03 \x03(\t\x12\x10\n\x08warnings\x18\x04 \x03(\t\x12*\n\x08\x66indings\x18\x05 \x03(\x0b\x32\x18.agent.ValidationFinding\"e\n\x14ValidateBatchRequest\x12\x12\n\nschema_ids\x18\x01 \x03(\t\x12\x0f\n\x07ruleset\x18\x02 \x01(\t\x12\x14\n\x0c\x63reated_from\x18\x03 \x01(\x03\x12\x12\n\ncreated_to\x18\x04 \x01(\x03\"\xab\x01\n\x13ValidateBatchResult\x12\x11\n\tschema_id\x18\x01 \x01(\t\x12\x15\n\rvalidation_id\x18\x02 \x01(\t\x12\r\n\x05valid\x18\x03 \x01(\x08\x12\x0e\n\x06\x65rrors\x18\x04 \x03(\t\x12\x10\n\x08warnings\x18\x05 \x03(\t\x12\r\n\x05\x65rror\x18\x06 \x01(\t\x12*\n\x08\x66indings\x18\x07 \x03(\x0b\x32\x18.agent.ValidationFinding\"J\n\rReportRequest\x12\x15\n\rvalidation_id\x18\x01 \x01(\t\x12\x11\n\tschema_id\x18\x02 \x01(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\t\"3\n\x0eReportResponse\x12\x11\n\treport_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\"H\n\x0e\x43onvertRequest\x12\x15\n\rvalidation_id\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t\x12\x0f\n\x07\x64ry_run\x18\x03 \x01(\x08\"N\n\x0f\x43onvertResponse\x12\x15\n\rconversion_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x14\n\x0c\x61rtifact_url\x18\x03 \x01(\t\"S\n\x12IntegrationRequest\x12\x15\n\rconversion_id\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t\x12\x16\n\x0e\x63redentials_id\x18\x03 \x01(\t\"=\n\x13IntegrationResponse\x12\x16\n\x0eintegration_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\"g\n\nAgentEvent\x12\r\n\x05\x61gent\x18\x01 \x01(\t\x12\x12\n\nevent_type\x18\x02 \x01(\t\x12\x14\n\x0creference_id\x18\x03 \x01(\t\x12\x14\n\x0cpayload_json\x18\x04 \x01(\t\x12\n\n\x02ts\x18\x05 \x01(\x03\"+\n\x08\x41gentAck\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t2\xfd\x03\n\tAgentComm\x12\x31\n\x08StartOCR\x12\x11.agent.OCRRequest\x1a\x12.agent.OCRResponse\x12\x32\n\tMapSchema\x12\x11.agent.MapRequest\x1a\x12.agent.MapResponse\x12\x41\n\x0eValidateSchema\x12\x16.agent.ValidateRequest\x1a\x17.agent.ValidateResponse\x12L\n\x0fValidateSchemas\x12\x1b.agent.ValidateBatchRequest\x1a\x1a.agent.ValidateBatchResult0\x01\x12=\n\x0eGenerateReport\x12\x14.agent.ReportRequest\x1a\x15.agent.ReportResponse\x12\x38\n\x07\x43onvert\x12\x15.agent.ConvertRequest\x1a\x16.agent.ConvertResponse\x12H\n\x0fPushIntegration\x12\x19.agent.IntegrationRequest\x1a\x1a.agent.IntegrationResponse\x12\x35\n\x0b\x45ventStream\x12\x11.agent.AgentEvent\x1a\x0f.agent.AgentAck(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -47,24 +47,30 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_MAPRESPONSE']._serialized_end=428
   _globals['_VALIDATEREQUEST']._serialized_start=430
   _globals['_VALIDATEREQUEST']._serialized_end=483
-  _globals['_VALIDATERESPONSE']._serialized_start=485
-  _globals['_VALIDATERESPONSE']._serialized_end=575
-  _globals['_REPORTREQUEST']._serialized_start=577
-  _globals['_REPORTREQUEST']._serialized_end=651
-  _globals['_REPORTRESPONSE']._serialized_start=653
-  _globals['_REPORTRESPONSE']._serialized_end=704
-  _globals['_CONVERTREQUEST']._serialized_start=706
-  _globals['_CONVERTREQUEST']._serialized_end=778
-  _globals['_CONVERTRESPONSE']._serialized_start=780
-  _globals['_CONVERTRESPONSE']._serialized_end=858
-  _globals['_INTEGRATIONREQUEST']._serialized_start=860
-  _globals['_INTEGRATIONREQUEST']._serialized_end=943
-  _globals['_INTEGRATIONRESPONSE']._serialized_start=945
-  _globals['_INTEGRATIONRESPONSE']._serialized_end=1006
-  _globals['_AGENTEVENT']._serialized_start=1008
-  _globals['_AGENTEVENT']._serialized_end=1111
-  _globals['_AGENTACK']._serialized_start=1113
-  _globals['_AGENTACK']._serialized_end=1156
-  _globals['_AGENTCOMM']._serialized_start=1159
-  _globals['_AGENTCOMM']._serialized_end=1590
+  _globals['_VALIDATIONFINDING']._serialized_start=485
+  _globals['_VALIDATIONFINDING']._serialized_end=604
+  _globals['_VALIDATERESPONSE']._serialized_start=607
+  _globals['_VALIDATERESPONSE']._serialized_end=741
+  _globals['_VALIDATEBATCHREQUEST']._serialized_start=743
+  _globals['_VALIDATEBATCHREQUEST']._serialized_end=844
+  _globals['_VALIDATEBATCHRESULT']._serialized_start=847
+  _globals['_VALIDATEBATCHRESULT']._serialized_end=1018
+  _globals['_REPORTREQUEST']._serialized_start=1020
+  _globals['_REPORTREQUEST']._serialized_end=1094
+  _globals['_REPORTRESPONSE']._serialized_start=1096
+  _globals['_REPORTRESPONSE']._serialized_end=1147
+  _globals['_CONVERTREQUEST']._serialized_start=1149
+  _globals['_CONVERTREQUEST']._serialized_end=1221
+  _globals['_CONVERTRESPONSE']._serialized_start=1223
+  _globals['_CONVERTRESPONSE']._serialized_end=1301
+  _globals['_INTEGRATIONREQUEST']._serialized_start=1303
+  _globals['_INTEGRATIONREQUEST']._serialized_end=1386
+  _globals['_INTEGRATIONRESPONSE']._serialized_start=1388
+  _globals['_INTEGRATIONRESPONSE']._serialized_end=1449
+  _globals['_AGENTEVENT']._serialized_start=1451
+  _globals['_AGENTEVENT']._serialized_end=1554
+  _globals['_AGENTACK']._serialized_start=1556
+  _globals['_AGENTACK']._serialized_end=1599
+  _globals['_AGENTCOMM']._serialized_start=1602
+  _globals['_AGENTCOMM']._serialized_end=2111
 # @@protoc_insertion_point(module_scope)
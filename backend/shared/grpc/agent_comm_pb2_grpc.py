@@ -49,6 +49,11 @@ class AgentCommStub(object):
                 request_serializer=agent__comm__pb2.ValidateRequest.SerializeToString,
                 response_deserializer=agent__comm__pb2.ValidateResponse.FromString,
                 _registered_method=True)
+        self.ValidateSchemas = channel.unary_stream(
+                '/agent.AgentComm/ValidateSchemas',
+                request_serializer=agent__comm__pb2.ValidateBatchRequest.SerializeToString,
+                response_deserializer=agent__comm__pb2.ValidateBatchResult.FromString,
+                _registered_method=True)
         self.GenerateReport = channel.unary_unary(
                 '/agent.AgentComm/GenerateReport',
                 request_serializer=agent__comm__pb2.ReportRequest.SerializeToString,
@@ -92,6 +97,12 @@ class AgentCommServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ValidateSchemas(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GenerateReport(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -135,6 +146,11 @@ def add_AgentCommServicer_to_server(servicer, server):
                     request_deserializer=agent__comm__pb2.ValidateRequest.FromString,
                     response_serializer=agent__comm__pb2.ValidateResponse.SerializeToString,
             ),
+            'ValidateSchemas': grpc.unary_stream_rpc_method_handler(
+                    servicer.ValidateSchemas,
+                    request_deserializer=agent__comm__pb2.ValidateBatchRequest.FromString,
+                    response_serializer=agent__comm__pb2.ValidateBatchResult.SerializeToString,
+            ),
             'GenerateReport': grpc.unary_unary_rpc_method_handler(
                     servicer.GenerateReport,
                     request_deserializer=agent__comm__pb2.ReportRequest.FromString,
@@ -247,6 +263,33 @@ class AgentComm(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ValidateSchemas(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/agent.AgentComm/ValidateSchemas',
+            agent__comm__pb2.ValidateBatchRequest.SerializeToString,
+            agent__comm__pb2.ValidateBatchResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GenerateReport(request,
             target,
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tmcp.proto\x12\x03mcp\"\xbd\x01\n\nSaveDocReq\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x12\n\nfile_bytes\x18\x03 \x01(\x0c\x12\x10\n\x08\x66ile_url\x18\x04 \x01(\t\x12/\n\x08metadata\x18\x05 \x03(\x0b\x32\x1d.mcp.SaveDocReq.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\";\n\x0bSaveDocResp\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x0f\n\x07\x64oc_ref\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"!\n\tGetDocReq\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\"\xa5\x01\n\nGetDocResp\x12\x0f\n\x07\x64oc_ref\x18\x01 \x01(\t\x12\x10\n\x08\x66ile_url\x18\x02 \x01(\t\x12\x12\n\nfile_bytes\x18\x03 \x01(\x0c\x12/\n\x08metadata\x18\x04 \x03(\x0b\x32\x1d.mcp.GetDocResp.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x8c\x01\n\x0bQueryLLMReq\x12\x0e\n\x06prompt\x18\x01 \x01(\t\x12\r\n\x05model\x18\x02 \x01(\t\x12.\n\x07options\x18\x03 \x03(\x0b\x32\x1d.mcp.QueryLLMReq.OptionsEntry\x1a.\n\x0cOptionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"F\n\x0cQueryLLMResp\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x14\n\x0craw_response\x18\x03 \x01(\t\"]\n\x0eWriteMetricReq\x12\r\n\x05\x61gent\x18\x01 \x01(\t\x12\x14\n\x0cingestion_id\x18\x02 \x01(\t\x12\x13\n\x0bmetric_json\x18\x03 \x01(\t\x12\x11\n\tmetric_ts\x18\x04 \x01(\x03\"\x16\n\x08WriteAck\x12\n\n\x02ok\x18\x01 \x01(\x08\"f\n\rWriteAuditReq\x12\r\n\x05\x61gent\x18\x01 \x01(\t\x12\x0e\n\x06\x61\x63tion\x18\x02 \x01(\t\x12\x14\n\x0creference_id\x18\x03 \x01(\t\x12\x14\n\x0cpayload_json\x18\x04 \x01(\t\x12\n\n\x02ts\x18\x05 \x01(\x03\x32\xfd\x01\n\x03MCP\x12\x31\n\x0cSaveDocument\x12\x0f.mcp.SaveDocReq\x1a\x10.mcp.SaveDocResp\x12.\n\x0bGetDocument\x12\x0e.mcp.GetDocReq\x1a\x0f.mcp.GetDocResp\x12/\n\x08QueryLLM\x12\x10.mcp.QueryLLMReq\x1a\x11.mcp.QueryLLMResp\x12\x31\n\x0bWriteMetric\x12\x13.mcp.WriteMetricReq\x1a\r.mcp.WriteAck\x12/\n\nWriteAudit\x12\x12.mcp.WriteAuditReq\x1a\r.mcp.WriteAckb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tmcp.proto\x12\x03mcp\"\xbd\x01\n\nSaveDocReq\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x12\n\nfile_bytes\x18\x03 \x01(\x0c\x12\x10\n\x08\x66ile_url\x18\x04 \x01(\t\x12/\n\x08metadata\x18\x05 \x03(\x0b\x32\x1d.mcp.SaveDocReq.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\";\n\x0bSaveDocResp\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x0f\n\x07\x64oc_ref\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"!\n\tGetDocReq\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\"\xb8\x01\n\nGetDocResp\x12\x0f\n\x07\x64oc_ref\x18\x01 \x01(\t\x12\x10\n\x08\x66ile_url\x18\x02 \x01(\t\x12\x12\n\nfile_bytes\x18\x03 \x01(\x0c\x12/\n\x08metadata\x18\x04 \x03(\x0b\x32\x1d.mcp.GetDocResp.MetadataEntry\x12\x11\n\tfile_name\x18\x05 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"O\n\x0eUploadDocChunk\x12!\n\x06header\x18\x01 \x01(\x0b\x32\x0f.mcp.SaveDocReqH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x42\t\n\x07payload\"I\n\x08\x44ocChunk\x12!\n\x06header\x18\x01 \x01(\x0b\x32\x0f.mcp.GetDocRespH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x42\t\n\x07payload\"\xb5\x01\n\x0bQueryLLMReq\x12\x0e\n\x06prompt\x18\x01 \x01(\t\x12\r\n\x05model\x18\x02 \x01(\t\x12.\n\x07options\x18\x03 \x03(\x0b\x32\x1d.mcp.QueryLLMReq.OptionsEntry\x12\x11\n\tcache_key\x18\x04 \x01(\t\x12\x14\n\x0cingestion_id\x18\x05 \x01(\t\x1a.\n\x0cOptionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"V\n\x0cQueryLLMResp\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x14\n\x0craw_response\x18\x03 \x01(\t\x12\x0e\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08\"P\n\rQueryLLMChunk\x12\r\n\x05\x64\x65lta\x18\x01 \x01(\t\x12\x0c\n\x04\x64one\x18\x02 \x01(\x08\x12\x0e\n\x06\x63\x61\x63hed\x18\x03 \x01(\x08\x12\x12\n\nconfidence\x18\x04 \x01(\x02\"]\n\x0eWriteMetricReq\x12\r\n\x05\x61gent\x18\x01 \x01(\t\x12\x14\n\x0cingestion_id\x18\x02 \x01(\t\x12\x13\n\x0bmetric_json\x18\x03 \x01(\t\x12\x11\n\tmetric_ts\x18\x04 \x01(\x03\"\x16\n\x08WriteAck\x12\n\n\x02ok\x18\x01 \x01(\x08\"f\n\rWriteAuditReq\x12\r\n\x05\x61gent\x18\x01 \x01(\t\x12\x0e\n\x06\x61\x63tion\x18\x02 \x01(\t\x12\x14\n\x0creference_id\x18\x03 \x01(\t\x12\x14\n\x0cpayload_json\x18\x04 \x01(\t\x12\n\n\x02ts\x18\x05 \x01(\x03\"M\n\rWriteBatchAck\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x01 \x01(\x05\x12\x10\n\x08rejected\x18\x02 \x01(\x05\x12\x18\n\x10rejected_indexes\x18\x03 \x03(\x05\"\xf1\x01\n\x06OcrJob\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x14\n\x0cingestion_id\x18\x02 \x01(\t\x12\x10\n\x08\x66ile_url\x18\x03 \x01(\t\x12+\n\x08metadata\x18\x04 \x03(\x0b\x32\x19.mcp.OcrJob.MetadataEntry\x12\x10\n\x08priority\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x10\n\x08\x61ttempts\x18\x07 \x01(\x05\x12\x0e\n\x06ocr_id\x18\x08 \x01(\t\x12\r\n\x05\x65rror\x18\t \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xb4\x01\n\x10\x45nqueueOcrJobReq\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ile_url\x18\x02 \x01(\t\x12\x35\n\x08metadata\x18\x03 \x03(\x0b\x32#.mcp.EnqueueOcrJobReq.MetadataEntry\x12\x10\n\x08priority\x18\x04 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"J\n\x0f\x43laimOcrJobsReq\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x10\n\x08max_jobs\x18\x02 \x01(\x05\x12\x12\n\npriorities\x18\x03 \x03(\t\"-\n\x10\x43laimOcrJobsResp\x12\x19\n\x04jobs\x18\x01 \x03(\x0b\x32\x0b.mcp.OcrJob\"F\n\x11\x43ompleteOcrJobReq\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06ocr_id\x18\x02 \x01(\t\x12\x11\n\tworker_id\x18\x03 \x01(\t\"X\n\rFailOcrJobReq\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x15\n\rretry_delay_s\x18\x03 \x01(\x05\x12\x11\n\tworker_id\x18\x04 \x01(\t\"@\n\x10ListDocumentsReq\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\r\n\x05\x61\x66ter\x18\x03 \x01(\t\">\n\x11ListDocumentsResp\x12\x15\n\ringestion_ids\x18\x01 \x03(\t\x12\x12\n\nnext_after\x18\x02 \x01(\t\"V\n\x16StreamMappedSchemasReq\x12\x12\n\nschema_ids\x18\x01 \x03(\t\x12\x14\n\x0c\x63reated_from\x18\x02 \x01(\x03\x12\x12\n\ncreated_to\x18\x03 \x01(\x03\"W\n\x10ValidationResult\x12 \n\x03log\x18\x01 \x01(\x0b\x32\x13.mcp.ValidationLogs\x12!\n\x08warnings\x18\x02 \x03(\x0b\x32\x0f.mcp.WarningLog\"\x19\n\x0b\x41rtifactReq\x12\n\n\x02id\x18\x01 \x01(\t\"?\n\x12OrchestrationState\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x13\n\x0bstate_bytes\x18\x02 \x01(\x0c\"\x8c\x01\n\x11OrchestrationStep\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\x03\x12\x13\n\x0bstate_delta\x18\x03 \x01(\x0c\x12\x0e\n\x06status\x18\x04 \x01(\t\x12\x17\n\x0f\x63heckpoint_type\x18\x05 \x01(\t\x12\x12\n\ncheckpoint\x18\x06 \x01(\x0c\"\x90\x01\n\x15OrchestrationSnapshot\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\x03\x12\x13\n\x0bstate_bytes\x18\x03 \x01(\x0c\x12\x0e\n\x06status\x18\x04 \x01(\t\x12\x17\n\x0f\x63heckpoint_type\x18\x05 \x01(\t\x12\x12\n\ncheckpoint\x18\x06 \x01(\x0c\"k\n\x18OrchestrationCheckpoints\x12(\n\x04\x62\x61se\x18\x01 \x01(\x0b\x32\x1a.mcp.OrchestrationSnapshot\x12%\n\x05steps\x18\x02 \x03(\x0b\x32\x16.mcp.OrchestrationStep\"K\n\x15OrchestrationLeaseReq\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\r\n\x05owner\x18\x02 \x01(\t\x12\r\n\x05ttl_s\x18\x03 \x01(\x05\"&\n\x12OrchestrationLease\x12\x10\n\x08\x61\x63quired\x18\x01 \x01(\x08\"R\n\x1bRenewOrchestrationLeasesReq\x12\r\n\x05owner\x18\x01 \x01(\t\x12\x15\n\ringestion_ids\x18\x02 \x03(\t\x12\r\n\x05ttl_s\x18\x03 \x01(\x05\"b\n\x1b\x43laimStaleOrchestrationsReq\x12\r\n\x05owner\x18\x01 \x01(\t\x12\r\n\x05ttl_s\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x16\n\x0emax_recoveries\x18\x04 \x01(\x05\"5\n\x1c\x43laimStaleOrchestrationsResp\x12\x15\n\ringestion_ids\x18\x01 \x03(\t\"A\n\x11IdempotencyRecord\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05\x61gent\x18\x02 \x01(\t\x12\x10\n\x08response\x18\x03 \x01(\x0c\"\x80\x01\n\tOcrOutput\x12\x0e\n\x06ocr_id\x18\x01 \x01(\t\x12\x14\n\x0cingestion_id\x18\x02 \x01(\t\x12\x10\n\x08raw_text\x18\x03 \x01(\t\x12\x17\n\x0f\x64\x65tected_fields\x18\x04 \x01(\x0c\x12\x12\n\nconfidence\x18\x05 \x01(\x02\x12\x0e\n\x06status\x18\x06 \x01(\t\"b\n\x0cMappedSchema\x12\x11\n\tschema_id\x18\x01 \x01(\t\x12\x0e\n\x06ocr_id\x18\x02 \x01(\t\x12\x13\n\x0bmapped_data\x18\x03 \x01(\x0c\x12\x1a\n\x12mapping_confidence\x18\x04 \x01(\x02\"l\n\x0eValidationLogs\x12\x15\n\rvalidation_id\x18\x01 \x01(\t\x12\x11\n\tschema_id\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x0e\n\x06\x65rrors\x18\x04 \x01(\x0c\x12\x10\n\x08warnings\x18\x05 \x01(\x0c\"\x83\x01\n\rConversionLog\x12\x15\n\rconversion_id\x18\x01 \x01(\t\x12\x15\n\rvalidation_id\x18\x02 \x01(\t\x12\x0e\n\x06target\x18\x03 \x01(\t\x12\x0e\n\x06output\x18\x04 \x01(\t\x12\x14\n\x0c\x61rtifact_url\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\"\xd7\x01\n\x0eIntegrationLog\x12\x16\n\x0eintegration_id\x18\x01 \x01(\t\x12\x15\n\rconversion_id\x18\x02 \x01(\t\x12\x0e\n\x06target\x18\x03 \x01(\t\x12\x19\n\x11platform_response\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\r\n\x05retry\x18\x06 \x01(\x05\x12\x1c\n\x14platform_status_code\x18\x07 \x01(\x05\x12\x17\n\x0flast_attempt_at\x18\x08 \x01(\x03\x12\x15\n\rnext_retry_at\x18\t \x01(\x03\"\x8b\x01\n\x06Report\x12\x11\n\treport_id\x18\x01 \x01(\t\x12\x15\n\rvalidation_id\x18\x02 \x01(\t\x12\x11\n\tschema_id\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x0f\n\x07summary\x18\x06 \x01(\x0c\x12\x12\n\nreport_url\x18\x07 \x01(\t\"\x9b\x01\n\nWarningLog\x12\x12\n\nwarning_id\x18\x01 \x01(\t\x12\x14\n\x0cingestion_id\x18\x02 \x01(\t\x12\x15\n\rvalidation_id\x18\x03 \x01(\t\x12\x12\n\nfield_name\x18\x04 \x01(\t\x12\x10\n\x08severity\x18\x05 \x01(\t\x12\x0f\n\x07message\x18\x06 \x01(\t\x12\x15\n\rsuggested_fix\x18\x07 \x01(\x0c\x32\x80\x14\n\x03MCP\x12\x31\n\x0cSaveDocument\x12\x0f.mcp.SaveDocReq\x1a\x10.mcp.SaveDocResp\x12.\n\x0bGetDocument\x12\x0e.mcp.GetDocReq\x1a\x0f.mcp.GetDocResp\x12\x39\n\x0eUploadDocument\x12\x13.mcp.UploadDocChunk\x1a\x10.mcp.SaveDocResp(\x01\x12\x33\n\x10\x44ownloadDocument\x12\x0e.mcp.GetDocReq\x1a\r.mcp.DocChunk0\x01\x12>\n\rListDocuments\x12\x15.mcp.ListDocumentsReq\x1a\x16.mcp.ListDocumentsResp\x12/\n\x08QueryLLM\x12\x10.mcp.QueryLLMReq\x1a\x11.mcp.QueryLLMResp\x12\x38\n\x0eQueryLLMStream\x12\x10.mcp.QueryLLMReq\x1a\x12.mcp.QueryLLMChunk0\x01\x12\x31\n\x0bWriteMetric\x12\x13.mcp.WriteMetricReq\x1a\r.mcp.WriteAck\x12/\n\nWriteAudit\x12\x12.mcp.WriteAuditReq\x1a\r.mcp.WriteAck\x12\x39\n\x0cWriteMetrics\x12\x13.mcp.WriteMetricReq\x1a\x12.mcp.WriteBatchAck(\x01\x12\x37\n\x0bWriteAudits\x12\x12.mcp.WriteAuditReq\x1a\x12.mcp.WriteBatchAck(\x01\x12;\n\x11SaveOrchestration\x12\x17.mcp.OrchestrationState\x1a\r.mcp.WriteAck\x12;\n\x10GetOrchestration\x12\x0e.mcp.GetDocReq\x1a\x17.mcp.OrchestrationState\x12@\n\x17\x41ppendOrchestrationStep\x12\x16.mcp.OrchestrationStep\x1a\r.mcp.WriteAck\x12\x41\n\x14\x43ompactOrchestration\x12\x1a.mcp.OrchestrationSnapshot\x1a\r.mcp.WriteAck\x12L\n\x1bGetOrchestrationCheckpoints\x12\x0e.mcp.GetDocReq\x1a\x1d.mcp.OrchestrationCheckpoints\x12?\n\x1e\x44\x65leteOrchestrationCheckpoints\x12\x0e.mcp.GetDocReq\x1a\r.mcp.WriteAck\x12P\n\x19\x41\x63quireOrchestrationLease\x12\x1a.mcp.OrchestrationLeaseReq\x1a\x17.mcp.OrchestrationLease\x12P\n\x18RenewOrchestrationLeases\x12 .mcp.RenewOrchestrationLeasesReq\x1a\x12.mcp.WriteBatchAck\x12\x46\n\x19ReleaseOrchestrationLease\x12\x1a.mcp.OrchestrationLeaseReq\x1a\r.mcp.WriteAck\x12_\n\x18\x43laimStaleOrchestrations\x12 .mcp.ClaimStaleOrchestrationsReq\x1a!.mcp.ClaimStaleOrchestrationsResp\x12@\n\x14GetIdempotencyRecord\x12\x10.mcp.ArtifactReq\x1a\x16.mcp.IdempotencyRecord\x12>\n\x15SaveIdempotencyRecord\x12\x16.mcp.IdempotencyRecord\x1a\r.mcp.WriteAck\x12.\n\rSaveOcrOutput\x12\x0e.mcp.OcrOutput\x1a\r.mcp.WriteAck\x12\x30\n\x0cGetOcrOutput\x12\x10.mcp.ArtifactReq\x1a\x0e.mcp.OcrOutput\x12\x34\n\x10SaveMappedSchema\x12\x11.mcp.MappedSchema\x1a\r.mcp.WriteAck\x12\x36\n\x0fGetMappedSchema\x12\x10.mcp.ArtifactReq\x1a\x11.mcp.MappedSchema\x12\x38\n\x12SaveValidationLogs\x12\x13.mcp.ValidationLogs\x1a\r.mcp.WriteAck\x12:\n\x11GetValidationLogs\x12\x10.mcp.ArtifactReq\x1a\x13.mcp.ValidationLogs\x12G\n\x13StreamMappedSchemas\x12\x1b.mcp.StreamMappedSchemasReq\x1a\x11.mcp.MappedSchema0\x01\x12\x44\n\x15SaveValidationResults\x12\x15.mcp.ValidationResult\x1a\x12.mcp.WriteBatchAck(\x01\x12\x36\n\x11SaveConversionLog\x12\x12.mcp.ConversionLog\x1a\r.mcp.WriteAck\x12\x38\n\x10GetConversionLog\x12\x10.mcp.ArtifactReq\x1a\x12.mcp.ConversionLog\x12\x38\n\x12SaveIntegrationLog\x12\x13.mcp.IntegrationLog\x1a\r.mcp.WriteAck\x12:\n\x11GetIntegrationLog\x12\x10.mcp.ArtifactReq\x1a\x13.mcp.IntegrationLog\x12(\n\nSaveReport\x12\x0b.mcp.Report\x1a\r.mcp.WriteAck\x12*\n\tGetReport\x12\x10.mcp.ArtifactReq\x1a\x0b.mcp.Report\x12-\n\x0bSaveWarning\x12\x0f.mcp.WarningLog\x1a\r.mcp.WriteAck\x12\x33\n\rEnqueueOcrJob\x12\x15.mcp.EnqueueOcrJobReq\x1a\x0b.mcp.OcrJob\x12;\n\x0c\x43laimOcrJobs\x12\x14.mcp.ClaimOcrJobsReq\x1a\x15.mcp.ClaimOcrJobsResp\x12\x37\n\x0e\x43ompleteOcrJob\x12\x16.mcp.CompleteOcrJobReq\x1a\r.mcp.WriteAck\x12/\n\nFailOcrJob\x12\x12.mcp.FailOcrJobReq\x1a\r.mcp.WriteAck\x12(\n\tGetOcrJob\x12\x0e.mcp.GetDocReq\x1a\x0b.mcp.OcrJobb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -37,6 +37,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETDOCRESP_METADATAENTRY']._serialized_options = b'8\001'
   _globals['_QUERYLLMREQ_OPTIONSENTRY']._loaded_options = None
   _globals['_QUERYLLMREQ_OPTIONSENTRY']._serialized_options = b'8\001'
+  _globals['_OCRJOB_METADATAENTRY']._loaded_options = None
+  _globals['_OCRJOB_METADATAENTRY']._serialized_options = b'8\001'
+  _globals['_ENQUEUEOCRJOBREQ_METADATAENTRY']._loaded_options = None
+  _globals['_ENQUEUEOCRJOBREQ_METADATAENTRY']._serialized_options = b'8\001'
   _globals['_SAVEDOCREQ']._serialized_start=19
   _globals['_SAVEDOCREQ']._serialized_end=208
   _globals['_SAVEDOCREQ_METADATAENTRY']._serialized_start=161
@@ -46,21 +50,89 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETDOCREQ']._serialized_start=271
   _globals['_GETDOCREQ']._serialized_end=304
   _globals['_GETDOCRESP']._serialized_start=307
-  _globals['_GETDOCRESP']._serialized_end=472
+  _globals['_GETDOCRESP']._serialized_end=491
   _globals['_GETDOCRESP_METADATAENTRY']._serialized_start=161
   _globals['_GETDOCRESP_METADATAENTRY']._serialized_end=208
-  _globals['_QUERYLLMREQ']._serialized_start=475
-  _globals['_QUERYLLMREQ']._serialized_end=615
-  _globals['_QUERYLLMREQ_OPTIONSENTRY']._serialized_start=569
-  _globals['_QUERYLLMREQ_OPTIONSENTRY']._serialized_end=615
-  _globals['_QUERYLLMRESP']._serialized_start=617
-  _globals['_QUERYLLMRESP']._serialized_end=687
-  _globals['_WRITEMETRICREQ']._serialized_start=689
-  _globals['_WRITEMETRICREQ']._serialized_end=782
-  _globals['_WRITEACK']._serialized_start=784
-  _globals['_WRITEACK']._serialized_end=806
-  _globals['_WRITEAUDITREQ']._serialized_start=808
-  _globals['_WRITEAUDITREQ']._serialized_end=910
-  _globals['_MCP']._serialized_start=913
-  _globals['_MCP']._serialized_end=1166
+  _globals['_UPLOADDOCCHUNK']._serialized_start=493
+  _globals['_UPLOADDOCCHUNK']._serialized_end=572
+  _globals['_DOCCHUNK']._serialized_start=574
+  _globals['_DOCCHUNK']._serialized_end=647
+  _globals['_QUERYLLMREQ']._serialized_start=650
+  _globals['_QUERYLLMREQ']._serialized_end=831
+  _globals['_QUERYLLMREQ_OPTIONSENTRY']._serialized_start=785
+  _globals['_QUERYLLMREQ_OPTIONSENTRY']._serialized_end=831
+  _globals['_QUERYLLMRESP']._serialized_start=833
+  _globals['_QUERYLLMRESP']._serialized_end=919
+  _globals['_QUERYLLMCHUNK']._serialized_start=921
+  _globals['_QUERYLLMCHUNK']._serialized_end=1001
+  _globals['_WRITEMETRICREQ']._serialized_start=1003
+  _globals['_WRITEMETRICREQ']._serialized_end=1096
+  _globals['_WRITEACK']._serialized_start=1098
+  _globals['_WRITEACK']._serialized_end=1120
+  _globals['_WRITEAUDITREQ']._serialized_start=1122
+  _globals['_WRITEAUDITREQ']._serialized_end=1224
+  _globals['_WRITEBATCHACK']._serialized_start=1226
+  _globals['_WRITEBATCHACK']._serialized_end=1303
+  _globals['_OCRJOB']._serialized_start=1306
+  _globals['_OCRJOB']._serialized_end=1547
+  _globals['_OCRJOB_METADATAENTRY']._serialized_start=161
+  _globals['_OCRJOB_METADATAENTRY']._serialized_end=208
+  _globals['_ENQUEUEOCRJOBREQ']._serialized_start=1550
+  _globals['_ENQUEUEOCRJOBREQ']._serialized_end=1730
+  _globals['_ENQUEUEOCRJOBREQ_METADATAENTRY']._serialized_start=161
+  _globals['_ENQUEUEOCRJOBREQ_METADATAENTRY']._serialized_end=208
+  _globals['_CLAIMOCRJOBSREQ']._serialized_start=1732
+  _globals['_CLAIMOCRJOBSREQ']._serialized_end=1806
+  _globals['_CLAIMOCRJOBSRESP']._serialized_start=1808
+  _globals['_CLAIMOCRJOBSRESP']._serialized_end=1853
+  _globals['_COMPLETEOCRJOBREQ']._serialized_start=1855
+  _globals['_COMPLETEOCRJOBREQ']._serialized_end=1925
+  _globals['_FAILOCRJOBREQ']._serialized_start=1927
+  _globals['_FAILOCRJOBREQ']._serialized_end=2015
+  _globals['_LISTDOCUMENTSREQ']._serialized_start=2017
+  _globals['_LISTDOCUMENTSREQ']._serialized_end=2081
+  _globals['_LISTDOCUMENTSRESP']._serialized_start=2083
+  _globals['_LISTDOCUMENTSRESP']._serialized_end=2145
+  _globals['_STREAMMAPPEDSCHEMASREQ']._serialized_start=2147
+  _globals['_STREAMMAPPEDSCHEMASREQ']._serialized_end=2233
+  _globals['_VALIDATIONRESULT']._serialized_start=2235
+  _globals['_VALIDATIONRESULT']._serialized_end=2322
+  _globals['_ARTIFACTREQ']._serialized_start=2324
+  _globals['_ARTIFACTREQ']._serialized_end=2349
+  _globals['_ORCHESTRATIONSTATE']._serialized_start=2351
+  _globals['_ORCHESTRATIONSTATE']._serialized_end=2414
+  _globals['_ORCHESTRATIONSTEP']._serialized_start=2417
+  _globals['_ORCHESTRATIONSTEP']._serialized_end=2557
+  _globals['_ORCHESTRATIONSNAPSHOT']._serialized_start=2560
+  _globals['_ORCHESTRATIONSNAPSHOT']._serialized_end=2704
+  _globals['_ORCHESTRATIONCHECKPOINTS']._serialized_start=2706
+  _globals['_ORCHESTRATIONCHECKPOINTS']._serialized_end=2813
+  _globals['_ORCHESTRATIONLEASEREQ']._serialized_start=2815
+  _globals['_ORCHESTRATIONLEASEREQ']._serialized_end=2890
+  _globals['_ORCHESTRATIONLEASE']._serialized_start=2892
+  _globals['_ORCHESTRATIONLEASE']._serialized_end=2930
+  _globals['_RENEWORCHESTRATIONLEASESREQ']._serialized_start=2932
+  _globals['_RENEWORCHESTRATIONLEASESREQ']._serialized_end=3014
+  _globals['_CLAIMSTALEORCHESTRATIONSREQ']._serialized_start=3016
+  _globals['_CLAIMSTALEORCHESTRATIONSREQ']._serialized_end=3114
+  _globals['_CLAIMSTALEORCHESTRATIONSRESP']._serialized_start=3116
+  _globals['_CLAIMSTALEORCHESTRATIONSRESP']._serialized_end=3169
+  _globals['_IDEMPOTENCYRECORD']._serialized_start=3171
+  _globals['_IDEMPOTENCYRECORD']._serialized_end=3236
+  _globals['_OCROUTPUT']._serialized_start=3239
+  _globals['_OCROUTPUT']._serialized_end=3367
+  _globals['_MAPPEDSCHEMA']._serialized_start=3369
+  _globals['_MAPPEDSCHEMA']._serialized_end=3467
+  _globals['_VALIDATIONLOGS']._serialized_start=3469
+  _globals['_VALIDATIONLOGS']._serialized_end=3577
+  _globals['_CONVERSIONLOG']._serialized_start=3580
+  _globals['_CONVERSIONLOG']._serialized_end=3711
+  _globals['_INTEGRATIONLOG']._serialized_start=3714
+  _globals['_INTEGRATIONLOG']._serialized_end=3929
+  _globals['_REPORT']._serialized_start=3932
+  _globals['_REPORT']._serialized_end=4071
+  _globals['_WARNINGLOG']._serialized_start=4074
+  _globals['_WARNINGLOG']._serialized_end=4229
+  _globals['_MCP']._serialized_start=4232
+  _globals['_MCP']._serialized_end=6792
 # @@protoc_insertion_point(module_scope)
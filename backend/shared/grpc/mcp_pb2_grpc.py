@@ -44,11 +44,31 @@ class MCPStub(object):
                 request_serializer=mcp__pb2.GetDocReq.SerializeToString,
                 response_deserializer=mcp__pb2.GetDocResp.FromString,
                 _registered_method=True)
+        self.UploadDocument = channel.stream_unary(
+                '/mcp.MCP/UploadDocument',
+                request_serializer=mcp__pb2.UploadDocChunk.SerializeToString,
+                response_deserializer=mcp__pb2.SaveDocResp.FromString,
+                _registered_method=True)
+        self.DownloadDocument = channel.unary_stream(
+                '/mcp.MCP/DownloadDocument',
+                request_serializer=mcp__pb2.GetDocReq.SerializeToString,
+                response_deserializer=mcp__pb2.DocChunk.FromString,
+                _registered_method=True)
+        self.ListDocuments = channel.unary_unary(
+                '/mcp.MCP/ListDocuments',
+                request_serializer=mcp__pb2.ListDocumentsReq.SerializeToString,
+                response_deserializer=mcp__pb2.ListDocumentsResp.FromString,
+                _registered_method=True)
         self.QueryLLM = channel.unary_unary(
                 '/mcp.MCP/QueryLLM',
                 request_serializer=mcp__pb2.QueryLLMReq.SerializeToString,
                 response_deserializer=mcp__pb2.QueryLLMResp.FromString,
                 _registered_method=True)
+        self.QueryLLMStream = channel.unary_stream(
+                '/mcp.MCP/QueryLLMStream',
+                request_serializer=mcp__pb2.QueryLLMReq.SerializeToString,
+                response_deserializer=mcp__pb2.QueryLLMChunk.FromString,
+                _registered_method=True)
         self.WriteMetric = channel.unary_unary(
                 '/mcp.MCP/WriteMetric',
                 request_serializer=mcp__pb2.WriteMetricReq.SerializeToString,
@@ -59,6 +79,176 @@ class MCPStub(object):
                 request_serializer=mcp__pb2.WriteAuditReq.SerializeToString,
                 response_deserializer=mcp__pb2.WriteAck.FromString,
                 _registered_method=True)
+        self.WriteMetrics = channel.stream_unary(
+                '/mcp.MCP/WriteMetrics',
+                request_serializer=mcp__pb2.WriteMetricReq.SerializeToString,
+                response_deserializer=mcp__pb2.WriteBatchAck.FromString,
+                _registered_method=True)
+        self.WriteAudits = channel.stream_unary(
+                '/mcp.MCP/WriteAudits',
+                request_serializer=mcp__pb2.WriteAuditReq.SerializeToString,
+                response_deserializer=mcp__pb2.WriteBatchAck.FromString,
+                _registered_method=True)
+        self.SaveOrchestration = channel.unary_unary(
+                '/mcp.MCP/SaveOrchestration',
+                request_serializer=mcp__pb2.OrchestrationState.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.GetOrchestration = channel.unary_unary(
+                '/mcp.MCP/GetOrchestration',
+                request_serializer=mcp__pb2.GetDocReq.SerializeToString,
+                response_deserializer=mcp__pb2.OrchestrationState.FromString,
+                _registered_method=True)
+        self.AppendOrchestrationStep = channel.unary_unary(
+                '/mcp.MCP/AppendOrchestrationStep',
+                request_serializer=mcp__pb2.OrchestrationStep.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.CompactOrchestration = channel.unary_unary(
+                '/mcp.MCP/CompactOrchestration',
+                request_serializer=mcp__pb2.OrchestrationSnapshot.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.GetOrchestrationCheckpoints = channel.unary_unary(
+                '/mcp.MCP/GetOrchestrationCheckpoints',
+                request_serializer=mcp__pb2.GetDocReq.SerializeToString,
+                response_deserializer=mcp__pb2.OrchestrationCheckpoints.FromString,
+                _registered_method=True)
+        self.DeleteOrchestrationCheckpoints = channel.unary_unary(
+                '/mcp.MCP/DeleteOrchestrationCheckpoints',
+                request_serializer=mcp__pb2.GetDocReq.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.AcquireOrchestrationLease = channel.unary_unary(
+                '/mcp.MCP/AcquireOrchestrationLease',
+                request_serializer=mcp__pb2.OrchestrationLeaseReq.SerializeToString,
+                response_deserializer=mcp__pb2.OrchestrationLease.FromString,
+                _registered_method=True)
+        self.RenewOrchestrationLeases = channel.unary_unary(
+                '/mcp.MCP/RenewOrchestrationLeases',
+                request_serializer=mcp__pb2.RenewOrchestrationLeasesReq.SerializeToString,
+                response_deserializer=mcp__pb2.WriteBatchAck.FromString,
+                _registered_method=True)
+        self.ReleaseOrchestrationLease = channel.unary_unary(
+                '/mcp.MCP/ReleaseOrchestrationLease',
+                request_serializer=mcp__pb2.OrchestrationLeaseReq.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.ClaimStaleOrchestrations = channel.unary_unary(
+                '/mcp.MCP/ClaimStaleOrchestrations',
+                request_serializer=mcp__pb2.ClaimStaleOrchestrationsReq.SerializeToString,
+                response_deserializer=mcp__pb2.ClaimStaleOrchestrationsResp.FromString,
+                _registered_method=True)
+        self.GetIdempotencyRecord = channel.unary_unary(
+                '/mcp.MCP/GetIdempotencyRecord',
+                request_serializer=mcp__pb2.ArtifactReq.SerializeToString,
+                response_deserializer=mcp__pb2.IdempotencyRecord.FromString,
+                _registered_method=True)
+        self.SaveIdempotencyRecord = channel.unary_unary(
+                '/mcp.MCP/SaveIdempotencyRecord',
+                request_serializer=mcp__pb2.IdempotencyRecord.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.SaveOcrOutput = channel.unary_unary(
+                '/mcp.MCP/SaveOcrOutput',
+                request_serializer=mcp__pb2.OcrOutput.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.GetOcrOutput = channel.unary_unary(
+                '/mcp.MCP/GetOcrOutput',
+                request_serializer=mcp__pb2.ArtifactReq.SerializeToString,
+                response_deserializer=mcp__pb2.OcrOutput.FromString,
+                _registered_method=True)
+        self.SaveMappedSchema = channel.unary_unary(
+                '/mcp.MCP/SaveMappedSchema',
+                request_serializer=mcp__pb2.MappedSchema.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.GetMappedSchema = channel.unary_unary(
+                '/mcp.MCP/GetMappedSchema',
+                request_serializer=mcp__pb2.ArtifactReq.SerializeToString,
+                response_deserializer=mcp__pb2.MappedSchema.FromString,
+                _registered_method=True)
+        self.SaveValidationLogs = channel.unary_unary(
+                '/mcp.MCP/SaveValidationLogs',
+                request_serializer=mcp__pb2.ValidationLogs.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.GetValidationLogs = channel.unary_unary(
+                '/mcp.MCP/GetValidationLogs',
+                request_serializer=mcp__pb2.ArtifactReq.SerializeToString,
+                response_deserializer=mcp__pb2.ValidationLogs.FromString,
+                _registered_method=True)
+        self.StreamMappedSchemas = channel.unary_stream(
+                '/mcp.MCP/StreamMappedSchemas',
+                request_serializer=mcp__pb2.StreamMappedSchemasReq.SerializeToString,
+                response_deserializer=mcp__pb2.MappedSchema.FromString,
+                _registered_method=True)
+        self.SaveValidationResults = channel.stream_unary(
+                '/mcp.MCP/SaveValidationResults',
+                request_serializer=mcp__pb2.ValidationResult.SerializeToString,
+                response_deserializer=mcp__pb2.WriteBatchAck.FromString,
+                _registered_method=True)
+        self.SaveConversionLog = channel.unary_unary(
+                '/mcp.MCP/SaveConversionLog',
+                request_serializer=mcp__pb2.ConversionLog.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.GetConversionLog = channel.unary_unary(
+                '/mcp.MCP/GetConversionLog',
+                request_serializer=mcp__pb2.ArtifactReq.SerializeToString,
+                response_deserializer=mcp__pb2.ConversionLog.FromString,
+                _registered_method=True)
+        self.SaveIntegrationLog = channel.unary_unary(
+                '/mcp.MCP/SaveIntegrationLog',
+                request_serializer=mcp__pb2.IntegrationLog.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.GetIntegrationLog = channel.unary_unary(
+                '/mcp.MCP/GetIntegrationLog',
+                request_serializer=mcp__pb2.ArtifactReq.SerializeToString,
+                response_deserializer=mcp__pb2.IntegrationLog.FromString,
+                _registered_method=True)
+        self.SaveReport = channel.unary_unary(
+                '/mcp.MCP/SaveReport',
+                request_serializer=mcp__pb2.Report.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.GetReport = channel.unary_unary(
+                '/mcp.MCP/GetReport',
+                request_serializer=mcp__pb2.ArtifactReq.SerializeToString,
+                response_deserializer=mcp__pb2.Report.FromString,
+                _registered_method=True)
+        self.SaveWarning = channel.unary_unary(
+                '/mcp.MCP/SaveWarning',
+                request_serializer=mcp__pb2.WarningLog.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.EnqueueOcrJob = channel.unary_unary(
+                '/mcp.MCP/EnqueueOcrJob',
+                request_serializer=mcp__pb2.EnqueueOcrJobReq.SerializeToString,
+                response_deserializer=mcp__pb2.OcrJob.FromString,
+                _registered_method=True)
+        self.ClaimOcrJobs = channel.unary_unary(
+                '/mcp.MCP/ClaimOcrJobs',
+                request_serializer=mcp__pb2.ClaimOcrJobsReq.SerializeToString,
+                response_deserializer=mcp__pb2.ClaimOcrJobsResp.FromString,
+                _registered_method=True)
+        self.CompleteOcrJob = channel.unary_unary(
+                '/mcp.MCP/CompleteOcrJob',
+                request_serializer=mcp__pb2.CompleteOcrJobReq.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.FailOcrJob = channel.unary_unary(
+                '/mcp.MCP/FailOcrJob',
+                request_serializer=mcp__pb2.FailOcrJobReq.SerializeToString,
+                response_deserializer=mcp__pb2.WriteAck.FromString,
+                _registered_method=True)
+        self.GetOcrJob = channel.unary_unary(
+                '/mcp.MCP/GetOcrJob',
+                request_serializer=mcp__pb2.GetDocReq.SerializeToString,
+                response_deserializer=mcp__pb2.OcrJob.FromString,
+                _registered_method=True)
 
 
 class MCPServicer(object):
@@ -76,65 +266,1482 @@ class MCPServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
-    def QueryLLM(self, request, context):
-        """Missing associated documentation comment in .proto file."""
-        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-        context.set_details('Method not implemented!')
-        raise NotImplementedError('Method not implemented!')
+    def UploadDocument(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DownloadDocument(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListDocuments(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def QueryLLM(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def QueryLLMStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WriteMetric(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WriteAudit(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WriteMetrics(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WriteAudits(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveOrchestration(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetOrchestration(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AppendOrchestrationStep(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CompactOrchestration(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetOrchestrationCheckpoints(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteOrchestrationCheckpoints(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AcquireOrchestrationLease(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RenewOrchestrationLeases(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReleaseOrchestrationLease(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ClaimStaleOrchestrations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetIdempotencyRecord(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveIdempotencyRecord(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveOcrOutput(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetOcrOutput(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveMappedSchema(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetMappedSchema(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveValidationLogs(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetValidationLogs(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamMappedSchemas(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveValidationResults(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveConversionLog(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetConversionLog(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveIntegrationLog(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetIntegrationLog(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveReport(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetReport(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SaveWarning(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def EnqueueOcrJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ClaimOcrJobs(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CompleteOcrJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def FailOcrJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetOcrJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_MCPServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'SaveDocument': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveDocument,
+                    request_deserializer=mcp__pb2.SaveDocReq.FromString,
+                    response_serializer=mcp__pb2.SaveDocResp.SerializeToString,
+            ),
+            'GetDocument': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDocument,
+                    request_deserializer=mcp__pb2.GetDocReq.FromString,
+                    response_serializer=mcp__pb2.GetDocResp.SerializeToString,
+            ),
+            'UploadDocument': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadDocument,
+                    request_deserializer=mcp__pb2.UploadDocChunk.FromString,
+                    response_serializer=mcp__pb2.SaveDocResp.SerializeToString,
+            ),
+            'DownloadDocument': grpc.unary_stream_rpc_method_handler(
+                    servicer.DownloadDocument,
+                    request_deserializer=mcp__pb2.GetDocReq.FromString,
+                    response_serializer=mcp__pb2.DocChunk.SerializeToString,
+            ),
+            'ListDocuments': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListDocuments,
+                    request_deserializer=mcp__pb2.ListDocumentsReq.FromString,
+                    response_serializer=mcp__pb2.ListDocumentsResp.SerializeToString,
+            ),
+            'QueryLLM': grpc.unary_unary_rpc_method_handler(
+                    servicer.QueryLLM,
+                    request_deserializer=mcp__pb2.QueryLLMReq.FromString,
+                    response_serializer=mcp__pb2.QueryLLMResp.SerializeToString,
+            ),
+            'QueryLLMStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.QueryLLMStream,
+                    request_deserializer=mcp__pb2.QueryLLMReq.FromString,
+                    response_serializer=mcp__pb2.QueryLLMChunk.SerializeToString,
+            ),
+            'WriteMetric': grpc.unary_unary_rpc_method_handler(
+                    servicer.WriteMetric,
+                    request_deserializer=mcp__pb2.WriteMetricReq.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'WriteAudit': grpc.unary_unary_rpc_method_handler(
+                    servicer.WriteAudit,
+                    request_deserializer=mcp__pb2.WriteAuditReq.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'WriteMetrics': grpc.stream_unary_rpc_method_handler(
+                    servicer.WriteMetrics,
+                    request_deserializer=mcp__pb2.WriteMetricReq.FromString,
+                    response_serializer=mcp__pb2.WriteBatchAck.SerializeToString,
+            ),
+            'WriteAudits': grpc.stream_unary_rpc_method_handler(
+                    servicer.WriteAudits,
+                    request_deserializer=mcp__pb2.WriteAuditReq.FromString,
+                    response_serializer=mcp__pb2.WriteBatchAck.SerializeToString,
+            ),
+            'SaveOrchestration': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveOrchestration,
+                    request_deserializer=mcp__pb2.OrchestrationState.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'GetOrchestration': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetOrchestration,
+                    request_deserializer=mcp__pb2.GetDocReq.FromString,
+                    response_serializer=mcp__pb2.OrchestrationState.SerializeToString,
+            ),
+            'AppendOrchestrationStep': grpc.unary_unary_rpc_method_handler(
+                    servicer.AppendOrchestrationStep,
+                    request_deserializer=mcp__pb2.OrchestrationStep.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'CompactOrchestration': grpc.unary_unary_rpc_method_handler(
+                    servicer.CompactOrchestration,
+                    request_deserializer=mcp__pb2.OrchestrationSnapshot.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'GetOrchestrationCheckpoints': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetOrchestrationCheckpoints,
+                    request_deserializer=mcp__pb2.GetDocReq.FromString,
+                    response_serializer=mcp__pb2.OrchestrationCheckpoints.SerializeToString,
+            ),
+            'DeleteOrchestrationCheckpoints': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteOrchestrationCheckpoints,
+                    request_deserializer=mcp__pb2.GetDocReq.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'AcquireOrchestrationLease': grpc.unary_unary_rpc_method_handler(
+                    servicer.AcquireOrchestrationLease,
+                    request_deserializer=mcp__pb2.OrchestrationLeaseReq.FromString,
+                    response_serializer=mcp__pb2.OrchestrationLease.SerializeToString,
+            ),
+            'RenewOrchestrationLeases': grpc.unary_unary_rpc_method_handler(
+                    servicer.RenewOrchestrationLeases,
+                    request_deserializer=mcp__pb2.RenewOrchestrationLeasesReq.FromString,
+                    response_serializer=mcp__pb2.WriteBatchAck.SerializeToString,
+            ),
+            'ReleaseOrchestrationLease': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReleaseOrchestrationLease,
+                    request_deserializer=mcp__pb2.OrchestrationLeaseReq.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'ClaimStaleOrchestrations': grpc.unary_unary_rpc_method_handler(
+                    servicer.ClaimStaleOrchestrations,
+                    request_deserializer=mcp__pb2.ClaimStaleOrchestrationsReq.FromString,
+                    response_serializer=mcp__pb2.ClaimStaleOrchestrationsResp.SerializeToString,
+            ),
+            'GetIdempotencyRecord': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetIdempotencyRecord,
+                    request_deserializer=mcp__pb2.ArtifactReq.FromString,
+                    response_serializer=mcp__pb2.IdempotencyRecord.SerializeToString,
+            ),
+            'SaveIdempotencyRecord': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveIdempotencyRecord,
+                    request_deserializer=mcp__pb2.IdempotencyRecord.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'SaveOcrOutput': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveOcrOutput,
+                    request_deserializer=mcp__pb2.OcrOutput.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'GetOcrOutput': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetOcrOutput,
+                    request_deserializer=mcp__pb2.ArtifactReq.FromString,
+                    response_serializer=mcp__pb2.OcrOutput.SerializeToString,
+            ),
+            'SaveMappedSchema': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveMappedSchema,
+                    request_deserializer=mcp__pb2.MappedSchema.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'GetMappedSchema': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMappedSchema,
+                    request_deserializer=mcp__pb2.ArtifactReq.FromString,
+                    response_serializer=mcp__pb2.MappedSchema.SerializeToString,
+            ),
+            'SaveValidationLogs': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveValidationLogs,
+                    request_deserializer=mcp__pb2.ValidationLogs.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'GetValidationLogs': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetValidationLogs,
+                    request_deserializer=mcp__pb2.ArtifactReq.FromString,
+                    response_serializer=mcp__pb2.ValidationLogs.SerializeToString,
+            ),
+            'StreamMappedSchemas': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamMappedSchemas,
+                    request_deserializer=mcp__pb2.StreamMappedSchemasReq.FromString,
+                    response_serializer=mcp__pb2.MappedSchema.SerializeToString,
+            ),
+            'SaveValidationResults': grpc.stream_unary_rpc_method_handler(
+                    servicer.SaveValidationResults,
+                    request_deserializer=mcp__pb2.ValidationResult.FromString,
+                    response_serializer=mcp__pb2.WriteBatchAck.SerializeToString,
+            ),
+            'SaveConversionLog': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveConversionLog,
+                    request_deserializer=mcp__pb2.ConversionLog.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'GetConversionLog': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetConversionLog,
+                    request_deserializer=mcp__pb2.ArtifactReq.FromString,
+                    response_serializer=mcp__pb2.ConversionLog.SerializeToString,
+            ),
+            'SaveIntegrationLog': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveIntegrationLog,
+                    request_deserializer=mcp__pb2.IntegrationLog.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'GetIntegrationLog': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetIntegrationLog,
+                    request_deserializer=mcp__pb2.ArtifactReq.FromString,
+                    response_serializer=mcp__pb2.IntegrationLog.SerializeToString,
+            ),
+            'SaveReport': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveReport,
+                    request_deserializer=mcp__pb2.Report.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'GetReport': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetReport,
+                    request_deserializer=mcp__pb2.ArtifactReq.FromString,
+                    response_serializer=mcp__pb2.Report.SerializeToString,
+            ),
+            'SaveWarning': grpc.unary_unary_rpc_method_handler(
+                    servicer.SaveWarning,
+                    request_deserializer=mcp__pb2.WarningLog.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'EnqueueOcrJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.EnqueueOcrJob,
+                    request_deserializer=mcp__pb2.EnqueueOcrJobReq.FromString,
+                    response_serializer=mcp__pb2.OcrJob.SerializeToString,
+            ),
+            'ClaimOcrJobs': grpc.unary_unary_rpc_method_handler(
+                    servicer.ClaimOcrJobs,
+                    request_deserializer=mcp__pb2.ClaimOcrJobsReq.FromString,
+                    response_serializer=mcp__pb2.ClaimOcrJobsResp.SerializeToString,
+            ),
+            'CompleteOcrJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.CompleteOcrJob,
+                    request_deserializer=mcp__pb2.CompleteOcrJobReq.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'FailOcrJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.FailOcrJob,
+                    request_deserializer=mcp__pb2.FailOcrJobReq.FromString,
+                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
+            ),
+            'GetOcrJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetOcrJob,
+                    request_deserializer=mcp__pb2.GetDocReq.FromString,
+                    response_serializer=mcp__pb2.OcrJob.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'mcp.MCP', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('mcp.MCP', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class MCP(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def SaveDocument(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/SaveDocument',
+            mcp__pb2.SaveDocReq.SerializeToString,
+            mcp__pb2.SaveDocResp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetDocument(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetDocument',
+            mcp__pb2.GetDocReq.SerializeToString,
+            mcp__pb2.GetDocResp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UploadDocument(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/mcp.MCP/UploadDocument',
+            mcp__pb2.UploadDocChunk.SerializeToString,
+            mcp__pb2.SaveDocResp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DownloadDocument(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/mcp.MCP/DownloadDocument',
+            mcp__pb2.GetDocReq.SerializeToString,
+            mcp__pb2.DocChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListDocuments(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/ListDocuments',
+            mcp__pb2.ListDocumentsReq.SerializeToString,
+            mcp__pb2.ListDocumentsResp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def QueryLLM(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/QueryLLM',
+            mcp__pb2.QueryLLMReq.SerializeToString,
+            mcp__pb2.QueryLLMResp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def QueryLLMStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/mcp.MCP/QueryLLMStream',
+            mcp__pb2.QueryLLMReq.SerializeToString,
+            mcp__pb2.QueryLLMChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WriteMetric(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/WriteMetric',
+            mcp__pb2.WriteMetricReq.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WriteAudit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/WriteAudit',
+            mcp__pb2.WriteAuditReq.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WriteMetrics(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/mcp.MCP/WriteMetrics',
+            mcp__pb2.WriteMetricReq.SerializeToString,
+            mcp__pb2.WriteBatchAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WriteAudits(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/mcp.MCP/WriteAudits',
+            mcp__pb2.WriteAuditReq.SerializeToString,
+            mcp__pb2.WriteBatchAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SaveOrchestration(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/SaveOrchestration',
+            mcp__pb2.OrchestrationState.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetOrchestration(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetOrchestration',
+            mcp__pb2.GetDocReq.SerializeToString,
+            mcp__pb2.OrchestrationState.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AppendOrchestrationStep(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/AppendOrchestrationStep',
+            mcp__pb2.OrchestrationStep.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CompactOrchestration(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/CompactOrchestration',
+            mcp__pb2.OrchestrationSnapshot.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetOrchestrationCheckpoints(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetOrchestrationCheckpoints',
+            mcp__pb2.GetDocReq.SerializeToString,
+            mcp__pb2.OrchestrationCheckpoints.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteOrchestrationCheckpoints(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/DeleteOrchestrationCheckpoints',
+            mcp__pb2.GetDocReq.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AcquireOrchestrationLease(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/AcquireOrchestrationLease',
+            mcp__pb2.OrchestrationLeaseReq.SerializeToString,
+            mcp__pb2.OrchestrationLease.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RenewOrchestrationLeases(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/RenewOrchestrationLeases',
+            mcp__pb2.RenewOrchestrationLeasesReq.SerializeToString,
+            mcp__pb2.WriteBatchAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReleaseOrchestrationLease(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/ReleaseOrchestrationLease',
+            mcp__pb2.OrchestrationLeaseReq.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ClaimStaleOrchestrations(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/ClaimStaleOrchestrations',
+            mcp__pb2.ClaimStaleOrchestrationsReq.SerializeToString,
+            mcp__pb2.ClaimStaleOrchestrationsResp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetIdempotencyRecord(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetIdempotencyRecord',
+            mcp__pb2.ArtifactReq.SerializeToString,
+            mcp__pb2.IdempotencyRecord.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SaveIdempotencyRecord(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/SaveIdempotencyRecord',
+            mcp__pb2.IdempotencyRecord.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SaveOcrOutput(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/SaveOcrOutput',
+            mcp__pb2.OcrOutput.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetOcrOutput(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetOcrOutput',
+            mcp__pb2.ArtifactReq.SerializeToString,
+            mcp__pb2.OcrOutput.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SaveMappedSchema(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/SaveMappedSchema',
+            mcp__pb2.MappedSchema.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetMappedSchema(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetMappedSchema',
+            mcp__pb2.ArtifactReq.SerializeToString,
+            mcp__pb2.MappedSchema.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SaveValidationLogs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/SaveValidationLogs',
+            mcp__pb2.ValidationLogs.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetValidationLogs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetValidationLogs',
+            mcp__pb2.ArtifactReq.SerializeToString,
+            mcp__pb2.ValidationLogs.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamMappedSchemas(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/mcp.MCP/StreamMappedSchemas',
+            mcp__pb2.StreamMappedSchemasReq.SerializeToString,
+            mcp__pb2.MappedSchema.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SaveValidationResults(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/mcp.MCP/SaveValidationResults',
+            mcp__pb2.ValidationResult.SerializeToString,
+            mcp__pb2.WriteBatchAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
-    def WriteMetric(self, request, context):
-        """Missing associated documentation comment in .proto file."""
-        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-        context.set_details('Method not implemented!')
-        raise NotImplementedError('Method not implemented!')
+    @staticmethod
+    def SaveConversionLog(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/SaveConversionLog',
+            mcp__pb2.ConversionLog.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
-    def WriteAudit(self, request, context):
-        """Missing associated documentation comment in .proto file."""
-        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-        context.set_details('Method not implemented!')
-        raise NotImplementedError('Method not implemented!')
+    @staticmethod
+    def GetConversionLog(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetConversionLog',
+            mcp__pb2.ArtifactReq.SerializeToString,
+            mcp__pb2.ConversionLog.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
+    @staticmethod
+    def SaveIntegrationLog(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/SaveIntegrationLog',
+            mcp__pb2.IntegrationLog.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
-def add_MCPServicer_to_server(servicer, server):
-    rpc_method_handlers = {
-            'SaveDocument': grpc.unary_unary_rpc_method_handler(
-                    servicer.SaveDocument,
-                    request_deserializer=mcp__pb2.SaveDocReq.FromString,
-                    response_serializer=mcp__pb2.SaveDocResp.SerializeToString,
-            ),
-            'GetDocument': grpc.unary_unary_rpc_method_handler(
-                    servicer.GetDocument,
-                    request_deserializer=mcp__pb2.GetDocReq.FromString,
-                    response_serializer=mcp__pb2.GetDocResp.SerializeToString,
-            ),
-            'QueryLLM': grpc.unary_unary_rpc_method_handler(
-                    servicer.QueryLLM,
-                    request_deserializer=mcp__pb2.QueryLLMReq.FromString,
-                    response_serializer=mcp__pb2.QueryLLMResp.SerializeToString,
-            ),
-            'WriteMetric': grpc.unary_unary_rpc_method_handler(
-                    servicer.WriteMetric,
-                    request_deserializer=mcp__pb2.WriteMetricReq.FromString,
-                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
-            ),
-            'WriteAudit': grpc.unary_unary_rpc_method_handler(
-                    servicer.WriteAudit,
-                    request_deserializer=mcp__pb2.WriteAuditReq.FromString,
-                    response_serializer=mcp__pb2.WriteAck.SerializeToString,
-            ),
-    }
-    generic_handler = grpc.method_handlers_generic_handler(
-            'mcp.MCP', rpc_method_handlers)
-    server.add_generic_rpc_handlers((generic_handler,))
-    server.add_registered_method_handlers('mcp.MCP', rpc_method_handlers)
+    @staticmethod
+    def GetIntegrationLog(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetIntegrationLog',
+            mcp__pb2.ArtifactReq.SerializeToString,
+            mcp__pb2.IntegrationLog.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
+    @staticmethod
+    def SaveReport(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/SaveReport',
+            mcp__pb2.Report.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
- # This class is part of an EXPERIMENTAL API.
-class MCP(object):
-    """Missing associated documentation comment in .proto file."""
+    @staticmethod
+    def GetReport(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetReport',
+            mcp__pb2.ArtifactReq.SerializeToString,
+            mcp__pb2.Report.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
-    def SaveDocument(request,
+    def SaveWarning(request,
             target,
             options=(),
             channel_credentials=None,
@@ -147,9 +1754,9 @@ class MCP(object):
         return grpc.experimental.unary_unary(
             request,
             target,
-            '/mcp.MCP/SaveDocument',
-            mcp__pb2.SaveDocReq.SerializeToString,
-            mcp__pb2.SaveDocResp.FromString,
+            '/mcp.MCP/SaveWarning',
+            mcp__pb2.WarningLog.SerializeToString,
+            mcp__pb2.WriteAck.FromString,
             options,
             channel_credentials,
             insecure,
@@ -161,7 +1768,7 @@ class MCP(object):
             _registered_method=True)
 
     @staticmethod
-    def GetDocument(request,
+    def EnqueueOcrJob(request,
             target,
             options=(),
             channel_credentials=None,
@@ -174,9 +1781,9 @@ class MCP(object):
         return grpc.experimental.unary_unary(
             request,
             target,
-            '/mcp.MCP/GetDocument',
-            mcp__pb2.GetDocReq.SerializeToString,
-            mcp__pb2.GetDocResp.FromString,
+            '/mcp.MCP/EnqueueOcrJob',
+            mcp__pb2.EnqueueOcrJobReq.SerializeToString,
+            mcp__pb2.OcrJob.FromString,
             options,
             channel_credentials,
             insecure,
@@ -188,7 +1795,7 @@ class MCP(object):
             _registered_method=True)
 
     @staticmethod
-    def QueryLLM(request,
+    def ClaimOcrJobs(request,
             target,
             options=(),
             channel_credentials=None,
@@ -201,9 +1808,9 @@ class MCP(object):
         return grpc.experimental.unary_unary(
             request,
             target,
-            '/mcp.MCP/QueryLLM',
-            mcp__pb2.QueryLLMReq.SerializeToString,
-            mcp__pb2.QueryLLMResp.FromString,
+            '/mcp.MCP/ClaimOcrJobs',
+            mcp__pb2.ClaimOcrJobsReq.SerializeToString,
+            mcp__pb2.ClaimOcrJobsResp.FromString,
             options,
             channel_credentials,
             insecure,
@@ -215,7 +1822,7 @@ class MCP(object):
             _registered_method=True)
 
     @staticmethod
-    def WriteMetric(request,
+    def CompleteOcrJob(request,
             target,
             options=(),
             channel_credentials=None,
@@ -228,8 +1835,8 @@ class MCP(object):
         return grpc.experimental.unary_unary(
             request,
             target,
-            '/mcp.MCP/WriteMetric',
-            mcp__pb2.WriteMetricReq.SerializeToString,
+            '/mcp.MCP/CompleteOcrJob',
+            mcp__pb2.CompleteOcrJobReq.SerializeToString,
             mcp__pb2.WriteAck.FromString,
             options,
             channel_credentials,
@@ -242,7 +1849,7 @@ class MCP(object):
             _registered_method=True)
 
     @staticmethod
-    def WriteAudit(request,
+    def FailOcrJob(request,
             target,
             options=(),
             channel_credentials=None,
@@ -255,8 +1862,8 @@ class MCP(object):
         return grpc.experimental.unary_unary(
             request,
             target,
-            '/mcp.MCP/WriteAudit',
-            mcp__pb2.WriteAuditReq.SerializeToString,
+            '/mcp.MCP/FailOcrJob',
+            mcp__pb2.FailOcrJobReq.SerializeToString,
             mcp__pb2.WriteAck.FromString,
             options,
             channel_credentials,
@@ -267,3 +1874,30 @@ class MCP(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetOcrJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mcp.MCP/GetOcrJob',
+            mcp__pb2.GetDocReq.SerializeToString,
+            mcp__pb2.OcrJob.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,5 +1,9 @@
 """Extraction prompts for schema mapping"""
 
+# Cached LLM extractions are keyed on this; bump it whenever EXTRACTION_SCHEMA_PROMPT
+# changes so answers to the old prompt are not reused.
+EXTRACTION_SCHEMA_PROMPT_VERSION = "1"
+
 EXTRACTION_SCHEMA_PROMPT = """
 
 You are an expert schema mapping agent specializing in invoices.
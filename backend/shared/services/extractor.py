@@ -1,33 +1,188 @@
+import hashlib
 import json
-from backend.shared.prompts import EXTRACTION_SCHEMA_PROMPT
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, List, Optional, Tuple
+from backend.shared.prompts import EXTRACTION_SCHEMA_PROMPT, EXTRACTION_SCHEMA_PROMPT_VERSION
+from backend.shared.dependencies.config import get_settings
+
+_INVISIBLE = re.compile("[\u200b-\u200d\u2060\ufeff]")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_ocr_text(ocr_text: str) -> str:
+    """OCR text with layout noise removed: Unicode compatibility forms folded,
+    zero-width characters dropped and whitespace runs collapsed. Re-scans of the
+    same invoice that differ only in spacing or line breaks normalize alike."""
+    text = _INVISIBLE.sub("", unicodedata.normalize("NFKC", ocr_text))
+    return _WHITESPACE.sub(" ", text).strip()
+
+def extraction_cache_key(model: str, ocr_text: str) -> str:
+    """LLM cache key of an extraction: hash of the model, prompt version and normalized text."""
+    material = "\0".join((model, EXTRACTION_SCHEMA_PROMPT_VERSION, normalize_ocr_text(ocr_text)))
+    return f"extraction:{hashlib.sha256(material.encode('utf-8')).hexdigest()}"
+
+def parse_llm_json(text: str) -> dict:
+    """Parses the JSON object of an LLM answer, tolerating markdown fences and
+    surrounding prose. Raises ValueError if there is none."""
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError(f"LLM response has no JSON object: {text[:100]!r}")
+    try:
+        return json.loads(text[start:end + 1])
+    except json.JSONDecodeError as e:
+        raise ValueError(f"LLM response is not valid JSON: {e}") from e
+
+class IncrementalJSONParser:
+    """Parses a JSON object as it streams in and reports each top-level member as soon
+    as its value is complete.
+
+    Objects, arrays and strings are complete at their closing character; numbers and
+    literals at the following "," or "}". Text before the opening brace (such as a
+    markdown fence) is skipped. Chunks are kept as they arrive and each character is
+    scanned once; a member's text is joined from its chunks only when it completes, so
+    parsing stays linear in the length of the stream however small the chunks are.
+    """
+
+    def __init__(self):
+        self.fields: dict = {}
+        self.done = False
+        self._chunks: List[str] = []
+        self._chunk_starts: List[int] = []  # offset of each chunk in the stream
+        self._length = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key: Optional[str] = None
+        self._key_start: Optional[int] = None
+        self._value_start: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        if len(self._chunks) > 1:
+            self._chunks, self._chunk_starts = ["".join(self._chunks)], [0]
+        return self._chunks[0] if self._chunks else ""
+
+    def _slice(self, start: int, end: int) -> str:
+        first = bisect_right(self._chunk_starts, start) - 1
+        last = bisect_left(self._chunk_starts, end)
+        offset = self._chunk_starts[first]
+        return "".join(self._chunks[first:last])[start - offset:end - offset]
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Adds a chunk and returns the (key, value) members it completed."""
+        completed = []
+        if not chunk:
+            return completed
+        offset = self._length
+        self._chunks.append(chunk)
+        self._chunk_starts.append(offset)
+        self._length += len(chunk)
+        for j, c in enumerate(chunk):
+            if self.done:
+                break
+            i = offset + j
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._key_start is not None:
+                        self._key = json.loads(self._slice(self._key_start, i + 1))
+                        self._key_start = None
+                    elif self._depth == 1 and self._value_start is not None:
+                        self._complete(self._slice(self._value_start, i + 1), completed)
+                continue
+            if self._depth == 0:
+                if c == "{":
+                    self._depth = 1
+                continue
+            if c == '"':
+                self._in_string = True
+                if self._depth == 1 and self._key is None:
+                    self._key_start = i
+                elif self._depth == 1 and self._value_start is None:
+                    self._value_start = i
+            elif c in "{[":
+                if self._depth == 1 and self._value_start is None:
+                    self._value_start = i
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    self._complete(self._slice(self._value_start, i + 1), completed)
+                elif self._depth == 0:
+                    if self._value_start is not None:
+                        self._complete(self._slice(self._value_start, i), completed)
+                    self.done = True
+            elif self._depth == 1:
+                if c == ",":
+                    if self._value_start is not None:
+                        self._complete(self._slice(self._value_start, i), completed)
+                elif self._key is not None and self._value_start is None and c not in ": \t\r\n":
+                    self._value_start = i
+        return completed
+
+    def _complete(self, value_text: str, completed: list):
+        key, self._key, self._value_start = self._key, None, None
+        if key is None:
+            return
+        try:
+            value = json.loads(value_text)
+        except json.JSONDecodeError:
+            return
+        self.fields[key] = value
+        completed.append((key, value))
 
 class ExtractorService:
-    def __init__(self, mcp_client):
+    def __init__(self, mcp_client, model: str = None):
         self.mcp_client = mcp_client
+        self.model = model or get_settings().EXTRACTION_LLM_MODEL
+
+    def _prompt(self, ocr_text: str) -> str:
+        # Not str.format: the prompt's JSON schema is full of literal braces. The model
+        # gets the text as scanned (its line breaks carry table layout); only the cache
+        # key is normalized.
+        return EXTRACTION_SCHEMA_PROMPT.replace("{extracted_text}", ocr_text)
 
-    def extract_schema(self, ocr_text: str) -> dict:
+    def extract_schema(self, ocr_text: str, ingestion_id: str = "") -> dict:
         """
         Extracts a structured schema from raw OCR text using an LLM.
+
+        The call goes through the MCP's LLM cache, so the same (or only differently
+        spaced) OCR text is sent to the model once per model and prompt version.
+        """
+        llm_response = self.mcp_client.query_llm(
+            self._prompt(ocr_text),
+            self.model,
+            options={"temperature": 0},
+            cache_key=extraction_cache_key(self.model, ocr_text),
+            ingestion_id=ingestion_id,
+        )
+        return parse_llm_json(llm_response.text)
+
+    def extract_schema_stream(self, ocr_text: str, ingestion_id: str = "",
+                              on_field: Optional[Callable[[str, Any], None]] = None) -> dict:
+        """
+        Like extract_schema, but streams the completion (QueryLLMStream) and calls
+        `on_field(name, value)` for each top-level field as soon as it is complete, so
+        header fields can be acted on while line items are still being generated.
         """
-        prompt = EXTRACTION_SCHEMA_PROMPT.format(extracted_text=ocr_text)
-
-        # In a real implementation, you would call the MCP's QueryLLM RPC.
-        # For now, we'll return a fake result.
-        fake_llm_response = {
-            "invoiceNumber": "INV-123",
-            "invoiceDate": "2025-11-25",
-            "dueDate": None,
-            "vendor": {"name": "Dummy Vendor", "gstin": None, "pan": None, "address": None},
-            "customer": {"name": "Dummy Customer", "address": None},
-            "lineItems": [],
-            "totals": {"subtotal": 100.0, "gstAmount": 0.0, "roundOff": None, "grandTotal": 100.0},
-            "paymentDetails": {"mode": None, "reference": None, "status": None},
-        }
-
-        # llm_response = self.mcp_client.query_llm(prompt)
-        # return json.loads(llm_response.text)
-
-        return fake_llm_response
+        parser = IncrementalJSONParser()
+        for chunk in self.mcp_client.query_llm_stream(
+            self._prompt(ocr_text),
+            self.model,
+            options={"temperature": 0},
+            cache_key=extraction_cache_key(self.model, ocr_text),
+            ingestion_id=ingestion_id,
+        ):
+            for name, value in parser.feed(chunk.delta):
+                if on_field:
+                    on_field(name, value)
+        return parse_llm_json(parser.text)
 
 def get_extractor_service(mcp_client) -> ExtractorService:
     return ExtractorService(mcp_client)
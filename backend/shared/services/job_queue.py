@@ -0,0 +1,242 @@
+import itertools
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from backend.mcp.grpc import mcp_pb2
+from backend.shared.dependencies.config import get_settings
+
+PRIORITY_RANKS = {"high": 0, "normal": 1, "low": 2}
+
+def _copy(job: mcp_pb2.OcrJob) -> mcp_pb2.OcrJob:
+    copied = mcp_pb2.OcrJob()
+    copied.CopyFrom(job)
+    return copied
+
+class OcrJobQueue(ABC):
+    """Work queue of OCR jobs with priority lanes (high, normal, low).
+
+    Jobs are represented as `mcp_pb2.OcrJob` messages whatever the backend.
+    """
+
+    @abstractmethod
+    def enqueue(self, ingestion_id: str, file_url: str, metadata: dict, priority: str = "normal") -> mcp_pb2.OcrJob:
+        """Adds a job to the lane matching `priority`."""
+
+    @abstractmethod
+    def claim(self, worker_id: str, max_jobs: int = 1, priorities: Optional[List[str]] = None) -> List[mcp_pb2.OcrJob]:
+        """Claims up to `max_jobs` jobs, highest priority lane first."""
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str, ocr_id: str) -> bool:
+        """Marks a job claimed by `worker_id` as done.
+
+        Returns False, changing nothing, if the worker no longer holds the job because
+        it was reclaimed after the visibility timeout.
+        """
+
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay_s: int = 30) -> bool:
+        """Records a failed attempt; the job is retried until it runs out of attempts.
+
+        Returns False, changing nothing, if the worker no longer holds the job.
+        """
+
+    @abstractmethod
+    def get(self, ingestion_id: str) -> Optional[mcp_pb2.OcrJob]:
+        """Returns the latest job for an ingestion, if any."""
+
+
+class MCPOcrJobQueue(OcrJobQueue):
+    """Durable queue stored in Postgres and claimed with SKIP LOCKED through the MCP."""
+
+    def __init__(self, mcp_client):
+        self.mcp_client = mcp_client
+
+    def enqueue(self, ingestion_id, file_url, metadata, priority="normal"):
+        return self.mcp_client.enqueue_ocr_job(ingestion_id, file_url, metadata, priority)
+
+    def claim(self, worker_id, max_jobs=1, priorities=None):
+        return self.mcp_client.claim_ocr_jobs(worker_id, max_jobs, priorities)
+
+    def complete(self, job_id, worker_id, ocr_id):
+        return self.mcp_client.complete_ocr_job(job_id, worker_id, ocr_id)
+
+    def fail(self, job_id, worker_id, error, retry_delay_s=30):
+        return self.mcp_client.fail_ocr_job(job_id, worker_id, error, retry_delay_s)
+
+    def get(self, ingestion_id):
+        return self.mcp_client.get_ocr_job(ingestion_id)
+
+
+class InMemoryOcrJobQueue(OcrJobQueue):
+    """Non-durable, single-process queue for local development and tests.
+
+    Claims follow the MCP queue: a waiting job moves up one lane per
+    `priority_aging_s`, and the oldest job of the best lane goes first. A RUNNING job
+    not completed or failed within `visibility_timeout_s` is claimed again, or marked
+    FAILED if it has no attempts left. Each claim scans the queued jobs, which is fine
+    at development volumes.
+    """
+
+    def __init__(self, max_attempts: int = 3, visibility_timeout_s: float = 600, priority_aging_s: float = 300):
+        self.max_attempts = max_attempts
+        self.visibility_timeout_s = visibility_timeout_s
+        self.priority_aging_s = priority_aging_s
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._jobs = {}
+        self._created = {}  # job_id -> (monotonic enqueue time, seq)
+        self._queued = {}  # job_id -> monotonic time the job becomes claimable
+        self._leases = {}  # job_id -> (worker_id, monotonic claim time) of RUNNING jobs
+
+    def enqueue(self, ingestion_id, file_url, metadata, priority="normal"):
+        if priority not in PRIORITY_RANKS:
+            priority = "normal"
+        job = mcp_pb2.OcrJob(
+            job_id=f"JOB-{uuid.uuid4()}",
+            ingestion_id=ingestion_id,
+            file_url=file_url or "",
+            metadata=metadata,
+            priority=priority,
+            status="QUEUED",
+        )
+        now = time.monotonic()
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._created[job.job_id] = (now, next(self._seq))
+            self._queued[job.job_id] = now
+        return _copy(job)
+
+    def _claim_order(self, job_id: str, now: float) -> tuple:
+        created_at, seq = self._created[job_id]
+        lanes_up = int((now - created_at) // self.priority_aging_s)
+        return max(PRIORITY_RANKS[self._jobs[job_id].priority] - lanes_up, 0), created_at, seq
+
+    def claim(self, worker_id, max_jobs=1, priorities=None):
+        now = time.monotonic()
+        with self._lock:
+            self._reclaim_abandoned(now)
+            ready = [
+                job_id for job_id, available_at in self._queued.items()
+                if available_at <= now and (not priorities or self._jobs[job_id].priority in priorities)
+            ]
+            claimed = []
+            for job_id in sorted(ready, key=lambda job_id: self._claim_order(job_id, now))[:max_jobs]:
+                del self._queued[job_id]
+                job = self._jobs[job_id]
+                job.status = "RUNNING"
+                job.attempts += 1
+                self._leases[job_id] = (worker_id, now)
+                claimed.append(job)
+            return [_copy(job) for job in claimed]
+
+    def _reclaim_abandoned(self, now: float):
+        cutoff = now - self.visibility_timeout_s
+        for job_id in [job_id for job_id, (_, claimed_at) in self._leases.items() if claimed_at < cutoff]:
+            del self._leases[job_id]
+            job = self._jobs[job_id]
+            if job.attempts >= self.max_attempts:
+                job.status = "FAILED"
+                job.error = f"No result within {self.visibility_timeout_s}s on the last attempt"
+            else:
+                job.status = "QUEUED"
+                self._queued[job_id] = now
+
+    def _release(self, job_id: str, worker_id: str) -> bool:
+        lease = self._leases.get(job_id)
+        if not lease or lease[0] != worker_id:
+            return False
+        del self._leases[job_id]
+        return True
+
+    def complete(self, job_id, worker_id, ocr_id):
+        with self._lock:
+            if not self._release(job_id, worker_id):
+                return False
+            job = self._jobs[job_id]
+            job.status = "DONE"
+            job.ocr_id = ocr_id
+            job.error = ""
+            return True
+
+    def fail(self, job_id, worker_id, error, retry_delay_s=30):
+        with self._lock:
+            if not self._release(job_id, worker_id):
+                return False
+            job = self._jobs[job_id]
+            job.error = error
+            if job.attempts >= self.max_attempts:
+                job.status = "FAILED"
+            else:
+                job.status = "QUEUED"
+                self._queued[job_id] = time.monotonic() + retry_delay_s
+            return True
+
+    def get(self, ingestion_id):
+        with self._lock:
+            matches = [job for job in self._jobs.values() if job.ingestion_id == ingestion_id]
+            return _copy(matches[-1]) if matches else None
+
+
+class AsyncOcrJobQueue(ABC):
+    """The gateway's side of an OcrJobQueue: enqueueing jobs and reading them back from async code."""
+
+    @abstractmethod
+    async def enqueue(self, ingestion_id: str, file_url: str, metadata: dict, priority: str = "normal") -> mcp_pb2.OcrJob:
+        """Adds a job to the lane matching `priority`."""
+
+    @abstractmethod
+    async def get(self, ingestion_id: str) -> Optional[mcp_pb2.OcrJob]:
+        """Returns the latest job for an ingestion, if any."""
+
+
+class AsyncMCPOcrJobQueue(AsyncOcrJobQueue):
+    """MCPOcrJobQueue over an AsyncMCPClient."""
+
+    def __init__(self, mcp_client):
+        self.mcp_client = mcp_client
+
+    async def enqueue(self, ingestion_id, file_url, metadata, priority="normal"):
+        return await self.mcp_client.enqueue_ocr_job(ingestion_id, file_url, metadata, priority)
+
+    async def get(self, ingestion_id):
+        return await self.mcp_client.get_ocr_job(ingestion_id)
+
+
+class AsyncInMemoryOcrJobQueue(AsyncOcrJobQueue):
+    """An InMemoryOcrJobQueue seen from async code; its operations never wait, so they run on the loop."""
+
+    def __init__(self, queue: InMemoryOcrJobQueue):
+        self.queue = queue
+
+    async def enqueue(self, ingestion_id, file_url, metadata, priority="normal"):
+        return self.queue.enqueue(ingestion_id, file_url, metadata, priority)
+
+    async def get(self, ingestion_id):
+        return self.queue.get(ingestion_id)
+
+
+# The "memory" backend is one queue per process, shared by its producers and workers.
+_in_memory_queue: Optional[InMemoryOcrJobQueue] = None
+_in_memory_queue_lock = threading.Lock()
+
+def _shared_in_memory_queue() -> InMemoryOcrJobQueue:
+    global _in_memory_queue
+    with _in_memory_queue_lock:
+        if _in_memory_queue is None:
+            _in_memory_queue = InMemoryOcrJobQueue()
+        return _in_memory_queue
+
+def get_ocr_job_queue(mcp_client) -> OcrJobQueue:
+    if get_settings().OCR_JOB_QUEUE_BACKEND == "memory":
+        return _shared_in_memory_queue()
+    return MCPOcrJobQueue(mcp_client)
+
+def get_async_ocr_job_queue(mcp_client) -> AsyncOcrJobQueue:
+    """get_ocr_job_queue for async callers such as the gateway; `mcp_client` is an AsyncMCPClient."""
+    if get_settings().OCR_JOB_QUEUE_BACKEND == "memory":
+        return AsyncInMemoryOcrJobQueue(_shared_in_memory_queue())
+    return AsyncMCPOcrJobQueue(mcp_client)
@@ -1,23 +1,442 @@
-from typing import List, Dict
+import base64
+import io
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import pytesseract
+from pdf2image import convert_from_path, pdfinfo_from_path
+from PIL import Image
+
+from backend.shared.dependencies.config import get_settings
+from backend.shared.prompts import TYPHOON_EXTRACTION_PROMPT
+from backend.shared.services.process_pool import BoundedProcessPool
+
+try:
+    import easyocr
+except ImportError:  # optional: pip install easyocr
+    easyocr = None
+
+class OcrError(Exception):
+    """No engine of the cascade produced any text."""
+
+@dataclass
+class OcrResult:
+    text: str
+    confidence: float
+    engine: str = ""
+    # One entry per engine considered: engine, outcome, latency_ms, confidence, hit.
+    attempts: List[dict] = field(default_factory=list)
+
+def is_pdf_file(file_path: str, file_name: str = "") -> bool:
+    with open(file_path, "rb") as f:
+        return f.read(5) == b"%PDF-" or file_name.lower().endswith(".pdf")
+
+def page_count(file_path: str, file_name: str = "") -> int:
+    if is_pdf_file(file_path, file_name):
+        return int(pdfinfo_from_path(file_path)["Pages"])
+    with Image.open(file_path) as image:
+        return getattr(image, "n_frames", 1)
+
+def load_page(file_path: str, page: int, is_pdf: bool, dpi: int = 300) -> Image.Image:
+    """Page `page` (from 0) of a document as an image. A PDF page is rendered on its
+    own (needs poppler); for multi-frame images such as TIFF scans a page is a frame."""
+    if is_pdf:
+        return convert_from_path(file_path, dpi=dpi, first_page=page + 1, last_page=page + 1)[0]
+    with Image.open(file_path) as image:
+        image.seek(page)
+        return image.convert("RGB")
+
+def page_images(file_path: str, file_name: str = "", dpi: int = 300) -> Iterator[Image.Image]:
+    """The pages of a document as images, rendered one at a time as they are consumed."""
+    is_pdf = is_pdf_file(file_path, file_name)
+    for page in range(page_count(file_path, file_name)):
+        yield load_page(file_path, page, is_pdf, dpi)
+
+class PagePool(BoundedProcessPool):
+    """Runs a per-page function over a document's pages on a process pool.
+
+    `fn(file_path, page, is_pdf, timeout_s, *args)` loads and processes one page in a
+    worker process, so CPU-bound OCR uses every core and only the page's result, not
+    its image, comes back. Results are returned in page order. Single-page documents,
+    or a pool of one worker, are processed in this process.
+    """
+
+    def map_pages(self, fn: Callable, file_path: str, file_name: str, timeout_s: float, *args) -> list:
+        deadline = time.monotonic() + timeout_s
+        is_pdf = is_pdf_file(file_path, file_name)
+        pages = page_count(file_path, file_name)
+
+        def remaining() -> float:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise TimeoutError
+            return left
+
+        try:
+            if pages == 1:
+                return [fn(file_path, 0, is_pdf, remaining(), *args)]
+            tasks = ((file_path, page, is_pdf, remaining(), *args) for page in range(pages))
+            return list(self.imap(fn, tasks, deadline))
+        except TimeoutError:
+            raise TimeoutError(f"Pages of {file_name} not processed within {timeout_s}s") from None
+
+class OcrEngine(ABC):
+    """One OCR backend of the cascade.
+
+    `recognize` returns the document's text and a confidence in [0, 1] and should give
+    up after about `timeout_s`; the cascade stops waiting for it then in any case.
+    Engines that are not installed or configured report `available()` False and are
+    skipped.
+    """
+
+    name = ""
+
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def recognize(self, file_path: str, file_name: str, timeout_s: float) -> Tuple[str, float]:
+        """Returns the document's text and a confidence in [0, 1]."""
+
+    def close(self):
+        pass
+
+class StubEngine(OcrEngine):
+    """Fixed text for development without any OCR backend. Its zero confidence means
+    any real engine's text is preferred."""
+
+    name = "stub"
+
+    def recognize(self, file_path: str, file_name: str, timeout_s: float) -> Tuple[str, float]:
+        return "Invoice Number: INV-123\nDate: 2025-11-25\nTotal: 100.00", 0.0
+
+def tesseract_page_text(data: dict) -> Tuple[str, List[float]]:
+    """Text and word confidences (0-100) of a pytesseract.image_to_data dict, one
+    line of text per Tesseract line and a blank line between blocks."""
+    lines: Dict[tuple, List[str]] = {}
+    confidences = []
+    for i, word in enumerate(data["text"]):
+        conf = float(data["conf"][i])
+        if conf < 0 or not word.strip():
+            continue
+        lines.setdefault((data["block_num"][i], data["par_num"][i], data["line_num"][i]), []).append(word)
+        confidences.append(conf)
+    text, previous_block = [], None
+    for (block, _, _), words in lines.items():
+        if previous_block is not None and block != previous_block:
+            text.append("")
+        text.append(" ".join(words))
+        previous_block = block
+    return "\n".join(text), confidences
+
+def tesseract_page(file_path: str, page: int, is_pdf: bool, timeout_s: float, dpi: int,
+                   lang: str) -> Tuple[str, List[float]]:
+    """Renders and OCRs one page; runs in PagePool worker processes."""
+    data = pytesseract.image_to_data(
+        load_page(file_path, page, is_pdf, dpi), lang=lang, timeout=timeout_s,
+        output_type=pytesseract.Output.DICT,
+    )
+    return tesseract_page_text(data)
+
+class TesseractEngine(OcrEngine):
+    """Local Tesseract through pytesseract. Pages are rendered and OCRed in parallel
+    on a PagePool of OCR_PAGE_WORKERS processes. The confidence is the mean word
+    confidence over all pages."""
+
+    name = "tesseract"
+
+    def __init__(self, lang: str = None, dpi: int = None, workers: int = None):
+        settings = get_settings()
+        self.lang = lang or settings.OCR_TESSERACT_LANG
+        self.dpi = dpi or settings.OCR_PDF_DPI
+        self.pages = PagePool(settings.OCR_PAGE_WORKERS if workers is None else workers)
+        self._available = None
+
+    def available(self) -> bool:
+        if self._available is None:
+            try:
+                pytesseract.get_tesseract_version()
+                self._available = True
+            except (pytesseract.TesseractNotFoundError, OSError):
+                logging.warning("Tesseract binary not found; the tesseract OCR engine is disabled")
+                self._available = False
+        return self._available
+
+    def recognize(self, file_path: str, file_name: str, timeout_s: float) -> Tuple[str, float]:
+        pages = self.pages.map_pages(tesseract_page, file_path, file_name, timeout_s, self.dpi, self.lang)
+        confidences = [conf for _, page_confidences in pages for conf in page_confidences]
+        confidence = sum(confidences) / len(confidences) / 100 if confidences else 0.0
+        return "\n\n".join(text for text, _ in pages), confidence
+
+    def close(self):
+        self.pages.close()
+
+class EasyOcrEngine(OcrEngine):
+    """EasyOCR, if installed. The reader loads its models on first use."""
+
+    name = "easyocr"
+
+    def __init__(self, langs: str = None, dpi: int = None):
+        settings = get_settings()
+        self.langs = (langs or settings.OCR_EASYOCR_LANGS).split(",")
+        self.dpi = dpi or settings.OCR_PDF_DPI
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        return easyocr is not None
+
+    def recognize(self, file_path: str, file_name: str, timeout_s: float) -> Tuple[str, float]:
+        import numpy
+
+        with self._lock:
+            if self._reader is None:
+                self._reader = easyocr.Reader(self.langs, gpu=False)
+        pages, confidences = [], []
+        for image in page_images(file_path, file_name, self.dpi):
+            results = self._reader.readtext(numpy.array(image))
+            pages.append("\n".join(text for _, text, _ in results))
+            confidences.extend(conf for _, _, conf in results)
+        confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        return "\n\n".join(pages), confidence
+
+def transcription_confidence(text: str) -> float:
+    """Confidence of a vision model's transcription, which comes without one: 0.95
+    less the share of lines the model marked [UNREADABLE]."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return 0.0
+    unreadable = sum("[UNREADABLE]" in line for line in lines)
+    return round(0.95 * (1 - unreadable / len(lines)), 4)
+
+class _VisionLLMEngine(OcrEngine):
+    """A vision model behind an OpenAI-compatible /chat/completions endpoint, sent the
+    pages as PNG images with TYPHOON_EXTRACTION_PROMPT."""
+
+    def __init__(self, api_base: str, api_key: Optional[str], model: str, dpi: int = None):
+        self.api_base = api_base.rstrip("/")
+        self.api_key = api_key
+        self.model = model
+        self.dpi = dpi or get_settings().OCR_PDF_DPI
+
+    def available(self) -> bool:
+        return bool(self.api_key)
+
+    def recognize(self, file_path: str, file_name: str, timeout_s: float) -> Tuple[str, float]:
+        content = [{"type": "text", "text": TYPHOON_EXTRACTION_PROMPT}]
+        for image in page_images(file_path, file_name, self.dpi):
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG")
+            encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+            content.append({"type": "image_url", "image_url": {"url": f"data:image/png;base64,{encoded}"}})
+        response = httpx.post(
+            f"{self.api_base}/chat/completions",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={"model": self.model, "temperature": 0, "messages": [{"role": "user", "content": content}]},
+            timeout=timeout_s,
+        )
+        response.raise_for_status()
+        text = response.json()["choices"][0]["message"]["content"] or ""
+        return text, transcription_confidence(text)
+
+class TyphoonEngine(_VisionLLMEngine):
+    name = "typhoon"
+
+    def __init__(self):
+        settings = get_settings()
+        super().__init__(settings.OCR_TYPHOON_API_BASE, settings.OCR_TYPHOON_API_KEY, settings.OCR_TYPHOON_MODEL)
+
+class GPT4VisionEngine(_VisionLLMEngine):
+    name = "gpt4v"
+
+    def __init__(self):
+        settings = get_settings()
+        super().__init__(settings.OCR_OPENAI_API_BASE, settings.OCR_OPENAI_API_KEY, settings.OCR_OPENAI_MODEL)
+
+class AzureDocumentIntelligenceEngine(OcrEngine):
+    """Azure AI Document Intelligence's prebuilt-read model. The analysis runs
+    asynchronously on Azure's side and is polled until it completes. The confidence is
+    the mean word confidence."""
+
+    name = "azure"
+    api_version = "2023-07-31"
+    poll_interval_s = 1.0
+
+    def __init__(self, endpoint: str = None, api_key: str = None):
+        settings = get_settings()
+        self.endpoint = (endpoint or settings.OCR_AZURE_ENDPOINT or "").rstrip("/")
+        self.api_key = api_key or settings.OCR_AZURE_API_KEY
+
+    def available(self) -> bool:
+        return bool(self.endpoint and self.api_key)
+
+    def recognize(self, file_path: str, file_name: str, timeout_s: float) -> Tuple[str, float]:
+        deadline = time.monotonic() + timeout_s
+        headers = {"Ocp-Apim-Subscription-Key": self.api_key}
+        with open(file_path, "rb") as f:
+            response = httpx.post(
+                f"{self.endpoint}/formrecognizer/documentModels/prebuilt-read:analyze",
+                params={"api-version": self.api_version},
+                headers={**headers, "Content-Type": "application/octet-stream"},
+                content=f.read(),
+                timeout=timeout_s,
+            )
+        response.raise_for_status()
+        operation_url = response.headers["Operation-Location"]
+        while True:
+            time.sleep(self.poll_interval_s)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Azure analysis did not finish in time")
+            body = httpx.get(operation_url, headers=headers, timeout=remaining).raise_for_status().json()
+            if body["status"] == "succeeded":
+                break
+            if body["status"] == "failed":
+                raise RuntimeError(f"Azure analysis failed: {body.get('error')}")
+        result = body["analyzeResult"]
+        confidences = [word["confidence"] for page in result.get("pages", []) for word in page.get("words", [])]
+        confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        return result.get("content", ""), confidence
+
+ENGINES = {
+    engine.name: engine
+    for engine in (TyphoonEngine, GPT4VisionEngine, AzureDocumentIntelligenceEngine, TesseractEngine,
+                   EasyOcrEngine, StubEngine)
+}
+
+def create_engine(name: str) -> OcrEngine:
+    if name not in ENGINES:
+        raise ValueError(f"Unknown OCR engine: {name}")
+    return ENGINES[name]()
+
+def parse_engine_timeouts(spec: str) -> Dict[str, float]:
+    """Per-engine timeouts from "engine=seconds,..." (OCR_ENGINE_TIMEOUTS)."""
+    timeouts = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, seconds = item.partition("=")
+        timeouts[name.strip()] = float(seconds)
+    return timeouts
+
+class OcrCascade:
+    """Tries OCR engines in order until one is confident enough.
+
+    Each available engine is given its timeout; its text is accepted, and the later
+    engines are not tried, once its confidence reaches `confidence_threshold`.
+    Otherwise the cascade moves on and, if no engine gets there, returns the most
+    confident text it got. Every engine considered is passed to
+    `record_metric(ingestion_id, metrics)` with its outcome (accepted,
+    low_confidence, timeout, error or unavailable), latency, confidence and whether
+    its text was the one returned (`hit`).
+    """
+
+    def __init__(self, engines: List[OcrEngine], confidence_threshold: float, timeout_s: float,
+                 timeouts: Optional[Dict[str, float]] = None,
+                 record_metric: Optional[Callable[[str, dict], None]] = None):
+        self.engines = engines
+        self.confidence_threshold = confidence_threshold
+        self.timeout_s = timeout_s
+        self.timeouts = timeouts or {}
+        self.record_metric = record_metric
+
+    def run(self, file_path: str, file_name: str, ingestion_id: str = "") -> OcrResult:
+        best: Optional[OcrResult] = None
+        attempts = []
+        for position, engine in enumerate(self.engines):
+            attempt = {"engine": engine.name, "position": position, "latency_ms": 0.0, "confidence": None}
+            attempts.append(attempt)
+            if not engine.available():
+                attempt["outcome"] = "unavailable"
+                continue
+            timeout_s = self.timeouts.get(engine.name, self.timeout_s)
+            started = time.monotonic()
+            try:
+                text, confidence = self._call(engine, file_path, file_name, timeout_s)
+            except FutureTimeoutError:
+                attempt["outcome"] = "timeout"
+                logging.warning(f"OCR engine {engine.name} timed out after {timeout_s}s on {file_name}")
+                continue
+            except Exception as e:
+                attempt["outcome"] = "error"
+                logging.warning(f"OCR engine {engine.name} failed on {file_name}: {e}")
+                continue
+            finally:
+                attempt["latency_ms"] = round((time.monotonic() - started) * 1000, 2)
+            confidence = confidence if text.strip() else 0.0
+            attempt["confidence"] = round(confidence, 4)
+            if best is None or confidence > best.confidence:
+                best = OcrResult(text, confidence, engine.name)
+            if confidence >= self.confidence_threshold:
+                attempt["outcome"] = "accepted"
+                break
+            attempt["outcome"] = "low_confidence"
+
+        for attempt in attempts:
+            attempt["hit"] = best is not None and attempt["engine"] == best.engine
+            self._record(ingestion_id, attempt)
+        if best is None:
+            raise OcrError(f"No OCR engine could read {file_name}: {[(a['engine'], a['outcome']) for a in attempts]}")
+        best.attempts = attempts
+        return best
+
+    @staticmethod
+    def _call(engine: OcrEngine, file_path: str, file_name: str, timeout_s: float):
+        # Engines are asked to respect their timeout, but one that does not (a hung
+        # request, a stuck native call) is left behind on its daemon thread.
+        future = Future()
+
+        def target():
+            try:
+                future.set_result(engine.recognize(file_path, file_name, timeout_s))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=target, name=f"ocr-{engine.name}", daemon=True).start()
+        return future.result(timeout=timeout_s)
+
+    def _record(self, ingestion_id: str, metrics: dict):
+        if not self.record_metric:
+            return
+        try:
+            self.record_metric(ingestion_id, metrics)
+        except Exception as e:
+            logging.warning(f"Could not record OCR metrics: {e}")
 
 class OcrService:
-    def __init__(self, mcp_client):
+    def __init__(self, mcp_client, telemetry=None, engines: Optional[List[OcrEngine]] = None):
+        settings = get_settings()
         self.mcp_client = mcp_client
+        self.telemetry = telemetry
+        if engines is None:
+            engines = [create_engine(name.strip()) for name in settings.OCR_ENGINES.split(",") if name.strip()]
+        self.cascade = OcrCascade(
+            engines,
+            confidence_threshold=settings.OCR_CONFIDENCE_THRESHOLD,
+            timeout_s=settings.OCR_ENGINE_TIMEOUT_S,
+            timeouts=parse_engine_timeouts(settings.OCR_ENGINE_TIMEOUTS),
+            record_metric=self._record_metric if telemetry else None,
+        )
 
-    def perform_ocr(self, file_bytes: bytes, file_name: str) -> str:
+    def perform_ocr(self, file_path: str, file_name: str, ingestion_id: str = "") -> OcrResult:
         """
-        Performs OCR on a file using a cascading series of OCR services.
-        This is a stub and returns fake OCR text.
+        Performs OCR on a file through the engine cascade (OCR_ENGINES, by default
+        Typhoon → GPT-4 Vision → Azure Document Intelligence → Tesseract → EasyOCR).
+        The document is read from `file_path` rather than passed in memory.
         """
-        # In a real implementation, you would call the OCR services in order:
-        # 1. Typhoon
-        # 2. GPT-4 Vision
-        # 3. Azure Document Intelligence
-        # 4. Tesseract
-        # 5. EasyOCR
-
-        # For now, we'll return a fake result.
-        return "Invoice Number: INV-123\nDate: 2025-11-25\nTotal: 100.00"
-
-def get_ocr_service(mcp_client) -> OcrService:
-    return OcrService(mcp_client)
+        return self.cascade.run(file_path, file_name, ingestion_id)
+
+    def close(self):
+        for engine in self.cascade.engines:
+            engine.close()
+
+    def _record_metric(self, ingestion_id: str, metrics: dict):
+        self.telemetry.write_metric(agent="OCR-ENGINE", ingestion_id=ingestion_id, metrics=metrics)
+
+def get_ocr_service(mcp_client, telemetry=None) -> OcrService:
+    return OcrService(mcp_client, telemetry)
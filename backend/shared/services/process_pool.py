@@ -0,0 +1,75 @@
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, Iterator, Optional
+
+def available_cores() -> int:
+    """Number of cores this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+class BoundedProcessPool:
+    """A process pool, started on first use, that maps a function over a stream of tasks.
+
+    At most two tasks per worker are in flight, so memory stays bounded however many
+    tasks the stream holds, and results are yielded in task order. Tasks are drawn from
+    the stream only when they are submitted. A pool of one worker runs them in this
+    process. If a worker dies the pool is discarded and the next map starts a new one.
+    """
+
+    def __init__(self, workers: int = 0):
+        self.workers = workers or available_cores()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # forkserver: the agents fork from multi-threaded gRPC servers.
+                self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("forkserver"))
+            return self._pool
+
+    def imap(self, fn: Callable, tasks: Iterable[tuple], deadline: Optional[float] = None) -> Iterator:
+        """Yields `fn(*task)` for each task, in order.
+
+        Raises TimeoutError once the `time.monotonic()` deadline passes.
+        """
+        if self.workers == 1:
+            for task in tasks:
+                yield fn(*task)
+            return
+
+        executor = self._executor()
+        pending = deque()
+        try:
+            for task in tasks:
+                pending.append(executor.submit(fn, *task))
+                if len(pending) >= 2 * self.workers:
+                    yield self._result(pending.popleft(), deadline)
+            while pending:
+                yield self._result(pending.popleft(), deadline)
+        except BrokenProcessPool:
+            with self._lock:
+                self._pool = None
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _result(future, deadline: Optional[float]):
+        if deadline is None:
+            return future.result()
+        return future.result(timeout=max(deadline - time.monotonic(), 0))
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool:
+            pool.shutdown(cancel_futures=True)
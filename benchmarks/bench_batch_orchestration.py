@@ -0,0 +1,76 @@
+"""
+Batch orchestration throughput.
+
+Runs `--flows` orchestration graphs one after another (the per-request
+`POST /orchestrate/{ingestion_id}` pattern) and then as one BatchRun for each worker
+count in `--workers`. Agent calls are simulated by sleeping `--agent-ms` inside each
+agent's concurrency slot, so the per-agent limits (`--extraction-limit` for OCR,
+`--agent-limit` for the rest) shape throughput the same way real agents would.
+No MCP or agents are needed.
+
+Usage:
+    python -m benchmarks.bench_batch_orchestration --flows 200 --workers 1,8,16,32 --agent-ms 20
+"""
+import argparse
+import time
+from contextlib import contextmanager
+
+from backend.orchestrator.batch import AgentLimits, BatchRun
+from backend.orchestrator.flow.graph import build_graph
+
+class SimulatedAgents(AgentLimits):
+    """AgentLimits whose slots also stand in for the agent's response time."""
+
+    def __init__(self, limits: dict, agent_ms: float):
+        super().__init__(limits)
+        self.agent_s = agent_ms / 1000
+
+    @contextmanager
+    def slot(self, agent: str):
+        with super().slot(agent):
+            time.sleep(self.agent_s)
+            yield
+
+def make_run_flow(limits: AgentLimits):
+    graph = build_graph(None, limits)
+
+    def run_flow(ingestion_id: str) -> dict:
+        final = {}
+        for final in graph.stream({"ingestion_id": ingestion_id}, stream_mode="values"):
+            pass
+        return final
+    return run_flow
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--flows", type=int, default=200)
+    parser.add_argument("--workers", default="1,8,16,32")
+    parser.add_argument("--agent-ms", type=float, default=20.0, help="simulated latency of every agent call")
+    parser.add_argument("--extraction-limit", type=int, default=4)
+    parser.add_argument("--agent-limit", type=int, default=8)
+    args = parser.parse_args()
+
+    def limits():
+        per_agent = {agent: args.agent_limit for agent in ("mapping", "validation", "report", "conversion", "integration")}
+        return SimulatedAgents({"extraction": args.extraction_limit, **per_agent}, args.agent_ms)
+
+    ids = [f"ING-BENCH-{i}" for i in range(args.flows)]
+
+    run_flow = make_run_flow(limits())
+    start = time.perf_counter()
+    for ingestion_id in ids:
+        run_flow(ingestion_id)
+    serial_s = time.perf_counter() - start
+    print(f"{'mode':>12} {'flows/s':>9} {'elapsed s':>10} {'avg flow ms':>12}")
+    print(f"{'sequential':>12} {args.flows / serial_s:>9.1f} {serial_s:>10.2f} {serial_s / args.flows * 1000:>12.1f}")
+
+    for workers in (int(w) for w in args.workers.split(",")):
+        batch = BatchRun(ids, make_run_flow(limits()), max_workers=workers).start()
+        for _ in batch.stream():
+            pass
+        summary = batch.progress()
+        print(f"{f'batch x{workers}':>12} {summary['throughput_per_s']:>9.1f} {summary['elapsed_s']:>10.2f} "
+              f"{summary['avg_flow_s'] * 1000:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Connection pool load test for the MCP database engine.
+
+Runs `--workers` threads (the MCP gRPC worker count) issuing short transactions
+against Postgres (DATABASE_URL) for each pool size in `--pool-sizes`, and reports
+throughput, latency and pool wait metrics. The knee is the smallest pool size that
+reaches 95% of the best throughput; sizing DB_POOL_SIZE beyond it only adds
+idle server connections.
+
+Usage:
+    DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.bench_db_pool --workers 10 --pool-sizes 1,2,4,6,8,10
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from backend.mcp.db.engine import DATABASE_URL, create_db_engine
+
+def run(pool_size: int, workers: int, duration_s: float, query_ms: float, app_ms: float) -> dict:
+    engine = create_db_engine(DATABASE_URL, pool_size=pool_size, max_overflow=0, pool_timeout=60)
+    Session = sessionmaker(bind=engine)
+    latencies = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration_s
+
+    def worker():
+        local = []
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            # Request handling outside the transaction (protobuf decoding, blob I/O, ...).
+            time.sleep(app_ms / 1000)
+            with Session() as session:
+                session.execute(text("SELECT pg_sleep(:s)"), {"s": query_ms / 1000})
+                session.commit()
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    stats = engine.pool.stats()
+    engine.dispose()
+    latencies.sort()
+    return {
+        "pool_size": pool_size,
+        "ops_per_s": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "wait_ratio": stats["waits"] / stats["checkouts"],
+        "avg_checkout_ms": stats["avg_checkout_ms"],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--pool-sizes", default="1,2,4,6,8,10,12")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--query-ms", type=float, default=2.0, help="simulated server time per transaction")
+    parser.add_argument("--app-ms", type=float, default=2.0, help="simulated work per request outside the transaction")
+    args = parser.parse_args()
+
+    results = [
+        run(int(size), args.workers, args.duration, args.query_ms, args.app_ms)
+        for size in args.pool_sizes.split(",")
+    ]
+
+    print(f"{'pool':>5} {'ops/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'waits':>7} {'checkout ms':>12}")
+    for r in results:
+        print(f"{r['pool_size']:>5} {r['ops_per_s']:>9.0f} {r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+              f"{r['wait_ratio']:>6.0%} {r['avg_checkout_ms']:>12.2f}")
+
+    best = max(r["ops_per_s"] for r in results)
+    knee = next(r for r in results if r["ops_per_s"] >= 0.95 * best)
+    print(f"knee: pool_size={knee['pool_size']} for {args.workers} workers ({knee['ops_per_s']:.0f} ops/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Load benchmark for concurrent uploads through the gateway.
+
+Starts in-process fake MCP and extraction agent gRPC servers with a fixed simulated
+latency, then drives POST /ingestion/upload with N concurrent clients against:
+
+  * sync  - the previous handler shape: `async def` calling the blocking MCPClient/AgentsClient
+  * async - the current gateway app using the grpc.aio clients, which enqueues the OCR job
+            instead of waiting for StartOCR
+
+Usage:
+    python -m benchmarks.bench_gateway_upload --requests 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from concurrent import futures
+
+import grpc
+import httpx
+
+from backend.shared.grpc import agent_comm_pb2, agent_comm_pb2_grpc, mcp_pb2, mcp_pb2_grpc
+
+class FakeMCP(mcp_pb2_grpc.MCPServicer):
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def UploadDocument(self, request_iterator, context):
+        for _ in request_iterator:
+            pass
+        time.sleep(self.latency)
+        return mcp_pb2.SaveDocResp(ok=True)
+
+    def EnqueueOcrJob(self, request, context):
+        time.sleep(self.latency)
+        return mcp_pb2.OcrJob(job_id="JOB-BENCH", ingestion_id=request.ingestion_id, status="QUEUED")
+
+class FakeExtraction(agent_comm_pb2_grpc.AgentCommServicer):
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def StartOCR(self, request, context):
+        time.sleep(self.latency)
+        return agent_comm_pb2.OCRResponse(ocr_id="OCR-BENCH", status="EXTRACTED")
+
+def start_fake_servers(mcp_latency: float, ocr_latency: float):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=256))
+    mcp_pb2_grpc.add_MCPServicer_to_server(FakeMCP(mcp_latency), server)
+    mcp_port = server.add_insecure_port("localhost:0")
+
+    agent_server = grpc.server(futures.ThreadPoolExecutor(max_workers=256))
+    agent_comm_pb2_grpc.add_AgentCommServicer_to_server(FakeExtraction(ocr_latency), agent_server)
+    agent_port = agent_server.add_insecure_port("localhost:0")
+
+    server.start()
+    agent_server.start()
+    os.environ.update({
+        "MCP_HOST": "localhost", "MCP_PORT": str(mcp_port),
+        "EXTRACTION_AGENT_HOST": "localhost", "EXTRACTION_AGENT_PORT": str(agent_port),
+    })
+    return server, agent_server
+
+def build_sync_app():
+    """The upload handler as it was before the gateway moved to grpc.aio."""
+    from fastapi import FastAPI, File, UploadFile
+    from backend.shared.clients.agents import AgentsClient
+    from backend.shared.clients.mcp import MCPClient, iter_file_chunks
+
+    app = FastAPI()
+    mcp_client, agents_client = MCPClient(), AgentsClient()
+
+    @app.post("/ingestion/upload")
+    async def upload_ingestion(file: UploadFile = File(...)):
+        mcp_client.upload_document("ING-BENCH", file.filename, "s3://bench", {}, iter_file_chunks(file.file))
+        agents_client.start_ocr("ING-BENCH", "s3://bench", {})
+        return {"status": "ACCEPTED"}
+
+    return app
+
+def build_async_app():
+    from backend.gateway.app.main import app
+    return app
+
+async def run_load(app, total: int, concurrency: int, payload: bytes):
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        async def one():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post("/ingestion/upload", files={"file": ("scan.pdf", payload)})
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - start
+
+    from backend.gateway.app.dependencies.grpc_clients import close_async_clients
+    await close_async_clients()
+
+    latencies.sort()
+    return {
+        "req_per_s": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--mcp-latency-ms", type=float, default=20)
+    parser.add_argument("--ocr-latency-ms", type=float, default=100)
+    parser.add_argument("--payload-kb", type=int, default=256)
+    args = parser.parse_args()
+
+    servers = start_fake_servers(args.mcp_latency_ms / 1000, args.ocr_latency_ms / 1000)
+    from backend.shared.dependencies.config import get_settings
+    get_settings.cache_clear()
+
+    payload = os.urandom(args.payload_kb * 1024)
+    for mode, build in (("sync", build_sync_app), ("async", build_async_app)):
+        result = asyncio.run(run_load(build(), args.requests, args.concurrency, payload))
+        print(f"{mode:>5}: {result['req_per_s']:8.1f} req/s  p50={result['p50_ms']:7.1f} ms  p99={result['p99_ms']:7.1f} ms")
+
+    for server in servers:
+        server.stop(None)
+
+if __name__ == "__main__":
+    main()
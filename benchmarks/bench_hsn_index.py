@@ -0,0 +1,83 @@
+"""
+HSN/SAC master load time and lookup throughput.
+
+Generates a master of `--codes` codes across chapters, headings, subheadings and
+tariff items and reports the time to load it from CSV, then lookups/s and ns per
+lookup for codes found as-is, codes resolved to a shorter heading, unknown codes,
+and rate lookups, against a linear scan of the headings for reference.
+
+Usage:
+    python -m benchmarks.bench_hsn_index --codes 20000 --lookups 500000
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+from backend.agents.common.hsn_index import load_hsn_master
+
+RATES = ("0", "5", "12", "18", "28", "5|12", "12|18")
+
+def make_codes(count: int, rng: random.Random):
+    codes = {}
+    while len(codes) < count:
+        code = f"{rng.randint(1, 99):02d}{rng.randint(1, 99):02d}"
+        codes.setdefault(code, rng.choice(RATES))
+        for _ in range(rng.randint(0, 3)):
+            code += f"{rng.randint(10, 99)}"
+            if len(code) > 8:
+                break
+            codes.setdefault(code, rng.choice(RATES))
+    return codes
+
+def per_lookup(codes, fn):
+    started = time.perf_counter()
+    fn(codes)
+    elapsed = time.perf_counter() - started
+    return len(codes) / elapsed, elapsed / len(codes) * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--codes", type=int, default=20000)
+    parser.add_argument("--lookups", type=int, default=500000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    codes = make_codes(args.codes, rng)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "hsn.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["code", "description", "rates"])
+            writer.writerows((code, f"Goods {code}", rates) for code, rates in codes.items())
+        started = time.perf_counter()
+        index = load_hsn_master(path)
+    print(f"{len(index)} codes: loaded in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    master_codes = list(codes)
+    exact = rng.choices(master_codes, k=args.lookups)
+    prefixed = [code + "9" * (8 - len(code)) if len(code) < 8 else code for code in exact]
+    unknown = [f"00{rng.randint(0, 999999):06d}" for _ in range(args.lookups)]
+    headings = sorted((code for code in master_codes if len(code) == 4))
+
+    def scan(items):
+        for code in items:
+            next((h for h in headings if code.startswith(h)), None)
+
+    print(f"{'lookup':<30} {'per second':>12} {'ns each':>9}")
+    for label, items, fn in (
+        ("resolve, exact code", exact, lambda items: [index.resolve(c) for c in items]),
+        ("resolve, under a heading", prefixed, lambda items: [index.resolve(c) for c in items]),
+        ("resolve, unknown code", unknown, lambda items: [index.resolve(c) for c in items]),
+        ("rates, under a heading", prefixed, lambda items: [index.rates(c) for c in items]),
+        ("linear scan of headings", prefixed[:1000], scan),
+    ):
+        per_second, ns = per_lookup(items, fn)
+        print(f"{label:<30} {per_second:>12.0f} {ns:>9.0f}")
+    assert all(index.resolve(code) == code for code in exact[:1000])
+
+if __name__ == "__main__":
+    main()
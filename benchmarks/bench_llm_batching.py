@@ -0,0 +1,66 @@
+"""
+LLM request coalescing.
+
+Sends `--calls` prompts from `--concurrency` threads through an LLMDispatcher whose
+provider simulates a model server: every request costs `--request-ms` plus
+`--prompt-ms` per prompt in it, and the server runs at most `--max-concurrency`
+requests at once. Runs once with batching off (one prompt per request) and once per
+batch size in `--batch-sizes`, reporting calls/s and the mean batch size. No model
+or MCP is needed.
+
+Usage:
+    python -m benchmarks.bench_llm_batching --calls 400 --concurrency 32 --batch-sizes 4,8,16
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.mcp.llm.client import FakeLLMProvider
+from backend.mcp.llm.dispatcher import LLMDispatcher
+
+class SimulatedModelServer(FakeLLMProvider):
+    def __init__(self, request_s: float, prompt_s: float):
+        self.request_s = request_s
+        self.prompt_s = prompt_s
+
+    def complete(self, prompts, model, options):
+        time.sleep(self.request_s + self.prompt_s * len(prompts))
+        return super().complete(prompts, model, options)
+
+def run(dispatcher: LLMDispatcher, calls: int, concurrency: int):
+    batch_sizes = []
+    lock = threading.Lock()
+
+    def call(i: int):
+        _, served = dispatcher.query(f"Invoice Number: INV-{i}", "bench-model", {})
+        with lock:
+            batch_sizes.append(served["batch_size"])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(call, range(calls)))
+    return time.perf_counter() - start, statistics.mean(batch_sizes)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--batch-sizes", default="4,8,16")
+    parser.add_argument("--batch-window-ms", type=float, default=10.0)
+    parser.add_argument("--request-ms", type=float, default=40.0, help="fixed cost of one request")
+    parser.add_argument("--prompt-ms", type=float, default=5.0, help="added cost of each prompt in a request")
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    provider = SimulatedModelServer(args.request_ms / 1000, args.prompt_ms / 1000)
+    print(f"{'batch size':>10} {'calls/s':>9} {'elapsed s':>10} {'mean batch':>11}")
+    for batch_size in [1] + [int(size) for size in args.batch_sizes.split(",")]:
+        dispatcher = LLMDispatcher(provider, max_concurrency=args.max_concurrency,
+                                   max_batch_size=batch_size, batch_window_s=args.batch_window_ms / 1000)
+        elapsed, mean_batch = run(dispatcher, args.calls, args.concurrency)
+        print(f"{batch_size:>10} {args.calls / elapsed:>9.1f} {elapsed:>10.2f} {mean_batch:>11.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Concurrent RPC benchmark: threaded MCP server vs the grpc.aio/asyncpg server.
+
+Starts the MCP server (MCP_SERVER_MODE threaded or aio) in a child process against a
+real Postgres (DATABASE_URL) and drives `--concurrency` in-flight RPCs from a grpc.aio
+client: a mix of GetOrchestration reads and SaveOrchestration upserts. Reports
+throughput and p50/p99 latency for each mode.
+
+`--db-latency-ms` routes the server's database traffic through a local TCP proxy that
+delays every response, to model a database across the network rather than on the
+same host.
+
+Usage:
+    DATABASE_URL=postgresql+psycopg2://... DB_POOL_SIZE=40 \\
+        python -m benchmarks.bench_mcp_server --requests 5000 --concurrency 100 --db-latency-ms 5
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import statistics
+import threading
+import time
+
+import grpc
+from sqlalchemy.engine import make_url
+
+from backend.shared.grpc import mcp_pb2, mcp_pb2_grpc
+
+def start_latency_proxy(database_url: str, latency_s: float) -> str:
+    """Starts a delaying TCP proxy to the database in a background thread.
+
+    Returns DATABASE_URL rewritten to point at the proxy.
+    """
+    url = make_url(database_url)
+    socket_dir = url.query.get("host")
+    ready = threading.Event()
+    bound = {}
+
+    async def pipe(reader, writer, delay):
+        try:
+            while data := await reader.read(65536):
+                if delay:
+                    await asyncio.sleep(delay)
+                writer.write(data)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def handle(client_reader, client_writer):
+        if socket_dir:
+            upstream = await asyncio.open_unix_connection(os.path.join(socket_dir, f".s.PGSQL.{url.port or 5432}"))
+        else:
+            upstream = await asyncio.open_connection(url.host, url.port or 5432)
+        up_reader, up_writer = upstream
+        await asyncio.gather(pipe(client_reader, up_writer, 0), pipe(up_reader, client_writer, latency_s))
+
+    async def main():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        bound["port"] = server.sockets[0].getsockname()[1]
+        ready.set()
+        await server.serve_forever()
+
+    threading.Thread(target=lambda: asyncio.run(main()), daemon=True).start()
+    ready.wait()
+    proxied = url.set(host="127.0.0.1", port=bound["port"], query={k: v for k, v in url.query.items() if k != "host"})
+    return proxied.render_as_string(hide_password=False)
+
+def _run_server(mode: str, ports):
+    logging.disable(logging.WARNING)
+    from backend.mcp.db.engine import Base, engine
+    Base.metadata.create_all(engine)
+
+    if mode == "aio":
+        from backend.mcp import aio_server
+        from backend.mcp.db.async_engine import init_async_engine
+
+        async def main():
+            init_async_engine()
+            server, port = aio_server.create_server(aio_server.AsyncMCPServicer(), "localhost:0")
+            await server.start()
+            ports.put(port)
+            await server.wait_for_termination()
+
+        asyncio.run(main())
+    else:
+        from concurrent import futures
+        from backend.mcp import server as mcp_server
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=mcp_server.MCP_GRPC_WORKERS))
+        mcp_pb2_grpc.add_MCPServicer_to_server(mcp_server.MCPServicer(), server)
+        port = server.add_insecure_port("localhost:0")
+        server.start()
+        ports.put(port)
+        server.wait_for_termination()
+
+async def run_load(port: int, total: int, concurrency: int, write_ratio: float) -> dict:
+    channel = grpc.aio.insecure_channel(f"localhost:{port}")
+    stub = mcp_pb2_grpc.MCPStub(channel)
+    keys = [f"ING-BENCH-{i}" for i in range(100)]
+    for key in keys:
+        await stub.SaveOrchestration(mcp_pb2.OrchestrationState(ingestion_id=key, state_bytes=b'{"status": "RUNNING"}'))
+
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    writes_every = int(1 / write_ratio) if write_ratio else 0
+
+    async def one(i: int):
+        key = keys[i % len(keys)]
+        async with semaphore:
+            start = time.perf_counter()
+            if writes_every and i % writes_every == 0:
+                await stub.SaveOrchestration(mcp_pb2.OrchestrationState(ingestion_id=key, state_bytes=b'{"status": "DONE"}'))
+            else:
+                await stub.GetOrchestration(mcp_pb2.GetDocReq(ingestion_id=key))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - start
+    await channel.close()
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--db-latency-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    if args.db_latency_ms:
+        from backend.mcp.db.engine import DATABASE_URL
+        proxied = start_latency_proxy(DATABASE_URL, args.db_latency_ms / 1000)
+        os.environ["DATABASE_URL"] = proxied
+        os.environ["ASYNC_DATABASE_URL"] = proxied.replace("+psycopg2", "+asyncpg")
+
+    ctx = multiprocessing.get_context("spawn")
+    for mode in ("threaded", "aio"):
+        ports = ctx.Queue()
+        process = ctx.Process(target=_run_server, args=(mode, ports), daemon=True)
+        process.start()
+        try:
+            port = ports.get(timeout=60)
+            result = asyncio.run(run_load(port, args.requests, args.concurrency, args.write_ratio))
+        finally:
+            process.terminate()
+            process.join()
+        print(f"{mode:>8}: {result['rps']:8.0f} req/s  p50={result['p50_ms']:7.1f} ms  p99={result['p99_ms']:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
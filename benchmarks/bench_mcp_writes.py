@@ -0,0 +1,71 @@
+"""
+Throughput benchmark for MCP metric writes.
+
+Compares, against a real Postgres (DATABASE_URL), N threads each writing metrics:
+
+  * per-row  - repository.write_metric, one session and commit per row (the unbuffered path)
+  * insert   - BatchWriter flushing with a multi-row INSERT
+  * copy     - BatchWriter flushing with COPY FROM STDIN
+
+Usage:
+    DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.bench_mcp_writes --rows 20000 --threads 10
+"""
+import argparse
+import json
+import logging
+import time
+from concurrent import futures
+
+from backend.mcp.db import repository
+from backend.mcp.db.engine import Base, engine
+from backend.mcp.db.writer import BatchWriter
+
+METRIC_JSON = json.dumps({"ocr_time_ms": 812, "text_length": 2048, "success": True})
+
+def run_per_row(rows: int, threads: int) -> float:
+    def write(i):
+        repository.write_metric("BENCH", f"ING-{i}", METRIC_JSON, int(time.time()))
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(threads) as pool:
+        list(pool.map(write, range(rows)))
+    return rows / (time.perf_counter() - start)
+
+def run_buffered(rows: int, threads: int, use_copy: bool, batch_size: int) -> float:
+    writer = BatchWriter(
+        "bench",
+        lambda batch: repository.bulk_write_metrics(batch, use_copy=use_copy),
+        max_batch_size=batch_size,
+    ).start()
+
+    def write(i):
+        writer.submit(repository.metric_row("BENCH", f"ING-{i}", METRIC_JSON, int(time.time())))
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(threads) as pool:
+        list(pool.map(write, range(rows)))
+    writer.close()
+    elapsed = time.perf_counter() - start
+    assert writer.rows_written == rows, writer.stats()
+    return rows / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    Base.metadata.create_all(engine)
+
+    results = {
+        "per-row": run_per_row(args.rows, args.threads),
+        "insert": run_buffered(args.rows, args.threads, use_copy=False, batch_size=args.batch_size),
+        "copy": run_buffered(args.rows, args.threads, use_copy=True, batch_size=args.batch_size),
+    }
+    for mode, rows_per_s in results.items():
+        print(f"{mode:>8}: {rows_per_s:10.0f} rows/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+OCR cascade latency/accuracy trade-off.
+
+Builds a corpus of `--docs` synthetic invoices, a `--poor-share` of them poor scans,
+and OCRs it with every engine alone and with OcrCascade in two engine orders (the
+documented remote-first order and a local-first one) at each threshold in
+`--thresholds`. Reports mean and p95 latency, character accuracy against the ground
+truth and the mean number of engines tried per document.
+
+By default the engines are simulated: each has a latency and an accuracy on clean
+and poor scans, modeled on the real services, garbles that share of characters and
+reports a noisy estimate of its accuracy as confidence. Sleeps are shortened by
+`--time-scale` and latencies reported unscaled. With `--real` the corpus is rendered
+to PNG images (poor scans blurred and speckled) and OCRed by the engines of
+OCR_ENGINES that are available here.
+
+Usage:
+    python -m benchmarks.bench_ocr_cascade --docs 200 --thresholds 0.8,0.9,0.95
+    python -m benchmarks.bench_ocr_cascade --real --docs 20
+"""
+import argparse
+import difflib
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from backend.shared.dependencies.config import get_settings
+from backend.shared.services.ocr import OcrCascade, OcrEngine, OcrError, create_engine
+
+REMOTE_FIRST = ["typhoon", "gpt4v", "azure", "tesseract", "easyocr"]
+LOCAL_FIRST = ["tesseract", "easyocr", "azure", "typhoon", "gpt4v"]
+
+# name: (latency ms, accuracy on a clean scan, accuracy on a poor scan)
+PROFILES = {
+    "typhoon": (1800, 0.99, 0.95),
+    "gpt4v": (2500, 0.985, 0.93),
+    "azure": (900, 0.98, 0.90),
+    "tesseract": (350, 0.97, 0.70),
+    "easyocr": (600, 0.95, 0.78),
+}
+
+def make_corpus(docs: int, poor_share: float, rng: random.Random):
+    corpus = []
+    for i in range(docs):
+        lines = [
+            f"Invoice Number: INV-{rng.randint(1000, 99999)}",
+            f"Date: 2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            f"Vendor: Supplier {rng.randint(1, 500)} Pvt Ltd",
+            f"GSTIN: {rng.randint(10, 35)}ABCDE{rng.randint(1000, 9999)}F1Z5",
+        ]
+        for n in range(rng.randint(2, 8)):
+            lines.append(f"{n + 1} Item {rng.randint(100, 999)} {rng.randint(1, 20)} x {rng.randint(10, 5000)}.00")
+        lines.append(f"Total: {rng.randint(100, 90000)}.00")
+        quality = rng.uniform(0.0, 0.4) if rng.random() < poor_share else rng.uniform(0.8, 1.0)
+        corpus.append((f"doc-{i}.png", "\n".join(lines), quality))
+    return corpus
+
+class SimulatedEngine(OcrEngine):
+    def __init__(self, name: str, corpus: dict, time_scale: float, seed: int):
+        self.name = name
+        self.latency_s, self.clean, self.poor = PROFILES[name]
+        self.latency_s /= 1000
+        self.corpus = corpus
+        self.time_scale = time_scale
+        self.seed = seed
+
+    def recognize(self, file_path, file_name, timeout_s):
+        truth, quality = self.corpus[file_path]
+        rng = random.Random(f"{self.seed}:{self.name}:{file_path}")
+        accuracy = self.poor + (self.clean - self.poor) * quality
+        time.sleep(self.latency_s * rng.uniform(0.8, 1.3) * self.time_scale)
+        text = "".join(
+            c if c == "\n" or rng.random() < accuracy else rng.choice("0O1lI5S8B ")
+            for c in truth
+        )
+        confidence = min(max(accuracy + rng.gauss(0, 0.03), 0.0), 1.0)
+        return text, confidence
+
+def render_corpus(corpus, directory: str, rng: random.Random):
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+    font = ImageFont.load_default(size=28)
+    rendered = {}
+    for file_name, truth, quality in corpus:
+        image = Image.new("L", (1400, 120 + 44 * truth.count("\n")), 255)
+        ImageDraw.Draw(image).multiline_text((60, 60), truth, fill=0, font=font, spacing=16)
+        if quality < 0.5:
+            image = image.filter(ImageFilter.GaussianBlur(1.6 - 2 * quality))
+            pixels = image.load()
+            for _ in range(image.width * image.height // 60):
+                pixels[rng.randrange(image.width), rng.randrange(image.height)] = rng.choice((0, 255))
+        path = os.path.join(directory, file_name)
+        image.save(path)
+        rendered[path] = (file_name, truth)
+    return rendered
+
+def run(cascade: OcrCascade, documents, time_scale: float):
+    latencies, accuracies, tried = [], [], []
+    for path, (file_name, truth) in documents.items():
+        started = time.perf_counter()
+        try:
+            result = cascade.run(path, file_name)
+            text, attempts = result.text, result.attempts
+        except OcrError:
+            text, attempts = "", []
+        latencies.append((time.perf_counter() - started) * 1000 / time_scale)
+        accuracies.append(difflib.SequenceMatcher(None, truth, text, autojunk=False).ratio())
+        tried.append(sum(attempt.get("outcome") != "unavailable" for attempt in attempts))
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    return statistics.mean(latencies), p95, statistics.mean(accuracies), statistics.mean(tried)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--poor-share", type=float, default=0.3, help="share of poor scans in the corpus")
+    parser.add_argument("--thresholds", default="0.8,0.9,0.95")
+    parser.add_argument("--time-scale", type=float, default=0.01, help="simulated engine sleeps are multiplied by this")
+    parser.add_argument("--timeout-s", type=float, default=60.0)
+    parser.add_argument("--real", action="store_true", help="OCR rendered images with the available OCR_ENGINES")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = make_corpus(args.docs, args.poor_share, rng)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.real:
+            time_scale = 1.0
+            documents = render_corpus(corpus, tmp_dir, rng)
+            names = [name.strip() for name in get_settings().OCR_ENGINES.split(",") if name.strip() != "stub"]
+            engines = {name: create_engine(name) for name in names}
+            engines = {name: engine for name, engine in engines.items() if engine.available()}
+            if not engines:
+                raise SystemExit(f"None of {names} is available here; install tesseract or configure an engine")
+        else:
+            time_scale = args.time_scale
+            documents = {file_name: (file_name, truth) for file_name, truth, _ in corpus}
+            truths = {file_name: (truth, quality) for file_name, truth, quality in corpus}
+            engines = {name: SimulatedEngine(name, truths, time_scale, args.seed) for name in PROFILES}
+
+        configs = [(name, [name], 0.0) for name in engines]
+        for label, order in (("remote-first", REMOTE_FIRST), ("local-first", LOCAL_FIRST)):
+            order = [name for name in order if name in engines]
+            configs += [(f"{label} @{t}", order, float(t)) for t in args.thresholds.split(",")]
+
+        print(f"{'engines':<22} {'mean ms':>9} {'p95 ms':>9} {'accuracy':>9} {'tried':>6}")
+        for label, order, threshold in configs:
+            cascade = OcrCascade([engines[name] for name in order], threshold, args.timeout_s)
+            mean_ms, p95_ms, accuracy, tried = run(cascade, documents, time_scale)
+            print(f"{label:<22} {mean_ms:>9.0f} {p95_ms:>9.0f} {accuracy:>9.4f} {tried:>6.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Page-parallel OCR of a multi-page scan.
+
+Renders a `--pages`-page invoice scan and OCRs it with the tesseract engine on a
+PagePool of each size in `--workers` (1 = page by page in this process), reporting
+elapsed time (including worker start-up), pages/s and the speedup over one worker.
+Checks that the pages come back in order.
+
+Needs the tesseract and poppler binaries. Without them, `--simulate-ms` replaces
+Tesseract with that much CPU-bound work per page (on a multi-frame TIFF, which
+needs no poppler), so the pool itself can be measured anywhere.
+
+Usage:
+    python -m benchmarks.bench_ocr_pages --pages 50 --workers 1,2,4,8
+    python -m benchmarks.bench_ocr_pages --pages 50 --simulate-ms 200
+"""
+import argparse
+import functools
+import os
+import re
+import tempfile
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+from backend.shared.services.ocr import PagePool, TesseractEngine, load_page
+from backend.shared.services.process_pool import available_cores
+
+def render_scan(path: str, pages: int, dpi: int):
+    font = ImageFont.load_default(size=dpi // 8)
+    images = []
+    for page in range(pages):
+        image = Image.new("L", (dpi * 8, dpi * 11), 255)
+        lines = [f"Invoice INV-2025-001 page {page + 1} of {pages}"]
+        lines += [f"{n + 1} Item {page * 100 + n} 2 x {n + 10}.00" for n in range(30)]
+        ImageDraw.Draw(image).multiline_text((dpi, dpi), "\n".join(lines), fill=0, font=font, spacing=dpi // 12)
+        images.append(image)
+    options = {"compression": "tiff_deflate"} if path.endswith(".tiff") else {}
+    images[0].save(path, save_all=True, append_images=images[1:], resolution=dpi, **options)
+
+def simulated_page(burn_s: float, file_path: str, page: int, is_pdf: bool, timeout_s: float):
+    # Decodes the page, then spins like a CPU-bound OCR engine would.
+    load_page(file_path, page, is_pdf)
+    deadline = time.process_time() + burn_s
+    while time.process_time() < deadline:
+        pass
+    return f"page {page + 1}", [90.0]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--workers", default=f"1,2,4,{available_cores()}")
+    parser.add_argument("--dpi", type=int, default=200)
+    parser.add_argument("--simulate-ms", type=float, default=0.0, help="CPU time per page instead of Tesseract")
+    parser.add_argument("--timeout-s", type=float, default=600.0)
+    args = parser.parse_args()
+
+    simulate = args.simulate_ms > 0
+    if not simulate and not TesseractEngine(workers=1).available():
+        raise SystemExit("Tesseract is not installed here; rerun with --simulate-ms")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = "scan.tiff" if simulate else "scan.pdf"
+        path = os.path.join(tmp_dir, file_name)
+        render_scan(path, args.pages, args.dpi)
+        print(f"{args.pages} pages, {os.path.getsize(path) / 1e6:.1f} MB, {available_cores()} cores")
+        print(f"{'workers':>7} {'elapsed s':>10} {'pages/s':>8} {'speedup':>8}")
+        baseline = None
+        for workers in sorted({int(w) for w in args.workers.split(",")}):
+            if simulate:
+                pool = PagePool(workers)
+                page_fn = functools.partial(simulated_page, args.simulate_ms / 1000)
+                run = lambda: "\n".join(text for text, _ in pool.map_pages(page_fn, path, file_name, args.timeout_s))
+            else:
+                engine = TesseractEngine(dpi=args.dpi, workers=workers)
+                pool = engine.pages
+                run = lambda: engine.recognize(path, file_name, args.timeout_s)[0]
+            try:
+                started = time.perf_counter()
+                text = run()
+                elapsed = time.perf_counter() - started
+            finally:
+                pool.close()
+            numbers = [int(n) for n in re.findall(r"page (\d+)", text)]
+            baseline = baseline or elapsed
+            print(f"{workers:>7} {elapsed:>10.2f} {args.pages / elapsed:>8.1f} {baseline / elapsed:>7.2f}x"
+                  + ("" if numbers == sorted(numbers) else "  (pages out of order!)"))
+
+if __name__ == "__main__":
+    main()
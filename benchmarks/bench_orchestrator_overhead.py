@@ -0,0 +1,112 @@
+"""
+Per-request orchestration overhead: fresh clients and graph vs shared ones.
+
+Runs `--flows` orchestration flows one after another against an in-process MCP that
+only acknowledges the orchestration checkpoint and lease RPCs, first the way every
+request used to (new gRPC channels to the MCP and the five agents, a freshly compiled
+graph), then through `service.run_flow`, which reuses the registry's channels and the
+compiled graph. Graph nodes are the orchestrator's own stubs, so what is left is setup plus the
+checkpoint and lease round trips. No database or agents are needed.
+
+Usage:
+    python -m benchmarks.bench_orchestrator_overhead --flows 300
+"""
+import argparse
+import os
+import statistics
+import time
+from concurrent import futures
+
+import grpc
+
+from backend.mcp.grpc import mcp_pb2, mcp_pb2_grpc
+
+class AckingMCP(mcp_pb2_grpc.MCPServicer):
+    def AppendOrchestrationStep(self, request, context):
+        return mcp_pb2.WriteAck(ok=True)
+
+    def CompactOrchestration(self, request, context):
+        return mcp_pb2.WriteAck(ok=True)
+
+    def GetOrchestrationCheckpoints(self, request, context):
+        return mcp_pb2.OrchestrationCheckpoints()
+
+    def DeleteOrchestrationCheckpoints(self, request, context):
+        return mcp_pb2.WriteAck(ok=True)
+
+    def AcquireOrchestrationLease(self, request, context):
+        return mcp_pb2.OrchestrationLease(acquired=True)
+
+    def ReleaseOrchestrationLease(self, request, context):
+        return mcp_pb2.WriteAck(ok=True)
+
+class PerRequestClients:
+    """What service.Clients cost before the registry: six channels per flow."""
+
+    def __init__(self, settings):
+        from backend.shared.clients.mcp import MCPClient
+
+        targets = [f"{settings.MCP_HOST}:{settings.MCP_PORT}"] + [
+            f"{getattr(settings, f'{agent}_AGENT_HOST')}:{getattr(settings, f'{agent}_AGENT_PORT')}"
+            for agent in ("EXTRACTION", "VALIDATION", "REPORT", "CONVERSION", "INTEGRATION")
+        ]
+        self.channels = [grpc.insecure_channel(target) for target in targets]
+        self.mcp = MCPClient()
+        self.mcp.stub = mcp_pb2_grpc.MCPStub(self.channels[0])
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+def summarize(label: str, samples: list):
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{label:>10} {statistics.mean(samples):>9.2f} {samples[len(samples) // 2]:>9.2f} {p99:>9.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--flows", type=int, default=300)
+    args = parser.parse_args()
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    mcp_pb2_grpc.add_MCPServicer_to_server(AckingMCP(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    os.environ["MCP_HOST"] = "localhost"
+    os.environ["MCP_PORT"] = str(port)
+    from backend.shared.dependencies.config import get_settings
+    get_settings.cache_clear()
+    from backend.orchestrator import service
+    from backend.orchestrator.flow.checkpointer import MCPCheckpointSaver
+    from backend.orchestrator.flow.graph import OrchestrationState, build_graph
+    from backend.shared.clients.registry import get_channel_registry
+
+    def per_request(ingestion_id: str):
+        clients = PerRequestClients(get_settings())
+        checkpointer = MCPCheckpointSaver(clients.mcp, OrchestrationState.model_fields)
+        graph = build_graph(clients, service.agent_limits, checkpointer)
+        clients.mcp.acquire_orchestration_lease(ingestion_id, "bench", 60)
+        checkpointer.delete_thread(ingestion_id)
+        config = {"configurable": {"thread_id": ingestion_id}}
+        for _ in graph.stream({"ingestion_id": ingestion_id}, config, stream_mode="values"):
+            pass
+        checkpointer.compact(ingestion_id)
+        clients.mcp.release_orchestration_lease(ingestion_id, "bench")
+        clients.close()
+
+    print(f"{'mode':>10} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for label, run in (("fresh", per_request), ("shared", service.run_flow)):
+        run("ING-WARMUP")
+        samples = []
+        for i in range(args.flows):
+            start = time.perf_counter()
+            run(f"ING-BENCH-{i}")
+            samples.append((time.perf_counter() - start) * 1000)
+        summarize(label, samples)
+
+    get_channel_registry().close()
+    server.stop(None)
+
+if __name__ == "__main__":
+    main()
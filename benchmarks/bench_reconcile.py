@@ -0,0 +1,111 @@
+"""
+Reconciliation throughput on long invoices.
+
+Generates `--invoices` invoices of `--items` line items priced from a catalog of
+`--products` products, with stated tax amounts, line totals, subtotal, CGST/SGST,
+round off and grand total, and transposes two digits of one amount in about 2% of
+them, as OCR misreads do. Reconciles them three ways: a straightforward row-by-row
+Decimal loop, the column-wise Reconciler one invoice at a time (as ValidateSchema
+runs it), and over `--batch` invoices per pass. Reports invoices/s, line items/s
+and the number of mismatches, which must agree.
+
+Usage:
+    python -m benchmarks.bench_reconcile --invoices 1000 --items 1000
+"""
+import argparse
+import random
+import time
+from decimal import ROUND_HALF_UP, Decimal
+
+from backend.agents.validation_agent.reconcile import CENT, ReconcileConfig, Reconciler
+
+def transpose_digits(amount: float, rng: random.Random) -> float:
+    digits = f"{amount:.2f}"
+    positions = [i for i in range(len(digits) - 1) if digits[i].isdigit() and digits[i + 1].isdigit() and digits[i] != digits[i + 1]]
+    if not positions:
+        return amount + 1
+    i = rng.choice(positions)
+    return float(digits[:i] + digits[i + 1] + digits[i] + digits[i + 2:])
+
+def make_invoices(count: int, items: int, products: int, rng: random.Random):
+    catalog = [(f"Product {n}", rng.randint(100, 10**5) / 100, rng.choice((5, 12, 18, 28))) for n in range(products)]
+    invoices = []
+    for _ in range(count):
+        lines, subtotal, tax_total = [], Decimal(0), Decimal(0)
+        for description, rate, tax_rate in rng.choices(catalog, k=items):
+            quantity = rng.randint(1, 20)
+            taxable = (quantity * Decimal(repr(rate))).quantize(CENT, ROUND_HALF_UP)
+            tax = (taxable * tax_rate / 100).quantize(CENT, ROUND_HALF_UP)
+            subtotal, tax_total = subtotal + taxable, tax_total + tax
+            lines.append({"description": description, "quantity": quantity, "rate": rate, "tax_rate": tax_rate,
+                          "tax_amount": float(tax), "total": float(taxable + tax)})
+        cgst = (tax_total / 2).quantize(CENT, ROUND_HALF_UP)
+        grand_total = (subtotal + tax_total).quantize(Decimal(1), ROUND_HALF_UP)
+        invoice = {
+            "total_amount": float(subtotal), "tax_total": float(tax_total), "cgst": float(cgst),
+            "sgst": float(tax_total - cgst), "round_off": float(grand_total - subtotal - tax_total),
+            "grand_total": float(grand_total), "items": lines,
+        }
+        if rng.random() < 0.02:
+            line = rng.choice(lines)
+            line["total"] = transpose_digits(line["total"], rng)
+        invoices.append(invoice)
+    return invoices
+
+def row_by_row(invoice: dict, tolerance=CENT, max_round_off=Decimal("0.50")) -> int:
+    # The same checks written item by item; returns the mismatch count.
+    def amount(value):
+        return None if value is None else Decimal(str(value))
+
+    mismatches, subtotal, tax_total = 0, Decimal(0), Decimal(0)
+    for item in invoice["items"]:
+        taxable = (amount(item["quantity"]) * amount(item["rate"])).quantize(CENT, ROUND_HALF_UP)
+        tax = (taxable * amount(item["tax_rate"]) / 100).quantize(CENT, ROUND_HALF_UP)
+        mismatches += abs(amount(item["tax_amount"]) - tax) > tolerance
+        mismatches += abs(amount(item["total"]) - (taxable + amount(item["tax_amount"]))) > tolerance
+        subtotal, tax_total = subtotal + taxable, tax_total + amount(item["tax_amount"])
+    gst, cgst, sgst = amount(invoice["tax_total"]), amount(invoice["cgst"]), amount(invoice["sgst"])
+    round_off = amount(invoice["round_off"])
+    mismatches += abs(amount(invoice["total_amount"]) - subtotal) > tolerance
+    mismatches += abs(gst - tax_total) > tolerance
+    mismatches += abs(cgst + sgst - gst) > tolerance
+    mismatches += abs(cgst - sgst) > tolerance
+    mismatches += abs(round_off) > max_round_off
+    mismatches += abs(amount(invoice["grand_total"]) - (amount(invoice["total_amount"]) + gst + round_off)) > tolerance
+    return mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--invoices", type=int, default=1000)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=300)
+    parser.add_argument("--batch", type=int, default=20, help="invoices per reconcile_many pass")
+    parser.add_argument("--chunk", type=int, default=100, help="invoices generated at a time")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    reconciler = Reconciler(ReconcileConfig())
+    modes = {
+        "row by row": lambda invoices: sum(map(row_by_row, invoices)),
+        "columns, per invoice": lambda invoices: sum(len(reconciler.reconcile_many([invoice])[0]) for invoice in invoices),
+        f"columns, batches of {args.batch}": lambda invoices: sum(
+            len(found)
+            for start in range(0, len(invoices), args.batch)
+            for found in reconciler.reconcile_many(invoices[start:start + args.batch])
+        ),
+    }
+
+    print(f"{args.invoices} invoices x {args.items} items from {args.products} products")
+    print(f"{'mode':<24} {'invoices/s':>11} {'items/s':>11} {'mismatches':>11}")
+    for mode, reconcile in modes.items():
+        rng = random.Random(args.seed)
+        elapsed, mismatches = 0.0, 0
+        for start in range(0, args.invoices, args.chunk):
+            invoices = make_invoices(min(args.chunk, args.invoices - start), args.items, args.products, rng)
+            started = time.perf_counter()
+            mismatches += reconcile(invoices)
+            elapsed += time.perf_counter() - started
+        print(f"{mode:<24} {args.invoices / elapsed:>11.0f} {args.invoices * args.items / elapsed:>11.0f} {mismatches:>11}")
+
+if __name__ == "__main__":
+    main()
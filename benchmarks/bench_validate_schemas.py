@@ -0,0 +1,68 @@
+"""
+Bulk validation throughput (the validation side of ValidateSchemas).
+
+Encodes `--schemas` generated invoices of `--items` line items as the JSON the MCP
+streams, then decodes and validates them: one at a time as ValidateSchema does
+(without its per-schema MCP round trips and writes), and with a BatchValidator of
+each size in `--workers` (1 = chunks in this process). Worker processes are started
+and warmed up before timing, as they stay up in the agent. Reports schemas/s, the
+speedup over one at a time and the number of invalid schemas, which must agree.
+
+Usage:
+    python -m benchmarks.bench_validate_schemas --schemas 20000 --items 50 --workers 1,2,4
+"""
+import argparse
+import json
+import random
+import time
+
+from benchmarks.bench_validation_rules import make_invoices
+from backend.agents.validation_agent.batch import BatchValidator
+from backend.agents.validation_agent.rules import BUNDLED_RULESETS_DIR, RulesetRegistry
+from backend.shared.services.process_pool import available_cores
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--schemas", type=int, default=20000)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--ruleset", default="default")
+    parser.add_argument("--workers", default=f"1,2,{available_cores()}")
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    registry = RulesetRegistry(BUNDLED_RULESETS_DIR, reload_interval_s=0)
+    ruleset, source = registry.get(args.ruleset), registry.source(args.ruleset)
+    invoices = make_invoices(args.schemas, args.items, random.Random(args.seed))
+    documents = [(f"SCH-{n}", json.dumps(invoice).encode()) for n, invoice in enumerate(invoices)]
+    del invoices
+
+    print(f"{args.schemas} schemas x {args.items} items, {available_cores()} cores, chunks of {args.chunk_size}")
+    print(f"{'mode':<18} {'schemas/s':>10} {'speedup':>8} {'invalid':>8}")
+
+    started = time.perf_counter()
+    invalid = sum(
+        any(f.severity == "error" for f in ruleset.validate(json.loads(mapped_json)))
+        for _, mapped_json in documents
+    )
+    baseline = time.perf_counter() - started
+    print(f"{'one at a time':<18} {args.schemas / baseline:>10.0f} {1:>7.2f}x {invalid:>8}")
+
+    for workers in sorted({int(w) for w in args.workers.split(",")}):
+        validator = BatchValidator(workers, args.chunk_size)
+        try:
+            for _ in validator.validate(source, iter(documents[:args.chunk_size * workers])):
+                pass
+            started = time.perf_counter()
+            invalid = sum(
+                bool(outcome.errors)
+                for outcomes in validator.validate(source, iter(documents))
+                for outcome in outcomes
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            validator.close()
+        print(f"{f'{workers} worker(s)':<18} {args.schemas / elapsed:>10.0f} {baseline / elapsed:>7.2f}x {invalid:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Validation rule engine throughput.
+
+Validates `--invoices` generated invoices of `--items` line items each (about 2% of
+the values invalid) three ways: the hard-coded checks ValidateSchema used to run,
+the compiled ruleset one invoice at a time (as ValidateSchema calls it), and the
+compiled ruleset over `--batch` invoices per pass. Invoices are generated
+`--chunk` at a time to bound memory; only validation is timed. Reports invoices/s,
+line items/s and the number of findings, which must agree across the three.
+
+Usage:
+    python -m benchmarks.bench_validation_rules --invoices 10000 --items 200 --ruleset default
+"""
+import argparse
+import random
+import time
+from decimal import ROUND_HALF_UP, Decimal
+
+from backend.agents.common.validation_utils import validate_date, validate_gstin
+from backend.agents.validation_agent.reconcile import CENT
+from backend.agents.validation_agent.rules import BUNDLED_RULESETS_DIR, RulesetRegistry
+
+def make_invoices(count: int, items: int, rng: random.Random):
+    def maybe_bad(good, bad):
+        return bad if rng.random() < 0.02 else good
+
+    def invoice():
+        lines = [
+            {
+                "description": f"Item {n}",
+                "quantity": rng.randint(1, 20),
+                "rate": rng.randint(100, 10**5) / 100,
+                "tax_rate": maybe_bad(18, 17),
+                "hsn": maybe_bad(rng.choice(("9988", "998314", "84713010")), "12"),
+            }
+            for n in range(items)
+        ]
+        # Amounts that add up, so reconciliation finds nothing the hard-coded checks don't.
+        taxable = [(Decimal(item["quantity"]) * Decimal(repr(item["rate"]))).quantize(CENT, ROUND_HALF_UP) for item in lines]
+        taxes = [(value * item["tax_rate"] / 100).quantize(CENT, ROUND_HALF_UP) for value, item in zip(taxable, lines)]
+        return {
+            "invoice_number": f"INV-{rng.randint(1, 10**6)}",
+            "invoice_date": maybe_bad(f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", "2099-01-01"),
+            "supplier_gstin": maybe_bad("29AAFCD5862R1ZR", "29AAFCD5862R1Z"),
+            "grand_total": float(sum(taxable) + sum(taxes)),
+            "items": lines,
+        }
+
+    return [invoice() for _ in range(count)]
+
+def legacy_validate(mapped_schema: dict) -> int:
+    # The checks ValidateSchema hard-coded before rulesets; returns the finding count.
+    errors, warnings = [], []
+    if not validate_gstin(mapped_schema.get("supplier_gstin")):
+        errors.append("Invalid GSTIN format.")
+    if not validate_date(mapped_schema.get("invoice_date")):
+        errors.append("Invoice date is in the future or invalid.")
+    for item in mapped_schema.get("items", []):
+        if not item.get("hsn") or len(str(item.get("hsn"))) not in [4, 6, 8]:
+            warnings.append(("hsn", f"Invalid HSN for item: {item.get('description')}"))
+    return len(errors) + len(warnings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--invoices", type=int, default=10000)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--ruleset", default="default")
+    parser.add_argument("--batch", type=int, default=100, help="invoices per validate_many pass")
+    parser.add_argument("--chunk", type=int, default=500, help="invoices generated at a time")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    ruleset = RulesetRegistry(BUNDLED_RULESETS_DIR, reload_interval_s=0).get(args.ruleset)
+    modes = {
+        "per invoice": lambda invoices: sum(len(ruleset.validate(invoice)) for invoice in invoices),
+        f"batches of {args.batch}": lambda invoices: sum(
+            len(found)
+            for start in range(0, len(invoices), args.batch)
+            for found in ruleset.validate_many(invoices[start:start + args.batch])
+        ),
+    }
+    if args.ruleset == "default":
+        modes = {"hard-coded (before)": lambda invoices: sum(map(legacy_validate, invoices)), **modes}
+
+    print(f"ruleset {args.ruleset}: {len(ruleset.rules)} rules, {args.invoices} invoices x {args.items} items")
+    print(f"{'mode':<22} {'invoices/s':>11} {'items/s':>11} {'findings':>9}")
+    for mode, validate in modes.items():
+        rng = random.Random(args.seed)
+        elapsed, findings = 0.0, 0
+        for start in range(0, args.invoices, args.chunk):
+            invoices = make_invoices(min(args.chunk, args.invoices - start), args.items, rng)
+            started = time.perf_counter()
+            findings += validate(invoices)
+            elapsed += time.perf_counter() - started
+        print(f"{mode:<22} {args.invoices / elapsed:>11.0f} {args.invoices * args.items / elapsed:>11.0f} {findings:>9}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Vendor index snapshot size, open time and lookup throughput.
+
+Builds a snapshot of `--vendors` generated vendors (valid GSTINs) and reports build
+time, file size, the time to open it (memory-mapped, so independent of size) against
+parsing the same vendors from CSV into a dict, and lookups/s for GSTIN hits, misses
+and exact normalized-name lookups, plus fuzzy name scores/s.
+
+Usage:
+    python -m benchmarks.bench_vendor_index --vendors 1000000 --lookups 200000
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+from backend.agents.common.validation_utils import GSTIN_CHARS, gstin_check_digit
+from backend.agents.common.vendor_index import VendorIndex, VendorRecord, build_vendor_index, read_vendor_csv
+
+WORDS = ("Acme", "Deccan", "Indus", "Bharat", "Kaveri", "Sagar", "Om", "Sri", "Ganga", "Pioneer",
+         "Traders", "Supplies", "Steel", "Electricals", "Textiles", "Foods", "Logistics", "Pharma")
+
+def make_gstin(rng: random.Random) -> str:
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    body = (f"{rng.randint(1, 37):02d}" + "".join(rng.choices(letters, k=5)) + f"{rng.randint(0, 9999):04d}"
+            + rng.choice(letters) + rng.choice(GSTIN_CHARS[1:]) + "Z")
+    return body + gstin_check_digit(body)
+
+def make_vendors(count: int, rng: random.Random):
+    return [
+        VendorRecord(make_gstin(rng), f"{' '.join(rng.sample(WORDS, 3))} {n} Private Limited")
+        for n in range(count)
+    ]
+
+def rate(count: int, fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - started)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vendors", type=int, default=1000000)
+    parser.add_argument("--lookups", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vendors = make_vendors(args.vendors, rng)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path, index_path = os.path.join(tmp_dir, "vendors.csv"), os.path.join(tmp_dir, "vendors.idx")
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["gstin", "legal_name", "trade_name", "status"])
+            writer.writerows((v.gstin, v.legal_name, v.trade_name, v.status) for v in vendors)
+
+        started = time.perf_counter()
+        build_vendor_index(vendors, index_path)
+        print(f"{args.vendors} vendors: built in {time.perf_counter() - started:.1f}s, "
+              f"{os.path.getsize(index_path) / 1e6:.1f} MB (CSV {os.path.getsize(csv_path) / 1e6:.1f} MB)")
+
+        started = time.perf_counter()
+        by_gstin = {v.gstin: v for v in read_vendor_csv(csv_path)}
+        parse_s = time.perf_counter() - started
+        started = time.perf_counter()
+        index = VendorIndex(index_path)
+        open_s = time.perf_counter() - started
+        print(f"open: {open_s * 1000:.2f} ms mmap vs {parse_s * 1000:.0f} ms parsing the CSV into a dict")
+
+        sample = rng.sample(vendors, min(args.lookups, len(vendors)))
+        misses = [make_gstin(rng) for _ in sample]
+        names = [v.legal_name.upper().replace("PRIVATE LIMITED", "PVT. LTD.") for v in sample]
+        print(f"{'operation':<22} {'per second':>12}")
+        for label, count, fn in (
+            ("GSTIN hit (dict)", len(sample), lambda: [by_gstin.get(v.gstin) for v in sample]),
+            ("GSTIN hit (index)", len(sample), lambda: [index.get(v.gstin) for v in sample]),
+            ("GSTIN miss (index)", len(misses), lambda: [index.get(g) for g in misses]),
+            ("name lookup (index)", len(names), lambda: [index.find_by_name(n) for n in names]),
+            ("fuzzy name score", len(names), lambda: [v.name_score(n) for v, n in zip(sample, names)]),
+        ):
+            print(f"{label:<22} {rate(count, fn):>12.0f}")
+        assert all(index.get(v.gstin) == v for v in sample[:1000])
+        index.close()
+
+if __name__ == "__main__":
+    main()
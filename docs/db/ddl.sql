@@ -11,11 +11,27 @@ CREATE TYPE integration_status_enum AS ENUM ('posted', 'failed', 'pending');
 CREATE TYPE report_status_enum AS ENUM ('generating', 'ready', 'failed');
 CREATE TYPE severity_enum AS ENUM ('INFO', 'WARNING', 'ERROR');
 
+-- Table: document_blobs
+CREATE TABLE document_blobs (
+    content_hash VARCHAR(64) PRIMARY KEY,
+    size_bytes BIGINT NOT NULL,
+    ref_count INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+COMMENT ON TABLE document_blobs IS 'Content-addressed document bytes held in the MCP blob store.';
+COMMENT ON COLUMN document_blobs.content_hash IS 'Primary key, SHA-256 hex digest of the content.';
+COMMENT ON COLUMN document_blobs.size_bytes IS 'Size of the stored content in bytes.';
+COMMENT ON COLUMN document_blobs.ref_count IS 'Number of document saves that referenced this blob. Only ever incremented: documents are not deleted, so nothing releases a reference.';
+
+
 -- Table: documents_ingested
 CREATE TABLE documents_ingested (
     ingestion_id VARCHAR PRIMARY KEY,
     file_name VARCHAR(255) NOT NULL,
     file_url VARCHAR(1024),
+    content_hash VARCHAR(64) REFERENCES document_blobs(content_hash),
     source source_enum NOT NULL,
     metadata JSONB,
     status document_status_enum NOT NULL DEFAULT 'received',
@@ -27,6 +43,7 @@ COMMENT ON TABLE documents_ingested IS 'Represents uploaded documents for proces
 COMMENT ON COLUMN documents_ingested.ingestion_id IS 'Primary key, format: ING-YYYYMMDD-ID';
 COMMENT ON COLUMN documents_ingested.file_name IS 'Original name of the uploaded file.';
 COMMENT ON COLUMN documents_ingested.file_url IS 'Optional URL to the stored file (e.g., S3).';
+COMMENT ON COLUMN documents_ingested.content_hash IS 'SHA-256 of the uploaded bytes in the blob store (optional).';
 COMMENT ON COLUMN documents_ingested.source IS 'Source of the document (upload, email, etc.).';
 COMMENT ON COLUMN documents_ingested.metadata IS 'Additional metadata about the ingestion.';
 COMMENT ON COLUMN documents_ingested.status IS 'Current processing status of the document.';
@@ -35,7 +52,45 @@ COMMENT ON COLUMN documents_ingested.updated_at IS 'Timestamp of the last update
 
 -- Indexes for documents_ingested
 CREATE INDEX idx_documents_ingested_created_at ON documents_ingested(created_at);
-CREATE INDEX idx_documents_ingested_status ON documents_ingested(status);
+-- (status, ingestion_id) serves both status lookups and ListDocuments keyset pages.
+CREATE INDEX idx_documents_ingested_status ON documents_ingested(status, ingestion_id);
+CREATE INDEX idx_documents_ingested_content_hash ON documents_ingested(content_hash);
+
+
+-- Table: ocr_jobs
+CREATE TABLE ocr_jobs (
+    job_id VARCHAR PRIMARY KEY,
+    ingestion_id VARCHAR NOT NULL,
+    file_url TEXT,
+    metadata JSONB,
+    priority VARCHAR(16) NOT NULL DEFAULT 'normal',
+    priority_rank INT NOT NULL DEFAULT 1,
+    status VARCHAR(16) NOT NULL DEFAULT 'QUEUED',
+    attempts INT NOT NULL DEFAULT 0,
+    max_attempts INT NOT NULL DEFAULT 3,
+    locked_by VARCHAR(255),
+    locked_at TIMESTAMP WITH TIME ZONE,
+    available_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    ocr_id VARCHAR,
+    error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    CONSTRAINT fk_ingestion_job
+        FOREIGN KEY(ingestion_id)
+        REFERENCES documents_ingested(ingestion_id)
+        ON DELETE CASCADE
+);
+
+COMMENT ON TABLE ocr_jobs IS 'Durable OCR work queue drained by extraction agent workers.';
+COMMENT ON COLUMN ocr_jobs.priority IS 'Priority lane from OCRRequest.priority (low, normal, high).';
+COMMENT ON COLUMN ocr_jobs.priority_rank IS 'Claim order of the lane: 0 = high, 1 = normal, 2 = low.';
+COMMENT ON COLUMN ocr_jobs.status IS 'QUEUED, RUNNING, DONE or FAILED.';
+COMMENT ON COLUMN ocr_jobs.locked_by IS 'Worker currently holding the job.';
+COMMENT ON COLUMN ocr_jobs.available_at IS 'Earliest time the job may be claimed (retry backoff).';
+
+-- Indexes for ocr_jobs
+CREATE INDEX idx_ocr_jobs_claim ON ocr_jobs(status, priority_rank, available_at, created_at);
+CREATE INDEX idx_ocr_jobs_ingestion_id ON ocr_jobs(ingestion_id);
 
 
 -- Table: ocr_output
@@ -280,8 +335,63 @@ CREATE TABLE orchestrations (
     ingestion_id VARCHAR PRIMARY KEY,
     state JSONB,
     status VARCHAR(255),
+    version BIGINT NOT NULL DEFAULT 0,
+    checkpoint_type VARCHAR,
+    checkpoint BYTEA,
+    lease_owner VARCHAR,
+    lease_expires_at TIMESTAMP WITH TIME ZONE,
+    recoveries INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 COMMENT ON TABLE orchestrations IS 'Stores the state of LangGraph orchestrations.';
+COMMENT ON COLUMN orchestrations.version IS 'Step version the state and checkpoint were last compacted at.';
+COMMENT ON COLUMN orchestrations.checkpoint IS 'Serialized LangGraph checkpoint as of version (format in checkpoint_type).';
+COMMENT ON COLUMN orchestrations.lease_owner IS 'Orchestrator process running the flow; NULL when no run is in flight.';
+COMMENT ON COLUMN orchestrations.lease_expires_at IS 'When the lease lapses unless renewed; lapsed flows are resumed by the recovery sweeper.';
+COMMENT ON COLUMN orchestrations.recoveries IS 'Times the sweeper has resumed the current run.';
+
+-- Index for the recovery sweeper
+CREATE INDEX idx_orchestrations_lease ON orchestrations(lease_expires_at) WHERE lease_owner IS NOT NULL;
+
+-- Table: orchestration_steps
+CREATE TABLE orchestration_steps (
+    ingestion_id VARCHAR NOT NULL,
+    version BIGINT NOT NULL,
+    state_delta JSONB,
+    status VARCHAR(255),
+    checkpoint_type VARCHAR,
+    checkpoint BYTEA,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (ingestion_id, version)
+);
+
+COMMENT ON TABLE orchestration_steps IS 'Per-step orchestration deltas recorded since the last compaction into orchestrations.';
+COMMENT ON COLUMN orchestration_steps.state_delta IS 'State fields changed by the step.';
+
+-- Table: idempotency_keys
+CREATE TABLE idempotency_keys (
+    key VARCHAR PRIMARY KEY,
+    agent VARCHAR NOT NULL,
+    response BYTEA,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+COMMENT ON TABLE idempotency_keys IS 'Agent responses by idempotency key, replayed when an orchestration step is re-executed.';
+
+-- Table: llm_cache
+CREATE TABLE llm_cache (
+    key VARCHAR PRIMARY KEY,
+    model VARCHAR NOT NULL,
+    text TEXT,
+    confidence DOUBLE PRECISION,
+    raw_response TEXT,
+    hits INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    last_used_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX idx_llm_cache_last_used_at ON llm_cache(last_used_at);
+
+COMMENT ON TABLE llm_cache IS 'LLM responses by cache key (model, prompt version and normalized input), expired by age and evicted least recently used first.';
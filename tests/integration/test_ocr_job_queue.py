@@ -0,0 +1,69 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import sqlalchemy as sa
+
+from backend.mcp.db import repository
+from backend.mcp.db.engine import SessionLocal
+from backend.mcp.db.models import DocumentsIngested, OcrJobs
+
+@pytest.mark.integration
+def test_waiting_jobs_move_up_one_lane_per_aging_interval():
+    aging = timedelta(seconds=repository.OCR_JOB_PRIORITY_AGING_S)
+    created = datetime.now(timezone.utc)
+    run = uuid.uuid4().hex[:8]
+    ids = {}
+    with SessionLocal() as session:
+        # The low job was queued first, then a normal and a high one.
+        for offset, priority in enumerate(["low", "normal", "high"]):
+            ingestion_id = f"ING-AGING-{run}-{priority}"
+            session.add(DocumentsIngested(ingestion_id=ingestion_id, file_name="scan.pdf"))
+            session.flush()
+            job = repository.new_ocr_job(ingestion_id, "s3://a", {}, priority)
+            job.created_at = created + timedelta(seconds=offset)
+            session.add(job)
+            ids[job.job_id] = priority
+        session.commit()
+
+        def claim_order(now):
+            query = sa.select(OcrJobs.job_id).where(OcrJobs.job_id.in_(ids)).order_by(*repository.ocr_job_claim_order(now))
+            return [ids[job_id] for job_id in session.scalars(query)]
+
+        try:
+            assert claim_order(created + timedelta(seconds=3)) == ["high", "normal", "low"]
+            # One interval in, low has reached the normal lane (and is older); normal has not waited a full interval.
+            assert claim_order(created + aging + timedelta(seconds=0.5)) == ["high", "low", "normal"]
+            # Two intervals in, every job is in the high lane and the oldest goes first.
+            assert claim_order(created + 2 * aging + timedelta(seconds=3)) == ["low", "normal", "high"]
+        finally:
+            session.execute(sa.delete(OcrJobs).where(OcrJobs.job_id.in_(ids)))
+            session.execute(sa.delete(DocumentsIngested).where(DocumentsIngested.ingestion_id.like(f"ING-AGING-{run}-%")))
+            session.commit()
+
+@pytest.mark.integration
+def test_a_worker_that_lost_its_lease_cannot_complete_the_job():
+    ingestion_id = f"ING-LEASE-{uuid.uuid4().hex[:8]}"
+    with SessionLocal() as session:
+        session.add(DocumentsIngested(ingestion_id=ingestion_id, file_name="scan.pdf"))
+        session.flush()
+        job = repository.new_ocr_job(ingestion_id, "s3://a", {}, "high")
+        # Reclaimed from worker-1 after the visibility timeout; worker-2 holds it now.
+        job.status, job.locked_by, job.attempts = "RUNNING", "worker-2", 2
+        job.locked_at = datetime.now(timezone.utc)
+        session.add(job)
+        session.commit()
+        job_id = job.job_id
+
+    try:
+        assert repository.complete_ocr_job(job_id, "worker-1", "OCR-stale") is False
+        assert repository.fail_ocr_job(job_id, "worker-1", "boom") is False
+        assert repository.get_ocr_job(ingestion_id).status == "RUNNING"
+        assert repository.complete_ocr_job(job_id, "worker-2", "OCR-1") is True
+        job = repository.get_ocr_job(ingestion_id)
+        assert (job.status, job.ocr_id) == ("DONE", "OCR-1")
+    finally:
+        with SessionLocal() as session:
+            session.execute(sa.delete(OcrJobs).where(OcrJobs.job_id == job_id))
+            session.execute(sa.delete(DocumentsIngested).where(DocumentsIngested.ingestion_id == ingestion_id))
+            session.commit()
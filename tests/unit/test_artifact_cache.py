@@ -0,0 +1,45 @@
+import time
+from types import SimpleNamespace
+
+from backend.mcp import server as mcp_server
+from backend.mcp.cache import ArtifactCache
+from backend.shared.grpc import mcp_pb2
+
+def test_artifact_cache_evicts_lru_by_size_and_expires():
+    cache = ArtifactCache(max_bytes=10, ttl_s=60, size_fn=len)
+    cache.put("ocr_output", "a", "aaaa")
+    cache.put("ocr_output", "b", "bbbb")
+    assert cache.get("ocr_output", "a") == "aaaa"
+    cache.put("ocr_output", "c", "cccc")
+
+    assert cache.get("ocr_output", "b") is None
+    assert cache.get("ocr_output", "a") == "aaaa"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 8
+
+    cache.invalidate("ocr_output", "a")
+    assert cache.get("ocr_output", "a") is None
+
+    short = ArtifactCache(max_bytes=10, ttl_s=0.01, size_fn=len)
+    short.put("ocr_output", "a", "aaaa")
+    time.sleep(0.02)
+    assert short.get("ocr_output", "a") is None
+
+def test_get_ocr_output_reads_through_cache(monkeypatch):
+    calls = []
+
+    def get_ocr_output(ocr_id):
+        calls.append(ocr_id)
+        return SimpleNamespace(ocr_id=ocr_id, ingestion_id="ING-1", raw_text="text",
+                               detected_fields={"total": "10"}, confidence=0.9, status="EXTRACTED")
+
+    monkeypatch.setattr(mcp_server, "WRITE_BUFFER_ENABLED", False)
+    monkeypatch.setattr(mcp_server.repository, "get_ocr_output", get_ocr_output)
+    servicer = mcp_server.MCPServicer()
+
+    first = servicer.GetOcrOutput(mcp_pb2.ArtifactReq(id="OCR-1"), None)
+    second = servicer.GetOcrOutput(mcp_pb2.ArtifactReq(id="OCR-1"), None)
+
+    assert first.raw_text == second.raw_text == "text"
+    assert calls == ["OCR-1"]
+    assert servicer.artifact_cache.stats()["hits"] == 1
@@ -0,0 +1,65 @@
+import json
+from types import SimpleNamespace
+
+import grpc
+from sqlalchemy.dialects import postgresql
+
+from backend.mcp import server as mcp_server
+from backend.mcp.db import repository
+from backend.mcp.db.models import MappedSchema
+from backend.shared.grpc import mcp_pb2
+
+class FakeContext:
+    def __init__(self):
+        self.code = None
+        self.details = None
+
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, details):
+        self.details = details
+
+def test_artifact_upsert_targets_primary_key():
+    stmt = repository.artifact_upsert(MappedSchema, dict(schema_id="MAP-1", ocr_id="OCR-1", mapped_data={}, mapping_confidence=0.5))
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (schema_id) DO UPDATE" in sql
+    assert "ocr_id = excluded.ocr_id" in sql
+
+def test_save_then_get_mapped_schema_refreshes_cache(monkeypatch):
+    rows = {}
+
+    def save_mapped_schema(**row):
+        rows[row["schema_id"]] = SimpleNamespace(**row)
+        return True
+
+    monkeypatch.setattr(mcp_server, "WRITE_BUFFER_ENABLED", False)
+    monkeypatch.setattr(mcp_server.repository, "save_mapped_schema", save_mapped_schema)
+    monkeypatch.setattr(mcp_server.repository, "get_mapped_schema", rows.get)
+    servicer = mcp_server.MCPServicer()
+
+    def save(total):
+        request = mcp_pb2.MappedSchema(schema_id="MAP-1", ocr_id="OCR-1", mapped_data=json.dumps({"total": total}).encode())
+        return servicer.SaveMappedSchema(request, FakeContext())
+
+    assert save(10).ok
+    first = servicer.GetMappedSchema(mcp_pb2.ArtifactReq(id="MAP-1"), FakeContext())
+    assert save(20).ok
+    second = servicer.GetMappedSchema(mcp_pb2.ArtifactReq(id="MAP-1"), FakeContext())
+
+    assert json.loads(first.mapped_data) == {"total": 10}
+    assert json.loads(second.mapped_data) == {"total": 20}
+    assert servicer.artifact_cache.stats()["invalidations"] == 1
+
+def test_save_artifact_rejects_missing_id_and_bad_json(monkeypatch):
+    monkeypatch.setattr(mcp_server, "WRITE_BUFFER_ENABLED", False)
+    servicer = mcp_server.MCPServicer()
+
+    context = FakeContext()
+    assert not servicer.SaveReport(mcp_pb2.Report(status="READY"), context).ok
+    assert context.code == grpc.StatusCode.INVALID_ARGUMENT
+
+    context = FakeContext()
+    assert not servicer.SaveReport(mcp_pb2.Report(report_id="RPT-1", summary=b"{not json"), context).ok
+    assert context.code == grpc.StatusCode.INVALID_ARGUMENT
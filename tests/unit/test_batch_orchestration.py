@@ -0,0 +1,79 @@
+import json
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from backend.orchestrator import api, service
+from backend.orchestrator.batch import AgentLimits, BatchRun
+
+def test_batch_run_bounds_concurrency_and_reports_each_flow():
+    lock = threading.Lock()
+    running, peak = 0, 0
+
+    def run_flow(ingestion_id):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        if ingestion_id == "ING-3":
+            raise RuntimeError("agent unavailable")
+        return {"status": "COMPLETED"}
+
+    batch = BatchRun((f"ING-{i}" for i in range(20)), run_flow, max_workers=4).start()
+    lines = [json.loads(line) for line in batch.stream(heartbeat_s=0.5)]
+
+    flows = [line for line in lines if line["event"] == "flow"]
+    summary = lines[-1]
+    assert len(flows) == 20
+    assert [flow["completed"] for flow in flows] == list(range(1, 21))
+    assert summary["event"] == "summary"
+    assert summary["completed"] == 20
+    assert summary["failed"] == 1
+    assert summary["statuses"] == {"COMPLETED": 19, "ERROR": 1}
+    assert summary["throughput_per_s"] > 0
+    assert peak <= 4
+
+def test_agent_limits_cap_in_flight_calls():
+    limits = AgentLimits({"extraction": 2, "mapping": 0})
+    lock = threading.Lock()
+    running, peak = 0, 0
+
+    def call():
+        nonlocal running, peak
+        with limits.slot("extraction"):
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert limits.stats()["extraction"]["waits"] > 0
+    assert "mapping" not in limits.stats()
+
+def test_batch_endpoint_streams_ndjson(monkeypatch):
+    monkeypatch.setattr(service, "run_flow", lambda ingestion_id: {"status": "COMPLETED"})
+    client = TestClient(api.app)
+
+    response = client.post("/orchestrate/batch", json={"ingestion_ids": ["ING-1", "ING-2", "ING-3"], "limit": 2})
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert sorted(line["ingestion_id"] for line in lines if line["event"] == "flow") == ["ING-1", "ING-2"]
+    assert lines[-1]["completed"] == 2
+
+    progress = client.get(f"/orchestrate/batch/{response.headers['x-batch-id']}").json()
+    assert progress["state"] == "DONE"
+
+    assert client.post("/orchestrate/batch", json={}).status_code == 400
@@ -0,0 +1,78 @@
+import threading
+from backend.mcp.db.writer import BatchWriter
+
+def test_batch_writer_flushes_by_size_and_on_close():
+    batches = []
+    writer = BatchWriter("test", batches.append, max_batch_size=3, flush_interval_s=5).start()
+    for i in range(7):
+        assert writer.submit(i)
+    writer.close()
+
+    assert [row for batch in batches for row in batch] == list(range(7))
+    assert all(len(batch) <= 3 for batch in batches)
+    assert writer.stats()["rows_written"] == 7
+    assert not writer.submit(8)
+
+def test_batch_writer_applies_back_pressure():
+    release = threading.Event()
+    writer = BatchWriter(
+        "test", lambda batch: release.wait(), max_batch_size=1, flush_interval_s=0.01,
+        max_queue_size=1, put_timeout_s=0.05,
+    ).start()
+
+    results = [writer.submit(i) for i in range(4)]
+    release.set()
+    writer.close()
+
+    assert results[0] and not results[-1]
+    assert writer.rows_rejected >= 1
+    assert writer.rows_written + writer.rows_rejected == 4
+
+def test_batch_writer_retries_a_failed_flush_without_losing_rows():
+    written, failures = [], [RuntimeError("db down")] * 2
+
+    def flush(batch):
+        if failures:
+            raise failures.pop()
+        written.extend(batch)
+
+    writer = BatchWriter("test", flush, max_batch_size=10, flush_interval_s=0.01, retry_backoff_s=0.01).start()
+    for i in range(5):
+        writer.submit(i)
+    writer.close()
+
+    assert written == list(range(5))
+    assert writer.stats()["rows_failed"] == 0 and writer.stats()["flush_retries"] == 2
+
+def test_batch_writer_drops_only_the_rows_that_keep_failing():
+    written = []
+
+    def flush(batch):
+        if 3 in batch:
+            raise ValueError("bad row")
+        written.extend(batch)
+
+    writer = BatchWriter(
+        "test", flush, max_batch_size=10, flush_interval_s=5, max_flush_attempts=2, retry_backoff_s=0.01,
+    ).start()
+    for i in range(6):
+        writer.submit(i)
+    writer.close()
+
+    assert written == [0, 1, 2, 4, 5]
+    assert writer.rows_failed == 1 and writer.rows_written == 5
+
+def test_batch_writer_counts_every_row_submitted_from_many_threads():
+    writer = BatchWriter(
+        "test", lambda batch: None, max_batch_size=5, flush_interval_s=0.01, max_queue_size=5, put_timeout_s=0,
+    ).start()
+
+    threads = [threading.Thread(target=lambda: [writer.submit(i) for i in range(500)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+    stats = writer.stats()
+    assert stats["rows_written"] + stats["rows_rejected"] == 8 * 500
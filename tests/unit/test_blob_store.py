@@ -0,0 +1,25 @@
+import hashlib
+import os
+from backend.mcp.storage.blob_store import LocalBlobStore
+
+def test_local_blob_store_dedup(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    data = b"%PDF-1.4 invoice bytes"
+
+    first_hash, size = store.put(data)
+    second_hash, _ = store.put(data)
+
+    assert first_hash == second_hash == hashlib.sha256(data).hexdigest()
+    assert size == len(data)
+    assert os.path.exists(tmp_path / first_hash[:2] / first_hash[2:4] / first_hash)
+    assert os.listdir(tmp_path / ".tmp") == []
+
+def test_local_blob_store_streaming(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    content_hash, size = store.put_stream([b"abc", b"def", b"ghi"])
+
+    assert size == 9
+    assert list(store.iter_chunks(content_hash, chunk_size=4)) == [b"abcd", b"efgh", b"i"]
+
+    store.delete(content_hash)
+    assert not store.exists(content_hash)
@@ -0,0 +1,47 @@
+from concurrent import futures
+
+import grpc
+
+from backend.mcp import server as mcp_server
+from backend.mcp.grpc import mcp_pb2_grpc
+from backend.orchestrator import service
+from backend.shared.clients.registry import ChannelRegistry, get_channel, get_channel_registry
+
+def test_registry_reuses_channels_per_target():
+    registry = ChannelRegistry(pool_size=2)
+    first, second, third = (registry.get_channel("localhost:1") for _ in range(3))
+
+    assert first is not second
+    assert third is first
+    assert registry.get_channel("localhost:2") not in (first, second)
+    registry.close()
+
+def test_shared_clients_use_one_channel_per_target():
+    from backend.shared.clients.agents import AgentsClient
+    from backend.shared.clients.mcp import MCPClient
+
+    MCPClient(), MCPClient(), AgentsClient(), AgentsClient()
+    channel = get_channel("localhost:6001")
+
+    assert all(len(pool) == 1 for pool in get_channel_registry()._pools.values())
+    assert get_channel("localhost:6001") is channel
+    assert "localhost:50051" in get_channel_registry()._pools
+
+def test_health_check_reports_each_target():
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1), options=mcp_server.GRPC_SERVER_OPTIONS)
+    mcp_pb2_grpc.add_MCPServicer_to_server(mcp_pb2_grpc.MCPServicer(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    registry = ChannelRegistry()
+    registry.get_channel(f"localhost:{port}")
+    registry.get_channel("localhost:1")
+    health = registry.check_health(timeout_s=0.5)
+
+    assert health == {f"localhost:{port}": "READY", "localhost:1": "UNAVAILABLE"}
+    registry.close()
+    server.stop(None)
+
+def test_orchestrator_compiles_the_graph_once():
+    assert service.get_graph() is service.get_graph()
+    assert service.get_clients() is service.get_clients()
@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import exc, text
+
+from backend.mcp import server as mcp_server
+from backend.mcp.db import async_engine
+from backend.mcp.db.engine import create_db_engine
+
+def test_pool_stats_track_checkouts_and_timeouts(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path}/pool.db", pool_size=1, max_overflow=0, pool_timeout=0.05)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert engine.pool.stats()["saturation"] == 1.0
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    stats = engine.pool.stats()
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["checked_out"] == 0
+    assert sum(stats["checkout_ms_buckets"].values()) == 1
+    engine.dispose()
+
+def test_db_pool_metrics_include_the_asyncpg_pool_in_aio_mode(monkeypatch):
+    monkeypatch.setattr(async_engine, "async_engine", None)
+    assert "asyncpg" not in mcp_server.db_pool_stats()
+
+    engine = async_engine.create_db_async_engine("postgresql+asyncpg://user@localhost/db", pool_size=3, max_overflow=1)
+    monkeypatch.setattr(async_engine, "async_engine", engine)
+    assert mcp_server.db_pool_stats()["asyncpg"] == {"pool_size": 3, "max_overflow": 1, "checked_out": 0, "idle": 0}
@@ -0,0 +1,55 @@
+import os
+
+from backend.agents.common.hsn_index import HsnMaster, load_hsn_master
+from backend.agents.validation_agent import rules
+from backend.agents.validation_agent.rules import BUNDLED_RULESETS_DIR, RulesetRegistry
+
+SAMPLE_HSN_MASTER = os.path.join(os.path.dirname(rules.__file__), "data", "hsn_sample.csv")
+
+def test_codes_resolve_to_the_longest_master_heading():
+    index = load_hsn_master(SAMPLE_HSN_MASTER)
+
+    assert index.resolve("84713010") == "84713010"
+    assert index.resolve("8471.30 90") == "847130"
+    assert index.resolve(84719000) == "8471"
+    assert index.resolve("8499") is None
+    assert index.resolve("84") is None
+    assert index.rates("998314") == {18}
+    assert index.rates("9988") == {5, 12, 18}
+
+def test_a_new_dataset_version_is_swapped_in_whole_and_a_broken_one_ignored(tmp_path):
+    path = tmp_path / "hsn.csv"
+    path.write_text("code,description,rates\n8471,Computers,18\n")
+    master = HsnMaster(str(path), reload_interval_s=0.01)
+    first = master.index()
+
+    path.write_text("code,description,rates\n8471,Computers,12|18\n9988,Job work,5\n")
+    os.utime(path, ns=(1, 1))
+    master._checked_at -= 1
+    second = master.index()
+
+    path.write_text("code,description,rates\nnot-a-code,Broken,18\n")
+    master._checked_at -= 1
+
+    assert (len(first), first.rates("8471")) == (1, {18})
+    assert (len(second), second.rates("8471")) == (2, {12, 18})
+    assert master.index() is second and second.version != first.version
+
+def test_default_ruleset_cross_checks_item_tax_rates(monkeypatch):
+    monkeypatch.setattr(rules, "get_hsn_master", lambda: HsnMaster(SAMPLE_HSN_MASTER, reload_interval_s=0))
+    ruleset = RulesetRegistry(BUNDLED_RULESETS_DIR, reload_interval_s=0).get("default")
+    items = [
+        {"description": "Laptop", "hsn": "84713010", "tax_rate": 18},
+        {"description": "Job work", "hsn": "9988", "tax_rate": 12.0},
+        {"description": "Car", "hsn": "8703", "tax_rate": 18},
+        {"description": "Gadget", "hsn": "8499", "tax_rate": 18},
+        {"description": "Misc", "hsn": "12", "tax_rate": None},
+    ]
+
+    findings = ruleset.validate({"supplier_gstin": "29AAFCD5862R1ZR", "invoice_date": "2025-11-25", "items": items})
+
+    assert [(f.rule_id, f.message) for f in findings] == [
+        ("item_hsn_length", "Invalid HSN for item: Misc"),
+        ("item_hsn_known", "Unknown HSN/SAC code 8499 for item: Gadget"),
+        ("item_tax_rate_matches_hsn", "GST rate 18% does not apply to HSN/SAC 8703 for item: Car"),
+    ]
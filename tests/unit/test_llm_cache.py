@@ -0,0 +1,87 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from backend.mcp import server as mcp_server
+from backend.mcp.llm.cache import LLMResponseCache
+from backend.shared.grpc import mcp_pb2
+from backend.shared.services.extractor import ExtractorService, extraction_cache_key, parse_llm_json
+
+class FakeCacheTable:
+    """Stands in for the llm_cache repository functions."""
+
+    def __init__(self, monkeypatch):
+        self.rows = {}
+        monkeypatch.setattr(mcp_server.repository, "get_llm_cache_entry",
+                            lambda key, ttl_s: self.rows.get(key))
+        monkeypatch.setattr(mcp_server.repository, "save_llm_cache_entry", self.save)
+        monkeypatch.setattr(mcp_server.repository, "prune_llm_cache", lambda ttl_s, max_entries: 0)
+
+    def save(self, key, model, **values):
+        self.rows[key] = SimpleNamespace(**values)
+        return True
+
+class ServicerClient:
+    """MCPClient.query_llm against an in-process servicer."""
+
+    def __init__(self, servicer):
+        self.servicer = servicer
+        self.responses = []
+
+    def query_llm(self, prompt, model, options=None, cache_key="", ingestion_id=""):
+        request = mcp_pb2.QueryLLMReq(prompt=prompt, model=model, cache_key=cache_key, ingestion_id=ingestion_id,
+                                      options={k: str(v) for k, v in (options or {}).items()})
+        response = self.servicer.QueryLLM(request, None)
+        self.responses.append(response)
+        return response
+
+def test_near_identical_invoices_share_one_llm_call(monkeypatch):
+    FakeCacheTable(monkeypatch)
+    monkeypatch.setattr(mcp_server, "WRITE_BUFFER_ENABLED", False)
+    servicer = mcp_server.MCPServicer()
+    calls = []
+    query = servicer.llm.query
+    monkeypatch.setattr(servicer.llm, "query", lambda *args: calls.append(args) or query(*args))
+    monkeypatch.setattr(servicer.llm, "record_metric", None)
+    monkeypatch.setattr(servicer, "_record_llm_metric", lambda ingestion_id, metrics: None)
+    client = ServicerClient(servicer)
+    extractor = ExtractorService(client, model="fake-model")
+
+    first = extractor.extract_schema("Invoice Number: INV-9\nDate: 2025-11-25\nTotal: 1,250.50")
+    rescanned = extractor.extract_schema("Invoice Number:  INV-9\r\n\nDate: 2025-11-25\u200b\nTotal: 1,250.50 ")
+
+    assert first == rescanned
+    assert first["invoiceNumber"] == "INV-9" and first["totals"]["grandTotal"] == 1250.5
+    assert len(calls) == 1
+    assert [response.cached for response in client.responses] == [False, True]
+
+def test_cache_key_covers_model_and_text():
+    text = "Invoice Number: INV-9"
+    assert extraction_cache_key("model-a", text) == extraction_cache_key("model-a", f" {text}\n")
+    assert extraction_cache_key("model-a", text) != extraction_cache_key("model-b", text)
+    assert extraction_cache_key("model-a", text) != extraction_cache_key("model-a", "Invoice Number: INV-8")
+
+def test_concurrent_misses_make_one_call(monkeypatch):
+    FakeCacheTable(monkeypatch)
+    cache = LLMResponseCache(ttl_s=60, max_entries=10)
+    calls = []
+
+    def query():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"text": "{}", "confidence": 0.9, "raw_response": "{}"}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_query("k", "m", query)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert sorted(cached for _, cached in results) == [False, True, True, True]
+    assert cache._key_locks == {}
+
+def test_parse_llm_json_tolerates_fences():
+    assert parse_llm_json('```json\n{"invoiceNumber": "INV-1"}\n```') == {"invoiceNumber": "INV-1"}
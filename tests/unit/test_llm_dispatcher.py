@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+
+from backend.mcp.llm.client import FakeLLMProvider, LLMProvider, LLMResult
+from backend.mcp.llm.dispatcher import LLMDispatcher, LLMService, RateLimiter
+
+class RecordingProvider(FakeLLMProvider):
+    def __init__(self, delay_s=0.0):
+        self.delay_s = delay_s
+        self.batches = []
+        self.in_flight = self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def complete(self, prompts, model, options):
+        with self._lock:
+            self.batches.append(list(prompts))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay_s)
+        with self._lock:
+            self.in_flight -= 1
+        return super().complete(prompts, model, options)
+
+def run_concurrently(fn, count):
+    results = [None] * count
+    threads = [threading.Thread(target=lambda i=i: results.__setitem__(i, fn(i))) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def test_concurrent_calls_are_coalesced_into_batches():
+    provider = RecordingProvider()
+    dispatcher = LLMDispatcher(provider, max_batch_size=4, batch_window_s=0.2)
+
+    results = run_concurrently(lambda i: dispatcher.query(f"prompt {i}", "m", {}), 8)
+
+    assert sorted(len(batch) for batch in provider.batches) == [4, 4]
+    for i, (result, served) in enumerate(results):
+        assert result.text == f"FAKE_LLM_RESPONSE for: prompt {i}"
+        assert served["batch_size"] == 4
+
+def test_unbatched_provider_is_capped_by_concurrency():
+    provider = RecordingProvider(delay_s=0.05)
+    provider.supports_batching = False
+    dispatcher = LLMDispatcher(provider, max_concurrency=2, max_batch_size=8)
+
+    run_concurrently(lambda i: dispatcher.query(f"prompt {i}", "m", {}), 6)
+
+    assert [len(batch) for batch in provider.batches] == [1] * 6
+    assert provider.max_in_flight == 2
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(per_minute=600, burst=1)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.18
+
+def test_service_records_tokens_and_cost(monkeypatch):
+    monkeypatch.setenv("LLM_PRICED_PROMPT_PRICE_PER_1K", "1.0")
+    monkeypatch.setenv("LLM_PRICED_COMPLETION_PRICE_PER_1K", "0")
+
+    class Priced(LLMProvider):
+        def complete(self, prompts, model, options):
+            return [LLMResult("ok", prompt_tokens=500, completion_tokens=10) for _ in prompts]
+
+    class Failing(LLMProvider):
+        def complete(self, prompts, model, options):
+            raise RuntimeError("down")
+
+    recorded = []
+    service = LLMService("priced", lambda ingestion_id, metrics: recorded.append((ingestion_id, metrics)),
+                         create=lambda name: {"priced": Priced, "failing": Failing}[name]())
+
+    assert service.query("hello", "m", {}, "ING-1")["text"] == "ok"
+    with pytest.raises(RuntimeError):
+        service.query("hello", "m", {"provider": "failing"}, "ING-2")
+
+    (ingestion_id, metrics), (_, failure) = recorded
+    assert ingestion_id == "ING-1"
+    assert metrics["provider"] == "priced" and metrics["prompt_tokens"] == 500
+    assert metrics["cost_usd"] == 0.5
+    assert failure == {"provider": "failing", "model": "m", "success": False, "total_ms": failure["total_ms"]}
+
+def test_a_provider_without_complete_cannot_be_created():
+    class Incomplete(LLMProvider):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,76 @@
+import json
+
+from backend.agents.common.validation_utils import check_header_field
+from backend.mcp import server as mcp_server
+from backend.shared.grpc import mcp_pb2
+from backend.shared.services.extractor import ExtractorService, IncrementalJSONParser
+from tests.unit.test_llm_cache import FakeCacheTable
+
+INVOICE = {
+    "invoiceNumber": "INV-7",
+    "invoiceDate": "2025-11-25",
+    "vendor": {"name": "Acme, {Ltd}", "gstin": "29AAFCD5862R1ZR"},
+    "lineItems": [{"description": "Widget \"A\"", "quantity": 2, "amount": 10.5}],
+    "totals": {"grandTotal": 21.0},
+    "roundOff": None,
+}
+
+def test_parser_reports_header_fields_before_line_items_finish():
+    text = "```json\n" + json.dumps(INVOICE, indent=2) + "\n```"
+    cut = text.index('"quantity"')
+    parser = IncrementalJSONParser()
+
+    early = [name for name, _ in parser.feed(text[:cut])]
+    assert early == ["invoiceNumber", "invoiceDate", "vendor"]
+    assert check_header_field("vendor", parser.fields["vendor"]) == []
+
+    late = []
+    for i in range(cut, len(text), 3):
+        late += [name for name, _ in parser.feed(text[i:i + 3])]
+    assert late == ["lineItems", "totals", "roundOff"]
+    assert parser.done and parser.fields == INVOICE
+
+def test_parser_handles_members_split_across_single_character_chunks():
+    text = "Here it is: " + json.dumps(INVOICE)
+    parser = IncrementalJSONParser()
+
+    names = [name for c in text for name, _ in parser.feed(c)]
+
+    assert names == list(INVOICE)
+    assert parser.fields == INVOICE and parser.text == text
+
+class StreamingClient:
+    def __init__(self, servicer):
+        self.servicer = servicer
+        self.chunks = []
+
+    def query_llm_stream(self, prompt, model, options=None, cache_key="", ingestion_id=""):
+        request = mcp_pb2.QueryLLMReq(prompt=prompt, model=model, cache_key=cache_key, ingestion_id=ingestion_id)
+        for chunk in self.servicer.QueryLLMStream(request, None):
+            self.chunks.append(chunk)
+            yield chunk
+
+def test_streamed_extraction_is_cached_and_replayed(monkeypatch):
+    FakeCacheTable(monkeypatch)
+    monkeypatch.setattr(mcp_server, "WRITE_BUFFER_ENABLED", False)
+    servicer = mcp_server.MCPServicer()
+    metrics = []
+    record = lambda ingestion_id, m: metrics.append(m)
+    monkeypatch.setattr(servicer, "_record_llm_metric", record)
+    monkeypatch.setattr(servicer.llm, "record_metric", record)
+    client = StreamingClient(servicer)
+    extractor = ExtractorService(client, model="fake-model")
+    seen = []
+
+    fields = extractor.extract_schema_stream("Invoice Number: INV-7\nDate: 2025-11-25", "ING-1",
+                                             lambda name, value: seen.append(name))
+
+    assert fields["invoiceNumber"] == "INV-7"
+    assert seen.index("vendor") < seen.index("lineItems")
+    assert len(client.chunks) > 3 and client.chunks[-1].done
+    assert metrics[0]["streamed"] and metrics[0]["first_token_ms"] is not None
+
+    client.chunks.clear()
+    assert extractor.extract_schema_stream("Invoice Number: INV-7 Date: 2025-11-25", "ING-2") == fields
+    assert [chunk.cached for chunk in client.chunks] == [True, True]
+    assert metrics[1]["cached"]
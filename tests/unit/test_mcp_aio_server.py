@@ -0,0 +1,49 @@
+import asyncio
+from types import SimpleNamespace
+
+import grpc
+
+from backend.mcp import aio_server, server as mcp_server
+from backend.mcp.db import async_repository
+from backend.mcp.storage.blob_store import LocalBlobStore
+from backend.shared.grpc import mcp_pb2, mcp_pb2_grpc
+
+def test_aio_server_serves_async_and_inherited_rpcs(tmp_path, monkeypatch):
+    jobs = {}
+
+    async def enqueue_ocr_job(ingestion_id, file_url, metadata, priority="normal"):
+        jobs[ingestion_id] = SimpleNamespace(
+            job_id="JOB-1", ingestion_id=ingestion_id, file_url=file_url, metadata_=metadata,
+            priority=priority, status="QUEUED", attempts=0, ocr_id=None, error=None,
+        )
+        return jobs[ingestion_id]
+
+    async def get_ocr_job(ingestion_id):
+        return jobs.get(ingestion_id)
+
+    monkeypatch.setattr(async_repository, "enqueue_ocr_job", enqueue_ocr_job)
+    monkeypatch.setattr(async_repository, "get_ocr_job", get_ocr_job)
+    monkeypatch.setattr(mcp_server, "WRITE_BUFFER_ENABLED", False)
+    monkeypatch.setattr(mcp_server, "get_blob_store", lambda: LocalBlobStore(str(tmp_path)))
+    monkeypatch.setattr(mcp_server.repository, "save_document", lambda **kwargs: SimpleNamespace(**kwargs))
+
+    async def scenario():
+        server, port = aio_server.create_server(aio_server.AsyncMCPServicer(), "localhost:0")
+        await server.start()
+        async with grpc.aio.insecure_channel(f"localhost:{port}") as channel:
+            stub = mcp_pb2_grpc.MCPStub(channel)
+            job = await stub.EnqueueOcrJob(mcp_pb2.EnqueueOcrJobReq(ingestion_id="ING-1", priority="high"))
+            fetched = await stub.GetOcrJob(mcp_pb2.GetDocReq(ingestion_id="ING-1"))
+            # UploadDocument is not ported and runs on the migration thread pool.
+            uploaded = await stub.UploadDocument(iter([
+                mcp_pb2.UploadDocChunk(header=mcp_pb2.SaveDocReq(ingestion_id="ING-1", file_name="scan.pdf")),
+                mcp_pb2.UploadDocChunk(chunk=b"%PDF"),
+            ]))
+        await server.stop(None)
+        return job, fetched, uploaded
+
+    job, fetched, uploaded = asyncio.run(scenario())
+
+    assert job.priority == "high" and job.status == "QUEUED"
+    assert fetched.job_id == "JOB-1"
+    assert uploaded.ok and uploaded.doc_ref == "ING-1"
@@ -0,0 +1,74 @@
+import asyncio
+from concurrent import futures
+from types import SimpleNamespace
+
+import grpc
+import pytest
+
+from backend.mcp import server as mcp_server
+from backend.mcp.storage.blob_store import LocalBlobStore
+from backend.shared.clients.mcp import AsyncMCPClient, MCPClient
+from backend.shared.grpc import mcp_pb2_grpc
+
+@pytest.fixture
+def mcp_port(tmp_path, monkeypatch):
+    documents = {}
+
+    def save_document(ingestion_id, file_name, file_url, metadata, content_hash=None, size_bytes=None):
+        documents[ingestion_id] = SimpleNamespace(
+            ingestion_id=ingestion_id, file_name=file_name, file_url=file_url,
+            metadata=metadata, content_hash=content_hash,
+        )
+        return documents[ingestion_id]
+
+    monkeypatch.setattr(mcp_server.repository, "save_document", save_document)
+    monkeypatch.setattr(mcp_server.repository, "get_document", documents.get)
+    monkeypatch.setattr(mcp_server, "get_blob_store", lambda: LocalBlobStore(str(tmp_path)))
+    monkeypatch.setattr(mcp_server, "DOCUMENT_CHUNK_SIZE", 4)
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    mcp_pb2_grpc.add_MCPServicer_to_server(mcp_server.MCPServicer(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield port
+    server.stop(None)
+
+@pytest.fixture
+def mcp_client(mcp_port):
+    client = MCPClient()
+    client.stub = mcp_pb2_grpc.MCPStub(grpc.insecure_channel(f"localhost:{mcp_port}"))
+    return client
+
+def test_upload_and_download_document_in_chunks(mcp_client):
+    response = mcp_client.upload_document("ING-1", "scan.pdf", "s3://bucket/scan.pdf", {"source": "test"}, [b"%PDF-", b"1.4 body"])
+    assert response.ok
+
+    header, chunks = mcp_client.download_document("ING-1")
+    chunks = list(chunks)
+
+    assert header.file_name == "scan.pdf"
+    assert header.metadata["source"] == "test"
+    assert b"".join(chunks) == b"%PDF-1.4 body"
+    assert all(len(chunk) <= 4 for chunk in chunks)
+
+def test_download_missing_document(mcp_client):
+    with pytest.raises(grpc.RpcError) as exc:
+        mcp_client.download_document("ING-missing")
+    assert exc.value.code() == grpc.StatusCode.NOT_FOUND
+
+def test_async_client_downloads_a_document_in_chunks(mcp_client, mcp_port):
+    mcp_client.upload_document("ING-2", "scan.pdf", None, {}, [b"%PDF-1.4 ", b"multi-chunk body"])
+
+    async def download():
+        client = AsyncMCPClient()
+        client.channel = grpc.aio.insecure_channel(f"localhost:{mcp_port}")
+        client.stub = mcp_pb2_grpc.MCPStub(client.channel)
+        header, chunks = await client.download_document("ING-2")
+        received = [chunk async for chunk in chunks]
+        await client.close()
+        return header, received
+
+    header, chunks = asyncio.run(download())
+
+    assert header.file_name == "scan.pdf"
+    assert len(chunks) > 1 and b"".join(chunks) == b"%PDF-1.4 multi-chunk body"
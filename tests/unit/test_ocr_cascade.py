@@ -0,0 +1,111 @@
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from backend.shared.services.ocr import (
+    OcrCascade, OcrEngine, OcrError, PagePool, load_page, tesseract_page_text,
+)
+
+class ScriptedEngine(OcrEngine):
+    def __init__(self, name, text="text", confidence=0.9, delay_s=0.0, error=None, available=True):
+        self.name = name
+        self.text = text
+        self.confidence = confidence
+        self.delay_s = delay_s
+        self.error = error
+        self._available = available
+        self.calls = 0
+
+    def available(self):
+        return self._available
+
+    def recognize(self, file_path, file_name, timeout_s):
+        self.calls += 1
+        time.sleep(self.delay_s)
+        if self.error:
+            raise self.error
+        return self.text, self.confidence
+
+def cascade(engines, **kwargs):
+    recorded = []
+    kwargs.setdefault("confidence_threshold", 0.8)
+    kwargs.setdefault("timeout_s", 1.0)
+    return OcrCascade(engines, record_metric=lambda ingestion_id, m: recorded.append(m), **kwargs), recorded
+
+def test_first_confident_engine_ends_the_cascade():
+    first, second = ScriptedEngine("first", "first text", 0.95), ScriptedEngine("second")
+    runner, recorded = cascade([first, second])
+
+    result = runner.run("doc.png", "doc.png", "ING-1")
+
+    assert (result.text, result.engine) == ("first text", "first")
+    assert second.calls == 0
+    assert [(m["engine"], m["outcome"], m["hit"]) for m in recorded] == [("first", "accepted", True)]
+
+def test_falls_through_failures_and_returns_the_most_confident_text():
+    engines = [
+        ScriptedEngine("remote", available=False),
+        ScriptedEngine("slow", delay_s=0.5),
+        ScriptedEngine("broken", error=RuntimeError("boom")),
+        ScriptedEngine("fair", "fair text", 0.6),
+        ScriptedEngine("poor", "poor text", 0.3),
+        ScriptedEngine("blank", "   ", 0.99),
+    ]
+    runner, recorded = cascade(engines, timeouts={"slow": 0.05})
+
+    result = runner.run("doc.png", "doc.png")
+
+    assert (result.text, result.engine, result.confidence) == ("fair text", "fair", 0.6)
+    assert [(m["outcome"], m["hit"]) for m in recorded] == [
+        ("unavailable", False), ("timeout", False), ("error", False),
+        ("low_confidence", True), ("low_confidence", False), ("low_confidence", False),
+    ]
+    assert recorded[1]["latency_ms"] < 400
+
+def test_raises_when_no_engine_produces_text():
+    runner, recorded = cascade([ScriptedEngine("broken", error=OSError("no binary"))])
+
+    with pytest.raises(OcrError):
+        runner.run("doc.png", "doc.png")
+    assert recorded[0]["outcome"] == "error"
+
+def test_tesseract_page_text_keeps_lines_and_skips_non_words():
+    data = {
+        "text": ["", "Invoice", "Number:", "INV-9", "", "Total:", "10.00"],
+        "conf": [-1, 96, 90, 84, -1, 70, "80"],
+        "block_num": [1, 1, 1, 1, 2, 2, 2],
+        "par_num": [1, 1, 1, 1, 1, 1, 1],
+        "line_num": [0, 1, 1, 2, 0, 1, 1],
+    }
+
+    text, confidences = tesseract_page_text(data)
+
+    assert text == "Invoice Number:\nINV-9\n\nTotal: 10.00"
+    assert confidences == [96, 90, 84, 70, 80]
+
+def frame_number(file_path, page, is_pdf, timeout_s, scale):
+    # Runs in a PagePool worker process.
+    image = load_page(file_path, page, is_pdf)
+    return image.getpixel((0, 0))[0] * scale, os.getpid()
+
+def test_page_pool_returns_pages_in_order_from_worker_processes(tmp_path):
+    path = tmp_path / "scan.tiff"
+    frames = [Image.new("RGB", (8, 8), (shade, 0, 0)) for shade in range(12)]
+    frames[0].save(path, save_all=True, append_images=frames[1:])
+    pool = PagePool(workers=2)
+    try:
+        results = pool.map_pages(frame_number, str(path), "scan.tiff", 30.0, 10)
+    finally:
+        pool.close()
+
+    assert [value for value, _ in results] == [shade * 10 for shade in range(12)]
+    assert os.getpid() not in {pid for _, pid in results}
+
+def test_an_engine_without_recognize_cannot_be_created():
+    class Incomplete(OcrEngine):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
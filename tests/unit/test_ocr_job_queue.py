@@ -0,0 +1,98 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from backend.shared.dependencies.config import get_settings
+from backend.shared.services import job_queue
+from backend.shared.services.job_queue import InMemoryOcrJobQueue, get_async_ocr_job_queue, get_ocr_job_queue
+from backend.agents.extraction_agent.worker import OcrWorkerPool
+
+def test_in_memory_queue_claims_high_priority_first():
+    queue = InMemoryOcrJobQueue()
+    queue.enqueue("ING-low", "s3://a", {}, priority="low")
+    queue.enqueue("ING-normal", "s3://b", {})
+    queue.enqueue("ING-high", "s3://c", {}, priority="high")
+
+    claimed = queue.claim("worker-1", max_jobs=3)
+
+    assert [job.ingestion_id for job in claimed] == ["ING-high", "ING-normal", "ING-low"]
+    assert all(job.status == "RUNNING" and job.attempts == 1 for job in claimed)
+
+def test_in_memory_queue_retries_until_max_attempts():
+    queue = InMemoryOcrJobQueue(max_attempts=2)
+    job = queue.enqueue("ING-1", "s3://a", {})
+
+    queue.claim("worker-1")
+    queue.fail(job.job_id, "worker-1", "boom", retry_delay_s=0)
+    assert queue.get("ING-1").status == "QUEUED"
+
+    queue.claim("worker-1")
+    queue.fail(job.job_id, "worker-1", "boom", retry_delay_s=0)
+    assert queue.get("ING-1").status == "FAILED"
+    assert queue.claim("worker-1") == []
+
+def test_worker_pool_completes_jobs():
+    queue = InMemoryOcrJobQueue()
+    queue.enqueue("ING-1", "s3://a", {})
+    pool = OcrWorkerPool(queue, lambda ingestion_id: f"OCR-{ingestion_id}", num_workers=2, poll_interval_s=0.01)
+
+    pool.start()
+    deadline = time.time() + 5
+    while queue.get("ING-1").status != "DONE" and time.time() < deadline:
+        time.sleep(0.01)
+    pool.stop()
+
+    job = queue.get("ING-1")
+    assert job.status == "DONE"
+    assert job.ocr_id == "OCR-ING-1"
+
+def test_in_memory_queue_fails_abandoned_jobs_without_attempts_left():
+    queue = InMemoryOcrJobQueue(max_attempts=2, visibility_timeout_s=0)
+    queue.enqueue("ING-1", "s3://a", {})
+
+    assert [job.attempts for job in queue.claim("worker-1")] == [1]
+    # worker-1 never reports back, so the job is claimed again...
+    assert [job.attempts for job in queue.claim("worker-2")] == [2]
+    # ...until it has no attempts left.
+    assert queue.claim("worker-3") == []
+    job = queue.get("ING-1")
+    assert job.status == "FAILED" and job.attempts == 2
+
+def test_gateway_jobs_reach_the_in_memory_workers(monkeypatch):
+    monkeypatch.setattr(get_settings(), "OCR_JOB_QUEUE_BACKEND", "memory")
+    monkeypatch.setattr(job_queue, "_in_memory_queue", None)
+
+    enqueued = asyncio.run(get_async_ocr_job_queue(None).enqueue("ING-1", "s3://a", {}, "high"))
+    claimed = get_ocr_job_queue(None).claim("worker-1")
+
+    assert [job.job_id for job in claimed] == [enqueued.job_id]
+    assert asyncio.run(get_async_ocr_job_queue(None).get("ING-1")).status == "RUNNING"
+
+def test_in_memory_queue_moves_waiting_jobs_up_one_lane_per_aging_interval(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(job_queue, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    def claim_order(after_s):
+        clock[0] = 0.0
+        queue = InMemoryOcrJobQueue(priority_aging_s=10)
+        for priority in ["low", "normal", "high"]:
+            queue.enqueue(f"ING-{priority}", "s3://a", {}, priority=priority)
+            clock[0] += 1
+        clock[0] = after_s
+        return [job.ingestion_id for job in queue.claim("worker-1", max_jobs=3)]
+
+    assert claim_order(3) == ["ING-high", "ING-normal", "ING-low"]
+    # low has reached the normal lane and is older; normal has not waited a full interval.
+    assert claim_order(10.5) == ["ING-high", "ING-low", "ING-normal"]
+    assert claim_order(23) == ["ING-low", "ING-normal", "ING-high"]
+
+def test_in_memory_queue_ignores_a_worker_whose_job_was_reclaimed():
+    queue = InMemoryOcrJobQueue(visibility_timeout_s=0)
+    job = queue.enqueue("ING-1", "s3://a", {})
+    queue.claim("worker-1")
+    queue.claim("worker-2")
+
+    assert not queue.complete(job.job_id, "worker-1", "OCR-stale")
+    assert not queue.fail(job.job_id, "worker-1", "boom")
+    assert queue.get("ING-1").status == "RUNNING"
+    assert queue.complete(job.job_id, "worker-2", "OCR-1")
+    assert queue.get("ING-1").ocr_id == "OCR-1"
@@ -0,0 +1,102 @@
+import json
+from types import SimpleNamespace
+
+from backend.mcp import server as mcp_server
+from backend.mcp.grpc import mcp_pb2
+from backend.orchestrator.flow import graph as flow
+from backend.orchestrator.flow.checkpointer import MCPCheckpointSaver
+
+class FakeMCP:
+    """Keeps orchestration snapshots and steps the way the MCP tables do."""
+
+    def __init__(self):
+        self.bases, self.steps = {}, {}
+
+    def append_orchestration_step(self, ingestion_id, version, state_delta, status, checkpoint_type, checkpoint):
+        self.steps.setdefault(ingestion_id, []).append(mcp_pb2.OrchestrationStep(
+            ingestion_id=ingestion_id, version=version, state_delta=json.dumps(state_delta).encode(),
+            status=status, checkpoint_type=checkpoint_type, checkpoint=checkpoint,
+        ))
+        return mcp_pb2.WriteAck(ok=True)
+
+    def compact_orchestration(self, ingestion_id, version, state, status, checkpoint_type, checkpoint):
+        self.bases[ingestion_id] = mcp_pb2.OrchestrationSnapshot(
+            ingestion_id=ingestion_id, version=version, state_bytes=json.dumps(state).encode(),
+            status=status, checkpoint_type=checkpoint_type, checkpoint=checkpoint,
+        )
+        self.steps[ingestion_id] = [step for step in self.steps.get(ingestion_id, []) if step.version > version]
+        return mcp_pb2.WriteAck(ok=True)
+
+    def get_orchestration_checkpoints(self, ingestion_id):
+        message = mcp_pb2.OrchestrationCheckpoints(steps=self.steps.get(ingestion_id, []))
+        if ingestion_id in self.bases:
+            message.base.CopyFrom(self.bases[ingestion_id])
+        return message
+
+    def delete_orchestration_checkpoints(self, ingestion_id):
+        self.bases.pop(ingestion_id, None)
+        self.steps.pop(ingestion_id, None)
+        return mcp_pb2.WriteAck(ok=True)
+
+def run(graph, state, ingestion_id):
+    final = state
+    for final in graph.stream(state, {"configurable": {"thread_id": ingestion_id}}, stream_mode="values"):
+        pass
+    return final
+
+def test_steps_store_only_changed_fields_and_compact():
+    mcp = FakeMCP()
+    saver = MCPCheckpointSaver(mcp, flow.OrchestrationState.model_fields, compact_every=100)
+    final = run(flow.build_graph(None, checkpointer=saver), {"ingestion_id": "ING-1"}, "ING-1")
+
+    deltas = [json.loads(step.state_delta) for step in mcp.steps["ING-1"]]
+    assert {"schema_id": "SCHEMA-TEST-123"} in deltas
+    assert sum("ocr_id" in delta for delta in deltas) == 1
+    assert [step.version for step in mcp.steps["ING-1"]] == list(range(1, len(deltas) + 1))
+
+    # Replaying the deltas restores the same state.
+    restored = MCPCheckpointSaver(mcp, flow.OrchestrationState.model_fields).get_tuple(
+        {"configurable": {"thread_id": "ING-1"}})
+    assert restored.checkpoint["channel_values"]["status"] == final["status"] == "COMPLETED"
+
+    saver.compact("ING-1")
+    assert mcp.steps["ING-1"] == []
+    assert json.loads(mcp.bases["ING-1"].state_bytes)["tally_integration_id"] == final["tally_integration_id"]
+
+def test_periodic_compaction_keeps_history_short():
+    mcp = FakeMCP()
+    saver = MCPCheckpointSaver(mcp, flow.OrchestrationState.model_fields, compact_every=3)
+    run(flow.build_graph(None, checkpointer=saver), {"ingestion_id": "ING-1"}, "ING-1")
+
+    assert mcp.bases["ING-1"].version % 3 == 0
+    assert len(mcp.steps["ING-1"]) < 3
+
+def test_resume_restores_state_from_checkpoint(monkeypatch):
+    monkeypatch.setattr(flow, "node_validation", lambda state, clients: {
+        "validation_id": "VAL-1", "valid": False, "requires_human_review": True,
+    })
+    mcp = FakeMCP()
+    saver = MCPCheckpointSaver(mcp, flow.OrchestrationState.model_fields, compact_every=3)
+    paused = run(flow.build_graph(None, checkpointer=saver), {"ingestion_id": "ING-1"}, "ING-1")
+    saver.compact("ING-1")
+    assert paused["status"] == "PENDING_REVIEW"
+
+    # A fresh process restores from the MCP.
+    saver = MCPCheckpointSaver(mcp, flow.OrchestrationState.model_fields)
+    resumed = run(flow.build_graph(None, checkpointer=saver), {
+        "ingestion_id": "ING-1", "status": "RESUMING", "requires_human_review": False, "valid": True,
+    }, "ING-1")
+
+    assert resumed["status"] == "COMPLETED"
+    assert resumed["report_id"] == "REPORT-TEST-123"
+    assert resumed["validation_id"] == "VAL-1"
+
+def test_get_orchestration_applies_uncompacted_steps():
+    orchestration = SimpleNamespace(state={"ingestion_id": "ING-1", "status": "STARTED", "ocr_id": "OCR-1"})
+    steps = [SimpleNamespace(state_delta={"schema_id": "S-1"}), SimpleNamespace(state_delta={"status": "COMPLETED"})]
+
+    message = mcp_server._orchestration_message("ING-1", orchestration, steps)
+
+    assert json.loads(message.state_bytes) == {
+        "ingestion_id": "ING-1", "status": "COMPLETED", "ocr_id": "OCR-1", "schema_id": "S-1",
+    }
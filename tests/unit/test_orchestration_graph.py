@@ -0,0 +1,53 @@
+import time
+
+from backend.orchestrator.flow import graph as flow
+
+def run(graph, state):
+    final = state
+    for final in graph.stream(state, stream_mode="values"):
+        pass
+    return final
+
+def test_target_branches_run_concurrently(monkeypatch):
+    def slow_convert(target, state, clients):
+        time.sleep(0.2)
+        return f"CONV-{target}"
+
+    def slow_integrate(target, conversion_id, state, clients):
+        time.sleep(0.2)
+        return f"INT-{target}"
+
+    monkeypatch.setattr(flow, "convert_target", slow_convert)
+    monkeypatch.setattr(flow, "integrate_target", slow_integrate)
+
+    start = time.perf_counter()
+    final = run(flow.build_graph(None), {"ingestion_id": "ING-1"})
+    elapsed = time.perf_counter() - start
+
+    assert final["status"] == "COMPLETED"
+    assert final["tally_integration_id"] == "INT-tally"
+    assert final["zoho_integration_id"] == "INT-zoho"
+    # Sequential targets would take 0.8s.
+    assert elapsed < 0.7
+
+def test_failed_target_does_not_block_the_other(monkeypatch):
+    def convert(target, state, clients):
+        if target == "zoho":
+            raise RuntimeError("zoho is down")
+        return f"CONV-{target}"
+
+    monkeypatch.setattr(flow, "convert_target", convert)
+
+    final = run(flow.build_graph(None), {"ingestion_id": "ING-1"})
+
+    assert final["status"] == "PARTIALLY_COMPLETED"
+    assert final["tally_status"] == "INTEGRATED"
+    assert final["zoho_status"] == "FAILED"
+    assert "zoho_integration_id" not in final
+    assert final["errors"] == ["zoho conversion failed: zoho is down"]
+
+def test_resume_starts_at_conversion(monkeypatch):
+    final = run(flow.build_graph(None), {"ingestion_id": "ING-1", "status": "RESUMING", "valid": True})
+
+    assert final["status"] == "COMPLETED"
+    assert "ocr_id" not in final
@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.agents.common.idempotency import idempotent
+from backend.mcp.grpc import mcp_pb2
+from backend.orchestrator import service
+from backend.orchestrator.flow import graph as flow
+from backend.orchestrator.flow.checkpointer import MCPCheckpointSaver
+from backend.orchestrator.recovery import LeaseKeeper, OrchestrationBusy, RecoverySweeper
+from backend.shared.clients.agents import IDEMPOTENCY_KEY_HEADER
+from tests.unit.test_orchestration_checkpointer import FakeMCP
+
+class LeasingMCP(FakeMCP):
+    """FakeMCP that also keeps leases; `expire` stands in for a lease running out."""
+
+    def __init__(self):
+        super().__init__()
+        self.leases, self.expired, self.recoveries = {}, set(), {}
+        self.records = {}
+
+    def acquire_orchestration_lease(self, ingestion_id, owner, ttl_s):
+        if self.leases.get(ingestion_id) not in (None, owner) and ingestion_id not in self.expired:
+            return False
+        self.leases[ingestion_id] = owner
+        self.expired.discard(ingestion_id)
+        return True
+
+    def release_orchestration_lease(self, ingestion_id, owner):
+        if self.leases.get(ingestion_id) == owner:
+            self.leases[ingestion_id] = None
+        return mcp_pb2.WriteAck(ok=True)
+
+    def expire(self, ingestion_id):
+        self.expired.add(ingestion_id)
+
+    def claim_stale_orchestrations(self, owner, ttl_s, limit, max_recoveries):
+        claimed = [i for i in sorted(self.expired) if self.leases.get(i) and self.recoveries.get(i, 0) < max_recoveries]
+        for ingestion_id in claimed[:limit]:
+            self.leases[ingestion_id] = owner
+            self.expired.discard(ingestion_id)
+            self.recoveries[ingestion_id] = self.recoveries.get(ingestion_id, 0) + 1
+        return claimed[:limit]
+
+    def get_idempotency_record(self, key):
+        return self.records.get(key)
+
+    def save_idempotency_record(self, key, agent, response):
+        self.records.setdefault(key, response)
+        return mcp_pb2.WriteAck(ok=True)
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    mcp = LeasingMCP()
+    saver = MCPCheckpointSaver(mcp, flow.OrchestrationState.model_fields)
+    graph = flow.build_graph(None, checkpointer=saver)
+    leases = LeaseKeeper(mcp, "orchestrator-1", ttl_s=60)
+    monkeypatch.setattr(service, "get_checkpointer", lambda: saver)
+    monkeypatch.setattr(service, "get_graph", lambda: graph)
+    monkeypatch.setattr(service, "get_leases", lambda: leases)
+    return mcp, leases
+
+def test_sweeper_resumes_a_crashed_flow_from_its_checkpoint(orchestrator, monkeypatch):
+    mcp, leases = orchestrator
+    extractions = []
+    monkeypatch.setattr(flow, "node_extraction", lambda state, clients: extractions.append(state.run_id) or {
+        "ocr_id": "OCR-1", "status": "EXTRACTED",
+    })
+    report = flow.node_report
+    monkeypatch.setattr(flow, "node_report", lambda state, clients: 1 / 0)
+
+    with pytest.raises(ZeroDivisionError):
+        service.run_flow("ING-1")
+    # The failed run keeps its lease (unrenewed) so it can be swept.
+    assert mcp.leases["ING-1"] == "orchestrator-1"
+    assert leases.held() == []
+
+    monkeypatch.setattr(flow, "node_report", report)
+    mcp.expire("ING-1")
+    sweeper = RecoverySweeper(mcp, leases, service.recover_flow, interval_s=60, workers=2, max_recoveries=3)
+    assert sweeper.sweep_once() == ["ING-1"]
+    sweeper.stop(wait=True)
+
+    state = mcp.get_orchestration_checkpoints("ING-1")
+    assert state.base.status == "COMPLETED"
+    assert mcp.leases["ING-1"] is None
+    # Extraction ran once: the recovery resumed after the last checkpointed step.
+    assert len(extractions) == 1 and extractions[0]
+
+def test_sweeper_gives_up_after_max_recoveries(orchestrator):
+    mcp, leases = orchestrator
+    mcp.leases["ING-1"] = "dead-orchestrator"
+    mcp.recoveries["ING-1"] = 3
+    mcp.expire("ING-1")
+
+    sweeper = RecoverySweeper(mcp, leases, service.recover_flow, interval_s=60, workers=2, max_recoveries=3)
+    assert sweeper.sweep_once() == []
+    sweeper.stop()
+
+def test_flow_running_elsewhere_is_not_started_twice(orchestrator):
+    mcp, _ = orchestrator
+    mcp.leases["ING-1"] = "orchestrator-2"
+
+    with pytest.raises(OrchestrationBusy):
+        service.run_flow("ING-1")
+
+def test_idempotent_handler_replays_the_recorded_response():
+    calls = []
+
+    class Servicer:
+        mcp_client = LeasingMCP()
+
+        @idempotent("report", mcp_pb2.WriteAck)
+        def GenerateReport(self, request, context):
+            calls.append(request)
+            return mcp_pb2.WriteAck(ok=len(calls) == 1)
+
+    context = SimpleNamespace(invocation_metadata=lambda: ((IDEMPOTENCY_KEY_HEADER, "RUN-1:report"),),
+                              code=lambda: None)
+    first = Servicer().GenerateReport("request", context)
+    retried = Servicer().GenerateReport("request", context)
+
+    assert first == retried == mcp_pb2.WriteAck(ok=True)
+    assert len(calls) == 1
@@ -0,0 +1,43 @@
+import os
+import time
+
+import pytest
+
+from backend.shared.services.process_pool import BoundedProcessPool
+
+def square(value):
+    # Runs in a pool worker process.
+    return value * value, os.getpid()
+
+def nap(seconds):
+    time.sleep(seconds)
+    return seconds
+
+def test_results_come_back_in_order_while_tasks_are_drawn_lazily():
+    drawn = []
+
+    def tasks():
+        for value in range(20):
+            drawn.append(value)
+            yield (value,)
+
+    pool = BoundedProcessPool(workers=2)
+    try:
+        results = pool.imap(square, tasks())
+        first, _ = next(results)
+        # Only the first 2 * workers tasks are submitted before a result is yielded.
+        assert first == 0 and len(drawn) == 4
+        rest = list(results)
+    finally:
+        pool.close()
+
+    assert [value for value, _ in rest] == [value * value for value in range(1, 20)]
+    assert os.getpid() not in {pid for _, pid in rest}
+
+def test_a_passed_deadline_raises_timeout_error():
+    pool = BoundedProcessPool(workers=2)
+    try:
+        with pytest.raises(TimeoutError):
+            list(pool.imap(nap, [(2,), (2,)], deadline=time.monotonic() + 0.2))
+    finally:
+        pool.close()
@@ -0,0 +1,81 @@
+import json
+from decimal import Decimal
+
+import pytest
+from backend.agents.validation_agent.reconcile import ReconcileConfig, Reconciler, to_decimal
+from backend.agents.validation_agent.rules import BUNDLED_RULESETS_DIR, RulesetError, RulesetRegistry
+
+def invoice(**totals):
+    items = [
+        {"description": "Cable", "quantity": 3, "rate": 33.33, "tax_rate": 18, "tax_amount": 18.0, "total": 117.99},
+        {"description": "Repair", "quantity": 1, "rate": "1,250.50", "tax_rate": 18, "tax_amount": 225.09, "total": 1475.59},
+    ]
+    header = {"total_amount": 1350.49, "tax_total": 243.09, "cgst": 121.55, "sgst": 121.54, "round_off": 0.42, "grand_total": 1594.0}
+    return {**header, **totals, "items": items}
+
+def test_amounts_that_add_up_in_decimal_pass_and_misread_digits_are_located():
+    reconciler = Reconciler(ReconcileConfig())
+    misread = invoice(total_amount=1850.49, grand_total=1549.0)
+    misread["items"][1] = {**misread["items"][1], "total": 1457.59}
+
+    clean, found = reconciler.reconcile_many([invoice(), misread])
+
+    assert clean == []
+    assert [(m.check, m.field, m.expected, m.found) for m in found] == [
+        ("item_amount", "items[1].total", "1475.59", "1457.59"),
+        ("subtotal", "total_amount", "1350.49", "1850.49"),
+        ("grand_total", "grand_total", "2094.00", "1549.0"),
+    ]
+    assert found[0].message == "Amount 1457.59 should be 1475.59 for line 2: Repair"
+
+def test_gst_split_and_round_off():
+    reconciler = Reconciler(ReconcileConfig())
+    no_round_off = {**invoice(), "round_off": None}
+
+    found = reconciler.reconcile_many([
+        no_round_off,
+        {**no_round_off, "grand_total": 1595.0},
+        invoice(cgst=12.55, round_off=0.92, grand_total=1594.5),
+        invoice(cgst=None, sgst=None, igst=243.09),
+    ])
+
+    assert [[m.check for m in mismatches] for mismatches in found] == [
+        [], ["grand_total"], ["gst_split", "cgst_sgst", "round_off"], [],
+    ]
+    assert to_decimal(0.1) + to_decimal(0.2) == Decimal("0.3")
+    assert to_decimal("n/a") is None and to_decimal(True) is None
+
+def test_rulesets_configure_and_extend_reconciliation(tmp_path):
+    registry = RulesetRegistry(BUNDLED_RULESETS_DIR, reload_interval_s=0)
+    misread = invoice(tax_total=234.09)
+
+    def reconciled(ruleset):
+        return [(f.rule_id, f.severity) for f in registry.get(ruleset).validate(misread) if f.rule_id.startswith("reconcile_")]
+
+    assert reconciled("default") == [
+        ("reconcile_tax_total", "warning"), ("reconcile_gst_split", "warning"), ("reconcile_grand_total", "warning"),
+    ]
+    assert {severity for _, severity in reconciled("strict")} == {"error"}
+
+    (tmp_path / "llm.json").write_text(json.dumps({"rules": [], "reconcile": {
+        "fields": {"items": "lineItems", "rate": "unitPrice", "tax_rate": "taxPercent", "amount": "amount",
+                   "subtotal": "subtotal", "tax_total": "gstAmount", "round_off": "roundOff", "grand_total": "grandTotal"},
+        "amount_includes_tax": False,
+    }}))
+    llm = RulesetRegistry(str(tmp_path), reload_interval_s=0).get("llm")
+    extracted = {"subtotal": 200, "gstAmount": 36, "roundOff": None, "grandTotal": 263, "lineItems": [
+        {"description": "Pen", "quantity": 20, "unitPrice": 10, "taxPercent": 18, "amount": 200},
+    ]}
+    assert [(f.field, f.expected) for f in llm.validate(extracted)] == [("grandTotal", "236")]
+
+    (tmp_path / "llm.json").write_text(json.dumps({"rules": [], "reconcile": {"rounding": "nearest"}}))
+    with pytest.raises(RulesetError, match="ruleset llm: reconcile rounding"):
+        RulesetRegistry(str(tmp_path), reload_interval_s=0)
+
+def test_huge_misread_amounts_do_not_overflow_the_decimal_context():
+    ruleset = RulesetRegistry(BUNDLED_RULESETS_DIR, reload_interval_s=0).get("default")
+    item = {"description": "Misread", "quantity": 99999999999999, "rate": 99999999999999, "tax_rate": 99999999999999, "total": 1}
+
+    findings = ruleset.validate({"supplier_gstin": "29AAFCD5862R1ZR", "invoice_date": "2025-11-25", "items": [item]})
+
+    assert [(f.rule_id, f.field) for f in findings if f.rule_id.startswith("reconcile_")] == [("reconcile_item_amount", "items[0].total")]
@@ -0,0 +1,66 @@
+import os
+import time
+from concurrent import futures
+
+import grpc
+import pytest
+
+from backend.mcp import server as mcp_server
+from backend.shared.clients.mcp import MCPClient, TelemetrySender
+from backend.shared.grpc import mcp_pb2_grpc
+
+@pytest.fixture
+def written(monkeypatch):
+    rows = {"metrics": [], "audits": []}
+    monkeypatch.setattr(mcp_server, "WRITE_BUFFER_ENABLED", False)
+    monkeypatch.setattr(mcp_server.repository, "bulk_write_metrics", rows["metrics"].append)
+    monkeypatch.setattr(mcp_server.repository, "bulk_write_audits", rows["audits"].append)
+    return rows
+
+@pytest.fixture
+def mcp_client(written):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    mcp_pb2_grpc.add_MCPServicer_to_server(mcp_server.MCPServicer(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    client = MCPClient()
+    client.stub = mcp_pb2_grpc.MCPStub(grpc.insecure_channel(f"localhost:{port}"))
+    yield client
+    server.stop(None)
+
+def test_telemetry_sender_batches_events_over_streams(mcp_client, written):
+    sender = TelemetrySender(mcp_client, batch_size=10, flush_interval_s=0.05)
+    for i in range(5):
+        sender.write_metric("OCR-AG", f"ING-{i}", {"ocr_time_ms": i})
+    sender.write_audit("extraction_agent", "save_ocr_output", "ING-0", {"ocr_id": "OCR-1"})
+    sender.close()
+
+    assert sender.stats()["sent"] == 6
+    assert [row["ingestion_id"] for batch in written["metrics"] for row in batch] == [f"ING-{i}" for i in range(5)]
+    assert written["audits"][0][0]["payload"] == {"ocr_id": "OCR-1"}
+
+def test_telemetry_sender_replays_spill_files_left_by_an_earlier_process(mcp_client, written, tmp_path):
+    offline = MCPClient()
+    offline.stub = mcp_pb2_grpc.MCPStub(grpc.insecure_channel("localhost:1"))
+    sender = TelemetrySender(offline, flush_interval_s=0.05, spill_dir=str(tmp_path), rpc_timeout_s=0.5)
+    sender.write_metric("OCR-AG", "ING-1", {"ocr_time_ms": 1})
+    sender.close()
+    assert sender.stats()["spilled"] == 1
+    # As if the agent had restarted with a new pid.
+    os.replace(sender.spill_path, tmp_path / "telemetry-1.jsonl")
+
+    restarted = TelemetrySender(mcp_client, flush_interval_s=0.05, spill_dir=str(tmp_path))
+    deadline = time.monotonic() + 5
+    while not written["metrics"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    restarted.close()
+
+    assert written["metrics"][0][0]["ingestion_id"] == "ING-1"
+    assert list(tmp_path.iterdir()) == []
+
+def test_telemetry_sender_drops_without_spill_dir(mcp_client):
+    sender = TelemetrySender(mcp_client, flush_interval_s=0.05)
+    sender.close()
+    sender.write_metric("OCR-AG", "ING-1", {})
+    assert sender.stats()["dropped"] == 1
@@ -0,0 +1,153 @@
+import json
+from concurrent import futures
+from types import SimpleNamespace
+
+import grpc
+import pytest
+
+from backend.agents.validation_agent import server as validation_server
+from backend.agents.validation_agent.batch import BatchValidator, validate_chunk
+from backend.agents.validation_agent.rules import BUNDLED_RULESETS_DIR, RulesetRegistry
+from backend.mcp import server as mcp_server
+from backend.shared.clients.mcp import MCPClient
+from backend.shared.grpc import mcp_pb2_grpc
+
+class FakeTelemetry:
+    def __init__(self, mcp_client=None):
+        self.audits = []
+
+    def write_audit(self, **audit):
+        self.audits.append(audit)
+
+class FakeContext:
+    code = None
+
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, details):
+        self.details = details
+
+def invoice(gstin="29AAFCD5862R1ZR", hsns=("9988",)):
+    return {
+        "supplier_gstin": gstin,
+        "invoice_date": "2025-11-25",
+        "items": [{"description": f"Item {n}", "hsn": hsn} for n, hsn in enumerate(hsns)],
+    }
+
+@pytest.fixture
+def stored(monkeypatch):
+    schemas = {
+        f"SCH-{n:03d}": json.dumps(invoice(gstin=None if n % 5 == 0 else "29AAFCD5862R1ZR", hsns=("9988", "12")))
+        for n in range(30)
+    }
+    schemas["SCH-AMT"] = json.dumps({**invoice(), "total_amount": 100.0, "tax_total": 18.0, "grand_total": 181.0, "items": [
+        {"description": "Pen", "hsn": "9988", "quantity": 10, "rate": 10.0, "tax_rate": 18, "tax_amount": 18.0, "total": 118.0},
+    ]})
+    schemas["SCH-BAD"] = "not json"
+    saved = SimpleNamespace(logs=[], warnings=[], writes=0)
+
+    def iter_mapped_schemas(schema_ids, created_from, created_to, page_size):
+        for schema_id in sorted(schema_ids or schemas):
+            if schema_id in schemas:
+                yield SimpleNamespace(schema_id=schema_id, ocr_id=None, mapped_json=schemas[schema_id], mapping_confidence=0.9)
+
+    def bulk_save_validation_results(log_rows, warning_rows):
+        saved.logs += log_rows
+        saved.warnings += warning_rows
+        saved.writes += 1
+
+    monkeypatch.setattr(mcp_server.repository, "iter_mapped_schemas", iter_mapped_schemas)
+    monkeypatch.setattr(mcp_server.repository, "bulk_save_validation_results", bulk_save_validation_results)
+    monkeypatch.setattr(mcp_server, "WRITE_BUFFER_ENABLED", False)
+    return saved
+
+@pytest.fixture
+def servicer(stored, monkeypatch):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    mcp_pb2_grpc.add_MCPServicer_to_server(mcp_server.MCPServicer(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    client = MCPClient()
+    client.stub = mcp_pb2_grpc.MCPStub(grpc.insecure_channel(f"localhost:{port}"))
+    monkeypatch.setattr(validation_server, "MCPClient", lambda: client)
+    monkeypatch.setattr(validation_server, "TelemetrySender", FakeTelemetry)
+    servicer = validation_server.ValidationServicer()
+    servicer.batch_validator = BatchValidator(workers=2, chunk_size=4)
+    yield servicer
+    servicer.batch_validator.close()
+    server.stop(None)
+
+def test_validates_streamed_schemas_on_workers_and_bulk_saves_each_chunk(servicer, stored):
+    request = validation_server.agent_comm_pb2.ValidateBatchRequest(ruleset="default")
+
+    results = list(servicer.ValidateSchemas(request, FakeContext()))
+
+    assert [r.schema_id for r in results] == [f"SCH-{n:03d}" for n in range(30)] + ["SCH-AMT", "SCH-BAD"]
+    assert [r.valid for r in results[:6]] == [False, True, True, True, True, False]
+    assert results[0].errors == ["Invalid GSTIN format."]
+    assert results[1].warnings == ["Invalid HSN for item: Item 1"]
+    assert results[-1].error.startswith("Invalid mapped data") and not results[-1].validation_id
+
+    assert [(f.rule_id, f.field, f.expected, f.found) for f in results[-2].findings] == [
+        ("reconcile_grand_total", "grand_total", "118.0", "181.0"),
+    ]
+
+    assert stored.writes == 8  # 32 schemas in chunks of 4
+    assert [row["validation_id"] for row in stored.logs] == [r.validation_id for r in results[:31]]
+    assert stored.logs[0]["errors"] == [
+        {"rule_id": "supplier_gstin_format", "field": "supplier_gstin", "severity": "error", "message": "Invalid GSTIN format."},
+    ]
+    assert stored.logs[-1]["warnings"][0]["expected"] == "118.0"
+    assert stored.warnings[-1]["suggested_fix"] == {"expected": "118.0", "found": "181.0"}
+    assert {row["validation_id"] for row in stored.warnings} == {r.validation_id for r in results[:31]}
+    assert servicer.telemetry.audits[0]["payload"] == {"ruleset": "default", "valid": 25, "invalid": 6, "failed": 1}
+
+def test_reports_missing_schemas_and_unknown_rulesets(servicer):
+    request = validation_server.agent_comm_pb2.ValidateBatchRequest(schema_ids=["SCH-001", "SCH-404"])
+    results = list(servicer.ValidateSchemas(request, FakeContext()))
+
+    assert [(r.schema_id, r.valid, r.error) for r in results] == [
+        ("SCH-001", True, ""), ("SCH-404", False, "Mapped schema not found."),
+    ]
+
+    context = FakeContext()
+    request = validation_server.agent_comm_pb2.ValidateBatchRequest(ruleset="missing")
+    assert list(servicer.ValidateSchemas(request, context)) == []
+    assert context.code == grpc.StatusCode.NOT_FOUND
+
+def test_a_malformed_schema_fails_alone_rather_than_its_chunk():
+    ruleset = RulesetRegistry(BUNDLED_RULESETS_DIR, reload_interval_s=0).get("default")
+    documents = [
+        ("SCH-1", json.dumps(invoice())),
+        ("SCH-2", json.dumps({**invoice(), "items": "one laptop"})),
+        ("SCH-3", json.dumps(invoice(gstin=None))),
+    ]
+
+    outcomes = validate_chunk(ruleset, documents)
+
+    assert [(o.schema_id, o.errors, bool(o.error)) for o in outcomes] == [
+        ("SCH-1", [], False),
+        ("SCH-2", [], True),
+        ("SCH-3", ["Invalid GSTIN format."], False),
+    ]
+
+def test_only_the_results_the_mcp_rejects_are_reported_as_failed(servicer, stored, monkeypatch):
+    logs_row = mcp_server._validation_logs_row
+
+    def reject_sch_002(log):
+        if log.schema_id == "SCH-002":
+            raise ValueError("bad row")
+        return logs_row(log)
+
+    monkeypatch.setattr(mcp_server, "_validation_logs_row", reject_sch_002)
+    request = validation_server.agent_comm_pb2.ValidateBatchRequest(schema_ids=["SCH-001", "SCH-002", "SCH-003"])
+
+    results = list(servicer.ValidateSchemas(request, FakeContext()))
+
+    assert [(r.schema_id, r.error) for r in results] == [
+        ("SCH-001", ""), ("SCH-002", "Result rejected by the MCP"), ("SCH-003", ""),
+    ]
+    assert not results[1].validation_id
+    assert [row["validation_id"] for row in stored.logs] == [results[0].validation_id, results[2].validation_id]
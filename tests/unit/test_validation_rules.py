@@ -1,8 +1,13 @@
+import json
+import os
+import time
+
 import pytest
 from backend.agents.validation_agent.server import validate_gstin, validate_date
+from backend.agents.validation_agent.rules import BUNDLED_RULESETS_DIR, RulesetRegistry, UnknownRuleset
 
 def test_validate_gstin():
-    assert validate_gstin("29AAFCD5862R1Z5") == True
+    assert validate_gstin("29AAFCD5862R1ZR") == True
     assert validate_gstin("29AAFCD5862R1Z") == False
     assert validate_gstin(None) == False
 
@@ -11,3 +16,57 @@ def test_validate_date():
     assert validate_date("2099-12-31") == False
     assert validate_date("invalid-date") == False
     assert validate_date(None) == False
+
+def invoice(gstin="29AAFCD5862R1ZR", date="2025-11-25", hsns=("9988",)):
+    return {
+        "supplier_gstin": gstin,
+        "invoice_date": date,
+        "items": [{"description": f"Item {n}", "hsn": hsn} for n, hsn in enumerate(hsns)],
+    }
+
+def test_default_ruleset_validates_invoices_and_line_items_in_one_pass():
+    ruleset = RulesetRegistry(BUNDLED_RULESETS_DIR, reload_interval_s=0).get("default")
+
+    findings = ruleset.validate_many([
+        invoice(),
+        invoice(gstin=None, hsns=("9988", "12", None)),
+        invoice(date="2099-12-31", hsns=()),
+    ])
+
+    assert findings[0] == []
+    assert [(f.severity, f.field, f.message) for f in findings[1]] == [
+        ("error", "supplier_gstin", "Invalid GSTIN format."),
+        ("warning", "hsn", "Invalid HSN for item: Item 1"),
+        ("warning", "hsn", "Invalid HSN for item: Item 2"),
+    ]
+    assert [f.rule_id for f in findings[2]] == ["invoice_date_not_future"]
+
+def test_extending_ruleset_overrides_rules_by_id():
+    strict = RulesetRegistry(BUNDLED_RULESETS_DIR, reload_interval_s=0).get("strict")
+
+    findings = strict.validate({**invoice(hsns=("12",)), "invoice_number": "INV-1", "grand_total": 0})
+
+    assert {(f.rule_id, f.severity) for f in findings} == {
+        ("item_hsn_length", "error"), ("grand_total_positive", "error"), ("item_quantity_positive", "error"),
+    }
+
+def test_registry_reloads_changed_rulesets_and_keeps_the_last_good_ones(tmp_path):
+    path = tmp_path / "custom.json"
+    path.write_text(json.dumps({"rules": [
+        {"id": "number", "field": "invoice_number", "check": "regex", "pattern": "INV-\\d+", "message": "bad"},
+    ]}))
+    registry = RulesetRegistry(str(tmp_path), reload_interval_s=0.01)
+    assert registry.get("custom").validate({"invoice_number": "INV-7"}) == []
+
+    path.write_text(json.dumps({"rules": [
+        {"id": "number", "field": "invoice_number", "check": "regex", "pattern": "X-\\d+", "message": "bad"},
+    ]}))
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+    time.sleep(0.02)
+    assert [f.message for f in registry.get("custom").validate({"invoice_number": "INV-7"})] == ["bad"]
+
+    path.write_text(json.dumps({"rules": [{"id": "broken", "field": "x", "check": "regex", "pattern": "(", "message": "?"}]}))
+    time.sleep(0.02)
+    assert [f.message for f in registry.get("custom").validate({"invoice_number": "INV-7"})] == ["bad"]
+    with pytest.raises(UnknownRuleset):
+        registry.get("missing")
@@ -0,0 +1,66 @@
+import os
+
+from backend.agents.common.validation_utils import gstin_check_digit, gstin_problem
+from backend.agents.common.vendor_index import VendorIndex, VendorMaster, VendorRecord, build_vendor_index
+from backend.agents.validation_agent import rules
+from backend.agents.validation_agent.rules import BUNDLED_RULESETS_DIR, RulesetRegistry
+
+VENDORS = [
+    VendorRecord("27AAPFU0939F1ZV", "Acme Traders Private Limited", "Acme"),
+    VendorRecord("29AAFCD5862R1ZR", "Deccan Supplies LLP"),
+    VendorRecord("33AAACI1195H1ZT", "Indus Steel Ltd", status="Cancelled"),
+]
+
+def test_gstin_check_digit_and_state_code():
+    assert gstin_check_digit("27AAPFU0939F1Z") == "V"
+    assert gstin_problem("27AAPFU0939F1ZV") is None
+    assert gstin_problem("27AAPFU0939F1ZW") == "check_digit"
+    assert gstin_problem("40AAPFU0939F1ZV") == "state_code"
+    assert gstin_problem("27AAPFU0939F1Z") == "format"
+
+def test_index_lookups_by_gstin_and_fuzzy_name(tmp_path):
+    path = str(tmp_path / "vendors.idx")
+    assert build_vendor_index(VENDORS + [VendorRecord("bad", "Nobody")], path) == 3
+    index = VendorIndex(path)
+
+    assert index.get("29AAFCD5862R1ZR") == VENDORS[1]
+    assert index.get("29AAFCD5862R1ZA") is None
+    assert [v.gstin for v in index.find_by_name("M/s. ACME TRADERS PVT. LTD.")] == ["27AAPFU0939F1ZV"]
+    assert index.get("27AAPFU0939F1ZV").name_score("Acme Traders Pvt Ltd") == 1.0
+    assert index.get("27AAPFU0939F1ZV").name_score("Traders Acme") > 0.85
+    assert index.get("27AAPFU0939F1ZV").name_score("Bharat Electricals") < 0.5
+
+def test_vendor_master_picks_up_a_replaced_snapshot(tmp_path):
+    path = str(tmp_path / "vendors.idx")
+    build_vendor_index(VENDORS[:1], path)
+    master = VendorMaster(path, reload_interval_s=0.01)
+    assert master.index().get("29AAFCD5862R1ZR") is None
+
+    build_vendor_index(VENDORS, path)
+    os.utime(path, ns=(1, 1))
+    master._checked_at -= 1
+
+    assert master.index().get("29AAFCD5862R1ZR") == VENDORS[1]
+
+def test_default_ruleset_checks_gstins_against_the_vendor_master(tmp_path, monkeypatch):
+    path = str(tmp_path / "vendors.idx")
+    build_vendor_index(VENDORS, path)
+    monkeypatch.setattr(rules, "get_vendor_master", lambda: VendorMaster(path, reload_interval_s=0))
+    ruleset = RulesetRegistry(BUNDLED_RULESETS_DIR, reload_interval_s=0).get("default")
+
+    def invoice(gstin, name):
+        return {"supplier_gstin": gstin, "supplier_name": name, "invoice_date": "2025-11-25", "items": []}
+
+    findings = ruleset.validate_many([
+        invoice("27AAPFU0939F1ZV", "ACME TRADERS PVT LTD"),
+        invoice("27AAPFU0939F1ZW", "Acme Traders"),
+        invoice("33AAACI1195H1ZT", "Indus Steel"),
+        invoice("29AAFCD5862R1ZR", "Bharat Electricals"),
+    ])
+
+    assert [[f.rule_id for f in found] for found in findings] == [
+        [],
+        ["supplier_gstin_checksum", "supplier_in_vendor_master"],
+        ["supplier_in_vendor_master"],
+        ["supplier_name_matches_vendor_master"],
+    ]